@@ -5,8 +5,20 @@ from pathlib import Path
 from typing import Optional, Set, List
 import logging
 import json
-import soundfile as sf
-import numpy as np
+
+from roex_python.exceptions import (
+    AudioValidationError,
+    AudioTooShortError,
+    AudioTooLongError,
+    InvalidSampleRateError,
+    AudioTooQuietError,
+)
+from roex_python.validation import (
+    ALLOWED_SAMPLE_RATES,
+    MIN_DURATION_SECS,
+    MIN_RMS_THRESHOLD,
+    validate_audio,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -81,35 +93,14 @@ def ensure_output_dir(dir_path: str) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
 
-# --- Custom Exceptions for Audio Validation ---
-class AudioValidationError(ValueError):
-    """Base class for audio validation errors."""
-    pass
-
-class AudioTooShortError(AudioValidationError):
-    """Exception raised when audio is shorter than the minimum required duration."""
-    pass
-
-class AudioTooLongError(AudioValidationError):
-    """Exception raised when audio is longer than the maximum allowed duration."""
-    pass
-
-class InvalidSampleRateError(AudioValidationError):
-    """Exception raised when audio has an unsupported sample rate."""
-    pass
-
-class AudioTooQuietError(AudioValidationError):
-    """Exception raised when audio is effectively silent (RMS too low)."""
-    pass
-
-# --- Constants ---
-MIN_DURATION_SECS = 10
-ALLOWED_SAMPLE_RATES = {44100, 48000}
-MIN_RMS_THRESHOLD = 0.0001
+# --- Audio Validation ---
 
 def validate_audio_properties(audio_path: Path, max_duration_secs: float) -> None:
     """Validate audio properties: sample rate, duration, and silence.
 
+    Sample rate and duration are read from the file header; the silence check
+    streams at most one minute of audio. See ``roex_python.validation``.
+
     Args:
         audio_path: Path object to the audio file.
         max_duration_secs: Maximum allowed duration in seconds for this context.
@@ -119,61 +110,15 @@ def validate_audio_properties(audio_path: Path, max_duration_secs: float) -> Non
         AudioTooShortError: If duration is less than MIN_DURATION_SECS.
         AudioTooLongError: If duration exceeds max_duration_secs.
         AudioTooQuietError: If the audio's RMS value is below MIN_RMS_THRESHOLD.
-        sf.SoundFileError: If the file cannot be read by soundfile.
+        AudioValidationError: If the file is not a readable WAV or FLAC file.
     """
+    logger.info(f"Validating audio properties for: {audio_path.name}")
     try:
-        logger.info(f"Validating audio properties for: {audio_path.name}")
-        with sf.SoundFile(str(audio_path)) as f:
-            sample_rate = f.samplerate
-            frames = f.frames
-            duration_secs = frames / sample_rate
-
-            # 1. Check Sample Rate
-            if sample_rate not in ALLOWED_SAMPLE_RATES:
-                raise InvalidSampleRateError(
-                    f"Invalid sample rate: {sample_rate} Hz. "
-                    f"Must be one of: {', '.join(map(str, ALLOWED_SAMPLE_RATES))}."
-                )
-
-            # 2. Check Duration
-            if duration_secs < MIN_DURATION_SECS:
-                raise AudioTooShortError(
-                    f"Audio duration ({duration_secs:.2f}s) is less than minimum allowed ({MIN_DURATION_SECS}s)."
-                )
-            if duration_secs > max_duration_secs:
-                raise AudioTooLongError(
-                    f"Audio duration ({duration_secs:.2f}s) exceeds maximum allowed ({max_duration_secs / 60:.1f} mins)."
-                )
-
-            # 3. Check Silence (RMS)
-            # Read a chunk to check RMS - avoid loading huge files entirely if possible
-            # Read up to 1 minute or the whole file if shorter
-            read_frames = min(frames, sample_rate * 60)
-            audio_data = f.read(frames=read_frames, dtype='float32', always_2d=True)
-
-            if audio_data.shape[1] == 2: # Stereo
-                rms_left = np.sqrt(np.mean(audio_data[:, 0]**2))
-                rms_right = np.sqrt(np.mean(audio_data[:, 1]**2))
-                rms = (rms_left + rms_right) / 2
-            else: # Mono (or treat other channel counts as mono for RMS)
-                rms = np.sqrt(np.mean(audio_data[:, 0]**2))
-
-            if rms < MIN_RMS_THRESHOLD:
-                raise AudioTooQuietError(
-                    f"Audio appears too quiet (RMS: {rms:.6f}). Minimum threshold is {MIN_RMS_THRESHOLD}."
-                )
-
-        logger.info(f"Audio properties validated successfully for: {audio_path.name}")
-
-    except sf.SoundFileError as e:
-        logger.error(f"Could not read or process audio file {audio_path}: {e}")
-        raise # Re-raise the soundfile error
+        validate_audio(str(audio_path), max_duration=max_duration_secs)
     except AudioValidationError as e:
         logger.error(f"Audio validation failed for {audio_path.name}: {e}")
         raise # Re-raise our custom validation errors
-    except Exception as e:
-        logger.error(f"Unexpected error during audio validation for {audio_path.name}: {e}")
-        raise AudioValidationError(f"Unexpected validation error: {e}") # Wrap unexpected errors
+    logger.info(f"Audio properties validated successfully for: {audio_path.name}")
 
 def ensure_dir_exists(dir_path: str) -> None:
     """Ensure a directory exists, creating it if necessary."""
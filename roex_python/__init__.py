@@ -11,5 +11,41 @@ __email__ = "support@roexaudio.com"
 __license__ = "MIT"
 
 from roex_python.client import RoExClient
+from roex_python.async_client import AsyncRoExClient
+from roex_python.exceptions import RoExError, RoExApiError, RoExTimeoutError, RoExTaskError, RoExDownloadError, \
+    AudioValidationError
+from roex_python.deadline import Deadline
+from roex_python.polling import PollPolicy, TaskPoller
+from roex_python.scheduler import PollScheduler, TaskHandle
+from roex_python.webhooks import WebhookListener
+from roex_python.upload_cache import UploadCache
+from roex_python.analysis_table import AnalysisTable
+from roex_python.analysis_cache import AnalysisCache
+from roex_python.comparison import PairwiseDifferences
+from roex_python.pipeline import MultitrackPipeline
+from roex_python.providers.retry import RetryPolicy, RetryBudget, EndpointRetry
 
-__all__ = ["RoExClient"]
\ No newline at end of file
+__all__ = [
+    "RoExClient",
+    "AsyncRoExClient",
+    "RoExError",
+    "RoExApiError",
+    "RoExTimeoutError",
+    "RoExTaskError",
+    "RoExDownloadError",
+    "AudioValidationError",
+    "Deadline",
+    "PollPolicy",
+    "TaskPoller",
+    "PollScheduler",
+    "TaskHandle",
+    "WebhookListener",
+    "UploadCache",
+    "AnalysisTable",
+    "AnalysisCache",
+    "PairwiseDifferences",
+    "MultitrackPipeline",
+    "RetryPolicy",
+    "RetryBudget",
+    "EndpointRetry",
+]
\ No newline at end of file
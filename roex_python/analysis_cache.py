@@ -0,0 +1,188 @@
+"""
+Two-tier cache of analysis results
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Optional, Tuple
+
+from roex_python.models.analysis import AnalysisResult, MixAnalysisRequest
+from roex_python.sqlite_store import SqliteStore
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+DEFAULT_ANALYSIS_CACHE_PATH = os.path.join("~", ".cache", "roex", "analyses.sqlite3")
+
+_COLUMNS = {"result": "TEXT NOT NULL"}
+
+
+class AnalysisCache:
+    """
+    Caches ``analyze_mix`` results so repeated analyses skip the API.
+
+    An analysis depends only on the audio, the musical style and the
+    ``is_master`` flag, so results are keyed by those: the audio is
+    identified by the SHA-256 of its contents when the caller provides it
+    (see ``AnalysisController.analyze_mix``), or else by its URL.
+
+    Lookups go to an in-memory LRU first and then, if *path* is given, to a
+    SQLite file shared by every process on the machine pointing at it; disk
+    hits are promoted to memory. Keep the file on a local disk, not on NFS or
+    SMB, where SQLite's locking is unreliable. Entries older than *ttl* seconds are ignored and
+    removed in both tiers. Results the API reported as errors are never cached.
+
+    Pass the cache as ``RoExClient(analysis_cache=...)`` and ``analyze_mix``,
+    ``compare_mixes``, ``compare_many`` and ``analyze_batch`` use it
+    transparently. Any object with the same ``get(key)`` and
+    ``put(key, result)`` methods can be used instead, e.g. one backed by Redis.
+
+    Example:
+        >>> cache = AnalysisCache(path=DEFAULT_ANALYSIS_CACHE_PATH)
+        >>> client = RoExClient(api_key=api_key, analysis_cache=cache)
+        >>> client.analysis.analyze_mix(request)  # calls the API
+        >>> client.analysis.analyze_mix(request)  # served from memory
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = 7 * 24 * 3600,
+                 max_memory_entries: int = 1024, max_entries: Optional[int] = 100000,
+                 journal_mode: str = "DELETE"):
+        """
+        Args:
+            path: Location of the SQLite file for the on-disk tier, e.g.
+                ``DEFAULT_ANALYSIS_CACHE_PATH``. None (the default) keeps
+                results in memory only.
+            ttl: Seconds a result stays valid, or None to keep results until
+                evicted. Defaults to 7 days.
+            max_memory_entries: Results kept in the in-memory tier. Defaults to 1024.
+            max_entries: Results kept on disk, or None for no limit. Defaults to 100000.
+            journal_mode: SQLite journal mode of the on-disk tier, "DELETE" (the
+                default) or "WAL". WAL lets many local processes read while
+                one writes, but only works on a local disk.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if max_memory_entries < 1:
+            raise ValueError(f"max_memory_entries must be at least 1, got {max_memory_entries}")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self._store = (SqliteStore(path, "analyses", _COLUMNS, ttl, max_entries, journal_mode)
+                       if path is not None else None)
+        self.path = self._store.path if self._store is not None else None
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # key -> (created_at, serialized result), least recently used first
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(request: MixAnalysisRequest, base_url: str, content_hash: Optional[str] = None) -> str:
+        """
+        Cache key for an analysis request sent to a given API.
+
+        Args:
+            request: The analysis request.
+            base_url: Base URL of the API the request is sent to.
+            content_hash: SHA-256 of the audio, if known. Results are then
+                shared by every URL holding the same audio.
+
+        Returns:
+            str: The key.
+        """
+        source = f"sha256:{content_hash}" if content_hash else f"url:{request.audio_file_location}"
+        return f"{base_url.rstrip('/')}|{request.musical_style.value}|{int(request.is_master)}|{source}"
+
+    def get(self, key: str) -> Optional[AnalysisResult]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key built with ``key``.
+
+        Returns:
+            Optional[AnalysisResult]: A fresh copy of the cached result, or
+            None if absent or expired.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._expired(entry[0], now):
+                del self._memory[key]
+                entry = None
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is None and self._store is not None:
+            entry = self._store.get(key, ("result",), now)
+            if entry is not None:
+                self._remember(key, entry)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return AnalysisResult(**json.loads(entry[1]))
+
+    def put(self, key: str, result: AnalysisResult) -> None:
+        """
+        Store a result in both tiers, then evict expired and excess entries.
+
+        Args:
+            key: Key built with ``key``.
+            result: The analysis to cache. Ignored if ``result.error`` is set.
+        """
+        if result.error:
+            return
+        now = time.time()
+        entry = (now, json.dumps(asdict(result)))
+        self._remember(key, entry)
+        if self._store is not None:
+            self._store.put(key, (entry[1],), now)
+
+    def evict(self) -> int:
+        """
+        Remove expired entries from both tiers and, beyond *max_entries*, the least recently used on disk.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (created_at, _) in self._memory.items() if self._expired(created_at, now)]
+            for key in expired:
+                del self._memory[key]
+        removed = len(expired)
+        if self._store is not None:
+            removed += self._store.evict(now)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self._store is not None:
+            self._store.clear()
+
+    def __len__(self) -> int:
+        """Number of entries in the largest tier."""
+        if self._store is None:
+            return len(self._memory)
+        return len(self._store)
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and now - created_at > self.ttl
+
+    def _remember(self, key: str, entry: Tuple[float, str]) -> None:
+        """Add *entry* to the memory tier, evicting the least recently used beyond its size."""
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
@@ -0,0 +1,224 @@
+"""
+Columnar store of analysis metrics for whole catalogues
+"""
+
+import csv
+import logging
+import math
+from array import array
+from typing import Any, Dict, Iterator, List, Union
+
+from roex_python.models.analysis import NUMERIC_METRICS, PRODUCTION_METRICS, TONAL_BANDS, AnalysisResult
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# Column names for the tonal profile bands, e.g. "tonal_profile.bass_frequency"
+TONAL_COLUMNS = tuple(f"tonal_profile.{band}" for band in TONAL_BANDS)
+
+
+class _CategoricalColumn:
+    """Dictionary-encoded column: each row stores a small integer code into a list of distinct values."""
+
+    def __init__(self):
+        self.codes = array("i")
+        self.categories: List[Any] = []
+        self._lookup: Dict[Any, int] = {}
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def values(self) -> List[Any]:
+        categories = self.categories
+        return [categories[code] if code >= 0 else None for code in self.codes]
+
+
+class AnalysisTable:
+    """
+    Columnar store of the metrics of many analyses.
+
+    Each metric collected by ``compare_mixes`` (the production metrics and
+    the tonal profile bands) is kept in its own column rather than in one
+    dict per track: numeric metrics as a packed ``array("d")`` of 8 bytes
+    per track, with NaN where a value is missing, and the rest dictionary
+    encoded, as 4-byte codes into the handful of distinct values a column
+    holds ("YES"/"NO", "GOOD"/"HIGH", ...). A catalogue of tens of
+    thousands of tracks takes a few megabytes, and ``to_numpy`` /
+    ``to_arrow`` turn it into a structured array or Arrow table for
+    vectorised queries and exports.
+
+    Fill it by passing it to ``AnalysisController.analyze_batch(table=...)``
+    or by calling ``add`` yourself. Not thread-safe; ``analyze_batch`` only
+    adds rows from the thread iterating over its results.
+
+    Example:
+        >>> table = AnalysisTable()
+        >>> for item in client.analysis.analyze_batch(requests, table=table):
+        >>>     pass
+        >>> masters = table.to_numpy()
+        >>> too_loud = masters[masters["integrated_loudness_lufs"] > -9.0]["url"]
+    """
+
+    def __init__(self):
+        self._urls: List[str] = []
+        self._numeric = {name: array("d") for name in NUMERIC_METRICS}
+        self._categorical = {name: _CategoricalColumn() for name in PRODUCTION_METRICS + TONAL_COLUMNS
+                             if name not in self._numeric}
+
+    @property
+    def columns(self) -> List[str]:
+        """List[str]: Column names: "url", the production metrics, then the tonal profile bands."""
+        return ["url"] + list(PRODUCTION_METRICS) + list(TONAL_COLUMNS)
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def add(self, url: str, result: AnalysisResult) -> None:
+        """
+        Append the metrics of one analysis as a new row.
+
+        Args:
+            url: URL (or any identifier) of the analyzed track.
+            result: The analysis. Metrics missing from its payload are stored
+                as NaN (numeric) or None (other columns).
+        """
+        payload = result.payload or {}
+        self._urls.append(url)
+        for name, column in self._numeric.items():
+            column.append(self._as_float(payload.get(name)))
+        tonal_profile = payload.get("tonal_profile") or {}
+        for name, column in self._categorical.items():
+            if name.startswith("tonal_profile."):
+                column.append(tonal_profile.get(name[len("tonal_profile."):]))
+            else:
+                column.append(payload.get(name))
+
+    def column(self, name: str) -> Union[array, List[Any]]:
+        """
+        Values of one column, in row order.
+
+        Args:
+            name: One of ``columns``.
+
+        Returns:
+            The ``array("d")`` backing a numeric column (not a copy; do not
+            modify it), or a list of values for the other columns.
+
+        Raises:
+            KeyError: If there is no such column
+        """
+        if name == "url":
+            return list(self._urls)
+        if name in self._numeric:
+            return self._numeric[name]
+        return self._categorical[name].values()
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the rows as dicts keyed by column name."""
+        columns = {name: self.column(name) for name in self.columns}
+        for i in range(len(self)):
+            yield {name: values[i] for name, values in columns.items()}
+
+    def to_numpy(self) -> Any:
+        """
+        Convert the table to a NumPy structured array with one record per track.
+
+        Numeric columns become ``float64`` fields (NaN where missing), and the
+        other columns ``object`` fields.
+
+        Returns:
+            numpy.ndarray: Structured array with a field for each column.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        import numpy as np
+
+        dtype = [(name, "f8" if name in self._numeric else "O") for name in self.columns]
+        table = np.empty(len(self), dtype=dtype)
+        for name in self.columns:
+            if name in self._numeric:
+                table[name] = np.frombuffer(self._numeric[name], dtype="f8") if len(self) else []
+            else:
+                table[name] = self.column(name)
+        return table
+
+    def to_arrow(self) -> Any:
+        """
+        Convert the table to a ``pyarrow.Table``.
+
+        Non-numeric columns stay dictionary encoded, so the Arrow table (and
+        Parquet files written from it) is as compact as this one.
+
+        Returns:
+            pyarrow.Table: One column per entry in ``columns``.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        import pyarrow as pa
+
+        arrays = []
+        for name in self.columns:
+            if name == "url":
+                arrays.append(pa.array(self._urls, type=pa.string()))
+            elif name in self._numeric:
+                values = [None if math.isnan(value) else value for value in self._numeric[name]]
+                arrays.append(pa.array(values, type=pa.float64()))
+            else:
+                column = self._categorical[name]
+                indices = pa.array([code if code >= 0 else None for code in column.codes], type=pa.int32())
+                dictionary = pa.array([str(value) for value in column.categories], type=pa.string())
+                arrays.append(pa.DictionaryArray.from_arrays(indices, dictionary))
+        return pa.Table.from_arrays(arrays, names=self.columns)
+
+    def to_parquet(self, path: str) -> None:
+        """
+        Write the table to a Parquet file.
+
+        Args:
+            path: File to write.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path)
+        logger.info(f"Wrote {len(self)} analyses to {path}")
+
+    def to_csv(self, path: str) -> None:
+        """
+        Write the table to a CSV file with a header row.
+
+        Missing values are written as empty fields.
+
+        Args:
+            path: File to write.
+        """
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
+            for row in self.rows():
+                writer.writerow(["" if value is None or (isinstance(value, float) and math.isnan(value)) else value
+                                 for value in row.values()])
+        logger.info(f"Wrote {len(self)} analyses to {path}")
+
+    @staticmethod
+    def _as_float(value: Any) -> float:
+        """*value* as a float, or NaN for "N/A", None and other non-numeric values."""
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return math.nan
@@ -0,0 +1,127 @@
+"""
+Asyncio RoEx client interface that unifies all async controllers
+"""
+
+import logging
+from typing import Optional, Tuple, Union
+
+from .controllers.async_controllers import (
+    AsyncAnalysisController,
+    AsyncAudioCleanupController,
+    AsyncEnhanceController,
+    AsyncMasteringController,
+    AsyncMixController,
+    AsyncUploadController
+)
+from .providers.api_provider import DEFAULT_TIMEOUT
+from .providers.async_api_provider import AsyncApiProvider
+from .providers.retry import RetryPolicy
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+
+class AsyncRoExClient:
+    """
+    Asyncio client for the RoEx Tonn API.
+
+    Mirrors `RoExClient`, but every controller method is a coroutine and polling
+    uses `asyncio.sleep`, so a single event loop can keep hundreds of mixing,
+    mastering and enhancement tasks in flight without a thread per task.
+
+    Requires the optional ``httpx`` dependency: ``pip install roex_python[async]``.
+
+    Attributes:
+        api_provider (AsyncApiProvider): Handles the underlying HTTP requests and authentication.
+        mix (AsyncMixController): Controller for mixing operations.
+        mastering (AsyncMasteringController): Controller for mastering operations.
+        analysis (AsyncAnalysisController): Controller for analysis operations.
+        enhance (AsyncEnhanceController): Controller for enhancement operations.
+        audio_cleanup (AsyncAudioCleanupController): Controller for cleanup operations.
+        upload (AsyncUploadController): Controller for file upload operations.
+
+    Example:
+        >>> import asyncio
+        >>> from roex_python import AsyncRoExClient
+        >>>
+        >>> async def main():
+        >>>     async with AsyncRoExClient(api_key="YOUR_API_KEY") as client:
+        >>>         tasks = [client.mastering.create_mastering_preview(req) for req in requests]
+        >>>         responses = await asyncio.gather(*tasks)
+        >>>
+        >>> asyncio.run(main())
+    """
+
+    def __init__(self, api_key: str, base_url: str = "https://tonn.roexaudio.com",
+                 pool_connections: int = 10, pool_maxsize: int = 100, keep_alive: bool = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT):
+        """
+        Initialize the async RoEx client.
+
+        Args:
+            api_key (str): Your RoEx API key.
+            base_url (str, optional): The base URL for the RoEx Tonn API.
+                Defaults to "https://tonn.roexaudio.com".
+            pool_connections (int, optional): Maximum number of idle keep-alive
+                connections to retain. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of concurrent connections.
+                Coroutines beyond this limit wait for a free connection. Defaults to 100.
+            keep_alive (bool, optional): Whether to reuse connections between
+                requests. Defaults to True.
+            retry_policy (RetryPolicy, optional): Retry behaviour for API calls,
+                including jitter, a client-wide retry budget and per-endpoint
+                overrides. Defaults to ``RetryPolicy()``.
+            timeout (float or tuple, optional): Per-request timeout in seconds,
+                either a single value or a (connect, read) tuple. Defaults to
+                10 seconds to connect and 120 seconds between bytes read.
+
+        Raises:
+            ValueError: If the API key is missing.
+            ImportError: If ``httpx`` is not installed.
+        """
+        if not api_key:
+            raise ValueError("API key cannot be empty.")
+        self.api_provider = AsyncApiProvider(
+            base_url=base_url,
+            api_key=api_key,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy,
+            timeout=timeout,
+        )
+        logger.info(f"AsyncRoExClient initialized for base URL: {base_url}")
+
+        # Initialize controllers
+        self.mix = AsyncMixController(self.api_provider)
+        self.mastering = AsyncMasteringController(self.api_provider)
+        self.analysis = AsyncAnalysisController(self.api_provider)
+        self.enhance = AsyncEnhanceController(self.api_provider)
+        self.audio_cleanup = AsyncAudioCleanupController(self.api_provider)
+        self.upload = AsyncUploadController(self.api_provider)
+
+    async def aclose(self) -> None:
+        """Close the client's HTTP connection pool."""
+        await self.api_provider.aclose()
+
+    async def __aenter__(self) -> "AsyncRoExClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def health_check(self) -> str:
+        """
+        Perform a simple health check against the RoEx API.
+
+        Returns:
+            str: A status message from the API.
+        """
+        try:
+            response = await self.api_provider.get("/health")
+            logger.info(f"API health check successful: {response}")
+            return response
+        except Exception as e:
+            logger.error(f"API health check failed: {e}")
+            raise
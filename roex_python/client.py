@@ -8,9 +8,20 @@ from .controllers.analysis_controller import AnalysisController
 from .controllers.enhance_controller import EnhanceController
 from .controllers.audio_cleanup_controller import AudioCleanupController
 from .controllers.upload_controller import UploadController
-from .providers.api_provider import ApiProvider
+from .providers.api_provider import DEFAULT_TIMEOUT, ApiProvider
+from .providers.retry import RetryPolicy
+from .analysis_cache import AnalysisCache
+from .downloads import download_all
+from .models.common import MusicalStyle
+from .models.download import BatchDownloadResult
+from .scheduler import PollScheduler
+from .webhooks import WebhookListener
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Tuple, Union
 import logging
 
+if TYPE_CHECKING:
+    from .pipeline import MultitrackPipeline
+
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
@@ -27,8 +38,12 @@ class RoExClient:
     - `enhance`: Mix enhancement.
     - `audio_cleanup`: Audio source cleanup.
     - `upload`: File upload helpers (getting signed URLs).
+    - `poll_scheduler`: Background polling of many outstanding tasks from one thread.
+    - `multitrack_pipeline()`: Upload, mix, master and download a set of stems in one call.
 
-    Authentication is handled via an API key.
+    Authentication is handled via an API key. All controllers share a single
+    pooled HTTP session, so connections to the API are reused across calls;
+    call `close()` (or use the client as a context manager) to release them.
 
     Attributes:
         api_provider (ApiProvider): Handles the underlying HTTP requests and authentication.
@@ -38,6 +53,8 @@ class RoExClient:
         enhance (EnhanceController): Controller for enhancement operations.
         audio_cleanup (AudioCleanupController): Controller for cleanup operations.
         upload (UploadController): Controller for file upload operations.
+        poll_scheduler (PollScheduler): Background poll scheduler shared by the
+            ``submit`` methods; its threads start on first use.
 
     Example:
         >>> from roex_python.client import RoExClient
@@ -55,7 +72,12 @@ class RoExClient:
         >>>     print(f"Failed to connect to API: {e}")
     """
 
-    def __init__(self, api_key: str, base_url: str = "https://tonn.roexaudio.com"):
+    def __init__(self, api_key: str, base_url: str = "https://tonn.roexaudio.com",
+                 pool_connections: int = 10, pool_maxsize: int = 10, keep_alive: bool = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+                 webhook_listener: Optional[WebhookListener] = None,
+                 analysis_cache: Optional[AnalysisCache] = None):
         """
         Initialize the RoEx client.
 
@@ -65,6 +87,26 @@ class RoExClient:
             base_url (str, optional): The base URL for the RoEx Tonn API.
                 Defaults to "https://tonn.roexaudio.com".
                 Can be changed for testing or specific API environments.
+            pool_connections (int, optional): Number of per-host connection pools
+                cached by the shared HTTP session. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of connections kept open
+                per host. Raise this when issuing requests from many threads.
+                Defaults to 10.
+            keep_alive (bool, optional): Whether to reuse connections between
+                requests. Defaults to True.
+            retry_policy (RetryPolicy, optional): Retry behaviour for API calls,
+                including jitter, a client-wide retry budget and per-endpoint
+                overrides. Defaults to ``RetryPolicy()``.
+            timeout (float or tuple, optional): Per-request timeout in seconds,
+                either a single value or a (connect, read) tuple. Defaults to
+                10 seconds to connect and 120 seconds between bytes read.
+            webhook_listener (WebhookListener, optional): Listener whose callback
+                URLs are registered as the ``webhook_url`` of tasks started with
+                the ``submit`` methods, so they resolve on callback instead of by
+                polling. Closed together with the client. Defaults to None.
+            analysis_cache (AnalysisCache, optional): Cache of analysis results
+                used by ``client.analysis``, so repeated analyses of the same
+                audio, style and master flag skip the API. Defaults to None.
 
         Raises:
             ValueError: If the API key is invalid or missing (though actual check happens on first API call).
@@ -72,17 +114,107 @@ class RoExClient:
         if not api_key:
             # Early check for missing key, though ApiProvider might do more validation
             raise ValueError("API key cannot be empty.")
-        self.api_provider = ApiProvider(base_url=base_url, api_key=api_key)
+        self.api_provider = ApiProvider(
+            base_url=base_url,
+            api_key=api_key,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy,
+            timeout=timeout,
+        )
         logger.info(f"RoExClient initialized for base URL: {base_url}")
 
+        # All polling-based controllers share one background scheduler
+        self.poll_scheduler = PollScheduler(self.api_provider, webhook_listener=webhook_listener)
+
         # Initialize controllers
-        self.mix = MixController(self.api_provider)
-        self.mastering = MasteringController(self.api_provider)
-        self.analysis = AnalysisController(self.api_provider)
-        self.enhance = EnhanceController(self.api_provider)
+        self.mix = MixController(self.api_provider, poll_scheduler=self.poll_scheduler)
+        self.mastering = MasteringController(self.api_provider, poll_scheduler=self.poll_scheduler)
+        self.analysis = AnalysisController(self.api_provider, cache=analysis_cache)
+        self.enhance = EnhanceController(self.api_provider, poll_scheduler=self.poll_scheduler)
         self.audio_cleanup = AudioCleanupController(self.api_provider)
         self.upload = UploadController(self.api_provider)
 
+    def close(self) -> None:
+        """
+        Close the client's HTTP session and release all pooled connections.
+
+        All controllers share the same session, so none of them can be used
+        after the client has been closed. Tasks still tracked by
+        `poll_scheduler` are cancelled and the webhook listener, if any, is
+        stopped. Prefer using the client as a context
+        manager so the session is closed automatically.
+
+        Example:
+            >>> with RoExClient(api_key="YOUR_API_KEY") as client:
+            >>>     print(client.health_check())
+        """
+        self.poll_scheduler.close()
+        if self.poll_scheduler.webhook_listener is not None:
+            self.poll_scheduler.webhook_listener.close()
+        self.api_provider.close()
+
+    def __enter__(self) -> "RoExClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def download_all(self, result: Union[Any, Mapping[str, str]], output_dir: str,
+                     max_workers: int = 8, segments: int = 1) -> BatchDownloadResult:
+        """
+        Download the main output and every stem of a result concurrently.
+
+        Works with ``PreviewMixResult``, ``FinalMixResult``,
+        ``EnhancedTrackResult``, the mastering results, or a plain mapping
+        of names to URLs. Files are saved as ``{output_dir}/{name}{ext}``
+        ("mix", "enhanced", "master", or the stem name) and written
+        atomically over the client's pooled connections.
+
+        Args:
+            result: The task result (or name-to-URL mapping) to download.
+            output_dir: Directory to save the files in; created if needed.
+            max_workers: Maximum number of concurrent downloads. Defaults to 8.
+            segments: Ranges to fetch concurrently within each large file.
+                Defaults to 1; see ``ApiProvider.download_to_file``.
+
+        Returns:
+            BatchDownloadResult: ``paths`` maps each name to its local file;
+            ``files`` holds per-file byte counts, timings and errors.
+
+        Example:
+            >>> mix = client.mix.retrieve_final_mix(final_request)
+            >>> batch = client.download_all(mix, "final_mix")
+            >>> print(batch.paths["mix"], batch.paths.get("vocal"))
+        """
+        return download_all(self.api_provider, result, output_dir, max_workers=max_workers, segments=segments)
+
+    def multitrack_pipeline(self, musical_style: MusicalStyle, **options: Any) -> "MultitrackPipeline":
+        """
+        Create a pipeline that mixes local stems end to end with this client.
+
+        Stems are uploaded concurrently, the preview is polled by the shared
+        ``poll_scheduler``, and the preview, final mix and stems are
+        downloaded in parallel; see ``MultitrackPipeline``.
+
+        Args:
+            musical_style: Musical style of the mix.
+            **options: Settings accepted by ``MultitrackPipeline``, e.g.
+                ``create_master=True`` or ``desired_loudness``.
+
+        Returns:
+            MultitrackPipeline: A reusable pipeline; call ``run(tracks, output_dir)``.
+
+        Example:
+            >>> pipeline = client.multitrack_pipeline(MusicalStyle.ROCK_INDIE, create_master=True)
+            >>> result = pipeline.run(tracks, output_dir="song_1")
+            >>> print(result.stage_seconds, result.paths.get("mix"))
+        """
+        # Imported here because the pipeline's upload helpers import this module
+        from .pipeline import MultitrackPipeline
+        return MultitrackPipeline(self, musical_style, **options)
+
     def health_check(self) -> str:
         """
         Perform a simple health check against the RoEx API.
@@ -0,0 +1,149 @@
+"""
+Pairwise metric differences between analyzed mixes
+"""
+
+import logging
+from collections.abc import Mapping
+from typing import Any, Dict, Hashable, Iterator, Optional, Sequence, Tuple
+
+from roex_python.models.analysis import CATEGORICAL_METRICS, NUMERIC_METRICS, TONAL_BANDS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+
+class PairwiseDifferences(Mapping):
+    """
+    Differences between every pair of mixes, computed on demand.
+
+    Returned as ``compare_many(...)["differences"]``. It is a read-only
+    mapping from ``(label_a, label_b)``, with ``label_a`` before ``label_b``
+    in the order the mixes were given, to the same per-pair dict that
+    ``compare_mixes`` returns. Building those dicts for N mixes takes
+    N(N-1)/2 of them, so each is only built when its pair is looked up.
+    Construction reads each mix's metrics once and costs O(N).
+
+    For bulk work, ``matrix`` returns a metric's absolute differences for
+    all pairs at once as an N x N array, from a single NumPy broadcast.
+
+    Example:
+        >>> differences = client.analysis.compare_many(urls, AnalysisMusicalStyle.POP)["differences"]
+        >>> print(differences[(urls[0], urls[2])]["integrated_loudness_lufs"])
+        >>> loudness = differences.matrix("integrated_loudness_lufs")
+        >>> i, j = divmod(int(np.nanargmax(loudness)), len(urls))
+        >>> print(f"Furthest apart in loudness: {urls[i]} and {urls[j]}")
+    """
+
+    def __init__(self, labels: Sequence[Hashable], metrics: Sequence[Dict[str, Any]]):
+        """
+        Args:
+            labels: One unique label per mix, such as its URL.
+            metrics: Each mix's metrics as extracted by ``AnalysisController``,
+                in the order of *labels*.
+
+        Raises:
+            ValueError: If the lengths differ or a label is repeated.
+        """
+        if len(labels) != len(metrics):
+            raise ValueError("labels and metrics must have the same length.")
+        self.labels = tuple(labels)
+        self._positions = {label: i for i, label in enumerate(self.labels)}
+        if len(self._positions) != len(self.labels):
+            raise ValueError("labels must be unique.")
+        self._metrics = list(metrics)
+        self._numeric = {key: [_as_float(m.get(key, 0)) for m in self._metrics] for key in NUMERIC_METRICS}
+        self._matrices: Dict[str, Any] = {}
+
+    def __getitem__(self, pair: Tuple[Hashable, Hashable]) -> Dict[str, Any]:
+        try:
+            label_a, label_b = pair
+            i, j = self._positions[label_a], self._positions[label_b]
+        except (KeyError, TypeError, ValueError):
+            raise KeyError(pair) from None
+        if i >= j:
+            raise KeyError(pair)
+        return self._pair(i, j)
+
+    def __iter__(self) -> Iterator[Tuple[Hashable, Hashable]]:
+        labels = self.labels
+        for i in range(len(labels)):
+            for j in range(i + 1, len(labels)):
+                yield labels[i], labels[j]
+
+    def __len__(self) -> int:
+        return len(self.labels) * (len(self.labels) - 1) // 2
+
+    def matrix(self, metric: str) -> Any:
+        """
+        Absolute differences in one numeric metric between every pair of mixes.
+
+        Entry ``[i][j]`` compares the i-th and j-th mix; it is NaN if either
+        has no value. Computed once per metric and cached.
+
+        Args:
+            metric: One of ``NUMERIC_METRICS``, e.g. "integrated_loudness_lufs".
+
+        Returns:
+            numpy.ndarray: An N x N ``float64`` array when NumPy is installed
+            (``pip install "roex-python[audio]"``), otherwise a list of N lists.
+
+        Raises:
+            KeyError: If *metric* is not a numeric metric.
+        """
+        matrix = self._matrices.get(metric)
+        if matrix is None:
+            values = self._numeric[metric]
+            if np is not None:
+                column = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+                matrix = np.abs(column[:, np.newaxis] - column[np.newaxis, :])
+            else:
+                matrix = [[abs(a - b) if a is not None and b is not None else float("nan") for b in values]
+                          for a in values]
+            self._matrices[metric] = matrix
+        return matrix
+
+    def _pair(self, i: int, j: int) -> Dict[str, Any]:
+        """The ``compare_mixes`` differences dict for mixes *i* and *j*."""
+        metrics_a, metrics_b = self._metrics[i], self._metrics[j]
+        differences: Dict[str, Any] = {}
+        # Compare numeric values
+        for key, values in self._numeric.items():
+            val_a, val_b = values[i], values[j]
+            if val_a is None or val_b is None:
+                differences[key] = "N/A"
+            else:
+                differences[key] = {
+                    "difference": abs(val_a - val_b),
+                    "mix_a_value": val_a,
+                    "mix_b_value": val_b
+                }
+        # Compare categorical values
+        for key in CATEGORICAL_METRICS:
+            differences[key] = _status(metrics_a.get(key), metrics_b.get(key))
+        # Compare tonal profiles
+        tonal_a = metrics_a.get("tonal_profile") or {}
+        tonal_b = metrics_b.get("tonal_profile") or {}
+        differences["tonal_profile"] = {band: _status(tonal_a.get(band), tonal_b.get(band)) for band in TONAL_BANDS}
+        return differences
+
+
+def _status(val_a: Any, val_b: Any) -> Dict[str, Any]:
+    """Equality comparison of a categorical value."""
+    return {
+        "status": "SAME" if val_a == val_b else "DIFFERENT",
+        "mix_a_value": val_a,
+        "mix_b_value": val_b
+    }
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """*value* as a float, or None for "N/A" and other non-numeric values."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
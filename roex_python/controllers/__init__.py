@@ -8,6 +8,14 @@ from roex_python.controllers.analysis_controller import AnalysisController
 from roex_python.controllers.enhance_controller import EnhanceController
 from roex_python.controllers.upload_controller import UploadController
 from roex_python.controllers.audio_cleanup_controller import AudioCleanupController
+from roex_python.controllers.async_controllers import (
+    AsyncMixController,
+    AsyncMasteringController,
+    AsyncAnalysisController,
+    AsyncEnhanceController,
+    AsyncUploadController,
+    AsyncAudioCleanupController
+)
 
 __all__ = [
     "MixController",
@@ -15,5 +23,11 @@ __all__ = [
     "AnalysisController",
     "EnhanceController",
     "UploadController",
-    "AudioCleanupController"
+    "AudioCleanupController",
+    "AsyncMixController",
+    "AsyncMasteringController",
+    "AsyncAnalysisController",
+    "AsyncEnhanceController",
+    "AsyncUploadController",
+    "AsyncAudioCleanupController"
 ]
\ No newline at end of file
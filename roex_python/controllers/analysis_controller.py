@@ -2,12 +2,25 @@
 Controller for mix/master analysis operations
 """
 
-from typing import Dict, Any, List
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence
 
-import requests
 import logging
 
-from roex_python.models.analysis import AnalysisMusicalStyle, AnalysisResult, MixAnalysisRequest
+from roex_python.analysis_cache import AnalysisCache
+from roex_python.analysis_table import AnalysisTable
+from roex_python.comparison import PairwiseDifferences
+
+from roex_python.exceptions import RoExApiError
+from roex_python.models.analysis import (
+    PRODUCTION_METRICS,
+    AnalysisBatchItem,
+    AnalysisMusicalStyle,
+    AnalysisResult,
+    MixAnalysisRequest
+)
 from roex_python.providers.api_provider import ApiProvider
 
 # Initialize logger for this module
@@ -16,7 +29,7 @@ logger = logging.getLogger(__name__)
 class AnalysisController:
     """Controller for submitting audio tracks for analysis and comparison via the RoEx API."""
 
-    def __init__(self, api_provider: ApiProvider):
+    def __init__(self, api_provider: ApiProvider, cache: Optional[AnalysisCache] = None):
         """
         Initialize the AnalysisController.
 
@@ -26,20 +39,31 @@ class AnalysisController:
         Args:
             api_provider (ApiProvider): An instance of ApiProvider configured with
                 the base URL and API key.
+            cache (AnalysisCache, optional): Cache consulted by ``analyze_mix``
+                (and so by every comparison and batch) before calling the API.
+                Any object with ``get(key)`` and ``put(key, result)`` methods
+                works. Defaults to None (no caching).
         """
         self.api_provider = api_provider
+        self.cache = cache
         logger.info("AnalysisController initialized.")
 
-    def analyze_mix(self, request: MixAnalysisRequest) -> AnalysisResult:
+    def analyze_mix(self, request: MixAnalysisRequest, content_hash: Optional[str] = None) -> AnalysisResult:
         """
         Analyze a single mix or master track to retrieve detailed metrics.
 
         Sends the track URL and analysis parameters to ``/mixanalysis`` and
-        returns the results synchronously.
+        returns the results synchronously. If the controller has a cache, a
+        cached result for the same audio, musical style and ``is_master`` flag
+        is returned instead of calling the API.
 
         Args:
             request (MixAnalysisRequest): The track URL, musical style reference,
                 and ``is_master`` flag.
+            content_hash (str, optional): SHA-256 of the audio, e.g. from
+                ``UploadCache.hash_file``. With a cache, results are then shared
+                by every URL the same audio was uploaded to; without it they
+                are cached by URL.
 
         Returns:
             AnalysisResult: A typed result containing:
@@ -52,45 +76,125 @@ class AnalysisController:
                 - ``completion_time`` (str): When the analysis finished.
 
         Raises:
-            Exception: If the API returns an error response.
+            RoExApiError: If the API returns an error status.
 
         Example:
             >>> result = client.analysis.analyze_mix(request)
             >>> print(result.payload.get("integrated_loudness_lufs"))
         """
         logger.info(f"Analyzing mix with parameters: {request}")
-        payload = {
-            "mixDiagnosisData": {
-                "audioFileLocation": request.audio_file_location,
-                "musicalStyle": request.musical_style.value,
-                "isMaster": request.is_master
-            }
-        }
+        cache_key = None
+        if self.cache is not None:
+            cache_key = AnalysisCache.key(request, self.api_provider.base_url, content_hash)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("Analysis results served from cache.")
+                return cached
+        payload = self._prepare_analysis_payload(request)
 
         try:
             logger.debug(f"Sending analysis request to API: {payload}")
             response = self.api_provider.post("/mixanalysis", payload)
-            raw = response.get("mixDiagnosisResults", response)
             logger.info("Analysis results received successfully.")
-            return AnalysisResult(
-                payload=raw.get("payload"),
-                error=raw.get("error", False),
-                info=raw.get("info", ""),
-                completion_time=raw.get("completion_time", ""),
-            )
-        except requests.HTTPError as e:
-            logger.error(f"Failed to analyze mix: {str(e)}")
-            raise Exception(f"Failed to analyze mix: {str(e)}")
+            result = self._parse_analysis_result(response)
+            if cache_key is not None:
+                self.cache.put(cache_key, result)
+            return result
+        except RoExApiError as e:
+            logger.error(f"API error analyzing mix: {e}")
+            raise
         except Exception as e:
             logger.exception(f"Unexpected error analyzing mix: {e}")
             raise
 
+    def analyze_batch(self, requests: Iterable[MixAnalysisRequest], max_in_flight: int = 8,
+                      table: Optional[AnalysisTable] = None) -> Iterator[AnalysisBatchItem]:
+        """
+        Analyze many tracks concurrently, yielding each result as it completes.
+
+        At most *max_in_flight* analyses run at once, and *requests* is read
+        lazily, only as slots free up, so a generator over a catalogue of
+        tens of thousands of tracks is never held in memory. Results are
+        yielded in completion order, not request order; use
+        ``AnalysisBatchItem.index`` to match them up. Errors are reported per
+        request in ``AnalysisBatchItem.error`` and never stop the batch.
+
+        Stopping iteration early cancels analyses that have not started yet;
+        analyses already in progress are finished first.
+
+        Args:
+            requests: The analysis requests; any iterable, including a generator.
+            max_in_flight: Maximum number of analyses running concurrently. Defaults to 8.
+            table: An ``AnalysisTable`` to append the metrics of each successful
+                analysis to, keyed by its ``audio_file_location``.
+
+        Returns:
+            Iterator[AnalysisBatchItem]: One item per request, with its index,
+            result or error, and timing.
+
+        Raises:
+            ValueError: If *max_in_flight* is less than 1.
+
+        Example:
+            >>> table = AnalysisTable()
+            >>> requests = (MixAnalysisRequest(url, AnalysisMusicalStyle.POP, True) for url in catalogue)
+            >>> for item in client.analysis.analyze_batch(requests, max_in_flight=16, table=table):
+            >>>     if not item.ok:
+            >>>         print(f"{item.request.audio_file_location} failed: {item.error or item.result.info}")
+            >>> table.to_parquet("catalogue.parquet")
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        logger.info(f"Analyzing batch, {max_in_flight} at a time")
+        return self._iter_analysis_batch(iter(requests), max_in_flight, table)
+
+    def _iter_analysis_batch(self, requests: Iterator[MixAnalysisRequest], max_in_flight: int,
+                             table: Optional[AnalysisTable]) -> Iterator[AnalysisBatchItem]:
+        """Generator behind ``analyze_batch``."""
+        pool = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="roex-analysis")
+        numbered = enumerate(requests)
+        pending = set()
+        completed = 0
+        try:
+            while True:
+                # Top up the window from the (possibly lazy) request iterator
+                for index, request in itertools.islice(numbered, max_in_flight - len(pending)):
+                    pending.add(pool.submit(self._analyze_batch_item, index, request))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = future.result()
+                    if table is not None and item.ok:
+                        table.add(item.request.audio_file_location, item.result)
+                    completed += 1
+                    yield item
+        finally:
+            # Only reached early if the caller stopped iterating; drop analyses not yet started
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+            logger.info(f"Analysis batch finished after {completed} results")
+
+    def _analyze_batch_item(self, index: int, request: MixAnalysisRequest) -> AnalysisBatchItem:
+        """Analyze one request of a batch, capturing any error."""
+        item = AnalysisBatchItem(index=index, request=request)
+        started = time.monotonic()
+        try:
+            item.result = self.analyze_mix(request)
+        except Exception as e:
+            item.error = f"Analysis failed: {e}"
+            logger.error(f"Error analyzing {request.audio_file_location}: {e}")
+        item.seconds = time.monotonic() - started
+        return item
+
     def compare_mixes(self, mix_a_url: str, mix_b_url: str,
                       musical_style: AnalysisMusicalStyle, is_master: bool = False) -> Dict[str, Any]:
         """
         Analyze two mixes and provide a comparison of their key metrics.
 
-        Calls ``analyze_mix`` for both URLs and computes per-metric differences.
+        Runs ``analyze_mix`` for both URLs concurrently, so the comparison takes
+        about as long as a single analysis, and computes per-metric differences.
 
         Args:
             mix_a_url (str): URL of the first mix (accessible WAV/FLAC).
@@ -109,43 +213,106 @@ class AnalysisController:
             >>> print(comparison["differences"]["integrated_loudness_lufs"])
         """
         logger.info(f"Comparing mixes: {mix_a_url} and {mix_b_url} with musical style: {musical_style}")
-        request_a = MixAnalysisRequest(
-            audio_file_location=mix_a_url,
-            musical_style=musical_style,
-            is_master=is_master
-        )
+        results_a, results_b = self._analyze_concurrently([mix_a_url, mix_b_url], musical_style, is_master,
+                                                          max_workers=2)
 
-        request_b = MixAnalysisRequest(
-            audio_file_location=mix_b_url,
-            musical_style=musical_style,
-            is_master=is_master
-        )
+        comparison = self._build_comparison(results_a, results_b)
 
-        results_a = self.analyze_mix(request_a)
-        results_b = self.analyze_mix(request_b)
+        logger.info("Comparison results generated successfully.")
+        return comparison
 
-        comparison = {
-            "mix_a": self._extract_metrics(results_a),
-            "mix_b": self._extract_metrics(results_b),
-            "differences": self._compare_metrics(results_a, results_b)
-        }
+    def compare_many(self, urls: Sequence[str], musical_style: AnalysisMusicalStyle, is_master: bool = False,
+                     max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Analyze several mixes concurrently and compare every pair.
 
+        The analyses run on a pool of at most *max_workers* threads. Each
+        mix's metrics are then extracted once. The differences for a pair, in
+        the same format as ``compare_mixes``, are built when that pair is
+        looked up, and ``differences.matrix(metric)`` gives one numeric
+        metric for every pair at once as an N x N array.
+
+        Args:
+            urls (Sequence[str]): URLs of the mixes to compare (accessible WAV/FLAC), at least two.
+            musical_style (AnalysisMusicalStyle): Musical style reference for analysis.
+            is_master (bool): Whether to analyze as mastered tracks. Defaults to False.
+            max_workers (int): Maximum number of analyses in flight. Defaults to 8.
+
+        Returns:
+            Dict[str, Any]: ``{"mixes": {url: {...}}, "differences": PairwiseDifferences}``.
+            ``differences`` maps each pair ``(url_a, url_b)``, with ``url_a``
+            coming before ``url_b`` in *urls*, to its differences;
+            ``mix_a_value`` refers to ``url_a``.
+
+        Raises:
+            ValueError: If fewer than two URLs are given, a URL is repeated, or max_workers is less than 1.
+            Exception: If any underlying ``analyze_mix`` call fails.
+
+        Example:
+            >>> comparison = client.analysis.compare_many([url_a, url_b, url_c], AnalysisMusicalStyle.POP)
+            >>> print(comparison["differences"][(url_a, url_c)]["integrated_loudness_lufs"])
+        """
+        urls = list(urls)
+        if len(urls) < 2:
+            raise ValueError("compare_many needs at least two URLs.")
+        if len(set(urls)) != len(urls):
+            raise ValueError("compare_many URLs must be unique.")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        logger.info(f"Comparing {len(urls)} mixes with musical style: {musical_style}")
+        results = self._analyze_concurrently(urls, musical_style, is_master, max_workers)
+        comparison = self._build_many_comparison(urls, results)
         logger.info("Comparison results generated successfully.")
         return comparison
 
-    def _extract_metrics(self, diagnosis: AnalysisResult) -> Dict[str, Any]:
+    def _analyze_concurrently(self, urls: Sequence[str], musical_style: AnalysisMusicalStyle, is_master: bool,
+                              max_workers: int) -> List[AnalysisResult]:
+        """Run ``analyze_mix`` for each URL on a thread pool, returning results in order."""
+        analysis_requests = [MixAnalysisRequest(audio_file_location=url, musical_style=musical_style,
+                                                is_master=is_master) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(analysis_requests)),
+                                thread_name_prefix="roex-analysis") as pool:
+            return list(pool.map(self.analyze_mix, analysis_requests))
+
+    @staticmethod
+    def _prepare_analysis_payload(request: MixAnalysisRequest) -> Dict[str, Any]:
+        """Convert a MixAnalysisRequest to the ``/mixanalysis`` API payload."""
+        return {
+            "mixDiagnosisData": {
+                "audioFileLocation": request.audio_file_location,
+                "musicalStyle": request.musical_style.value,
+                "isMaster": request.is_master
+            }
+        }
+
+    @staticmethod
+    def _parse_analysis_result(response: Dict[str, Any]) -> AnalysisResult:
+        """Convert a ``/mixanalysis`` response into an AnalysisResult."""
+        raw = response.get("mixDiagnosisResults", response)
+        return AnalysisResult(
+            payload=raw.get("payload"),
+            error=raw.get("error", False),
+            info=raw.get("info", ""),
+            completion_time=raw.get("completion_time", ""),
+        )
+
+    @staticmethod
+    def _build_comparison(results_a: AnalysisResult, results_b: AnalysisResult) -> Dict[str, Any]:
+        """Assemble the ``compare_mixes`` output from two AnalysisResults."""
+        return {
+            "mix_a": AnalysisController._extract_metrics(results_a),
+            "mix_b": AnalysisController._extract_metrics(results_b),
+            "differences": AnalysisController._compare_metrics(results_a, results_b)
+        }
+
+    @staticmethod
+    def _extract_metrics(diagnosis: AnalysisResult) -> Dict[str, Any]:
         """Extract key metrics from an AnalysisResult."""
         logger.debug(f"Extracting metrics from diagnosis results: {diagnosis}")
         payload = diagnosis.payload or {}
 
         # Extract production metrics
-        production_keys = [
-            "bit_depth", "clipping", "if_master_drc", "if_master_loudness",
-            "if_mix_drc", "if_mix_loudness", "integrated_loudness_lufs", "mix_style",
-            "mono_compatible", "musical_style", "peak_loudness_dbfs", "phase_issues",
-            "sample_rate", "stereo_field"
-        ]
-        metrics = {key: payload.get(key, "N/A") for key in production_keys}
+        metrics = {key: payload.get(key, "N/A") for key in PRODUCTION_METRICS}
 
         # Add tonal profile
         metrics["tonal_profile"] = payload.get("tonal_profile", {})
@@ -153,54 +320,20 @@ class AnalysisController:
         logger.info("Metrics extracted successfully.")
         return metrics
 
-    def _compare_metrics(self, results_a: AnalysisResult, results_b: AnalysisResult) -> Dict[str, Any]:
+    @staticmethod
+    def _build_many_comparison(urls: Sequence[str], results: Sequence[AnalysisResult]) -> Dict[str, Any]:
+        """Assemble the ``compare_many`` output from AnalysisResults in the order of *urls*."""
+        metrics = [AnalysisController._extract_metrics(result) for result in results]
+        return {
+            "mixes": dict(zip(urls, metrics)),
+            "differences": PairwiseDifferences(urls, metrics)
+        }
+
+    @staticmethod
+    def _compare_metrics(results_a: AnalysisResult, results_b: AnalysisResult) -> Dict[str, Any]:
         """Compare metrics between two AnalysisResult objects."""
         logger.info("Comparing metrics between two analysis results.")
-        metrics_a = self._extract_metrics(results_a)
-        metrics_b = self._extract_metrics(results_b)
-
-        differences = {}
-
-        # Compare numeric values
-        numeric_keys = ["integrated_loudness_lufs", "peak_loudness_dbfs", "bit_depth", "sample_rate"]
-        for key in numeric_keys:
-            try:
-                val_a = float(metrics_a.get(key, 0))
-                val_b = float(metrics_b.get(key, 0))
-                differences[key] = {
-                    "difference": abs(val_a - val_b),
-                    "mix_a_value": val_a,
-                    "mix_b_value": val_b
-                }
-            except (ValueError, TypeError):
-                differences[key] = "N/A"
-
-        # Compare categorical values
-        categorical_keys = ["clipping", "if_master_drc", "if_master_loudness", "stereo_field"]
-        for key in categorical_keys:
-            val_a = metrics_a.get(key)
-            val_b = metrics_b.get(key)
-            differences[key] = {
-                "status": "SAME" if val_a == val_b else "DIFFERENT",
-                "mix_a_value": val_a,
-                "mix_b_value": val_b
-            }
-
-        # Compare tonal profiles
-        tonal_a = metrics_a.get("tonal_profile", {})
-        tonal_b = metrics_b.get("tonal_profile", {})
-        tonal_diff = {}
-
-        for freq in ["bass_frequency", "low_mid_frequency", "high_mid_frequency", "high_frequency"]:
-            val_a = tonal_a.get(freq)
-            val_b = tonal_b.get(freq)
-            tonal_diff[freq] = {
-                "status": "SAME" if val_a == val_b else "DIFFERENT",
-                "mix_a_value": val_a,
-                "mix_b_value": val_b
-            }
-
-        differences["tonal_profile"] = tonal_diff
-
+        metrics = [AnalysisController._extract_metrics(results_a), AnalysisController._extract_metrics(results_b)]
+        differences = PairwiseDifferences(("mix_a", "mix_b"), metrics)[("mix_a", "mix_b")]
         logger.info("Metrics comparison completed successfully.")
-        return differences
\ No newline at end of file
+        return differences
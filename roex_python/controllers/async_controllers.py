@@ -0,0 +1,371 @@
+"""
+Asyncio controllers mirroring the synchronous controllers.
+
+Each controller reuses the payload builders and response parsers of its
+synchronous counterpart, so the request/response shapes stay identical; only
+the transport (``AsyncApiProvider``) and the polling sleeps (``TaskPoller.apoll``
+uses ``asyncio.sleep``) differ.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Sequence
+
+from roex_python.controllers.analysis_controller import AnalysisController
+from roex_python.controllers.audio_cleanup_controller import AudioCleanupController
+from roex_python.controllers.enhance_controller import EnhanceController
+from roex_python.controllers.mastering_controller import MasteringController
+from roex_python.controllers.mix_controller import MixController
+from roex_python.controllers.upload_controller import UploadController
+from roex_python.deadline import Deadline
+from roex_python.models.analysis import AnalysisMusicalStyle, AnalysisResult, MixAnalysisRequest
+from roex_python.models.audio_cleanup import AudioCleanupBatchItem, AudioCleanupData, AudioCleanupResponse
+from roex_python.models.enhance import EnhancedTrackResult, MixEnhanceRequest, MixEnhanceResponse
+from roex_python.models.mastering import (
+    FinalMasterResult,
+    MasteringRequest,
+    MasteringTaskResponse,
+    PreviewMasterResult
+)
+from roex_python.models.mixing import (
+    FinalMixRequest,
+    FinalMixRequestAdvanced,
+    FinalMixResult,
+    MultitrackMixRequest,
+    MultitrackTaskResponse,
+    PreviewMixResult
+)
+from roex_python.models.upload import UploadUrlRequest, UploadUrlResponse
+from roex_python.polling import PollPolicy, TaskPoller
+from roex_python.providers.async_api_provider import AsyncApiProvider
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+
+class AsyncMixController:
+    """Asyncio controller for multitrack mixing operations. Mirrors ``MixController``."""
+
+    def __init__(self, api_provider: AsyncApiProvider):
+        """
+        Initialize the AsyncMixController.
+
+        Args:
+            api_provider (AsyncApiProvider): The shared async provider.
+        """
+        self.api_provider = api_provider
+        logger.info("AsyncMixController initialized.")
+
+    async def create_mix_preview(self, request: MultitrackMixRequest) -> MultitrackTaskResponse:
+        """Initiate a multitrack mix preview task. See ``MixController.create_mix_preview``."""
+        logger.info("Creating mix preview")
+        payload = MixController._prepare_mix_preview_payload(request)
+        response = await self.api_provider.post("/mixpreview", payload)
+        logger.info(f"Mix preview created successfully. Task ID: {response.get('multitrack_task_id', '')}")
+        return MixController._parse_task_response(response)
+
+    async def retrieve_preview_mix(self, task_id: str, retrieve_fx_settings: bool = False,
+                                   max_attempts: Optional[int] = None, poll_interval: Optional[float] = None,
+                                   timeout: Optional[float] = None,
+                                   poll_policy: Optional[PollPolicy] = None) -> PreviewMixResult:
+        """
+        Poll for a mix preview without blocking the event loop.
+
+        See ``MixController.retrieve_preview_mix``.
+
+        Raises:
+            RoExTimeoutError: If the task does not complete within *max_attempts*
+                polls or *timeout* seconds.
+            RoExTaskError: If the API reports that the mix task failed.
+        """
+        logger.info(f"Retrieving preview mix for task ID: {task_id}")
+        payload = MixController._prepare_retrieve_preview_payload(task_id, retrieve_fx_settings)
+        policy = PollPolicy.resolve(poll_policy, max_attempts, poll_interval, timeout)
+        return await TaskPoller(policy).apoll(
+            self.api_provider.post, "/retrievepreviewmix", payload, MixController._check_preview_mix,
+            task_id=task_id, is_failed=MixController._is_preview_mix_failed
+        )
+
+    async def retrieve_final_mix(self, request: FinalMixRequest) -> FinalMixResult:
+        """Retrieve the final mix. See ``MixController.retrieve_final_mix``."""
+        logger.info(f"Retrieving final mix for task ID: {request.multitrack_task_id}")
+        payload = MixController._prepare_final_mix_payload(request)
+        response = await self.api_provider.post("/retrievefinalmix", payload)
+        return MixController._parse_final_mix_result(response)
+
+    async def retrieve_final_mix_advanced(self, request: FinalMixRequestAdvanced) -> FinalMixResult:
+        """Retrieve the final mix with audio effects. See ``MixController.retrieve_final_mix_advanced``."""
+        logger.info(f"Retrieving advanced final mix for task ID: {request.multitrack_task_id}")
+        payload = MixController._prepare_advanced_final_mix_payload(request)
+        response = await self.api_provider.post("/retrievefinalmix", payload)
+        return MixController._parse_final_mix_result(response)
+
+
+class AsyncMasteringController:
+    """Asyncio controller for mastering operations. Mirrors ``MasteringController``."""
+
+    def __init__(self, api_provider: AsyncApiProvider):
+        """
+        Initialize the AsyncMasteringController.
+
+        Args:
+            api_provider (AsyncApiProvider): The shared async provider.
+        """
+        self.api_provider = api_provider
+        logger.info("AsyncMasteringController initialized.")
+
+    async def create_mastering_preview(self, request: MasteringRequest) -> MasteringTaskResponse:
+        """Initiate a mastering preview task. See ``MasteringController.create_mastering_preview``."""
+        logger.info("Creating mastering preview")
+        payload = MasteringController._prepare_mastering_payload(request)
+        response = await self.api_provider.post("/masteringpreview", payload)
+        logger.info(f"Mastering preview task created successfully. Task ID: {response.get('mastering_task_id', '')}")
+        return MasteringTaskResponse(
+            mastering_task_id=response.get("mastering_task_id", "")
+        )
+
+    async def retrieve_preview_master(self, task_id: str, max_attempts: Optional[int] = None,
+                                      poll_interval: Optional[float] = None, timeout: Optional[float] = None,
+                                      poll_policy: Optional[PollPolicy] = None) -> PreviewMasterResult:
+        """
+        Poll for a mastering preview without blocking the event loop.
+
+        See ``MasteringController.retrieve_preview_master``.
+
+        Raises:
+            RoExTimeoutError: If the task does not complete within *max_attempts*
+                polls or *timeout* seconds.
+            RoExTaskError: If the API reports that the mastering task failed.
+        """
+        logger.info(f"Retrieving preview master for task ID: {task_id}")
+        payload = MasteringController._prepare_task_payload(task_id)
+        policy = PollPolicy.resolve(poll_policy, max_attempts, poll_interval, timeout)
+        return await TaskPoller(policy).apoll(
+            self.api_provider.post, "/retrievepreviewmaster", payload, MasteringController._check_preview_master,
+            task_id=task_id, is_failed=MasteringController._is_preview_master_failed
+        )
+
+    async def retrieve_final_master(self, task_id: str, timeout: Optional[float] = None) -> FinalMasterResult:
+        """Retrieve the final master. See ``MasteringController.retrieve_final_master``."""
+        logger.info(f"Retrieving final master for task ID: {task_id}")
+        payload = MasteringController._prepare_task_payload(task_id)
+        deadline = None if timeout is None else Deadline(timeout)
+        response = await self.api_provider.post("/retrievefinalmaster", payload, deadline=deadline)
+        return MasteringController._parse_final_master_result(task_id, response)
+
+
+class AsyncAnalysisController:
+    """Asyncio controller for mix/master analysis. Mirrors ``AnalysisController``."""
+
+    def __init__(self, api_provider: AsyncApiProvider):
+        """
+        Initialize the AsyncAnalysisController.
+
+        Args:
+            api_provider (AsyncApiProvider): The shared async provider.
+        """
+        self.api_provider = api_provider
+        logger.info("AsyncAnalysisController initialized.")
+
+    async def analyze_mix(self, request: MixAnalysisRequest) -> AnalysisResult:
+        """Analyze a single mix or master. See ``AnalysisController.analyze_mix``."""
+        logger.info(f"Analyzing mix with parameters: {request}")
+        payload = AnalysisController._prepare_analysis_payload(request)
+        response = await self.api_provider.post("/mixanalysis", payload)
+        logger.info("Analysis results received successfully.")
+        return AnalysisController._parse_analysis_result(response)
+
+    async def compare_mixes(self, mix_a_url: str, mix_b_url: str,
+                            musical_style: AnalysisMusicalStyle, is_master: bool = False) -> Dict[str, Any]:
+        """
+        Analyze two mixes concurrently and compare their key metrics.
+
+        See ``AnalysisController.compare_mixes``.
+        """
+        logger.info(f"Comparing mixes: {mix_a_url} and {mix_b_url} with musical style: {musical_style}")
+        results_a, results_b = await asyncio.gather(
+            self.analyze_mix(MixAnalysisRequest(mix_a_url, musical_style, is_master)),
+            self.analyze_mix(MixAnalysisRequest(mix_b_url, musical_style, is_master)),
+        )
+        return AnalysisController._build_comparison(results_a, results_b)
+
+    async def compare_many(self, urls: Sequence[str], musical_style: AnalysisMusicalStyle, is_master: bool = False,
+                           max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Analyze several mixes concurrently, at most *max_workers* at a time, and compare every pair.
+
+        See ``AnalysisController.compare_many``.
+        """
+        urls = list(urls)
+        if len(urls) < 2:
+            raise ValueError("compare_many needs at least two URLs.")
+        if len(set(urls)) != len(urls):
+            raise ValueError("compare_many URLs must be unique.")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        logger.info(f"Comparing {len(urls)} mixes with musical style: {musical_style}")
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def analyze(url: str) -> AnalysisResult:
+            async with semaphore:
+                return await self.analyze_mix(MixAnalysisRequest(url, musical_style, is_master))
+
+        results = await asyncio.gather(*(analyze(url) for url in urls))
+        return AnalysisController._build_many_comparison(urls, results)
+
+
+class AsyncEnhanceController:
+    """Asyncio controller for mix enhancement. Mirrors ``EnhanceController``."""
+
+    def __init__(self, api_provider: AsyncApiProvider):
+        """
+        Initialize the AsyncEnhanceController.
+
+        Args:
+            api_provider (AsyncApiProvider): The shared async provider.
+        """
+        self.api_provider = api_provider
+        logger.info("AsyncEnhanceController initialized.")
+
+    async def create_mix_enhance_preview(self, request: MixEnhanceRequest) -> MixEnhanceResponse:
+        """Initiate a mix enhancement preview. See ``EnhanceController.create_mix_enhance_preview``."""
+        logger.info("Initiating mix enhancement preview.")
+        payload = EnhanceController._prepare_mix_enhance_payload(request)
+        response = await self.api_provider.post("/mixenhancepreview", payload)
+        return EnhanceController._parse_enhance_response(response)
+
+    async def create_mix_enhance(self, request: MixEnhanceRequest) -> MixEnhanceResponse:
+        """Initiate a full mix enhancement. See ``EnhanceController.create_mix_enhance``."""
+        logger.info("Initiating full mix enhancement.")
+        payload = EnhanceController._prepare_mix_enhance_payload(request)
+        response = await self.api_provider.post("/mixenhance", payload)
+        return EnhanceController._parse_enhance_response(response)
+
+    async def retrieve_enhanced_track(self, task_id: str, poll_interval: Optional[float] = None,
+                                      timeout: float = 600,
+                                      poll_policy: Optional[PollPolicy] = None) -> EnhancedTrackResult:
+        """
+        Poll for an enhanced track without blocking the event loop.
+
+        See ``EnhanceController.retrieve_enhanced_track``.
+
+        Raises:
+            RoExTimeoutError: If the task does not complete within *timeout* seconds.
+            RoExTaskError: If the API reports that the enhancement task failed.
+        """
+        logger.info(f"Attempting to retrieve results for task ID: {task_id}")
+        payload = EnhanceController._prepare_retrieve_payload(task_id)
+        max_attempts = int(timeout // poll_interval) if poll_interval else None
+        if poll_interval is None and poll_policy is None:
+            poll_policy = PollPolicy(max_attempts=None, timeout=timeout)
+        policy = PollPolicy.resolve(poll_policy, max_attempts, poll_interval, timeout)
+        return await TaskPoller(policy).apoll(
+            self.api_provider.post, "/retrieveenhancedtrack", payload, EnhanceController._check_enhanced_track,
+            task_id=task_id, is_failed=EnhanceController._is_enhanced_track_failed
+        )
+
+class AsyncAudioCleanupController:
+    """Asyncio controller for audio cleanup. Mirrors ``AudioCleanupController``."""
+
+    def __init__(self, api_provider: AsyncApiProvider):
+        """
+        Initialize the AsyncAudioCleanupController.
+
+        Args:
+            api_provider (AsyncApiProvider): The shared async provider.
+        """
+        self.api_provider = api_provider
+        logger.info("AsyncAudioCleanupController initialized.")
+
+    async def clean_up_audio(self, audio_cleanup_data: AudioCleanupData) -> Optional[AudioCleanupResponse]:
+        """
+        Submit an audio track for cleanup. See ``AudioCleanupController.clean_up_audio``.
+
+        Like the synchronous method, returns None if the request fails.
+        """
+        logger.info("Starting audio cleanup operation.")
+        payload = AudioCleanupController._prepare_cleanup_payload(audio_cleanup_data)
+        try:
+            response = await self.api_provider.post("/audio-cleanup", payload)
+            return AudioCleanupController._parse_cleanup_response(response)
+        except Exception as e:
+            logger.exception(f"Exception during audio cleanup operation: {e}")
+            return None
+
+    def clean_up_batch(self, requests: Iterable[AudioCleanupData],
+                       max_in_flight: int = 8) -> AsyncIterator[AudioCleanupBatchItem]:
+        """
+        Clean up many tracks concurrently, yielding each result as it completes.
+
+        See ``AudioCleanupController.clean_up_batch``. Use with ``async for``;
+        leaving the loop early cancels the requests still in flight.
+
+        Raises:
+            ValueError: If *max_in_flight* is less than 1.
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        logger.info(f"Cleaning up batch, {max_in_flight} at a time")
+        return self._iter_cleanup_batch(iter(requests), max_in_flight)
+
+    async def _iter_cleanup_batch(self, requests: Iterator[AudioCleanupData],
+                                  max_in_flight: int) -> AsyncIterator[AudioCleanupBatchItem]:
+        """Async generator behind ``clean_up_batch``."""
+        numbered = enumerate(requests)
+        pending = set()
+        completed = 0
+        try:
+            while True:
+                for index, request in itertools.islice(numbered, max_in_flight - len(pending)):
+                    pending.add(asyncio.ensure_future(self._clean_up_batch_item(index, request)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    completed += 1
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            logger.info(f"Audio cleanup batch finished after {completed} results")
+
+    async def _clean_up_batch_item(self, index: int, request: AudioCleanupData) -> AudioCleanupBatchItem:
+        """Clean up one request of a batch, capturing any error."""
+        item = AudioCleanupBatchItem(index=index, request=request)
+        started = time.monotonic()
+        try:
+            response = await self.api_provider.post("/audio-cleanup",
+                                                     AudioCleanupController._prepare_cleanup_payload(request))
+            item.response = AudioCleanupController._parse_cleanup_response(response)
+            item.error = AudioCleanupController._check_cleanup_response(item.response)
+        except Exception as e:
+            item.error = e
+        item.seconds = time.monotonic() - started
+        if item.error is not None:
+            logger.error(f"Error cleaning up {request.audio_file_location}: {item.error}")
+        return item
+
+
+class AsyncUploadController:
+    """Asyncio controller for obtaining upload URLs. Mirrors ``UploadController``."""
+
+    def __init__(self, api_provider: AsyncApiProvider):
+        """
+        Initialize the AsyncUploadController.
+
+        Args:
+            api_provider (AsyncApiProvider): The shared async provider.
+        """
+        self.api_provider = api_provider
+        logger.info("AsyncUploadController initialized.")
+
+    async def get_upload_url(self, request: UploadUrlRequest) -> UploadUrlResponse:
+        """Get a pre-signed upload URL. See ``UploadController.get_upload_url``."""
+        logger.info("Requesting upload URL")
+        payload = UploadController._prepare_upload_payload(request)
+        response = await self.api_provider.post("/upload", payload)
+        return UploadController._parse_upload_response(response)
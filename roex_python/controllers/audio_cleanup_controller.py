@@ -1,5 +1,9 @@
-from typing import Dict, Any, Optional
-from ..models.audio_cleanup import AudioCleanupData, AudioCleanupResponse, AudioCleanupResults
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Any, Iterable, Iterator, Optional
+from ..exceptions import RoExTaskError
+from ..models.audio_cleanup import AudioCleanupBatchItem, AudioCleanupData, AudioCleanupResponse, AudioCleanupResults
 from ..providers.api_provider import ApiProvider
 import logging
 
@@ -54,8 +58,8 @@ class AudioCleanupController:
                     - `info` (str): Information specific to the cleanup process.
                     - `cleaned_audio_file_location` (Optional[str]): URL to the cleaned audio file.
 
-                Returns `None` if an exception occurs during the API call.
-                (Note: Consider adapting error handling for more specific feedback).
+                Returns `None` if an exception occurs during the API call. Use
+                `clean_up_batch` (also for a single track) to get the exception itself.
 
         Raises:
             requests.exceptions.RequestException: If the API request fails due to network
@@ -87,35 +91,140 @@ class AudioCleanupController:
         """
         logger.info("Starting audio cleanup operation.")
         logger.debug(f"Audio cleanup request data: {audio_cleanup_data}")
-        payload = {
-            "audioCleanupData": {
-                "audioFileLocation": audio_cleanup_data.audio_file_location,
-                "soundSource": audio_cleanup_data.sound_source.value
-            }
-        }
+        payload = self._prepare_cleanup_payload(audio_cleanup_data)
 
         try:
             response = self.api_provider.post("/audio-cleanup", payload)
             logger.info("Received response from API.")
-            results = None
-            if "audioCleanupResults" in response:
-                results_data = response["audioCleanupResults"]
-                results = AudioCleanupResults(
-                    completion_time=results_data.get("completion_time", ""),
-                    error=results_data.get("error", False),
-                    info=results_data.get("info", ""),
-                    cleaned_audio_file_location=results_data.get("cleaned_audio_file_location")
-                )
-                logger.info("Audio cleanup results retrieved successfully.")
-
-            return AudioCleanupResponse(
-                error=response.get("error", False),
-                message=response.get("message", ""),
-                info=response.get("info", ""),
-                audio_cleanup_results=results
-            )
+            return self._parse_cleanup_response(response)
         except Exception as e:
             logger.exception(f"Exception during audio cleanup operation: {e}")
-            # Current implementation returns None on exception.
-            # Consider re-raising or returning a more informative error response.
+            # Kept for backwards compatibility; clean_up_batch reports the exception instead
             return None
+
+    def clean_up_batch(self, requests: Iterable[AudioCleanupData],
+                       max_in_flight: int = 8) -> Iterator[AudioCleanupBatchItem]:
+        """
+        Clean up many tracks concurrently, yielding each result as it completes.
+
+        Requests may mix files and sound sources freely, e.g. every vocal,
+        guitar and percussion track of a session. At most *max_in_flight*
+        requests run at once, and *requests* is read lazily, only as slots
+        free up. Results are yielded in completion order, not request order;
+        use ``AudioCleanupBatchItem.index`` to match them up.
+
+        Unlike ``clean_up_audio``, failures are not hidden behind ``None``:
+        each item's ``error`` holds the exception the request raised
+        (``RoExApiError`` for an HTTP error status, ``RoExTimeoutError`` or a
+        ``requests`` exception for a timeout or dropped connection), or a
+        ``RoExTaskError`` if the API responded but reported the cleanup as
+        failed. Errors never stop the batch.
+
+        Stopping iteration early cancels requests that have not started yet;
+        requests already in progress are finished first.
+
+        Args:
+            requests: The cleanup requests; any iterable, including a generator.
+            max_in_flight: Maximum number of requests running concurrently. Defaults to 8.
+
+        Returns:
+            Iterator[AudioCleanupBatchItem]: One item per request, with its
+            index, response or error, and latency.
+
+        Raises:
+            ValueError: If *max_in_flight* is less than 1.
+
+        Example:
+            >>> requests = [AudioCleanupData(url, source) for url, source in session_tracks]
+            >>> for item in client.audio_cleanup.clean_up_batch(requests, max_in_flight=10):
+            >>>     if item.ok:
+            >>>         print(f"{item.index}: {item.cleaned_audio_file_location} ({item.seconds:.1f}s)")
+            >>>     else:
+            >>>         print(f"{item.index} failed: {item.error!r}")
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        logger.info(f"Cleaning up batch, {max_in_flight} at a time")
+        return self._iter_cleanup_batch(iter(requests), max_in_flight)
+
+    def _iter_cleanup_batch(self, requests: Iterator[AudioCleanupData],
+                            max_in_flight: int) -> Iterator[AudioCleanupBatchItem]:
+        """Generator behind ``clean_up_batch``."""
+        pool = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="roex-cleanup")
+        numbered = enumerate(requests)
+        pending = set()
+        completed = 0
+        try:
+            while True:
+                # Top up the window from the (possibly lazy) request iterator
+                for index, request in itertools.islice(numbered, max_in_flight - len(pending)):
+                    pending.add(pool.submit(self._clean_up_batch_item, index, request))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    completed += 1
+                    yield future.result()
+        finally:
+            # Only reached early if the caller stopped iterating; drop requests not yet started
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+            logger.info(f"Audio cleanup batch finished after {completed} results")
+
+    def _clean_up_batch_item(self, index: int, request: AudioCleanupData) -> AudioCleanupBatchItem:
+        """Clean up one request of a batch, capturing any error."""
+        item = AudioCleanupBatchItem(index=index, request=request)
+        started = time.monotonic()
+        try:
+            response = self.api_provider.post("/audio-cleanup", self._prepare_cleanup_payload(request))
+            item.response = self._parse_cleanup_response(response)
+            item.error = self._check_cleanup_response(item.response)
+        except Exception as e:
+            item.error = e
+        item.seconds = time.monotonic() - started
+        if item.error is not None:
+            logger.error(f"Error cleaning up {request.audio_file_location}: {item.error}")
+        return item
+
+    @staticmethod
+    def _prepare_cleanup_payload(audio_cleanup_data: AudioCleanupData) -> Dict[str, Any]:
+        """Convert AudioCleanupData to the ``/audio-cleanup`` API payload."""
+        return {
+            "audioCleanupData": {
+                "audioFileLocation": audio_cleanup_data.audio_file_location,
+                "soundSource": audio_cleanup_data.sound_source.value
+            }
+        }
+
+    @staticmethod
+    def _check_cleanup_response(response: AudioCleanupResponse) -> Optional[RoExTaskError]:
+        """A RoExTaskError if *response* reports a failed cleanup or has no cleaned file, else None."""
+        results = response.audio_cleanup_results
+        if response.error:
+            return RoExTaskError(f"Audio cleanup failed: {response.message or response.info}", status="error")
+        if results is None or results.error or not results.cleaned_audio_file_location:
+            info = results.info if results is not None else response.message
+            return RoExTaskError(f"Audio cleanup failed: {info or 'no cleaned audio returned'}", status="error")
+        return None
+
+    @staticmethod
+    def _parse_cleanup_response(response: Dict[str, Any]) -> AudioCleanupResponse:
+        """Convert an ``/audio-cleanup`` response into an AudioCleanupResponse."""
+        results = None
+        if "audioCleanupResults" in response:
+            results_data = response["audioCleanupResults"]
+            results = AudioCleanupResults(
+                completion_time=results_data.get("completion_time", ""),
+                error=results_data.get("error", False),
+                info=results_data.get("info", ""),
+                cleaned_audio_file_location=results_data.get("cleaned_audio_file_location")
+            )
+            logger.info("Audio cleanup results retrieved successfully.")
+
+        return AudioCleanupResponse(
+            error=response.get("error", False),
+            message=response.get("message", ""),
+            info=response.get("info", ""),
+            audio_cleanup_results=results
+        )
@@ -3,14 +3,14 @@ Controller for mix enhancement operations
 """
 
 import os
-import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
 
-import requests
-
+from roex_python.exceptions import RoExApiError, RoExTaskError
 from roex_python.models.enhance import EnhancedTrackResult, MixEnhanceRequest, MixEnhanceResponse
+from roex_python.polling import PollPolicy, TaskPoller, reports_failure
 from roex_python.providers.api_provider import ApiProvider
+from roex_python.scheduler import PollScheduler, TaskHandle
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 class EnhanceController:
     """Controller for initiating and managing mix enhancement (mix revive) tasks via the RoEx API."""
 
-    def __init__(self, api_provider: ApiProvider):
+    def __init__(self, api_provider: ApiProvider, poll_scheduler: Optional[PollScheduler] = None):
         """
         Initialize the EnhanceController.
 
@@ -28,8 +28,12 @@ class EnhanceController:
         Args:
             api_provider (ApiProvider): An instance of ApiProvider configured with
                 the base URL and API key.
+            poll_scheduler (PollScheduler, optional): Scheduler that drives the
+                handles returned by ``submit``. The client passes its shared
+                scheduler; defaults to a new one using *api_provider*.
         """
         self.api_provider = api_provider
+        self.poll_scheduler = poll_scheduler if poll_scheduler is not None else PollScheduler(api_provider)
         logger.info("EnhanceController initialized.")
 
     def create_mix_enhance_preview(self, request: MixEnhanceRequest) -> MixEnhanceResponse:
@@ -61,7 +65,7 @@ class EnhanceController:
 
         Raises:
             requests.exceptions.RequestException: Network or API endpoint errors.
-            Exception: If the API returns an error status code (4xx, 5xx).
+            RoExApiError: If the API returns an error status (4xx, 5xx).
 
         Example:
             >>> from roex_python.models import MixEnhanceRequest, EnhanceMusicalStyle, LoudnessPreference
@@ -90,14 +94,10 @@ class EnhanceController:
         try:
             response = self.api_provider.post("/mixenhancepreview", payload)
             logger.info(f"Mix enhance preview created successfully. Task ID: {response.get('mixrevive_task_id', '')}")
-            return MixEnhanceResponse(
-                mixrevive_task_id=response.get("mixrevive_task_id", ""),
-                error=response.get("error", False),
-                message=response.get("message", "")
-            )
-        except requests.HTTPError as e:
-            logger.error(f"Failed to create mix enhance preview: {str(e)}")
-            raise Exception(f"Failed to create mix enhance preview: {str(e)}")
+            return self._parse_enhance_response(response)
+        except RoExApiError as e:
+            logger.error(f"API error creating mix enhance preview: {e}")
+            raise
         except Exception as e:
             logger.exception(f"Unexpected error creating mix enhance preview: {e}")
             raise
@@ -131,7 +131,7 @@ class EnhanceController:
 
         Raises:
             requests.exceptions.RequestException: Network or API endpoint errors.
-            Exception: If the API returns an error status code (4xx, 5xx).
+            RoExApiError: If the API returns an error status (4xx, 5xx).
 
         Example:
             >>> from roex_python.models import MixEnhanceRequest, EnhanceMusicalStyle
@@ -160,30 +160,31 @@ class EnhanceController:
         try:
             response = self.api_provider.post("/mixenhance", payload)
             logger.info(f"Mix enhance created successfully. Task ID: {response.get('mixrevive_task_id', '')}")
-            return MixEnhanceResponse(
-                mixrevive_task_id=response.get("mixrevive_task_id", ""),
-                error=response.get("error", False),
-                message=response.get("message", "")
-            )
-        except requests.HTTPError as e:
-            logger.error(f"Failed to create mix enhance: {str(e)}")
-            raise Exception(f"Failed to create mix enhance: {str(e)}")
+            return self._parse_enhance_response(response)
+        except RoExApiError as e:
+            logger.error(f"API error creating mix enhance: {e}")
+            raise
         except Exception as e:
             logger.exception(f"Unexpected error creating mix enhance: {e}")
             raise
 
-    def retrieve_enhanced_track(self, task_id: str, poll_interval: int = 5, timeout: int = 600) -> EnhancedTrackResult:
+    def retrieve_enhanced_track(self, task_id: str, poll_interval: Optional[float] = None,
+                                timeout: float = 600, poll_policy: Optional[PollPolicy] = None) -> EnhancedTrackResult:
         """
         Retrieve the results of a mix enhancement task (preview or full).
 
         Polls the ``/retrieveenhancedtrack`` endpoint until results are ready
-        or the *timeout* is reached.
+        or the *timeout* is reached. The first poll is sent immediately and
+        later polls back off geometrically (see ``PollPolicy``).
 
         Args:
             task_id (str): The unique ID of the enhancement task (obtained from
                 ``create_mix_enhance_preview`` or ``create_mix_enhance``).
-            poll_interval (int): Seconds to wait between status checks. Defaults to 5.
-            timeout (int): Maximum seconds to wait for task completion. Defaults to 600 (10 minutes).
+            poll_interval (float, optional): Poll at this fixed interval in seconds
+                instead of backing off.
+            timeout (float): End-to-end deadline in seconds covering every request,
+                retry and polling sleep. Defaults to 600 (10 minutes).
+            poll_policy (PollPolicy, optional): Custom backoff curve.
 
         Returns:
             EnhancedTrackResult: A typed result containing:
@@ -195,8 +196,9 @@ class EnhanceController:
                   the preview clip begins in the original track.
 
         Raises:
-            Exception: If the task does not complete within the specified *timeout*,
-                or the API returns an error during polling.
+            RoExTimeoutError: If the task does not complete within *timeout* seconds.
+            RoExTaskError: If the API reports that the enhancement task failed.
+            RoExApiError: If the API rejects the request (e.g. 401 invalid API key).
 
         Example:
             >>> result = client.enhance.retrieve_enhanced_track(task_id)
@@ -206,42 +208,109 @@ class EnhanceController:
             ...         print(f"{name}: {url}")
         """
         logger.info(f"Attempting to retrieve results for task ID: {task_id}")
-        payload = {
+        payload = self._prepare_retrieve_payload(task_id)
+        # Enhancement is bounded by time rather than by a number of polls
+        max_attempts = int(timeout // poll_interval) if poll_interval else None
+        if poll_interval is None and poll_policy is None:
+            poll_policy = PollPolicy(max_attempts=None, timeout=timeout)
+        policy = PollPolicy.resolve(poll_policy, max_attempts, poll_interval, timeout)
+        return TaskPoller(policy).poll(
+            self.api_provider.post, "/retrieveenhancedtrack", payload, self._check_enhanced_track,
+            task_id=task_id, is_failed=self._is_enhanced_track_failed
+        )
+
+    def submit(self, request: MixEnhanceRequest, timeout: float = 600,
+               poll_policy: Optional[PollPolicy] = None) -> TaskHandle:
+        """
+        Start a full mix enhancement and return immediately with a handle to its result.
+
+        Creates the task with ``create_mix_enhance`` and hands polling to the
+        shared ``PollScheduler`` instead of blocking in ``retrieve_enhanced_track``.
+        If the client has a ``WebhookListener``, the task is resolved by its
+        callback instead.
+
+        Args:
+            request (MixEnhanceRequest): Parameters for the enhancement.
+            timeout (float): End-to-end polling deadline in seconds. Defaults to
+                600 (10 minutes).
+            poll_policy (PollPolicy, optional): Custom backoff curve.
+
+        Returns:
+            TaskHandle: A future whose ``task_id`` is the ``mixrevive_task_id``
+            and whose result is an ``EnhancedTrackResult``, or which raises
+            ``RoExTaskError`` if the API reports that the task failed.
+
+        Raises:
+            RoExApiError: If the API rejects the enhancement request.
+            RoExTaskError: If the API reports an error instead of starting the task.
+
+        Example:
+            >>> handle = client.enhance.submit(enhance_request)
+            >>> print(handle.result(timeout=900).download_url_revived)
+        """
+        request, webhook_url = self.poll_scheduler.attach_webhook(request)
+        task = self.create_mix_enhance(request)
+        if task.error:
+            raise RoExTaskError(f"Mix enhancement was not started: {task.message}", task_id=task.mixrevive_task_id)
+        if poll_policy is None:
+            # Enhancement is bounded by time rather than by a number of polls
+            poll_policy = (self.poll_scheduler.webhook_listener.fallback_policy if webhook_url
+                           else PollPolicy(max_attempts=None, timeout=timeout))
+        return self.poll_scheduler.watch(
+            "/retrieveenhancedtrack", self._prepare_retrieve_payload(task.mixrevive_task_id),
+            self._check_enhanced_track, task_id=task.mixrevive_task_id, is_failed=self._is_enhanced_track_failed,
+            policy=PollPolicy.resolve(poll_policy, timeout=timeout), webhook_url=webhook_url
+        )
+
+    @staticmethod
+    def _parse_enhance_response(response: Dict[str, Any]) -> MixEnhanceResponse:
+        """Convert a ``/mixenhance`` or ``/mixenhancepreview`` response into a MixEnhanceResponse."""
+        return MixEnhanceResponse(
+            mixrevive_task_id=response.get("mixrevive_task_id", ""),
+            error=response.get("error", False),
+            message=response.get("message", "")
+        )
+
+    @staticmethod
+    def _prepare_retrieve_payload(task_id: str) -> Dict[str, Any]:
+        """Build the ``/retrieveenhancedtrack`` payload for a task."""
+        return {
             "mixReviveData": {
                 "mixReviveTaskId": task_id
             }
         }
 
-        for attempt in range(timeout // poll_interval):
-            try:
-                logger.debug(f"Polling attempt {attempt + 1}/{timeout // poll_interval}...")
-                response = self.api_provider.post("/retrieveenhancedtrack", payload)
-
-                if not response.get("error", False):
-                    results = response.get("revivedTrackTaskResults", {})
-                    has_url = (
-                        results.get("download_url_preview_revived")
-                        or results.get("download_url_revived")
-                    )
-                    if results and has_url:
-                        logger.info(f"Enhanced track retrieved successfully for task ID: {task_id}")
-                        return EnhancedTrackResult(
-                            download_url_preview_revived=results.get("download_url_preview_revived"),
-                            download_url_revived=results.get("download_url_revived"),
-                            stems=results.get("stems"),
-                            preview_start_time=results.get("preview_start_time"),
-                        )
-            except requests.HTTPError as e:
-                logger.error(f"Error during polling: {str(e)}")
-            except Exception as e:
-                logger.exception(f"Unexpected error during polling for task ID: {task_id}: {e}")
-
-            time.sleep(poll_interval)
-
-        logger.error(f"Enhanced track was not available after polling for task ID: {task_id}.")
-        raise Exception(f"Enhanced track task {task_id} did not complete after polling for {timeout} seconds.")
-
-    def _prepare_mix_enhance_payload(self, request: MixEnhanceRequest) -> Dict[str, Any]:
+    @staticmethod
+    def _check_enhanced_track(response: Dict[str, Any]) -> Optional[EnhancedTrackResult]:
+        """
+        Inspect a ``/retrieveenhancedtrack`` polling response.
+
+        Returns:
+            The parsed result once a download URL is present, otherwise None.
+        """
+        if response.get("error", False):
+            return None
+        results = response.get("revivedTrackTaskResults", {})
+        has_url = (
+            results.get("download_url_preview_revived")
+            or results.get("download_url_revived")
+        )
+        if not (results and has_url):
+            return None
+        return EnhancedTrackResult(
+            download_url_preview_revived=results.get("download_url_preview_revived"),
+            download_url_revived=results.get("download_url_revived"),
+            stems=results.get("stems"),
+            preview_start_time=results.get("preview_start_time"),
+        )
+
+    @staticmethod
+    def _is_enhanced_track_failed(response: Dict[str, Any]) -> bool:
+        """Return True if a ``/retrieveenhancedtrack`` response reports a failed task."""
+        return reports_failure(response, "revivedTrackTaskResults")
+
+    @staticmethod
+    def _prepare_mix_enhance_payload(request: MixEnhanceRequest) -> Dict[str, Any]:
         """
         Convert the model to API payload for mix enhance
 
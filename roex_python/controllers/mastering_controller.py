@@ -4,19 +4,24 @@ Controller for mastering operations
 
 import os
 import time
-from typing import Dict, Any, List
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
 
 import logging
-import requests
 
+from roex_python.deadline import Deadline
+from roex_python.exceptions import RoExApiError
 from roex_python.models.mastering import (
     AlbumMasteringRequest,
+    AlbumTrackResult,
     FinalMasterResult,
     MasteringRequest,
     MasteringTaskResponse,
     PreviewMasterResult
 )
+from roex_python.polling import PollPolicy, TaskPoller, reports_failure
 from roex_python.providers.api_provider import ApiProvider
+from roex_python.scheduler import PollScheduler, TaskHandle
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
@@ -24,7 +29,7 @@ logger = logging.getLogger(__name__)
 class MasteringController:
     """Controller for managing audio mastering operations via the RoEx API."""
 
-    def __init__(self, api_provider: ApiProvider):
+    def __init__(self, api_provider: ApiProvider, poll_scheduler: Optional[PollScheduler] = None):
         """
         Initialize the MasteringController.
 
@@ -34,8 +39,12 @@ class MasteringController:
         Args:
             api_provider (ApiProvider): An instance of ApiProvider configured with
                 the base URL and API key.
+            poll_scheduler (PollScheduler, optional): Scheduler that drives the
+                handles returned by ``submit``. The client passes its shared
+                scheduler; defaults to a new one using *api_provider*.
         """
         self.api_provider = api_provider
+        self.poll_scheduler = poll_scheduler if poll_scheduler is not None else PollScheduler(api_provider)
         logger.info("MasteringController initialized.")
 
     def create_mastering_preview(self, request: MasteringRequest) -> MasteringTaskResponse:
@@ -58,9 +67,9 @@ class MasteringController:
         Raises:
             requests.exceptions.RequestException: If the API request fails due to network
                                                  issues or invalid endpoint.
-            Exception: If the API returns an error response (e.g., 4xx, 5xx status codes)
-                       indicating issues like invalid input, authentication failure, or
-                       server errors.
+            RoExApiError: If the API returns an error status (e.g., 400 invalid input,
+                          401 authentication failure, 5xx server errors). The status
+                          code is available as ``status_code``.
 
         Example:
             >>> from roex_python.models import MasteringRequest, MusicalStyle, DesiredLoudness
@@ -81,19 +90,7 @@ class MasteringController:
         """
         logger.info("Creating mastering preview")
         logger.debug(f"Mastering preview request data: {request}")
-        data = {
-            "trackData": [
-                {
-                    "trackURL": request.track_url
-                }
-            ],
-            "musicalStyle": request.musical_style.value,
-            "desiredLoudness": request.desired_loudness.value,
-            "sampleRate": request.sample_rate,
-        }
-        if request.webhook_url is not None:
-            data["webhookURL"] = request.webhook_url
-        payload = {"masteringData": data}
+        payload = self._prepare_mastering_payload(request)
 
         try:
             response = self.api_provider.post("/masteringpreview", payload)
@@ -101,25 +98,33 @@ class MasteringController:
             return MasteringTaskResponse(
                 mastering_task_id=response.get("mastering_task_id", "")
             )
-        except requests.HTTPError as e:
-            logger.exception(f"HTTP error creating mastering preview task: {e}")
-            raise Exception(f"Failed to create mastering preview: {e}")
+        except RoExApiError as e:
+            logger.error(f"API error creating mastering preview task: {e}")
+            raise
         except Exception as e:
             logger.exception(f"Unexpected error creating mastering preview task: {e}")
             raise
 
-    def retrieve_preview_master(self, task_id: str, max_attempts: int = 30,
-                                poll_interval: int = 5) -> PreviewMasterResult:
+    def retrieve_preview_master(self, task_id: str, max_attempts: Optional[int] = None,
+                                poll_interval: Optional[float] = None, timeout: Optional[float] = None,
+                                poll_policy: Optional[PollPolicy] = None) -> PreviewMasterResult:
         """
         Retrieve the results of a mastering preview task, polling until complete.
 
         Polls the ``/retrievepreviewmaster`` endpoint until
-        ``previewMasterTaskResults`` is present or *max_attempts* is exhausted.
+        ``previewMasterTaskResults`` is present, *max_attempts* is exhausted or
+        *timeout* seconds have passed. The first poll is sent immediately and
+        later polls back off geometrically (see ``PollPolicy``).
 
         Args:
             task_id (str): The ``mastering_task_id`` from ``create_mastering_preview``.
-            max_attempts (int): Maximum polling iterations. Defaults to 30.
-            poll_interval (int): Seconds between polls. Defaults to 5.
+            max_attempts (int, optional): Maximum number of polls. Defaults to 30.
+            poll_interval (float, optional): Poll at this fixed interval in seconds
+                instead of backing off.
+            timeout (float, optional): End-to-end deadline in seconds covering every
+                request, retry and polling sleep. Defaults to None (bounded only by
+                *max_attempts*).
+            poll_policy (PollPolicy, optional): Custom backoff curve and limits.
 
         Returns:
             PreviewMasterResult: A typed result containing:
@@ -128,57 +133,57 @@ class MasteringController:
                   preview clip starts in the original track.
 
         Raises:
-            Exception: If the task does not complete within *max_attempts* polls.
+            RoExTimeoutError: If the task does not complete within *max_attempts*
+                polls or *timeout* seconds.
+            RoExTaskError: If the API reports that the mastering task failed.
 
         Example:
-            >>> result = client.mastering.retrieve_preview_master(task_id)
+            >>> result = client.mastering.retrieve_preview_master(task_id, timeout=300)
             >>> print(result.download_url_mastered_preview)
         """
         logger.info(f"Retrieving preview master for task ID: {task_id}")
-        payload = {
-            "masteringData": {
-                "masteringTaskId": task_id
-            }
-        }
+        payload = self._prepare_task_payload(task_id)
+        policy = PollPolicy.resolve(poll_policy, max_attempts, poll_interval, timeout)
+        return TaskPoller(policy).poll(
+            self.api_provider.post, "/retrievepreviewmaster", payload, self._check_preview_master,
+            task_id=task_id, is_failed=self._is_preview_master_failed
+        )
+
+    def submit(self, request: MasteringRequest, poll_policy: Optional[PollPolicy] = None) -> TaskHandle:
+        """
+        Start a mastering preview and return immediately with a handle to its result.
 
-        def _parse(raw: Dict[str, Any]) -> PreviewMasterResult:
-            return PreviewMasterResult(
-                download_url_mastered_preview=raw.get("download_url_mastered_preview"),
-                preview_start_time=raw.get("preview_start_time"),
-            )
+        Creates the task with ``create_mastering_preview`` and hands polling to
+        the shared ``PollScheduler``, so the caller is free to upload, submit or
+        download other tracks while this one is processed. If the client has a
+        ``WebhookListener``, the task is resolved by its callback instead.
 
-        try:
-            response = self.api_provider.post("/retrievepreviewmaster", payload)
-            if "previewMasterTaskResults" in response:
-                logger.info(f"Preview master ready for task ID: {task_id}")
-                return _parse(response["previewMasterTaskResults"])
-        except requests.HTTPError:
-            logger.warning(f"Initial request failed for task ID: {task_id}. Starting polling...")
-            pass
-
-        for attempt in range(max_attempts):
-            try:
-                logger.debug(f"Polling attempt {attempt + 1}/{max_attempts} for task ID: {task_id}")
-                response = self.api_provider.post("/retrievepreviewmaster", payload)
-
-                if "previewMasterTaskResults" in response:
-                    logger.info(f"Preview master ready for task ID: {task_id}")
-                    return _parse(response["previewMasterTaskResults"])
-
-                status_code = response.get("status", 0)
-                if status_code == 202:
-                    logger.info(f"Task still processing for task ID: {task_id}...")
-            except requests.HTTPError as e:
-                logger.error(f"Error during polling for task ID: {task_id}: {e}")
-            except Exception as e:
-                logger.exception(f"Unexpected error during polling for task ID: {task_id}: {e}")
-
-            time.sleep(poll_interval)
-
-        logger.error(f"Timeout waiting for preview master for task ID: {task_id} after {max_attempts} attempts.")
-        raise Exception(f"Preview master task {task_id} did not complete after polling for {max_attempts * poll_interval} seconds.")
-
-    def retrieve_final_master(self, task_id: str) -> FinalMasterResult:
+        Args:
+            request (MasteringRequest): Parameters for the mastering job.
+            poll_policy (PollPolicy, optional): Custom backoff curve and limits.
+
+        Returns:
+            TaskHandle: A future whose ``task_id`` is the ``mastering_task_id``
+            and whose result is a ``PreviewMasterResult``, or which raises
+            ``RoExTaskError`` if the API reports that the task failed.
+
+        Raises:
+            RoExApiError: If the API rejects the mastering request.
+
+        Example:
+            >>> handles = [client.mastering.submit(r) for r in requests]
+            >>> for handle in concurrent.futures.as_completed(handles):
+            >>>     print(handle.task_id, handle.result().download_url_mastered_preview)
+        """
+        request, webhook_url = self.poll_scheduler.attach_webhook(request)
+        task = self.create_mastering_preview(request)
+        return self.poll_scheduler.watch(
+            "/retrievepreviewmaster", self._prepare_task_payload(task.mastering_task_id),
+            self._check_preview_master, task_id=task.mastering_task_id,
+            is_failed=self._is_preview_master_failed, policy=poll_policy, webhook_url=webhook_url
+        )
+
+    def retrieve_final_master(self, task_id: str, timeout: Optional[float] = None) -> FinalMasterResult:
         """
         Retrieve the final mastered audio file.
 
@@ -188,6 +193,8 @@ class MasteringController:
 
         Args:
             task_id (str): The ``mastering_task_id`` from ``create_mastering_preview``.
+            timeout (float, optional): Deadline in seconds covering the request
+                and its retries. Defaults to None (the provider's request timeout).
 
         Returns:
             FinalMasterResult: A typed result containing:
@@ -195,89 +202,257 @@ class MasteringController:
                   mastered audio file.
 
         Raises:
-            Exception: If the API returns an error response.
+            RoExApiError: If the API returns an error status.
+            RoExTimeoutError: If *timeout* seconds pass before the request completes.
 
         Example:
             >>> result = client.mastering.retrieve_final_master(task_id)
             >>> print(result.download_url_mastered)
         """
         logger.info(f"Retrieving final master for task ID: {task_id}")
-        payload = {
-            "masteringData": {
-                "masteringTaskId": task_id
-            }
-        }
+        payload = self._prepare_task_payload(task_id)
 
         try:
-            response = self.api_provider.post("/retrievefinalmaster", payload)
-
-            if "finalMasterTaskResults" in response:
-                raw = response["finalMasterTaskResults"]
-                logger.info(f"Final master ready for task ID: {task_id}")
-                return FinalMasterResult(
-                    download_url_mastered=raw.get("download_url_mastered"),
-                )
-            elif isinstance(response, dict) and "download_url_mastered" in response:
-                logger.info(f"Final master ready for task ID: {task_id}")
-                return FinalMasterResult(
-                    download_url_mastered=response.get("download_url_mastered"),
-                )
-
-            logger.warning(f"Unknown response format for task ID: {task_id}. Returning empty result.")
-            return FinalMasterResult()
-        except requests.HTTPError as e:
-            logger.exception(f"HTTP error retrieving final master for task ID: {task_id}: {e}")
-            raise Exception(f"Failed to retrieve final master: {e}")
+            deadline = None if timeout is None else Deadline(timeout)
+            response = self.api_provider.post("/retrievefinalmaster", payload, deadline=deadline)
+            return self._parse_final_master_result(task_id, response)
+        except RoExApiError as e:
+            logger.error(f"API error retrieving final master for task ID: {task_id}: {e}")
+            raise
         except Exception as e:
             logger.exception(f"Unexpected error retrieving final master for task ID: {task_id}: {e}")
             raise
 
-    def process_album(self, album_request: AlbumMasteringRequest, output_dir: str = "final_masters") -> Dict[int, Any]:
+    @staticmethod
+    def _prepare_mastering_payload(request: MasteringRequest) -> Dict[str, Any]:
+        """Convert a MasteringRequest to the ``/masteringpreview`` API payload."""
+        data = {
+            "trackData": [
+                {
+                    "trackURL": request.track_url
+                }
+            ],
+            "musicalStyle": request.musical_style.value,
+            "desiredLoudness": request.desired_loudness.value,
+            "sampleRate": request.sample_rate,
+        }
+        if request.webhook_url is not None:
+            data["webhookURL"] = request.webhook_url
+        return {"masteringData": data}
+
+    @staticmethod
+    def _prepare_task_payload(task_id: str) -> Dict[str, Any]:
+        """Build the payload shared by the preview and final master retrieval endpoints."""
+        return {
+            "masteringData": {
+                "masteringTaskId": task_id
+            }
+        }
+
+    @staticmethod
+    def _check_preview_master(response: Dict[str, Any]) -> Optional[PreviewMasterResult]:
+        """
+        Inspect a ``/retrievepreviewmaster`` polling response.
+
+        Returns:
+            The parsed result if the preview is ready, otherwise None.
+        """
+        if "previewMasterTaskResults" in response:
+            raw = response["previewMasterTaskResults"]
+            return PreviewMasterResult(
+                download_url_mastered_preview=raw.get("download_url_mastered_preview"),
+                preview_start_time=raw.get("preview_start_time"),
+            )
+        return None
+
+    @staticmethod
+    def _is_preview_master_failed(response: Dict[str, Any]) -> bool:
+        """Return True if a ``/retrievepreviewmaster`` response reports a failed task."""
+        return reports_failure(response, "previewMasterTaskResults")
+
+    @staticmethod
+    def _parse_final_master_result(task_id: str, response: Any) -> FinalMasterResult:
+        """Convert a ``/retrievefinalmaster`` response into a FinalMasterResult."""
+        if "finalMasterTaskResults" in response:
+            raw = response["finalMasterTaskResults"]
+            logger.info(f"Final master ready for task ID: {task_id}")
+            return FinalMasterResult(
+                download_url_mastered=raw.get("download_url_mastered"),
+            )
+        elif isinstance(response, dict) and "download_url_mastered" in response:
+            logger.info(f"Final master ready for task ID: {task_id}")
+            return FinalMasterResult(
+                download_url_mastered=response.get("download_url_mastered"),
+            )
+
+        logger.warning(f"Unknown response format for task ID: {task_id}. Returning empty result.")
+        return FinalMasterResult()
+
+    def process_album(self, album_request: AlbumMasteringRequest, output_dir: str = "final_masters",
+                      timeout: Optional[float] = None, max_in_flight: int = 1) -> Dict[int, Any]:
         """
         Process multiple tracks as an album
 
+        Every track's task is created up front and all previews are polled
+        together; final masters are retrieved and downloaded up to
+        *max_in_flight* at a time as previews become ready (see ``iter_album``).
+        To act on each track as soon as it finishes, use ``iter_album`` directly.
+
         Args:
             album_request: Album mastering request containing multiple tracks
             output_dir: Directory to save downloaded masters
+            timeout: Optional deadline in seconds for the whole album, covering
+                preview polling, final master retrieval and downloads.
+            max_in_flight: Maximum number of final masters retrieved and
+                downloaded concurrently. Defaults to 1 (one at a time).
 
         Returns:
-            Dictionary mapping track index to download URL
+            Dictionary mapping track index to download URL, with a key for every
+            track. The URL is None for a track whose mastering task could not be
+            created or whose final master could not be retrieved; the error is
+            logged and the other tracks carry on.
 
         Raises:
-            Exception: If any track processing fails
+            ValueError: If *max_in_flight* is less than 1.
+        """
+        tracks = self.iter_album(album_request, output_dir, timeout=timeout, max_in_flight=max_in_flight)
+        return {track.index: track.final_url for track in sorted(tracks, key=lambda track: track.index)}
+
+    def iter_album(self, album_request: AlbumMasteringRequest, output_dir: str = "final_masters",
+                   timeout: Optional[float] = None, max_in_flight: int = 4) -> Iterator[AlbumTrackResult]:
         """
-        logger.info(f"Processing album with {len(album_request.tracks)} tracks")
+        Master an album and yield each track's result as soon as it finishes.
+
+        Every track is started with ``submit`` before anything is yielded, so
+        all previews are polled together by the shared ``PollScheduler``. As
+        each preview becomes ready, its final master is retrieved and streamed
+        straight to *output_dir* by one of *max_in_flight* workers, so memory
+        use does not grow with the album. Results are yielded in completion
+        order, not track order. Errors are reported per track in
+        ``AlbumTrackResult.error`` and never stop the other tracks.
+
+        Stopping iteration early stops polling the remaining previews and
+        skips their final masters; downloads already in progress are finished
+        first.
+
+        Args:
+            album_request: Album mastering request containing multiple tracks.
+            output_dir: Directory to save downloaded masters.
+            timeout: Optional deadline in seconds for the whole album, covering
+                preview polling, final master retrieval and downloads. Once it
+                passes, polling stops and every track not yet finished is
+                reported with an ``error``, so iteration ends promptly.
+            max_in_flight: Maximum number of final masters retrieved and
+                downloaded concurrently. Defaults to 4.
+
+        Returns:
+            Iterator[AlbumTrackResult]: One result per track, with its index,
+            task ID, final URL, local path and timings.
+
+        Raises:
+            ValueError: If *max_in_flight* is less than 1.
+
+        Example:
+            >>> for track in client.mastering.iter_album(album, output_dir="masters"):
+            >>>     if track.ok:
+            >>>         start_qc(track.local_path)
+            >>>     else:
+            >>>         print(f"Track {track.index} failed: {track.error}")
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        logger.info(f"Processing album with {len(album_request.tracks)} tracks, "
+                    f"downloading {max_in_flight} at a time")
         os.makedirs(output_dir, exist_ok=True)
-        results = {}
-
-        for idx, track_request in enumerate(album_request.tracks, start=1):
-            logger.info(f"Starting mastering for Track #{idx}")
-
-            # Create preview
-            preview_response = self.create_mastering_preview(track_request)
-            task_id = preview_response.mastering_task_id
-
-            # Wait for preview to complete
-            try:
-                preview_results = self.retrieve_preview_master(task_id)
-                logger.info(f"Preview master ready for Track #{idx}")
-            except Exception as e:
-                logger.warning(f"Could not retrieve preview for Track #{idx}: {e}")
-                # Continue to final master anyway
-
-            # Get final master
-            try:
-                final_url = self.retrieve_final_master(task_id).download_url_mastered
-                results[idx] = final_url
-
-                # Download the file
-                if isinstance(final_url, str) and (final_url.startswith("http://") or final_url.startswith("https://")):
-                    local_filename = os.path.join(output_dir, f"final_master_track_{idx}.wav")
-                    self.api_provider.download_file(final_url, local_filename)
+        return self._iter_album_tracks(album_request.tracks, output_dir, Deadline(timeout), max_in_flight)
+
+    def _iter_album_tracks(self, tracks: List[MasteringRequest], output_dir: str, deadline: Deadline,
+                           max_in_flight: int) -> Iterator[AlbumTrackResult]:
+        """Generator behind ``iter_album``."""
+        previews: Dict[TaskHandle, Tuple[AlbumTrackResult, float]] = {}
+        finishing: Set[Future] = set()
+        pool = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="roex-album")
+        try:
+            failed = []
+            for idx, track_request in enumerate(tracks, start=1):
+                track = AlbumTrackResult(index=idx)
+                started = time.monotonic()
+                logger.info(f"Starting mastering for Track #{idx}")
+                # Creating the task is one request; polling happens on the shared scheduler
+                try:
+                    handle = self.submit(track_request)
+                except Exception as e:
+                    track.error = f"Could not create mastering task: {e}"
+                    logger.error(f"Error processing Track #{idx}: {e}")
+                    failed.append(track)
+                    continue
+                track.task_id = handle.task_id
+                previews[handle] = (track, started)
+            yield from failed
+            while previews or finishing:
+                timeout = deadline.remaining() if previews else None
+                done, _ = wait(set(previews) | finishing, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    # Deadline reached: stop polling; the remaining tracks fail without further requests
+                    for handle in previews:
+                        handle.cancel()
+                    done = set(previews)
+                # Start downloads for ready previews before handing results to the caller
+                for handle in done - finishing:
+                    track, started = previews.pop(handle)
+                    finishing.add(pool.submit(self._finish_album_preview, track, handle, started, output_dir,
+                                              deadline))
+                for future in done & finishing:
+                    finishing.remove(future)
+                    yield future.result()
+        finally:
+            # Only reached early if the caller stopped iterating; drop tracks not yet downloading
+            for handle in previews:
+                handle.cancel()
+            for future in finishing:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+    def _finish_album_preview(self, track: AlbumTrackResult, handle: TaskHandle, started: float,
+                              output_dir: str, deadline: Deadline) -> AlbumTrackResult:
+        """Record an album track's preview outcome, then retrieve and download its final master."""
+        if handle.cancelled():
+            logger.warning(f"Preview for Track #{track.index} was not ready before the album deadline")
+        elif handle.exception() is not None:
+            logger.warning(f"Could not retrieve preview for Track #{track.index}: {handle.exception()!r}")
+        else:
+            track.preview_seconds = time.monotonic() - started
+            logger.info(f"Preview master ready for Track #{track.index}")
+        # Continue to final master anyway
+        self._finish_album_track(track, output_dir, deadline)
+        track.total_seconds = time.monotonic() - started
+        return track
+
+    def _finish_album_track(self, track: AlbumTrackResult, output_dir: str, deadline: Deadline) -> None:
+        """Retrieve an album track's final master and download it within *deadline*, recording the outcome."""
+        idx = track.index
+        if deadline.expired:
+            track.error = f"Album deadline of {deadline.timeout} seconds passed before the final master was retrieved"
+            logger.error(f"{track.error} for Track #{idx}")
+            return
+        try:
+            final_url = self.retrieve_final_master(track.task_id, timeout=deadline.remaining()).download_url_mastered
+            track.final_url = final_url
+
+            # Download the file
+            if isinstance(final_url, str) and (final_url.startswith("http://") or final_url.startswith("https://")):
+                local_filename = os.path.join(output_dir, f"final_master_track_{idx}.wav")
+                started = time.monotonic()
+                if self.api_provider.download_file(final_url, local_filename, deadline=deadline):
+                    track.local_path = local_filename
+                    track.download_seconds = time.monotonic() - started
                     logger.info(f"Downloaded Track #{idx} to {local_filename}")
                 else:
-                    logger.warning(f"Final URL for Track #{idx} is not a valid URL: {final_url}")
-            except Exception as e:
-                logger.error(f"Error processing Track #{idx}: {e}")
-
-        return results
\ No newline at end of file
+                    track.error = f"Could not download final master from {final_url}"
+                    logger.error(f"{track.error} for Track #{idx}")
+            else:
+                track.error = f"Final URL is not a valid URL: {final_url}"
+                logger.warning(f"Final URL for Track #{idx} is not a valid URL: {final_url}")
+        except Exception as e:
+            track.error = f"Could not retrieve final master: {e}"
+            logger.error(f"Error processing Track #{idx}: {e}")
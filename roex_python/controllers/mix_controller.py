@@ -2,12 +2,10 @@
 Controller for multitrack mixing operations
 """
 
-import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
 
-import requests
-
+from roex_python.exceptions import RoExApiError
 from roex_python.models.mixing import (
     FinalMixRequest,
     FinalMixRequestAdvanced,
@@ -19,7 +17,9 @@ from roex_python.models.mixing import (
     TrackGainData,
     TrackEffectsData
 )
+from roex_python.polling import PollPolicy, TaskPoller, reports_failure
 from roex_python.providers.api_provider import ApiProvider
+from roex_python.scheduler import PollScheduler, TaskHandle
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
@@ -27,7 +27,7 @@ logger = logging.getLogger(__name__)
 class MixController:
     """Controller for managing multitrack mixing operations via the RoEx API."""
 
-    def __init__(self, api_provider: ApiProvider):
+    def __init__(self, api_provider: ApiProvider, poll_scheduler: Optional[PollScheduler] = None):
         """
         Initialize the MixController.
 
@@ -37,8 +37,12 @@ class MixController:
         Args:
             api_provider (ApiProvider): An instance of ApiProvider configured with
                 the base URL and API key.
+            poll_scheduler (PollScheduler, optional): Scheduler that drives the
+                handles returned by ``submit_preview``. The client passes its shared
+                scheduler; defaults to a new one using *api_provider*.
         """
         self.api_provider = api_provider
+        self.poll_scheduler = poll_scheduler if poll_scheduler is not None else PollScheduler(api_provider)
         logger.info("MixController initialized.")
 
     def create_mix_preview(self, request: MultitrackMixRequest) -> MultitrackTaskResponse:
@@ -62,9 +66,9 @@ class MixController:
         Raises:
             requests.exceptions.RequestException: If the API request fails due to network
                                                  issues or invalid endpoint.
-            Exception: If the API returns an error response (e.g., 4xx, 5xx status codes)
-                       indicating issues like invalid input, authentication failure, or
-                       server errors.
+            RoExApiError: If the API returns an error status (e.g., 400 invalid input,
+                          401 authentication failure, 5xx server errors). The status
+                          code is available as ``status_code``.
 
         Example:
             >>> from roex_python.models import TrackData, MultitrackMixRequest, MusicalStyle, InstrumentGroup
@@ -94,32 +98,37 @@ class MixController:
         try:
             response = self.api_provider.post("/mixpreview", payload)
             logger.info(f"Mix preview created successfully. Task ID: {response.get('multitrack_task_id', '')}")
-            return MultitrackTaskResponse(
-                multitrack_task_id=response.get("multitrack_task_id", "")
-            )
-        except requests.HTTPError as e:
-            # Log specific HTTP errors
-            error_detail = f"{e.response.status_code} - {e.response.text}" if hasattr(e, 'response') and e.response else str(e)
-            logger.error(f"HTTP error creating mix preview: {error_detail}")
-            raise Exception(f"Failed to create mix preview: {error_detail}")
+            return self._parse_task_response(response)
+        except RoExApiError as e:
+            logger.error(f"API error creating mix preview: {e.status_code} - {e.response_text}")
+            raise
         except Exception as e:
             # Catch other potential exceptions (e.g., connection errors)
             logger.exception(f"Unexpected error creating mix preview: {e}")
             raise
 
     def retrieve_preview_mix(self, task_id: str, retrieve_fx_settings: bool = False,
-                             max_attempts: int = 30, poll_interval: int = 5) -> PreviewMixResult:
+                             max_attempts: Optional[int] = None, poll_interval: Optional[float] = None,
+                             timeout: Optional[float] = None,
+                             poll_policy: Optional[PollPolicy] = None) -> PreviewMixResult:
         """
         Retrieve the results of a multitrack mix preview task, polling until complete.
 
         Polls the ``/retrievepreviewmix`` endpoint until the task reaches
-        ``MIX_TASK_PREVIEW_COMPLETED`` or *max_attempts* is exhausted.
+        ``MIX_TASK_PREVIEW_COMPLETED``, *max_attempts* is exhausted or *timeout*
+        seconds have passed. The first poll is sent immediately and later polls
+        back off geometrically (see ``PollPolicy``).
 
         Args:
             task_id (str): The ``multitrack_task_id`` from ``create_mix_preview``.
             retrieve_fx_settings (bool): Request detailed FX settings. Defaults to False.
-            max_attempts (int): Maximum polling iterations. Defaults to 30.
-            poll_interval (int): Seconds between polls. Defaults to 5.
+            max_attempts (int, optional): Maximum number of polls. Defaults to 30.
+            poll_interval (float, optional): Poll at this fixed interval in seconds
+                instead of backing off.
+            timeout (float, optional): End-to-end deadline in seconds covering every
+                request, retry and polling sleep. Defaults to None (bounded only by
+                *max_attempts*).
+            poll_policy (PollPolicy, optional): Custom backoff curve and limits.
 
         Returns:
             PreviewMixResult: A typed result containing:
@@ -129,64 +138,56 @@ class MixController:
                 - ``status`` (Optional[str]): Task status string.
 
         Raises:
-            Exception: If the task does not complete within *max_attempts* polls.
+            RoExTimeoutError: If the task does not complete within *max_attempts*
+                polls or *timeout* seconds.
+            RoExTaskError: If the API reports that the mix task failed.
 
         Example:
-            >>> result = client.mix.retrieve_preview_mix(task_id)
+            >>> result = client.mix.retrieve_preview_mix(task_id, timeout=300)
             >>> print(result.download_url_preview_mixed)
         """
         logger.info(f"Retrieving preview mix for task ID: {task_id}")
-        payload = {
-            "multitrackData": {
-                "multitrackTaskId": task_id,
-                "retrieveFXSettings": retrieve_fx_settings
-            }
-        }
+        payload = self._prepare_retrieve_preview_payload(task_id, retrieve_fx_settings)
+        policy = PollPolicy.resolve(poll_policy, max_attempts, poll_interval, timeout)
+        return TaskPoller(policy).poll(
+            self.api_provider.post, "/retrievepreviewmix", payload, self._check_preview_mix,
+            task_id=task_id, is_failed=self._is_preview_mix_failed
+        )
+
+    def submit_preview(self, request: MultitrackMixRequest, retrieve_fx_settings: bool = False,
+                       poll_policy: Optional[PollPolicy] = None) -> TaskHandle:
+        """
+        Start a mix preview and return immediately with a handle to its result.
 
-        def _parse_preview_result(raw: Dict[str, Any]) -> PreviewMixResult:
-            return PreviewMixResult(
-                download_url_preview_mixed=raw.get("download_url_preview_mixed"),
-                stems=raw.get("stems"),
-                mix_output_settings=raw.get("mix_output_settings"),
-                status=raw.get("status"),
-            )
+        Creates the task with ``create_mix_preview`` and hands polling to the
+        shared ``PollScheduler`` instead of blocking in ``retrieve_preview_mix``.
+        If the client has a ``WebhookListener``, the task is resolved by its
+        callback instead.
 
-        try:
-            response = self.api_provider.post("/retrievepreviewmix", payload)
-
-            if "previewMixTaskResults" in response and response.get("status") == "MIX_TASK_PREVIEW_COMPLETED":
-                logger.info(f"Preview mix for task {task_id} is ready.")
-                return _parse_preview_result(response["previewMixTaskResults"])
-
-            if "status" in response and response.get("status") != "MIX_TASK_PREVIEW_COMPLETED":
-                logger.info(f"Mix preview is pending. Starting polling...")
-            else:
-                return _parse_preview_result(response)
-        except requests.HTTPError:
-            logger.error("Initial request failed. Starting polling...")
-            pass
-
-        for attempt in range(max_attempts):
-            try:
-                logger.debug(f"Polling attempt {attempt + 1}/{max_attempts}...")
-                response = self.api_provider.post("/retrievepreviewmix", payload)
-
-                if "previewMixTaskResults" in response:
-                    results = response["previewMixTaskResults"]
-                    status = results.get("status", "")
-                    if status == "MIX_TASK_PREVIEW_COMPLETED":
-                        logger.info(f"Preview mix for task {task_id} is ready.")
-                        return _parse_preview_result(results)
-
-                if "status" in response:
-                    logger.info(f"Current status: {response.get('status')}")
-            except requests.HTTPError as e:
-                logger.error(f"Error during polling: {str(e)}")
-
-            time.sleep(poll_interval)
-
-        logger.error(f"Polling timed out for preview mix task {task_id} after {max_attempts} attempts.")
-        raise Exception(f"Preview mix task {task_id} did not complete after polling for {max_attempts * poll_interval} seconds.")
+        Args:
+            request (MultitrackMixRequest): Parameters for the mix preview.
+            retrieve_fx_settings (bool): Request detailed FX settings. Defaults to False.
+            poll_policy (PollPolicy, optional): Custom backoff curve and limits.
+
+        Returns:
+            TaskHandle: A future whose ``task_id`` is the ``multitrack_task_id``
+            and whose result is a ``PreviewMixResult``.
+
+        Raises:
+            RoExApiError: If the API rejects the mix request.
+
+        Example:
+            >>> handle = client.mix.submit_preview(mix_request)
+            >>> handle.add_done_callback(lambda h: print(h.result().download_url_preview_mixed))
+        """
+        request, webhook_url = self.poll_scheduler.attach_webhook(request)
+        task = self.create_mix_preview(request)
+        return self.poll_scheduler.watch(
+            "/retrievepreviewmix",
+            self._prepare_retrieve_preview_payload(task.multitrack_task_id, retrieve_fx_settings),
+            self._check_preview_mix, task_id=task.multitrack_task_id,
+            is_failed=self._is_preview_mix_failed, policy=poll_policy, webhook_url=webhook_url
+        )
 
     def retrieve_final_mix_advanced(self, request: FinalMixRequestAdvanced) -> FinalMixResult:
         """
@@ -206,7 +207,7 @@ class MixController:
                 - ``mix_output_settings`` (Optional[Dict]): Applied settings.
 
         Raises:
-            Exception: If the API returns an error response.
+            RoExApiError: If the API returns an error status.
 
         Example:
             >>> result = client.mix.retrieve_final_mix_advanced(request)
@@ -219,16 +220,10 @@ class MixController:
         try:
             response = self.api_provider.post("/retrievefinalmix", payload)
             logger.info("Advanced final mix retrieved successfully.")
-            raw = response.get("applyAudioEffectsResults", response)
-            return FinalMixResult(
-                download_url_mixed=raw.get("download_url_mixed"),
-                stems=raw.get("stems"),
-                mix_output_settings=raw.get("mix_output_settings"),
-            )
-        except requests.HTTPError as e:
-            error_detail = f"{e.response.status_code} - {e.response.text}" if hasattr(e, 'response') and e.response else str(e)
-            logger.error(f"HTTP error retrieving advanced final mix: {error_detail}")
-            raise Exception(f"Failed to retrieve advanced final mix: {error_detail}")
+            return self._parse_final_mix_result(response)
+        except RoExApiError as e:
+            logger.error(f"API error retrieving advanced final mix: {e.status_code} - {e.response_text}")
+            raise
         except Exception as e:
             logger.exception(f"Unexpected error retrieving advanced final mix: {e}")
             raise
@@ -251,7 +246,7 @@ class MixController:
                 - ``mix_output_settings`` (Optional[Dict]): Applied settings.
 
         Raises:
-            Exception: If the API returns an error response.
+            RoExApiError: If the API returns an error status.
 
         Example:
             >>> result = client.mix.retrieve_final_mix(request)
@@ -264,21 +259,72 @@ class MixController:
         try:
             response = self.api_provider.post("/retrievefinalmix", payload)
             logger.info("Final mix retrieved successfully.")
-            raw = response.get("applyAudioEffectsResults", response)
-            return FinalMixResult(
-                download_url_mixed=raw.get("download_url_mixed"),
-                stems=raw.get("stems"),
-                mix_output_settings=raw.get("mix_output_settings"),
-            )
-        except requests.HTTPError as e:
-            error_detail = f"{e.response.status_code} - {e.response.text}" if hasattr(e, 'response') and e.response else str(e)
-            logger.error(f"HTTP error retrieving final mix: {error_detail}")
-            raise Exception(f"Failed to retrieve final mix: {error_detail}")
+            return self._parse_final_mix_result(response)
+        except RoExApiError as e:
+            logger.error(f"API error retrieving final mix: {e.status_code} - {e.response_text}")
+            raise
         except Exception as e:
             logger.exception(f"Unexpected error retrieving final mix: {e}")
             raise
 
-    def _prepare_mix_preview_payload(self, request: MultitrackMixRequest) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_task_response(response: Dict[str, Any]) -> MultitrackTaskResponse:
+        """Convert a ``/mixpreview`` response into a MultitrackTaskResponse."""
+        return MultitrackTaskResponse(
+            multitrack_task_id=response.get("multitrack_task_id", "")
+        )
+
+    @staticmethod
+    def _prepare_retrieve_preview_payload(task_id: str, retrieve_fx_settings: bool = False) -> Dict[str, Any]:
+        """Build the ``/retrievepreviewmix`` payload for a task."""
+        return {
+            "multitrackData": {
+                "multitrackTaskId": task_id,
+                "retrieveFXSettings": retrieve_fx_settings
+            }
+        }
+
+    @staticmethod
+    def _parse_preview_mix_result(raw: Dict[str, Any]) -> PreviewMixResult:
+        """Convert ``previewMixTaskResults`` into a PreviewMixResult."""
+        return PreviewMixResult(
+            download_url_preview_mixed=raw.get("download_url_preview_mixed"),
+            stems=raw.get("stems"),
+            mix_output_settings=raw.get("mix_output_settings"),
+            status=raw.get("status"),
+        )
+
+    @staticmethod
+    def _check_preview_mix(response: Dict[str, Any]) -> Optional[PreviewMixResult]:
+        """
+        Inspect a ``/retrievepreviewmix`` polling response.
+
+        Returns:
+            The parsed result if the preview is complete, otherwise None.
+        """
+        if "previewMixTaskResults" in response:
+            results = response["previewMixTaskResults"]
+            if "MIX_TASK_PREVIEW_COMPLETED" in (response.get("status"), results.get("status")):
+                return MixController._parse_preview_mix_result(results)
+        return None
+
+    @staticmethod
+    def _is_preview_mix_failed(response: Dict[str, Any]) -> bool:
+        """Return True if a ``/retrievepreviewmix`` response reports a failed task."""
+        return reports_failure(response, "previewMixTaskResults")
+
+    @staticmethod
+    def _parse_final_mix_result(response: Dict[str, Any]) -> FinalMixResult:
+        """Convert a ``/retrievefinalmix`` response into a FinalMixResult."""
+        raw = response.get("applyAudioEffectsResults", response)
+        return FinalMixResult(
+            download_url_mixed=raw.get("download_url_mixed"),
+            stems=raw.get("stems"),
+            mix_output_settings=raw.get("mix_output_settings"),
+        )
+
+    @staticmethod
+    def _prepare_mix_preview_payload(request: MultitrackMixRequest) -> Dict[str, Any]:
         """
         Convert the model to API payload for mix preview
 
@@ -309,7 +355,8 @@ class MixController:
             data["webhookURL"] = request.webhook_url
         return {"multitrackData": data}
 
-    def _prepare_final_mix_payload(self, request: FinalMixRequest) -> Dict[str, Any]:
+    @staticmethod
+    def _prepare_final_mix_payload(request: FinalMixRequest) -> Dict[str, Any]:
         """
         Convert the model to API payload for final mix
 
@@ -336,7 +383,8 @@ class MixController:
             }
         }
 
-    def _prepare_advanced_final_mix_payload(self, request: FinalMixRequestAdvanced) -> Dict[str, Any]:
+    @staticmethod
+    def _prepare_advanced_final_mix_payload(request: FinalMixRequestAdvanced) -> Dict[str, Any]:
         """
         Convert the advanced model to API payload for final mix with audio effects
 
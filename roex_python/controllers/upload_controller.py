@@ -2,6 +2,8 @@
 Controller for file upload operations
 """
 
+from typing import Any, Dict
+
 from ..models.upload import UploadUrlRequest, UploadUrlResponse
 from ..providers.api_provider import ApiProvider
 import logging
@@ -56,7 +58,7 @@ class UploadController:
         Raises:
             requests.exceptions.RequestException: If the API request to `/upload` fails due to
                                                  network issues or invalid endpoint.
-            Exception: If the API returns an error response (e.g., 4xx, 5xx status codes).
+            RoExApiError: If the API returns an error status (e.g., 4xx, 5xx status codes).
 
         Example:
             >>> import requests
@@ -81,7 +83,8 @@ class UploadController:
             >>>
             >>>         # 2. Upload the local file using the signed URL
             >>>         with open(local_file_path, 'rb') as f:
-            >>>             upload_put_response = requests.put(signed_url, data=f, headers={'Content-Type': content_type})
+            >>>             upload_put_response = requests.put(signed_url, data=f, headers={'Content-Type': content_type},
+            >>>                                            timeout=(10, 120))
             >>>
             >>>         if upload_put_response.status_code == 200:
             >>>             print("File uploaded successfully!")
@@ -96,21 +99,31 @@ class UploadController:
         """
         logger.info("Requesting upload URL")
         logger.debug(f"Upload URL request data: {request}")
-        payload = {
-            "filename": request.filename,
-            "contentType": request.content_type
-        }
+        payload = self._prepare_upload_payload(request)
 
         try:
             response = self.api_provider.post("/upload", payload)
             logger.info("Upload URL request successful")
-            return UploadUrlResponse(
-                signed_url=response.get("signed_url"),
-                readable_url=response.get("readable_url"),
-                error=response.get("error", False),
-                message=response.get("message", ""),
-                info=response.get("info", "")
-            )
+            return self._parse_upload_response(response)
         except Exception as e:
             logger.exception(f"Exception during upload URL creation: {e}")
             raise
+
+    @staticmethod
+    def _prepare_upload_payload(request: UploadUrlRequest) -> Dict[str, Any]:
+        """Convert an UploadUrlRequest to the ``/upload`` API payload."""
+        return {
+            "filename": request.filename,
+            "contentType": request.content_type
+        }
+
+    @staticmethod
+    def _parse_upload_response(response: Dict[str, Any]) -> UploadUrlResponse:
+        """Convert an ``/upload`` response into an UploadUrlResponse."""
+        return UploadUrlResponse(
+            signed_url=response.get("signed_url"),
+            readable_url=response.get("readable_url"),
+            error=response.get("error", False),
+            message=response.get("message", ""),
+            info=response.get("info", "")
+        )
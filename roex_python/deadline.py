@@ -0,0 +1,92 @@
+"""
+End-to-end deadlines for long-running client operations
+"""
+
+import time
+from typing import Optional, Tuple, Union
+
+from roex_python.exceptions import RoExTimeoutError
+
+# (connect, read) timeout in seconds for a single HTTP request
+RequestTimeout = Tuple[float, float]
+
+
+class Deadline:
+    """
+    A point in time by which an operation must finish.
+
+    A deadline is created once at the start of a high-level call such as
+    ``retrieve_preview_mix`` and passed down to every HTTP request, retry
+    backoff and polling sleep it makes, so the whole call returns or raises
+    ``RoExTimeoutError`` within a bounded time. A deadline created with
+    ``timeout=None`` never expires.
+
+    Example:
+        >>> deadline = Deadline(300)
+        >>> while not deadline.expired:
+        >>>     response = api_provider.post("/retrievepreviewmaster", payload, deadline=deadline)
+        >>>     ...
+        >>>     time.sleep(deadline.cap(5))
+    """
+
+    def __init__(self, timeout: Optional[float]):
+        """
+        Args:
+            timeout: Seconds from now until the deadline, or None for no deadline.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout must be non-negative.")
+        self.timeout = timeout
+        self.expires_at = None if timeout is None else time.monotonic() + timeout
+
+    @classmethod
+    def coerce(cls, value: Union[None, float, "Deadline"]) -> "Deadline":
+        """Return *value* if it is already a Deadline, otherwise a new Deadline of *value* seconds."""
+        if isinstance(value, Deadline):
+            return value
+        return cls(value)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (never negative), or None if there is no deadline."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """bool: True once the deadline has passed."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def check(self, operation: str) -> None:
+        """
+        Raise if the deadline has passed.
+
+        Args:
+            operation: Description of the operation, used in the error message.
+
+        Raises:
+            RoExTimeoutError: If the deadline has passed.
+        """
+        if self.expired:
+            raise RoExTimeoutError(f"{operation} did not complete within {self.timeout} seconds.", timeout=self.timeout)
+
+    def cap(self, seconds: float) -> float:
+        """Return *seconds*, shortened so that it does not extend past the deadline."""
+        remaining = self.remaining()
+        return seconds if remaining is None else min(seconds, remaining)
+
+    def request_timeout(self, default: RequestTimeout, operation: str) -> RequestTimeout:
+        """
+        Per-request (connect, read) timeout, capped by the time remaining.
+
+        Args:
+            default: The provider's configured (connect, read) timeout.
+            operation: Description of the request, used in the error message.
+
+        Raises:
+            RoExTimeoutError: If the deadline has already passed.
+        """
+        self.check(operation)
+        connect, read = default
+        return self.cap(connect), self.cap(read)
@@ -0,0 +1,117 @@
+"""
+Concurrent downloads of every file produced by a task
+"""
+
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Mapping, Union
+from urllib.parse import urlparse
+
+from roex_python.models.download import BatchDownloadResult, DownloadResult
+from roex_python.providers.api_provider import ApiProvider
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# Result attributes holding the main output, and the name each is saved under
+MAIN_OUTPUT_FIELDS = {
+    "download_url_preview_mixed": "mix",
+    "download_url_mixed": "mix",
+    "download_url_revived": "enhanced",
+    "download_url_preview_revived": "enhanced_preview",
+    "download_url_mastered": "master",
+    "download_url_mastered_preview": "master_preview",
+}
+
+
+def result_urls(result: Union[Any, Mapping[str, str]]) -> Dict[str, str]:
+    """
+    Collect the download URLs of a task result, keyed by output name.
+
+    Args:
+        result: A result with download URLs and/or ``stems`` (``PreviewMixResult``,
+            ``FinalMixResult``, ``EnhancedTrackResult``, ``PreviewMasterResult``,
+            ``FinalMasterResult``), or a mapping of names to URLs.
+
+    Returns:
+        Dict[str, str]: URLs keyed by name: "mix", "enhanced", "master" and so
+        on for the main outputs, and the stem names for stems.
+
+    Raises:
+        TypeError: If *result* has no download URLs attributes
+    """
+    if isinstance(result, Mapping):
+        return {name: url for name, url in result.items() if url}
+    fields = [field for field in MAIN_OUTPUT_FIELDS if hasattr(result, field)]
+    if not fields and not hasattr(result, "stems"):
+        raise TypeError(f"{type(result).__name__} has no download URLs")
+    urls = {MAIN_OUTPUT_FIELDS[field]: getattr(result, field) for field in fields if getattr(result, field)}
+    for stem, url in (getattr(result, "stems", None) or {}).items():
+        if url:
+            urls.setdefault(stem, url)
+    return urls
+
+
+def download_all(api_provider: ApiProvider, result: Union[Any, Mapping[str, str]], output_dir: str,
+                 max_workers: int = 8, segments: int = 1) -> BatchDownloadResult:
+    """
+    Download the main output and every stem of a result concurrently.
+
+    Each file is written atomically to ``{output_dir}/{name}{ext}``, the
+    extension taken from its URL. Downloads share the provider's pooled
+    connections; raise ``pool_maxsize`` on the client if *max_workers*
+    exceeds it. A file that fails does not stop the others.
+
+    Args:
+        api_provider: Provider whose session is used for the downloads.
+        result: Task result or mapping of names to URLs, as accepted by ``result_urls``.
+        output_dir: Directory to save the files in; created if needed.
+        max_workers: Maximum number of concurrent downloads. Defaults to 8.
+        segments: Ranges to fetch concurrently within each large file, for
+            servers that support Range requests. Defaults to 1.
+
+    Returns:
+        BatchDownloadResult: Per-file paths, byte counts and timings keyed by name.
+
+    Raises:
+        ValueError: If max_workers is less than 1
+        TypeError: If *result* has no download URLs
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    urls = result_urls(result)
+    files = {name: DownloadResult(name=name, url=url) for name, url in urls.items()}
+    logger.info(f"Downloading {len(files)} files to {output_dir} with {max_workers} workers")
+    started = time.monotonic()
+
+    def download_one(download: DownloadResult) -> None:
+        path = os.path.join(output_dir, _file_name(download.name, download.url))
+        file_started = time.monotonic()
+        try:
+            download.bytes_downloaded = api_provider.download_to_file(download.url, path, segments=segments)
+            download.path = path
+        except Exception as e:
+            download.error = f"Download failed: {e}"
+            logger.error(f"Error downloading {download.name}: {e}")
+        finally:
+            download.seconds = time.monotonic() - file_started
+
+    if files:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(files)),
+                                thread_name_prefix="roex-download") as pool:
+            list(pool.map(download_one, files.values()))
+
+    batch = BatchDownloadResult(files=files, elapsed_seconds=time.monotonic() - started)
+    logger.info(f"Downloaded {len(files) - len(batch.failed)}/{len(files)} files, {batch.total_bytes} bytes "
+                f"in {batch.elapsed_seconds:.1f}s ({batch.throughput / 1e6:.2f} MB/s)")
+    return batch
+
+
+def _file_name(name: str, url: str) -> str:
+    """Safe local file name for output *name*, keeping the extension of *url*."""
+    extension = os.path.splitext(urlparse(url).path)[1].lower() or ".wav"
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("._") or "output"
+    return safe + extension
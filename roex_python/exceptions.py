@@ -0,0 +1,113 @@
+"""
+Exception types raised by the RoEx client
+"""
+
+from typing import Optional
+
+import requests
+
+
+class RoExError(Exception):
+    """Base class for all errors raised by the RoEx client."""
+
+
+class RoExApiError(RoExError, requests.HTTPError):
+    """
+    Raised when the RoEx API (or a signed storage URL) returns an error status.
+
+    Subclasses ``requests.HTTPError`` so existing ``except requests.HTTPError``
+    handlers keep working, while exposing the status code and response body
+    so callers can tell a bad API key (401) from a malformed payload (400)
+    or a transient server error (5xx).
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None, endpoint: Optional[str] = None,
+                 response_text: str = "", retry_after: Optional[float] = None):
+        """
+        Args:
+            message: Human-readable error description.
+            status_code: HTTP status code of the failed response.
+            endpoint: API endpoint (or URL) that was called.
+            response_text: Body of the error response, if any.
+            retry_after: Seconds the server asked us to wait (``Retry-After``), if given.
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.endpoint = endpoint
+        self.response_text = response_text
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self) -> bool:
+        """bool: True for rate limiting (429) and server errors (5xx), which may succeed if retried."""
+        return self.status_code is not None and (self.status_code == 429 or self.status_code >= 500)
+
+
+class RoExTimeoutError(RoExError, TimeoutError):
+    """
+    Raised when an operation does not complete within its timeout or deadline,
+    e.g. a preview task that is still processing when polling gives up.
+    """
+
+    def __init__(self, message: str, timeout: Optional[float] = None):
+        """
+        Args:
+            message: Human-readable error description.
+            timeout: The timeout in seconds that was exceeded, if known.
+        """
+        super().__init__(message)
+        self.timeout = timeout
+
+
+class RoExTaskError(RoExError):
+    """Raised when the API reports that a processing task has failed."""
+
+    def __init__(self, message: str, task_id: Optional[str] = None, status: Optional[str] = None):
+        """
+        Args:
+            message: Human-readable error description.
+            task_id: ID of the failed task.
+            status: Status string reported by the API.
+        """
+        super().__init__(message)
+        self.task_id = task_id
+        self.status = status
+
+
+class RoExDownloadError(RoExError, IOError):
+    """Raised when a downloaded file is incomplete or does not match its checksum."""
+
+    def __init__(self, message: str, bytes_received: int = 0, expected_bytes: Optional[int] = None):
+        """
+        Args:
+            message: Human-readable error description.
+            bytes_received: Bytes received before the error.
+            expected_bytes: Size the server reported, if it reported one.
+        """
+        super().__init__(message)
+        self.bytes_received = bytes_received
+        self.expected_bytes = expected_bytes
+
+
+class AudioValidationError(RoExError, ValueError):
+    """Raised when a local audio file fails validation before upload."""
+
+
+class AudioFormatError(AudioValidationError):
+    """Raised when a file is not a readable WAV or FLAC file."""
+
+
+class AudioTooShortError(AudioValidationError):
+    """Raised when audio is shorter than the minimum required duration."""
+
+
+class AudioTooLongError(AudioValidationError):
+    """Raised when audio is longer than the maximum allowed duration."""
+
+
+class InvalidSampleRateError(AudioValidationError):
+    """Raised when audio has an unsupported sample rate."""
+
+
+class AudioTooQuietError(AudioValidationError):
+    """Raised when audio is effectively silent (RMS too low)."""
@@ -19,6 +19,7 @@ from roex_python.models.mixing import (
     FinalMixRequestAdvanced,
     FinalMixResult,
     MultitrackMixRequest,
+    MultitrackPipelineResult,
     MultitrackTaskResponse,
     PreviewMixResult,
     TrackData,
@@ -33,6 +34,7 @@ from roex_python.models.mixing import (
 # Import mastering models
 from roex_python.models.mastering import (
     AlbumMasteringRequest,
+    AlbumTrackResult,
     FinalMasterResult,
     MasteringRequest,
     MasteringTaskResponse,
@@ -41,6 +43,7 @@ from roex_python.models.mastering import (
 
 # Import analysis models
 from roex_python.models.analysis import (
+    AnalysisBatchItem,
     AnalysisMusicalStyle,
     AnalysisResult,
     MixAnalysisRequest
@@ -56,12 +59,23 @@ from roex_python.models.enhance import (
 
 # Import upload models
 from roex_python.models.upload import (
+    BatchUploadResult,
+    FileUploadResult,
+    TranscodeResult,
+    UploadProgress,
     UploadUrlRequest,
     UploadUrlResponse
 )
 
+# Import download models
+from roex_python.models.download import (
+    BatchDownloadResult,
+    DownloadResult
+)
+
 # Import audio cleanup models
 from roex_python.models.audio_cleanup import (
+    AudioCleanupBatchItem,
     AudioCleanupData,
     AudioCleanupResults,
     AudioCleanupResponse,
@@ -83,6 +97,7 @@ __all__ = [
     "FinalMixRequestAdvanced",
     "FinalMixResult",
     "MultitrackMixRequest",
+    "MultitrackPipelineResult",
     "MultitrackTaskResponse",
     "PreviewMixResult",
     "TrackData",
@@ -95,12 +110,14 @@ __all__ = [
 
     # Mastering models
     "AlbumMasteringRequest",
+    "AlbumTrackResult",
     "FinalMasterResult",
     "MasteringRequest",
     "MasteringTaskResponse",
     "PreviewMasterResult",
 
     # Analysis models
+    "AnalysisBatchItem",
     "AnalysisMusicalStyle",
     "AnalysisResult",
     "MixAnalysisRequest",
@@ -114,8 +131,17 @@ __all__ = [
     # Upload models
     "UploadUrlRequest",
     "UploadUrlResponse",
+    "FileUploadResult",
+    "BatchUploadResult",
+    "UploadProgress",
+    "TranscodeResult",
+
+    # Download models
+    "DownloadResult",
+    "BatchDownloadResult",
 
     # Audio Cleanup models
+    "AudioCleanupBatchItem",
     "AudioCleanupData",
     "AudioCleanupResults",
     "AudioCleanupResponse",
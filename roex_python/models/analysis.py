@@ -7,6 +7,24 @@ from enum import Enum
 from typing import Any, Dict, Optional
 
 
+# Production metrics of an analysis payload, as collected by ``AnalysisController._extract_metrics``
+PRODUCTION_METRICS = (
+    "bit_depth", "clipping", "if_master_drc", "if_master_loudness",
+    "if_mix_drc", "if_mix_loudness", "integrated_loudness_lufs", "mix_style",
+    "mono_compatible", "musical_style", "peak_loudness_dbfs", "phase_issues",
+    "sample_rate", "stereo_field"
+)
+
+# Production metrics holding numbers
+NUMERIC_METRICS = ("integrated_loudness_lufs", "peak_loudness_dbfs", "bit_depth", "sample_rate")
+
+# Production metrics compared by equality; NUMERIC_METRICS are compared by difference
+CATEGORICAL_METRICS = ("clipping", "if_master_drc", "if_master_loudness", "stereo_field")
+
+# Bands of the payload's ``tonal_profile``
+TONAL_BANDS = ("bass_frequency", "low_mid_frequency", "high_mid_frequency", "high_frequency")
+
+
 class AnalysisMusicalStyle(Enum):
     """Musical styles for mix/master analysis"""
     ROCK = "ROCK"
@@ -80,4 +98,24 @@ class AnalysisResult:
     info: str = ""
     """str: Additional information from the API."""
     completion_time: str = ""
-    """str: Timestamp when the analysis completed."""
\ No newline at end of file
+    """str: Timestamp when the analysis completed."""
+
+
+@dataclass
+class AnalysisBatchItem:
+    """Outcome of one analysis, yielded by ``AnalysisController.analyze_batch``."""
+    index: int
+    """int: 0-based position of the request in the batch."""
+    request: MixAnalysisRequest
+    """MixAnalysisRequest: The request that was analyzed."""
+    result: Optional[AnalysisResult] = None
+    """Optional[AnalysisResult]: The analysis, or None if the request failed."""
+    error: Optional[str] = None
+    """Optional[str]: Description of the failure, or None on success."""
+    seconds: Optional[float] = None
+    """Optional[float]: Seconds the analysis request took."""
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if the analysis completed without a request or API error."""
+        return self.error is None and self.result is not None and not self.result.error
@@ -56,3 +56,28 @@ class AudioCleanupResponse(BaseResponse):
     """
     audio_cleanup_results: Optional[AudioCleanupResults] = None
     """Optional[AudioCleanupResults]: Contains detailed results of the cleanup task, including the URL for the cleaned audio file, if successful. Is `None` if the API request itself failed before processing could start or if the cleanup process encountered a fatal error."""
+
+@dataclass
+class AudioCleanupBatchItem:
+    """Outcome of one cleanup, yielded by ``AudioCleanupController.clean_up_batch``."""
+    index: int
+    """int: 0-based position of the request in the batch."""
+    request: AudioCleanupData
+    """AudioCleanupData: The request that was processed."""
+    response: Optional[AudioCleanupResponse] = None
+    """Optional[AudioCleanupResponse]: The API response, or None if the request raised."""
+    error: Optional[Exception] = None
+    """Optional[Exception]: None on success; otherwise the exception the request raised (e.g. ``RoExApiError``, ``RoExTimeoutError``, ``requests.ConnectionError``), or a ``RoExTaskError`` if the API reported the cleanup as failed."""
+    seconds: Optional[float] = None
+    """Optional[float]: Seconds the cleanup request took."""
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if the track was cleaned up."""
+        return self.error is None and self.response is not None
+
+    @property
+    def cleaned_audio_file_location(self) -> Optional[str]:
+        """Optional[str]: URL of the cleaned audio file, if the cleanup succeeded."""
+        results = self.response.audio_cleanup_results if self.response is not None else None
+        return results.cleaned_audio_file_location if results is not None else None
@@ -0,0 +1,68 @@
+"""
+Models for bulk downloads of task results
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class DownloadResult:
+    """
+    Outcome of downloading one file as part of a batch.
+
+    Returned inside ``BatchDownloadResult`` by ``RoExClient.download_all``.
+    """
+    name: str
+    """str: Name of the output, e.g. "mix" or a stem name such as "vocal"."""
+    url: str
+    """str: Signed URL the file was downloaded from."""
+    path: Optional[str] = None
+    """Optional[str]: Local path of the downloaded file, or None if the download failed."""
+    bytes_downloaded: int = 0
+    """int: Size of the downloaded file in bytes."""
+    seconds: float = 0.0
+    """float: Seconds spent downloading this file."""
+    error: Optional[str] = None
+    """Optional[str]: Description of what went wrong, or None on success."""
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if the file was downloaded."""
+        return self.error is None and self.path is not None
+
+
+@dataclass
+class BatchDownloadResult:
+    """
+    Outcome of ``RoExClient.download_all``: per-file results keyed by name plus aggregate stats.
+    """
+    files: Dict[str, DownloadResult] = field(default_factory=dict)
+    """Dict[str, DownloadResult]: One result per output, keyed by name."""
+    elapsed_seconds: float = 0.0
+    """float: Wall-clock time for the whole batch."""
+
+    @property
+    def paths(self) -> Dict[str, str]:
+        """Dict[str, str]: Local paths of the downloaded files, keyed by name."""
+        return {name: f.path for name, f in self.files.items() if f.ok}
+
+    @property
+    def failed(self) -> List[DownloadResult]:
+        """List[DownloadResult]: Results of the files that could not be downloaded."""
+        return [f for f in self.files.values() if not f.ok]
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if every file was downloaded."""
+        return not self.failed
+
+    @property
+    def total_bytes(self) -> int:
+        """int: Total bytes downloaded."""
+        return sum(f.bytes_downloaded for f in self.files.values() if f.ok)
+
+    @property
+    def throughput(self) -> float:
+        """float: Aggregate download throughput in bytes per second."""
+        return self.total_bytes / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
@@ -46,9 +46,8 @@ class AlbumMasteringRequest:
     """
     Represents a request to master multiple tracks, potentially as part of an album.
 
-    Note: While this model exists, the current `MasteringController` might not expose
-    a direct method for album mastering. It typically handles tracks individually.
-    This model might be reserved for future use or internal API structures.
+    Processed by ``MasteringController.process_album``, which masters each track
+    individually, either one at a time or several concurrently.
     """
     tracks: List[MasteringRequest]
     """List[MasteringRequest]: A list of individual MasteringRequest objects, one for each track to be mastered."""
@@ -67,4 +66,30 @@ class PreviewMasterResult:
 class FinalMasterResult:
     """Result of a completed final master from the ``/retrievefinalmaster`` endpoint."""
     download_url_mastered: Optional[str] = None
-    """Optional[str]: Signed URL for the final mastered audio file."""
\ No newline at end of file
+    """Optional[str]: Signed URL for the final mastered audio file."""
+
+
+@dataclass
+class AlbumTrackResult:
+    """Outcome of mastering one album track, yielded by ``MasteringController.iter_album``."""
+    index: int
+    """int: 1-based position of the track in ``AlbumMasteringRequest.tracks``."""
+    task_id: Optional[str] = None
+    """Optional[str]: The ``mastering_task_id``, or None if the task could not be created."""
+    final_url: Optional[str] = None
+    """Optional[str]: Signed URL of the final master."""
+    local_path: Optional[str] = None
+    """Optional[str]: Path the final master was downloaded to, or None if it was not downloaded."""
+    error: Optional[str] = None
+    """Optional[str]: Description of the first step that failed, or None on success."""
+    preview_seconds: Optional[float] = None
+    """Optional[float]: Seconds from submission until the preview was ready."""
+    download_seconds: Optional[float] = None
+    """Optional[float]: Seconds spent downloading the final master."""
+    total_seconds: Optional[float] = None
+    """Optional[float]: Seconds from submission until the track finished, including download."""
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if the final master was retrieved and downloaded."""
+        return self.error is None and self.local_path is not None
@@ -5,6 +5,8 @@ Models for the mixing-related API endpoints
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from roex_python.models.download import BatchDownloadResult
+from roex_python.models.upload import BatchUploadResult
 from roex_python.models.common import (
     DesiredLoudness,
     InstrumentGroup,
@@ -431,4 +433,39 @@ class FinalMixResult:
     stems: Optional[Dict[str, str]] = None
     """Optional[Dict[str, str]]: URLs keyed by stem name, if stems were requested."""
     mix_output_settings: Optional[Dict[str, Any]] = None
-    """Optional[Dict[str, Any]]: The mixing settings applied."""
\ No newline at end of file
+    """Optional[Dict[str, Any]]: The mixing settings applied."""
+
+
+@dataclass
+class MultitrackPipelineResult:
+    """Outcome of ``MultitrackPipeline.run``: the output of each stage and how long it took."""
+    track_urls: List[str] = field(default_factory=list)
+    """List[str]: URL of each track sent to the API, in track order."""
+    task_id: Optional[str] = None
+    """Optional[str]: The ``multitrack_task_id`` of the mix, once created."""
+    preview: Optional[PreviewMixResult] = None
+    """Optional[PreviewMixResult]: The completed mix preview."""
+    final: Optional[FinalMixResult] = None
+    """Optional[FinalMixResult]: The final mix (mastered if ``create_master`` was set)."""
+    uploads: Optional[BatchUploadResult] = None
+    """Optional[BatchUploadResult]: Per-stem upload results, or None if no track needed uploading."""
+    downloads: Optional[BatchDownloadResult] = None
+    """Optional[BatchDownloadResult]: The downloaded preview, final mix and stems, keyed by name."""
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    """Dict[str, float]: Seconds spent in each stage that ran: "upload", "preview", "final_mix" and "download"."""
+    total_seconds: Optional[float] = None
+    """Optional[float]: Seconds from start to finish."""
+    failed_stage: Optional[str] = None
+    """Optional[str]: The stage that failed, or None on success."""
+    error: Optional[str] = None
+    """Optional[str]: Description of the failure, or None on success."""
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if every stage succeeded."""
+        return self.error is None
+
+    @property
+    def paths(self) -> Dict[str, str]:
+        """Dict[str, str]: Local paths of the downloaded files, keyed by name ("preview_mix", "mix" or a stem)."""
+        return self.downloads.paths if self.downloads is not None else {}
@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from .common import BaseResponse
 
 @dataclass
@@ -27,3 +27,129 @@ class UploadUrlResponse(BaseResponse):
     """Optional[str]: The pre-signed URL to use for uploading the file via an HTTP PUT request. This URL is temporary and has write permissions."""
     readable_url: Optional[str] = None
     """Optional[str]: The permanent URL that represents the uploaded file. Use this URL in other RoEx API calls (e.g., mixing, mastering) that require a file location."""
+
+@dataclass
+class UploadProgress:
+    """
+    Snapshot of an upload in progress, passed to ``on_progress`` callbacks.
+
+    Reported by ``ApiProvider.upload_to_signed_url``, ``utils.upload_file`` and
+    ``utils.upload_files`` each time more of the file has been accepted by storage.
+    """
+    bytes_sent: int
+    """int: Bytes acknowledged so far."""
+    total_bytes: int
+    """int: Size of the file."""
+    elapsed_seconds: float
+    """float: Seconds since the upload started, including retries."""
+    path: Optional[str] = None
+    """Optional[str]: Local path of the file, when known."""
+
+    @property
+    def fraction(self) -> float:
+        """float: Share of the file uploaded, from 0.0 to 1.0."""
+        return self.bytes_sent / self.total_bytes if self.total_bytes else 1.0
+
+    @property
+    def throughput(self) -> float:
+        """float: Average upload speed so far in bytes per second."""
+        return self.bytes_sent / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Optional[float]: Estimated seconds remaining at the average speed, or None before any bytes are sent."""
+        if self.bytes_sent >= self.total_bytes:
+            return 0.0
+        if self.throughput <= 0:
+            return None
+        return (self.total_bytes - self.bytes_sent) / self.throughput
+
+@dataclass
+class TranscodeResult:
+    """
+    Outcome of transcoding a WAV file to FLAC before upload.
+
+    Returned by ``transcode.transcode_to_flac`` and attached to ``FileUploadResult.transcode``.
+    """
+    source_path: str
+    """str: The WAV file that was transcoded."""
+    original_bytes: int = 0
+    """int: Size of the WAV file."""
+    flac_path: Optional[str] = None
+    """Optional[str]: Path of the FLAC file, or None if it was not worth keeping."""
+    flac_bytes: int = 0
+    """int: Size of the FLAC file, or 0 if it was skipped."""
+    skipped_reason: Optional[str] = None
+    """Optional[str]: Why the WAV was uploaded as-is, or None if the FLAC is used."""
+
+    @property
+    def bytes_saved(self) -> int:
+        """int: Bytes not uploaded because the FLAC was sent instead of the WAV."""
+        return self.original_bytes - self.flac_bytes if self.flac_path else 0
+
+@dataclass
+class FileUploadResult:
+    """
+    Outcome of uploading one file as part of a batch.
+
+    Returned inside ``BatchUploadResult`` by ``utils.upload_files``.
+    """
+    path: str
+    """str: Local path of the file."""
+    readable_url: Optional[str] = None
+    """Optional[str]: URL to use in other RoEx API calls, or None if the upload failed."""
+    error: Optional[str] = None
+    """Optional[str]: Description of what went wrong, or None on success."""
+    bytes_uploaded: int = 0
+    """int: Bytes sent; 0 if the upload failed or was skipped because of a cache hit."""
+    cached: bool = False
+    """bool: True if an identical file was uploaded before and the upload was skipped."""
+    transcode: Optional[TranscodeResult] = None
+    """Optional[TranscodeResult]: Outcome of FLAC transcoding, if it was attempted."""
+    seconds: float = 0.0
+    """float: Seconds from the start of the batch until this file finished (or failed)."""
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if the file was uploaded."""
+        return self.error is None and self.readable_url is not None
+
+@dataclass
+class BatchUploadResult:
+    """
+    Outcome of ``utils.upload_files``: per-file results in input order plus aggregate stats.
+    """
+    files: List[FileUploadResult] = field(default_factory=list)
+    """List[FileUploadResult]: One result per input path, in the same order."""
+    elapsed_seconds: float = 0.0
+    """float: Wall-clock time for the whole batch."""
+
+    @property
+    def readable_urls(self) -> List[Optional[str]]:
+        """List[Optional[str]]: Readable URLs in input order, with None for failed files."""
+        return [f.readable_url for f in self.files]
+
+    @property
+    def failed(self) -> List[FileUploadResult]:
+        """List[FileUploadResult]: Results of the files that could not be uploaded."""
+        return [f for f in self.files if not f.ok]
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if every file was uploaded."""
+        return not self.failed
+
+    @property
+    def total_bytes(self) -> int:
+        """int: Total bytes uploaded successfully (cache hits send nothing)."""
+        return sum(f.bytes_uploaded for f in self.files if f.ok)
+
+    @property
+    def bytes_saved(self) -> int:
+        """int: Bytes not uploaded thanks to FLAC transcoding."""
+        return sum(f.transcode.bytes_saved for f in self.files if f.ok and f.transcode is not None)
+
+    @property
+    def throughput(self) -> float:
+        """float: Aggregate upload throughput in bytes per second."""
+        return self.total_bytes / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
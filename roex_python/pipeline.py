@@ -0,0 +1,259 @@
+"""
+End-to-end multitrack pipeline: parallel upload, mix preview, final mix and download
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Iterator, List, Mapping, Optional, Sequence
+
+from roex_python.client import RoExClient
+from roex_python.downloads import download_all
+from roex_python.exceptions import RoExError, RoExTaskError, RoExTimeoutError
+from roex_python.models.common import DesiredLoudness, MusicalStyle
+from roex_python.models.download import BatchDownloadResult
+from roex_python.models.mixing import (
+    FinalMixRequestAdvanced,
+    MultitrackMixRequest,
+    MultitrackPipelineResult,
+    TrackData,
+    TrackEffectsData
+)
+from roex_python.polling import PollPolicy
+from roex_python.upload_cache import UploadCache
+from roex_python.utils import upload_files
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# Human-readable stage names for error messages
+_STAGE_NAMES = {
+    "upload": "Stem upload",
+    "preview": "Mix preview",
+    "final_mix": "Final mix",
+    "download": "Download",
+}
+
+
+class MultitrackPipeline:
+    """
+    Runs a multitrack mix end to end: upload, preview, final mix (and master), download.
+
+    ``run`` replaces the hand-chained sequence of ``upload_file`` per stem,
+    ``create_mix_preview``, ``retrieve_preview_mix``,
+    ``retrieve_final_mix_advanced`` and ``download_file`` with one call
+    whose stages overlap where they can:
+
+    - every local stem is uploaded concurrently with ``upload_files``, and
+      the mix is submitted as soon as the last URL lands;
+    - the preview is polled by the client's shared ``PollScheduler`` (or
+      resolved by its ``WebhookListener``) rather than a blocking loop;
+    - the preview mix downloads in the background while the final mix is
+      requested;
+    - the final mix and its stems download in parallel with ``download_all``.
+
+    A pipeline holds only settings, so one instance can ``run`` several
+    songs from different threads; their previews share the scheduler and
+    their requests the client's pooled connections.
+
+    Example:
+        >>> pipeline = client.multitrack_pipeline(MusicalStyle.POP, create_master=True,
+        ...                                       desired_loudness=DesiredLoudness.MEDIUM)
+        >>> tracks = [
+        ...     TrackData("stems/drums.wav", InstrumentGroup.DRUMS_GROUP, PresenceSetting.NORMAL,
+        ...               PanPreference.CENTRE),
+        ...     TrackData("stems/vocals.wav", InstrumentGroup.VOCAL_GROUP, PresenceSetting.LEAD,
+        ...               PanPreference.CENTRE),
+        ... ]
+        >>> result = pipeline.run(tracks, output_dir="song_1")
+        >>> print(result.paths["mix"], result.stage_seconds)
+    """
+
+    def __init__(self, client: RoExClient, musical_style: MusicalStyle, return_stems: bool = False,
+                 create_master: bool = False, desired_loudness: Optional[DesiredLoudness] = None,
+                 sample_rate: str = "44100", upload_workers: int = 8, download_workers: int = 8,
+                 upload_cache: Optional[UploadCache] = None, transcode: bool = False,
+                 download_preview: bool = True, preview_timeout: Optional[float] = 600,
+                 poll_policy: Optional[PollPolicy] = None):
+        """
+        Args:
+            client: Client whose controllers, scheduler and connections are used.
+            musical_style: Musical style of the mix.
+            return_stems: Request processed stems with the final mix and download
+                them. Defaults to False.
+            create_master: Master the final mix. Defaults to False.
+            desired_loudness: Target loudness of the final mix, if any.
+            sample_rate: Output sample rate, "44100" or "48000". Defaults to "44100".
+            upload_workers: Maximum number of concurrent stem uploads. Defaults to 8.
+            download_workers: Maximum number of concurrent downloads. Defaults to 8.
+            upload_cache: Optional ``UploadCache``, so stems uploaded by an
+                earlier run are not uploaded again.
+            transcode: Convert WAV stems to FLAC before upload (requires
+                ``soundfile``). Defaults to False.
+            download_preview: Download the preview mix as "preview_mix" while
+                the final mix is requested. Defaults to True.
+            preview_timeout: Seconds to wait for the preview, or None to wait
+                as long as the poll policy allows. Defaults to 600.
+            poll_policy: Custom backoff curve and limits for polling the preview.
+
+        Raises:
+            ValueError: If *upload_workers* or *download_workers* is less than 1
+        """
+        if upload_workers < 1:
+            raise ValueError(f"upload_workers must be at least 1, got {upload_workers}")
+        if download_workers < 1:
+            raise ValueError(f"download_workers must be at least 1, got {download_workers}")
+        self.client = client
+        self.musical_style = musical_style
+        self.return_stems = return_stems
+        self.create_master = create_master
+        self.desired_loudness = desired_loudness
+        self.sample_rate = sample_rate
+        self.upload_workers = upload_workers
+        self.download_workers = download_workers
+        self.upload_cache = upload_cache
+        self.transcode = transcode
+        self.download_preview = download_preview
+        self.preview_timeout = preview_timeout
+        self.poll_policy = poll_policy
+
+    def run(self, tracks: Sequence[TrackData], output_dir: str,
+            track_effects: Optional[Mapping[str, TrackEffectsData]] = None) -> MultitrackPipelineResult:
+        """
+        Mix a set of stems and download the results.
+
+        Args:
+            tracks: One ``TrackData`` per stem. ``track_url`` may be a local
+                path, which is uploaded first, or the URL of an uploaded file.
+            output_dir: Directory to save the preview, final mix and stems in;
+                created if needed. Files are named as by ``download_all``.
+            track_effects: Optional final-mix settings (gain, EQ, compression,
+                panning) keyed by the ``track_url`` given in *tracks*; their own
+                ``track_url`` is replaced by the uploaded URL. Tracks without an
+                entry get no extra gain or effects.
+
+        Returns:
+            MultitrackPipelineResult: Each stage's output and timing. If a stage
+            fails, later stages are skipped and ``failed_stage`` and ``error``
+            say why; errors are not raised.
+
+        Raises:
+            ValueError: If there are fewer than 2 or more than 32 tracks
+        """
+        # Validates the track count before anything is uploaded
+        request = MultitrackMixRequest(track_data=list(tracks), musical_style=self.musical_style,
+                                       return_stems=self.return_stems, sample_rate=self.sample_rate)
+        os.makedirs(output_dir, exist_ok=True)
+        logger.info(f"Starting multitrack pipeline for {len(tracks)} tracks")
+        started = time.monotonic()
+        result = MultitrackPipelineResult()
+        background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="roex-pipeline")
+        preview_download: Optional[Future] = None
+        stage = "upload"
+        try:
+            uploaded = self._upload(tracks, result)
+            stage = "preview"
+            preview_download = self._preview(replace(request, track_data=uploaded), output_dir, result, background)
+            stage = "final_mix"
+            self._final_mix(tracks, uploaded, track_effects or {}, result)
+            stage = "download"
+            self._download(output_dir, result, preview_download)
+        except Exception as e:
+            result.failed_stage = stage
+            result.error = f"{_STAGE_NAMES[stage]} failed: {e}"
+            logger.error(f"Multitrack pipeline stopped: {result.error}")
+        finally:
+            background.shutdown(wait=True)
+            if result.downloads is None and preview_download is not None:
+                # A later stage failed; still report the preview that was downloaded
+                result.downloads = preview_download.result()
+            result.total_seconds = time.monotonic() - started
+        logger.info(f"Multitrack pipeline finished in {result.total_seconds:.1f}s: "
+                    + ", ".join(f"{name} {seconds:.1f}s" for name, seconds in result.stage_seconds.items()))
+        return result
+
+    def _upload(self, tracks: Sequence[TrackData], result: MultitrackPipelineResult) -> List[TrackData]:
+        """Upload every local stem concurrently and return *tracks* pointing at the uploaded URLs."""
+        local_paths = list(dict.fromkeys(track.track_url for track in tracks if not _is_url(track.track_url)))
+        urls = {}
+        if local_paths:
+            with self._timed(result, "upload"):
+                result.uploads = upload_files(self.client, local_paths, max_workers=self.upload_workers,
+                                              cache=self.upload_cache, transcode=self.transcode)
+            if result.uploads.failed:
+                raise RoExError("; ".join(f"{f.path}: {f.error}" for f in result.uploads.failed))
+            urls = dict(zip(local_paths, result.uploads.readable_urls))
+        uploaded = [replace(track, track_url=urls.get(track.track_url, track.track_url)) for track in tracks]
+        result.track_urls = [track.track_url for track in uploaded]
+        return uploaded
+
+    def _preview(self, request: MultitrackMixRequest, output_dir: str, result: MultitrackPipelineResult,
+                 background: ThreadPoolExecutor) -> Optional[Future]:
+        """Submit the mix, wait for its preview on the shared scheduler and start downloading it."""
+        with self._timed(result, "preview"):
+            handle = self.client.mix.submit_preview(request, poll_policy=self.poll_policy)
+            result.task_id = handle.task_id
+            try:
+                result.preview = handle.result(timeout=self.preview_timeout)
+            except FutureTimeoutError:
+                handle.cancel()
+                raise RoExTimeoutError(f"Preview of task {handle.task_id} was not ready after "
+                                       f"{self.preview_timeout} seconds", timeout=self.preview_timeout)
+        logger.info(f"Mix preview ready for task {result.task_id}")
+        preview_url = result.preview.download_url_preview_mixed
+        if not self.download_preview or not preview_url:
+            return None
+        return background.submit(download_all, self.client.api_provider, {"preview_mix": preview_url}, output_dir,
+                                 max_workers=1)
+
+    def _final_mix(self, tracks: Sequence[TrackData], uploaded: List[TrackData],
+                   track_effects: Mapping[str, TrackEffectsData], result: MultitrackPipelineResult) -> None:
+        """Request the final (optionally mastered) mix with each track's effects."""
+        effects = []
+        for track, uploaded_track in zip(tracks, uploaded):
+            settings = track_effects.get(track.track_url)
+            effects.append(replace(settings, track_url=uploaded_track.track_url) if settings is not None
+                           else TrackEffectsData(track_url=uploaded_track.track_url))
+        with self._timed(result, "final_mix"):
+            result.final = self.client.mix.retrieve_final_mix_advanced(FinalMixRequestAdvanced(
+                multitrack_task_id=result.task_id,
+                track_data=effects,
+                return_stems=self.return_stems,
+                create_master=self.create_master,
+                desired_loudness=self.desired_loudness,
+                sample_rate=self.sample_rate,
+            ))
+        if not result.final.download_url_mixed:
+            raise RoExTaskError("The API returned no final mix URL", task_id=result.task_id)
+
+    def _download(self, output_dir: str, result: MultitrackPipelineResult,
+                  preview_download: Optional[Future]) -> None:
+        """Download the final mix and its stems in parallel, then collect the preview download."""
+        with self._timed(result, "download"):
+            batch = download_all(self.client.api_provider, result.final, output_dir,
+                                 max_workers=self.download_workers)
+            if preview_download is not None:
+                preview: BatchDownloadResult = preview_download.result()
+                batch.files = {**preview.files, **batch.files}
+        result.downloads = batch
+        if batch.failed:
+            raise RoExError("; ".join(f"{f.name}: {f.error}" for f in batch.failed))
+
+    @staticmethod
+    @contextmanager
+    def _timed(result: MultitrackPipelineResult, stage: str) -> Iterator[None]:
+        """Record the time spent in the block as *stage*, even if it raises."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            result.stage_seconds[stage] = time.monotonic() - started
+
+
+def _is_url(location: str) -> bool:
+    """True if *location* is an http(s) URL rather than a local path."""
+    return location.startswith("http://") or location.startswith("https://")
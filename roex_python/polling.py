@@ -0,0 +1,250 @@
+"""
+Shared polling engine for long-running RoEx tasks
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import requests
+
+from roex_python.deadline import Deadline
+from roex_python.exceptions import RoExApiError, RoExTaskError, RoExTimeoutError
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+def reports_failure(response: Any, results_key: str) -> bool:
+    """
+    Return True if a retrieval response reports a failed task.
+
+    The RoEx retrieval endpoints report progress in a ``status`` string, either
+    at the top level or inside the results section named *results_key* (e.g.
+    ``MIX_TASK_PREVIEW_FAILED``). Use as the ``is_failed`` predicate of
+    ``TaskPoller.poll`` and ``PollScheduler.watch``.
+    """
+    if not isinstance(response, dict):
+        return False
+    results = response.get(results_key)
+    statuses = [response.get("status")]
+    if isinstance(results, dict):
+        statuses.append(results.get("status"))
+    return any(isinstance(status, str) and "FAIL" in status.upper() for status in statuses)
+
+
+@dataclass
+class PollPolicy:
+    """
+    Backoff curve used while waiting for a task to finish.
+
+    The first poll is sent immediately. After that the wait starts at
+    *first_delay* and grows by *backoff* after every poll, up to *max_delay*,
+    so short tasks are picked up quickly while long ones are not hammered.
+    Each wait is randomised by +/- *jitter* so many concurrent pollers spread
+    out instead of hitting the API together.
+    """
+    first_delay: float = 2.0
+    """float: Seconds to wait after the first poll. Defaults to 2."""
+    backoff: float = 1.5
+    """float: Factor by which the wait grows after each further poll. Defaults to 1.5."""
+    max_delay: float = 20.0
+    """float: Upper bound on a single wait in seconds. Defaults to 20."""
+    jitter: float = 0.1
+    """float: Random fraction (0-1) applied to each wait. Defaults to 0.1 (+/- 10%)."""
+    max_attempts: Optional[int] = 30
+    """Optional[int]: Maximum number of polls, or None to rely on *timeout* only. Defaults to 30."""
+    timeout: Optional[float] = None
+    """Optional[float]: End-to-end deadline in seconds for the whole poll. Defaults to None."""
+
+    def __post_init__(self):
+        """Validate backoff parameters."""
+        if self.first_delay < 0 or self.max_delay < self.first_delay:
+            raise ValueError("first_delay must be non-negative and no larger than max_delay.")
+        if self.backoff < 1.0:
+            raise ValueError(f"backoff must be at least 1.0, got {self.backoff}")
+        if not 0.0 <= self.jitter <= 1.0:
+            raise ValueError(f"jitter must be between 0.0 and 1.0, got {self.jitter}")
+        if self.max_attempts is not None and self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {self.max_attempts}")
+        if self.max_attempts is None and self.timeout is None:
+            raise ValueError("At least one of max_attempts and timeout must be set.")
+
+    @staticmethod
+    def fixed(interval: float, max_attempts: Optional[int] = 30, timeout: Optional[float] = None) -> "PollPolicy":
+        """Create a policy that waits exactly *interval* seconds between polls."""
+        return PollPolicy(first_delay=interval, backoff=1.0, max_delay=interval, jitter=0.0,
+                          max_attempts=max_attempts, timeout=timeout)
+
+    @staticmethod
+    def resolve(poll_policy: Optional["PollPolicy"], max_attempts: Optional[int] = None,
+                poll_interval: Optional[float] = None, timeout: Optional[float] = None) -> "PollPolicy":
+        """
+        Combine a controller method's polling arguments into a single policy.
+
+        A *poll_interval* selects a fixed-interval policy; otherwise *poll_policy*
+        (or the default backoff curve) is used. Explicit *max_attempts* and
+        *timeout* values override the policy's own.
+        """
+        if poll_interval is not None:
+            base = PollPolicy.fixed(poll_interval)
+        else:
+            base = poll_policy if poll_policy is not None else PollPolicy()
+        return PollPolicy(
+            first_delay=base.first_delay,
+            backoff=base.backoff,
+            max_delay=base.max_delay,
+            jitter=base.jitter,
+            max_attempts=max_attempts if max_attempts is not None else base.max_attempts,
+            timeout=timeout if timeout is not None else base.timeout,
+        )
+
+    def delay(self, attempt: int) -> float:
+        """
+        Seconds to wait after poll number *attempt* (1-based).
+
+        Args:
+            attempt: Number of polls sent so far.
+        """
+        delay = min(self.max_delay, self.first_delay * self.backoff ** (attempt - 1))
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return delay
+
+
+class TaskPoller:
+    """
+    Polls a RoEx retrieval endpoint until a task completes.
+
+    Used by ``retrieve_preview_mix``, ``retrieve_preview_master`` and
+    ``retrieve_enhanced_track`` (and their async counterparts). Each poll is
+    passed to a *check* function that returns the parsed result once the
+    task is done, or None while it is still processing. Errors that polling
+    cannot fix (authentication, bad requests, a task reported as failed)
+    end the poll immediately; transient errors are logged and polled past.
+
+    Example:
+        >>> poller = TaskPoller(PollPolicy(first_delay=1, max_delay=10, timeout=300))
+        >>> result = poller.poll(api_provider.post, "/retrievepreviewmaster", payload,
+        >>>                      MasteringController._check_preview_master, task_id=task_id)
+    """
+
+    def __init__(self, policy: Optional[PollPolicy] = None):
+        """
+        Args:
+            policy: Backoff curve and limits. Defaults to ``PollPolicy()``.
+        """
+        self.policy = policy if policy is not None else PollPolicy()
+
+    @staticmethod
+    def _raise_if_unrecoverable(error: requests.HTTPError) -> None:
+        """Re-raise errors that will not resolve by polling again."""
+        # 404 is tolerated because a freshly created task may not be visible yet
+        if isinstance(error, RoExApiError) and not error.retryable and error.status_code != 404:
+            raise error
+
+    def _handle_response(self, response: Dict[str, Any], check: Callable[[Dict[str, Any]], Optional[R]],
+                         is_failed: Optional[Callable[[Dict[str, Any]], bool]], task_id: str) -> Optional[R]:
+        """Return the result if the task is done, raise if it failed, else None."""
+        if is_failed is not None and is_failed(response):
+            status = response.get("status") if isinstance(response, dict) else None
+            raise RoExTaskError(f"Task {task_id} failed with status {status}: {response}",
+                                task_id=task_id, status=status)
+        result = check(response)
+        if result is None and isinstance(response, dict) and "status" in response:
+            logger.info(f"Task {task_id} status: {response.get('status')}")
+        return result
+
+    def _timed_out(self, endpoint: str, task_id: str, attempts: int) -> RoExTimeoutError:
+        """Build the error raised when *max_attempts* polls have not produced a result."""
+        logger.error(f"Polling timed out for task {task_id} at {endpoint} after {attempts} attempts.")
+        return RoExTimeoutError(
+            f"Task {task_id} ({endpoint}) did not complete after polling {attempts} times.",
+            timeout=self.policy.timeout,
+        )
+
+    def poll(self, request: Callable[..., Dict[str, Any]], endpoint: str, payload: Dict[str, Any],
+             check: Callable[[Dict[str, Any]], Optional[R]], task_id: str,
+             is_failed: Optional[Callable[[Dict[str, Any]], bool]] = None) -> R:
+        """
+        Poll *endpoint* until *check* returns a result.
+
+        Args:
+            request: Function sending the request, called as
+                ``request(endpoint, payload, deadline=deadline)`` (e.g. ``ApiProvider.post``).
+            endpoint: Retrieval endpoint path, e.g. "/retrievepreviewmix".
+            payload: JSON payload identifying the task.
+            check: Returns the parsed result once the task is done, otherwise None.
+            task_id: Task ID, for logging and errors.
+            is_failed: Optional predicate returning True when a response reports
+                that the task has failed, which ends polling early.
+
+        Returns:
+            The result returned by *check*.
+
+        Raises:
+            RoExTimeoutError: If the task is not done within the policy's
+                *max_attempts* or *timeout*.
+            RoExTaskError: If *is_failed* reports a failed task.
+            RoExApiError: If the API rejects the request (e.g. 401 invalid API key).
+        """
+        policy = self.policy
+        deadline = Deadline(policy.timeout)
+        attempt = 0
+        while policy.max_attempts is None or attempt < policy.max_attempts:
+            deadline.check(f"Task {task_id}")
+            attempt += 1
+            try:
+                logger.debug(f"Polling {endpoint} for task {task_id} (attempt {attempt})")
+                response = request(endpoint, payload, deadline=deadline)
+                result = self._handle_response(response, check, is_failed, task_id)
+                if result is not None:
+                    logger.info(f"Task {task_id} completed after {attempt} polls.")
+                    return result
+            except requests.HTTPError as e:
+                self._raise_if_unrecoverable(e)
+                logger.error(f"Error during polling for task {task_id}: {e}")
+            except (RoExTimeoutError, RoExTaskError):
+                raise
+            except Exception as e:
+                logger.exception(f"Unexpected error during polling for task {task_id}: {e}")
+
+            if policy.max_attempts is None or attempt < policy.max_attempts:
+                time.sleep(deadline.cap(policy.delay(attempt)))
+
+        raise self._timed_out(endpoint, task_id, attempt)
+
+    async def apoll(self, request: Callable[..., Awaitable[Dict[str, Any]]], endpoint: str,
+                    payload: Dict[str, Any], check: Callable[[Dict[str, Any]], Optional[R]], task_id: str,
+                    is_failed: Optional[Callable[[Dict[str, Any]], bool]] = None) -> R:
+        """Coroutine counterpart of ``poll``; *request* must be a coroutine function."""
+        policy = self.policy
+        deadline = Deadline(policy.timeout)
+        attempt = 0
+        while policy.max_attempts is None or attempt < policy.max_attempts:
+            deadline.check(f"Task {task_id}")
+            attempt += 1
+            try:
+                logger.debug(f"Polling {endpoint} for task {task_id} (attempt {attempt})")
+                response = await request(endpoint, payload, deadline=deadline)
+                result = self._handle_response(response, check, is_failed, task_id)
+                if result is not None:
+                    logger.info(f"Task {task_id} completed after {attempt} polls.")
+                    return result
+            except requests.HTTPError as e:
+                self._raise_if_unrecoverable(e)
+                logger.error(f"Error during polling for task {task_id}: {e}")
+            except (RoExTimeoutError, RoExTaskError):
+                raise
+            except Exception as e:
+                logger.exception(f"Unexpected error during polling for task {task_id}: {e}")
+
+            if policy.max_attempts is None or attempt < policy.max_attempts:
+                await asyncio.sleep(deadline.cap(policy.delay(attempt)))
+
+        raise self._timed_out(endpoint, task_id, attempt)
@@ -3,5 +3,7 @@ Provider classes for handling direct API interactions
 """
 
 from roex_python.providers.api_provider import ApiProvider
+from roex_python.providers.async_api_provider import AsyncApiProvider
+from roex_python.providers.retry import RetryPolicy, RetryBudget, EndpointRetry
 
-__all__ = ["ApiProvider"]
\ No newline at end of file
+__all__ = ["ApiProvider", "AsyncApiProvider", "RetryPolicy", "RetryBudget", "EndpointRetry"]
\ No newline at end of file
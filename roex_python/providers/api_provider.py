@@ -2,155 +2,727 @@
 Provider for making API calls to the RoEx Tonn API
 """
 
+import base64
+import binascii
+import hashlib
 import os
 import logging
-from typing import Any, Dict, Optional
+import random
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from urllib.parse import urljoin
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type, retry_if_result, before_sleep_log
+from requests.adapters import HTTPAdapter
+
+from roex_python.deadline import Deadline, RequestTimeout
+from roex_python.exceptions import RoExApiError, RoExDownloadError, RoExTimeoutError
+from roex_python.models.upload import UploadProgress
+from roex_python.providers.retry import RetryPolicy, is_retryable_error, parse_retry_after
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
-# Helper function for tenacity: Checks if the result has a retry-able status code
-def should_retry_on_http_error(result: Any) -> bool:
-    """Return True if the result is a Response object with a retry-able server error status code."""
-    # Check if the result is actually a Response object
-    if isinstance(result, requests.Response):
-        return result.status_code in {500, 502, 503, 504}
-    # If it's not a Response object (e.g., it's the parsed dict), it means success, so don't retry.
-    return False
+# Default (connect, read) timeout in seconds. The read timeout bounds each wait
+# for data on the socket, not the total transfer time of large downloads.
+DEFAULT_TIMEOUT: RequestTimeout = (10.0, 120.0)
+
+# Resumable uploads send the body in chunks; storage requires each chunk but
+# the last to be a multiple of 256 KiB.
+UPLOAD_CHUNK_GRANULARITY = 256 * 1024
+DEFAULT_UPLOAD_CHUNK_SIZE = 32 * UPLOAD_CHUNK_GRANULARITY  # 8 MiB
+
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Segmented downloads give each concurrent range at least this many bytes
+DEFAULT_MIN_SEGMENT_SIZE = 8 * 1024 * 1024
+
+# Strong ETags of plain (non-multipart, non-composite) storage objects are the MD5 of the content
+_MD5_ETAG = re.compile(r'"([0-9a-fA-F]{32})"')
+
+
+def normalize_timeout(timeout: Union[float, Tuple[float, float]]) -> RequestTimeout:
+    """Return *timeout* as a (connect, read) tuple, validating that both are positive."""
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    if connect <= 0 or read <= 0:
+        raise ValueError("timeout values must be positive.")
+    return float(connect), float(read)
 
 
 class ApiProvider:
     """Provider for making API calls to the RoEx Tonn API"""
 
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(self, base_url: str, api_key: str, pool_connections: int = 10,
+                 pool_maxsize: int = 10, keep_alive: bool = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT):
         """
         Initialize the API provider
 
+        All requests made by the provider (API calls, signed-URL uploads and
+        file downloads) go through a single pooled ``requests.Session``, so
+        TCP and TLS connections are reused between calls instead of being
+        re-established for every request.
+
         Args:
             base_url: Base URL for the API (e.g., "https://tonn.roexaudio.com")
             api_key: API key for authentication
+            pool_connections: Number of per-host connection pools to cache
+                (one per distinct host, e.g. the API and the storage bucket).
+            pool_maxsize: Maximum number of connections kept open per host.
+                Should be at least the number of threads issuing requests
+                concurrently through this provider.
+            keep_alive: Whether to keep connections open between requests.
+                When False, every request is sent with ``Connection: close``.
+            retry_policy: Retry behaviour for ``post`` and ``get``. Defaults to
+                ``RetryPolicy()`` (3 attempts, jittered exponential backoff).
+            timeout: Per-request timeout in seconds, either a single value or a
+                (connect, read) tuple. Applies to every request, including
+                uploads and downloads, so a stalled socket cannot hang a worker.
         """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1.")
         self.base_url = base_url
         self.api_key = api_key
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.timeout = normalize_timeout(timeout)
         self.headers = {
             "Content-Type": "application/json",
             "x-api-key": api_key
         }
+        self.session = self._create_session()
         logger.info(f"ApiProvider initialized for base URL: {self.base_url}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=(retry_if_exception_type(requests.exceptions.RequestException) | retry_if_result(should_retry_on_http_error)),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
-    def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_session(self) -> requests.Session:
+        """Create the pooled session shared by every request made through this provider."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self) -> None:
+        """
+        Close the underlying session and release all pooled connections.
+
+        The provider should not be used after it has been closed.
+        """
+        logger.info(f"Closing ApiProvider session for base URL: {self.base_url}")
+        self.session.close()
+
+    def __enter__(self) -> "ApiProvider":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def _raise_if_deadline_passed(error: Exception, deadline: Optional[Deadline], operation: str) -> None:
+        """Report a request cut short by a deadline-capped timeout as RoExTimeoutError."""
+        if deadline is not None and deadline.expired:
+            raise RoExTimeoutError(
+                f"{operation} did not complete within {deadline.timeout} seconds.", timeout=deadline.timeout
+            ) from error
+
+    @staticmethod
+    def _raise_for_status(response: requests.Response, method: str, endpoint: str) -> None:
+        """
+        Raise a RoExApiError carrying the status code if the response is not OK.
+
+        Args:
+            response: The HTTP response to check
+            method: HTTP method, for the error message
+            endpoint: Endpoint path or URL that was called
+        """
+        if response.ok:
+            return
+        text = response.text or ""
+        logger.warning(f"Non-OK ({response.status_code}) response from {endpoint}. Response text: {text[:500]}...") # Log beginning of error text
+        raise RoExApiError(
+            f"{method} {endpoint} failed with status {response.status_code}: {text[:500]}",
+            status_code=response.status_code,
+            endpoint=endpoint,
+            response_text=text,
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        )
+
+    def _timeout_for(self, deadline: Optional[Deadline], operation: str) -> RequestTimeout:
+        """Per-request timeout, shortened to fit within *deadline* if one is given."""
+        if deadline is None:
+            return self.timeout
+        return deadline.request_timeout(self.timeout, operation)
+
+    def post(self, endpoint: str, data: Dict[str, Any], deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """
         Make a POST request to the API, handling retries and specific errors.
 
         Args:
             endpoint: API endpoint path (e.g., "/mixpreview")
             data: JSON payload for the request
+            deadline: Optional deadline for the call. Request timeouts and retry
+                backoff are shortened so the call finishes before it.
 
         Returns:
             JSON response from the API
 
         Raises:
-            requests.HTTPError: If the request fails
+            RoExApiError: If the API returns an error status. 429 and 5xx
+                responses are retried first; other 4xx responses fail immediately.
+            requests.exceptions.RequestException: If the request fails at the
+                transport level after all retries.
+            RoExTimeoutError: If *deadline* passes before the call completes.
         """
+        return self.retry_policy.call(endpoint, self._post, endpoint, data, deadline, deadline=deadline)
+
+    def _post(self, endpoint: str, data: Dict[str, Any], deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Make a single POST attempt."""
         url = urljoin(self.base_url, endpoint)
+        timeout = self._timeout_for(deadline, f"POST {endpoint}")
         logger.info(f"Making POST request to: {url}")
         logger.debug(f"Request data (keys): {list(data.keys())}")
 
         try:
-            response = requests.post(url, json=data, headers=self.headers)
+            response = self.session.post(url, json=data, headers=self.headers, timeout=timeout)
             logger.info(f"Received response with status code: {response.status_code} from {url}")
-
-            # Check status *after* tenacity is done (if it didn't retry to success)
-            if not response.ok:
-                logger.warning(f"Non-OK ({response.status_code}) response from {url}. Response text: {response.text[:500]}...") # Log beginning of error text
-            response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+            self._raise_for_status(response, "POST", endpoint)
             # Try to parse as JSON, but handle non-JSON responses gracefully
             try:
                 return response.json()
             except ValueError:
                 return {"response": response.text}
+        except RoExApiError:
+            raise
         except requests.exceptions.RequestException as e:
             logger.exception(f"HTTP request failed: POST {url}. Error: {e}")
+            self._raise_if_deadline_passed(e, deadline, f"POST {endpoint}")
             raise
         except Exception as e:
             logger.exception(f"An unexpected error occurred during request: POST {url}. Error: {e}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=(retry_if_exception_type(requests.exceptions.RequestException) | retry_if_result(should_retry_on_http_error)),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
-    def get(self, endpoint: str) -> Any:
+    def get(self, endpoint: str, deadline: Optional[Deadline] = None) -> Any:
         """
         Make a GET request to the API, handling retries and specific errors.
 
         Args:
             endpoint: API endpoint path (e.g., "/health")
+            deadline: Optional deadline for the call. Request timeouts and retry
+                backoff are shortened so the call finishes before it.
 
         Returns:
             JSON response from the API or response text if not JSON
 
         Raises:
-            requests.HTTPError: If the request fails
+            RoExApiError: If the API returns an error status. 429 and 5xx
+                responses are retried first; other 4xx responses fail immediately.
+            requests.exceptions.RequestException: If the request fails at the
+                transport level after all retries.
+            RoExTimeoutError: If *deadline* passes before the call completes.
         """
+        return self.retry_policy.call(endpoint, self._get, endpoint, deadline, deadline=deadline)
+
+    def _get(self, endpoint: str, deadline: Optional[Deadline] = None) -> Any:
+        """Make a single GET attempt."""
         url = urljoin(self.base_url, endpoint)
+        timeout = self._timeout_for(deadline, f"GET {endpoint}")
         logger.info(f"Making GET request to: {url}")
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers, timeout=timeout)
             logger.info(f"Received response with status code: {response.status_code} from {url}")
-            
-            # Check status *after* tenacity is done (if it didn't retry to success)
-            if not response.ok:
-                logger.warning(f"Non-OK ({response.status_code}) response from {url}. Response text: {response.text[:500]}...") # Log beginning of error text
-            response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+            self._raise_for_status(response, "GET", endpoint)
             # Try to parse as JSON, but handle non-JSON responses gracefully
             try:
                 return response.json()
             except ValueError: # Handle cases where API might return non-JSON on success
                  logger.warning(f"Response from GET {url} is not JSON. Returning raw text.")
-                 return response.text # Or raise RoexApiException if JSON is always expected
+                 return response.text
 
+        except RoExApiError:
+            raise
         except requests.exceptions.RequestException as e:
             logger.exception(f"HTTP request failed: GET {url}. Error: {e}")
+            self._raise_if_deadline_passed(e, deadline, f"GET {endpoint}")
             raise
         except Exception as e:
             logger.exception(f"An unexpected error occurred during request: GET {url}. Error: {e}")
             raise
 
-    def download_file(self, url: str, local_filename: str, chunk_size: int = 8192) -> bool:
+    def upload_to_signed_url(self, signed_url: str, data: Any, content_type: str,
+                             chunk_size: Optional[int] = None,
+                             on_progress: Optional[Callable[[UploadProgress], None]] = None,
+                             max_chunk_retries: int = 5) -> requests.Response:
+        """
+        Upload raw file data to a pre-signed URL using the pooled session.
+
+        Unlike ``post`` and ``get``, the URL is absolute and no API key is sent,
+        since signed URLs carry their own authorization.
+
+        With the defaults the data is sent in a single PUT. When *chunk_size*
+        is given and *data* is a seekable file larger than one chunk, a
+        resumable upload session is opened on the signed URL and the file is
+        sent one chunk at a time: a chunk that fails with a transport error,
+        429 or 5xx is retried after asking storage how much it already holds,
+        so a dropped connection costs at most one chunk rather than the whole
+        file. Resumable sessions need a URL signed for POST as well as PUT;
+        if storage does not open one for the URL, for whatever reason, the
+        file is sent in a single PUT instead.
+
+        Args:
+            signed_url: The pre-signed upload URL returned by ``/upload``
+            data: File object, bytes or iterable to send as the request body
+            content_type: MIME type of the uploaded data
+            chunk_size: Bytes per chunk for resumable uploads; a positive
+                multiple of 256 KiB such as ``DEFAULT_UPLOAD_CHUNK_SIZE``
+                (8 MiB). None (the default) always uses a single PUT.
+            on_progress: Called with an ``UploadProgress`` each time more of the
+                file has been sent. Requires *data* to be a seekable file.
+            max_chunk_retries: Consecutive failed attempts allowed without
+                progress before the upload is abandoned.
+
+        Returns:
+            The HTTP response from the storage service
+
+        Raises:
+            RoExApiError: If the storage service rejects the upload
+            ValueError: If *chunk_size* is not a positive multiple of 256 KiB
+        """
+        if chunk_size is None and on_progress is None:
+            return self._put_signed_url(signed_url, data, content_type)
+        if chunk_size is not None and (chunk_size <= 0 or chunk_size % UPLOAD_CHUNK_GRANULARITY):
+            raise ValueError(f"chunk_size must be a positive multiple of {UPLOAD_CHUNK_GRANULARITY}, got {chunk_size}")
+
+        start = data.tell()
+        total = data.seek(0, os.SEEK_END) - start
+        data.seek(start)
+        progress = _ProgressReporter(total, getattr(data, "name", None), on_progress)
+        if chunk_size is not None and total > chunk_size:
+            session_url = self._start_resumable_upload(signed_url, content_type)
+            if session_url is not None:
+                return self._upload_chunks(session_url, data, start, total, chunk_size, max_chunk_retries, progress)
+        response = self._put_signed_url(signed_url, _ProgressReader(data, total, progress), content_type)
+        progress.report(total)
+        return response
+
+    def _put_signed_url(self, signed_url: str, data: Any, content_type: str) -> requests.Response:
+        """Send *data* to *signed_url* in a single PUT."""
+        response = self.session.put(signed_url, data=data, headers={"Content-Type": content_type},
+                                    timeout=self.timeout)
+        self._raise_for_status(response, "PUT", signed_url.split("?", 1)[0])
+        return response
+
+    def _start_resumable_upload(self, signed_url: str, content_type: str) -> Optional[str]:
+        """
+        Open a resumable upload session on *signed_url*.
+
+        Returns:
+            The session URL to send chunks to, or None if the session could
+            not be opened for any reason, e.g. the URL is only signed for PUT
+            or storage kept failing after the retry policy gave up.
+        """
+        endpoint = signed_url.split("?", 1)[0]
+
+        def start() -> requests.Response:
+            response = self.session.post(signed_url, data=b"", timeout=self.timeout,
+                                         headers={"Content-Type": content_type, "x-goog-resumable": "start"})
+            self._raise_for_status(response, "POST", endpoint)
+            return response
+
+        try:
+            response = self.retry_policy.call(endpoint, start)
+        except Exception as e:
+            # Nothing has been sent yet, so any failure to open a session,
+            # including retries exhausted on 429 or 5xx, falls back to a PUT
+            logger.info(f"Resumable upload not available for {endpoint} ({e}); using a single PUT")
+            return None
+        session_url = response.headers.get("Location")
+        if not session_url:
+            logger.info(f"No resumable session returned for {endpoint}; using a single PUT")
+        return session_url
+
+    def _upload_chunks(self, session_url: str, data: Any, start: int, total: int, chunk_size: int,
+                       max_chunk_retries: int, progress: "_ProgressReporter") -> requests.Response:
+        """Send the file to a resumable session chunk by chunk, resuming from the acknowledged offset."""
+        endpoint = session_url.split("?", 1)[0]
+        offset, failures, query_offset = 0, 0, False
+        while True:
+            try:
+                if query_offset:
+                    # Ask storage how much it kept before resending anything
+                    response = self._put_chunk(session_url, b"", f"bytes */{total}", endpoint)
+                else:
+                    data.seek(start + offset)
+                    chunk = data.read(chunk_size)
+                    content_range = f"bytes {offset}-{offset + len(chunk) - 1}/{total}"
+                    response = self._put_chunk(session_url, chunk, content_range, endpoint)
+            except Exception as e:
+                if not is_retryable_error(e) or failures >= max_chunk_retries:
+                    raise
+                failures += 1
+                delay = self._resume_delay(e, failures)
+                logger.warning(f"Upload chunk at byte {offset}/{total} failed ({e}); "
+                               f"resuming in {delay:.1f}s (attempt {failures}/{max_chunk_retries})")
+                time.sleep(delay)
+                query_offset = True
+                continue
+            query_offset = False
+            if response.status_code != 308:
+                progress.report(total)
+                return response
+            acknowledged = self._acknowledged_bytes(response)
+            if acknowledged > offset:
+                failures = 0
+            offset = acknowledged
+            progress.report(offset)
+
+    def _put_chunk(self, session_url: str, chunk: bytes, content_range: str, endpoint: str) -> requests.Response:
+        """PUT one chunk (or a status query) to a resumable session."""
+        response = self.session.put(session_url, data=chunk, headers={"Content-Range": content_range},
+                                    timeout=self.timeout)
+        self._raise_for_status(response, "PUT", endpoint)
+        return response
+
+    @staticmethod
+    def _acknowledged_bytes(response: requests.Response) -> int:
+        """Bytes stored so far, from the ``Range: bytes=0-N`` header of a 308 response."""
+        range_header = response.headers.get("Range")
+        if not range_header:
+            return 0
+        return int(range_header.rsplit("-", 1)[-1]) + 1
+
+    def _resume_delay(self, error: Exception, failures: int) -> float:
+        """Backoff before resuming a failed upload chunk or download, using the provider's retry settings."""
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return min(float(retry_after), self.retry_policy.max_retry_after)
+        ceiling = min(self.retry_policy.max_delay, self.retry_policy.base_delay * 2 ** (failures - 1))
+        return random.uniform(0, ceiling) if self.retry_policy.jitter else ceiling
+
+    def download_to_file(self, url: str, local_filename: str, chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+                         max_retries: int = 5, verify: bool = True, segments: int = 1,
+                         min_segment_size: int = DEFAULT_MIN_SEGMENT_SIZE,
+                         deadline: Optional[Deadline] = None) -> int:
+        """
+        Download a URL to a local file atomically using the pooled session.
+
+        The body is streamed to a temporary file next to *local_filename*,
+        which is renamed into place only once the download is complete and
+        verified, so readers never see a partial file and a failed download
+        leaves any existing file untouched.
+
+        A transfer that drops with a transport error, 429 or 5xx, or that ends
+        before ``Content-Length`` bytes have arrived, is resumed after a backoff
+        with an HTTP ``Range`` request from the last byte written. ``If-Range``
+        carries the first response's ETag (or Last-Modified), so if the file
+        changed in between the server sends it whole and the download restarts
+        from zero instead of splicing two versions together.
+
+        With *segments* above 1, a one-byte Range request first checks that
+        the server supports ranges and reports the file size. If it does, the
+        temporary file is preallocated and split into up to *segments* ranges
+        of at least *min_segment_size* bytes, which are fetched concurrently
+        and written in place, each resuming on its own after a failure. This
+        lifts the throughput cap of a single TCP stream for large files. If
+        ranges are not supported, the file is too small, or it changes while
+        the segments are fetched, the file is downloaded as a single stream.
+
+        Args:
+            url: URL of the file to download
+            local_filename: Path to save the downloaded file
+            chunk_size: Size of chunks for streaming download
+            max_retries: Consecutive failed attempts allowed without progress
+                before the download is abandoned.
+            verify: Check the downloaded bytes against the MD5 the server
+                reports (``x-goog-hash``, ``Content-MD5`` or an MD5 ETag), when
+                it reports one. The length is always checked.
+            segments: Maximum number of ranges to fetch concurrently. Defaults
+                to 1 (a single stream). Values above the client's ``pool_maxsize``
+                open connections that are not kept for reuse.
+            min_segment_size: Smallest range worth its own connection.
+            deadline: Optional deadline for the whole download. Request
+                timeouts and resume backoffs are capped by the time remaining,
+                and the transfer is abandoned once it passes.
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            RoExApiError: If the server returns an error status
+            RoExDownloadError: If the file is still incomplete or fails its
+                checksum after *max_retries* attempts
+            requests.exceptions.RequestException: If the transfer fails
+            RoExTimeoutError: If *deadline* passes before the download completes
+            OSError: If the file cannot be written
+            ValueError: If *segments* or *min_segment_size* is less than 1
+        """
+        if segments < 1 or min_segment_size < 1:
+            raise ValueError("segments and min_segment_size must be at least 1.")
+        directory = os.path.dirname(os.path.abspath(local_filename))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(local_filename)}.", suffix=".part", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                written = None
+                if segments > 1:
+                    written = self._download_segmented(url, f, temp_path, segments, min_segment_size,
+                                                       chunk_size, max_retries, verify, deadline)
+                if written is None:
+                    written = self._download_resumable(url, f, chunk_size, max_retries, verify, deadline)
+            os.replace(temp_path, local_filename)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        logger.info(f"Downloaded {written} bytes to {local_filename}")
+        return written
+
+    def _download_resumable(self, url: str, f: Any, chunk_size: int, max_retries: int, verify: bool,
+                            deadline: Optional[Deadline] = None) -> int:
+        """Stream *url* into the open file *f*, resuming with Range requests after failures."""
+        endpoint = url.split("?", 1)[0]
+        offset, failures = 0, 0
+        total: Optional[int] = None
+        validator: Optional[str] = None
+        expected_md5: Optional[str] = None
+        digest = None
+        while True:
+            attempt_offset = offset
+            # Ask for the stored bytes so Content-Length and Range refer to what is written
+            headers = {"Accept-Encoding": "identity"}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+                if validator:
+                    headers["If-Range"] = validator
+            try:
+                timeout = self._timeout_for(deadline, f"GET {endpoint}")
+                with self.session.get(url, stream=True, timeout=timeout, headers=headers) as r:
+                    self._raise_for_status(r, "GET", endpoint)
+                    if not (offset and r.status_code == 206 and self._range_start(r) == offset):
+                        if r.status_code == 206:
+                            offset = 0
+                            raise RoExDownloadError(f"GET {endpoint} returned an unexpected range: "
+                                                    f"{r.headers.get('Content-Range')}")
+                        if offset:
+                            logger.info(f"Server sent {endpoint} from the start; restarting download")
+                        f.seek(0)
+                        f.truncate()
+                        offset = 0
+                        total = self._content_length(r)
+                        validator = self._range_validator(r)
+                        expected_md5 = self._expected_md5(r) if verify else None
+                        digest = hashlib.md5() if expected_md5 else None
+                    for chunk in r.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                        offset += len(chunk)
+                        if digest is not None:
+                            digest.update(chunk)
+                        if deadline is not None:
+                            deadline.check(f"GET {endpoint}")
+                if total is not None and offset != total:
+                    raise RoExDownloadError(f"GET {endpoint} ended after {offset} of {total} bytes",
+                                            bytes_received=offset, expected_bytes=total)
+                if digest is not None and digest.hexdigest() != expected_md5:
+                    raise RoExDownloadError(f"GET {endpoint} failed its checksum: MD5 {digest.hexdigest()}, "
+                                            f"expected {expected_md5}", bytes_received=offset, expected_bytes=total)
+                return offset
+            except Exception as e:
+                self._raise_if_deadline_passed(e, deadline, f"GET {endpoint}")
+                if not (isinstance(e, RoExDownloadError) or is_retryable_error(e)) or failures >= max_retries:
+                    raise
+                if isinstance(e, RoExDownloadError) and (total is None or offset >= total):
+                    # Wrong length or checksum: what we hold cannot be trusted, so start again
+                    offset = 0
+                failures = failures + 1 if offset <= attempt_offset else 1
+                delay = self._resume_delay(e, failures)
+                logger.warning(f"Download of {endpoint} interrupted at byte {offset}/{total or '?'} ({e}); "
+                               f"resuming in {delay:.1f}s (attempt {failures}/{max_retries})")
+                time.sleep(delay if deadline is None else deadline.cap(delay))
+
+    def _download_segmented(self, url: str, f: Any, path: str, segments: int, min_segment_size: int,
+                            chunk_size: int, max_retries: int, verify: bool,
+                            deadline: Optional[Deadline] = None) -> Optional[int]:
+        """
+        Fetch *url* as concurrent ranges written in place into *path*.
+
+        Returns:
+            Number of bytes written, or None if the file should be downloaded
+            as a single stream instead.
+        """
+        endpoint = url.split("?", 1)[0]
+        probe_headers = {"Accept-Encoding": "identity", "Range": "bytes=0-0"}
+        probe_timeout = self._timeout_for(deadline, f"GET {endpoint}")
+        with self.session.get(url, stream=True, timeout=probe_timeout, headers=probe_headers) as probe:
+            # The body is not read, so a server ignoring Range costs no more than the headers
+            if probe.status_code == 416:
+                return None  # empty file
+            self._raise_for_status(probe, "GET", endpoint)
+            total = self._range_total(probe) if probe.status_code == 206 else None
+            validator = self._range_validator(probe)
+            expected_md5 = self._expected_md5(probe, partial=True) if verify else None
+        if total is None or total < 2 * min_segment_size:
+            logger.info(f"Downloading {endpoint} as a single stream (ranges unsupported or file too small)")
+            return None
+
+        count = min(segments, total // min_segment_size)
+        size = -(-total // count)
+        bounds = [(start, min(start + size, total) - 1) for start in range(0, total, size)]
+        f.truncate(total)
+        f.flush()
+        logger.info(f"Downloading {endpoint} ({total} bytes) in {len(bounds)} concurrent segments")
+        failed = threading.Event()
+
+        def fetch(bound: Tuple[int, int]) -> None:
+            try:
+                self._download_segment(url, path, bound[0], bound[1], validator, chunk_size, max_retries, failed,
+                                       deadline)
+            except BaseException:
+                failed.set()
+                raise
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(bounds), thread_name_prefix="roex-segment") as pool:
+                list(pool.map(fetch, bounds))
+            if expected_md5 is not None:
+                digest = hashlib.md5()
+                with open(path, "rb") as written:
+                    for block in iter(lambda: written.read(chunk_size), b""):
+                        digest.update(block)
+                if digest.hexdigest() != expected_md5:
+                    raise RoExDownloadError(f"GET {endpoint} failed its checksum: MD5 {digest.hexdigest()}, "
+                                            f"expected {expected_md5}", bytes_received=total, expected_bytes=total)
+        except RoExDownloadError as e:
+            logger.warning(f"Segmented download of {endpoint} failed ({e}); downloading as a single stream")
+            return None
+        return total
+
+    def _download_segment(self, url: str, path: str, first: int, last: int, validator: Optional[str],
+                          chunk_size: int, max_retries: int, failed: threading.Event,
+                          deadline: Optional[Deadline] = None) -> None:
+        """Fetch bytes *first* to *last* of *url* into the same positions of *path*, resuming after failures."""
+        endpoint = url.split("?", 1)[0]
+        offset, failures = first, 0
+        with open(path, "r+b") as f:
+            while offset <= last and not failed.is_set():
+                attempt_offset = offset
+                headers = {"Accept-Encoding": "identity", "Range": f"bytes={offset}-{last}"}
+                if validator:
+                    headers["If-Range"] = validator
+                error: Optional[Exception] = None
+                try:
+                    timeout = self._timeout_for(deadline, f"GET {endpoint}")
+                    with self.session.get(url, stream=True, timeout=timeout, headers=headers) as r:
+                        self._raise_for_status(r, "GET", endpoint)
+                        if r.status_code != 206 or self._range_start(r) != offset:
+                            raise RoExDownloadError(f"GET {endpoint} changed while its segments were downloaded")
+                        f.seek(offset)
+                        for chunk in r.iter_content(chunk_size=chunk_size):
+                            f.write(chunk[:last + 1 - f.tell()])
+                            if f.tell() > last or failed.is_set():
+                                break
+                            if deadline is not None:
+                                deadline.check(f"GET {endpoint}")
+                except (RoExDownloadError, RoExTimeoutError):
+                    raise
+                except Exception as e:
+                    self._raise_if_deadline_passed(e, deadline, f"GET {endpoint}")
+                    if not is_retryable_error(e):
+                        raise
+                    error = e
+                offset = f.tell()
+                if offset > last or failed.is_set():
+                    return
+                error = error or RoExDownloadError(f"GET {endpoint} segment ended at byte {offset} of {last + 1}",
+                                                   bytes_received=offset - first, expected_bytes=last + 1 - first)
+                if failures >= max_retries:
+                    raise error
+                failures = failures + 1 if offset <= attempt_offset else 1
+                delay = self._resume_delay(error, failures)
+                logger.warning(f"Segment {first}-{last} of {endpoint} interrupted at byte {offset} ({error}); "
+                               f"resuming in {delay:.1f}s (attempt {failures}/{max_retries})")
+                time.sleep(delay if deadline is None else deadline.cap(delay))
+
+    @staticmethod
+    def _content_length(response: requests.Response) -> Optional[int]:
+        """Full size of the file from a 200 response, if the server sent it."""
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            # requests decodes the body, so its length will not match
+            return None
+        length = response.headers.get("Content-Length")
+        return int(length) if length and length.isdigit() else None
+
+    @staticmethod
+    def _range_start(response: requests.Response) -> Optional[int]:
+        """First byte of a 206 response, from its ``Content-Range: bytes N-M/T`` header."""
+        match = re.match(r"bytes (\d+)-", response.headers.get("Content-Range", ""))
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _range_total(response: requests.Response) -> Optional[int]:
+        """Full size of the file from a 206 response's ``Content-Range: bytes N-M/T`` header."""
+        match = re.match(r"bytes \d+-\d+/(\d+)$", response.headers.get("Content-Range", ""))
+        if not match or response.headers.get("Content-Encoding", "identity") != "identity":
+            return None
+        return int(match.group(1))
+
+    @staticmethod
+    def _range_validator(response: requests.Response) -> Optional[str]:
+        """The strong ETag, or else Last-Modified, to send as ``If-Range`` when resuming."""
+        etag = response.headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return response.headers.get("Last-Modified")
+
+    @staticmethod
+    def _expected_md5(response: requests.Response, partial: bool = False) -> Optional[str]:
+        """
+        MD5 of the whole file as reported by the server, in hex, or None if it reports none.
+
+        ``Content-MD5`` describes the body of the response, so it is ignored
+        when *partial* is True (the response holds only a range of the file).
+        """
+        hashes = [part.strip().partition("=") for part in response.headers.get("x-goog-hash", "").split(",")]
+        encoded = next((value for name, _, value in hashes if name == "md5"), None)
+        if not partial:
+            encoded = encoded or response.headers.get("Content-MD5")
+        if encoded:
+            try:
+                return base64.b64decode(encoded, validate=True).hex()
+            except (binascii.Error, ValueError):
+                logger.warning(f"Ignoring malformed MD5 header: {encoded}")
+                return None
+        match = _MD5_ETAG.fullmatch(response.headers.get("ETag", ""))
+        return match.group(1).lower() if match else None
+
+    def download_file(self, url: str, local_filename: str, chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+                      segments: int = 1, deadline: Optional[Deadline] = None) -> bool:
         """
         Download a file from a URL to a local file
 
+        Uses ``download_to_file``, so the file is written atomically, checked
+        against its length and checksum, and resumed if the transfer drops.
+
         Args:
             url: URL of the file to download
             local_filename: Path to save the downloaded file
             chunk_size: Size of chunks for streaming download
+            segments: Number of ranges to fetch concurrently for large files
+                on servers that support Range requests. Defaults to 1.
+            deadline: Optional deadline; the download fails once it passes.
 
         Returns:
             True if download was successful, False otherwise
         """
         logger.info(f"Attempting to download file from {url} to {local_filename}")
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(local_filename)), exist_ok=True)
-
         try:
-            with requests.get(url, stream=True) as r:
-                r.raise_for_status()
-                with open(local_filename, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=chunk_size):
-                        f.write(chunk)
+            self.download_to_file(url, local_filename, chunk_size=chunk_size, segments=segments, deadline=deadline)
             logger.info(f"Successfully downloaded file to {local_filename}")
             return True
         except requests.exceptions.RequestException as e:
@@ -161,4 +733,41 @@ class ApiProvider:
             return False
         except Exception as e:
             logger.exception(f"An unexpected error occurred during file download from {url}. Error: {e}")
-            return False
\ No newline at end of file
+            return False
+
+
+class _ProgressReporter:
+    """Builds ``UploadProgress`` snapshots for an upload and passes them to a callback."""
+
+    def __init__(self, total: int, path: Optional[str], callback: Optional[Callable[[UploadProgress], None]]):
+        self.total = total
+        self.path = path
+        self.callback = callback
+        self.started = time.monotonic()
+
+    def report(self, bytes_sent: int) -> None:
+        if self.callback is not None:
+            self.callback(UploadProgress(bytes_sent=bytes_sent, total_bytes=self.total,
+                                         elapsed_seconds=time.monotonic() - self.started, path=self.path))
+
+
+class _ProgressReader:
+    """File wrapper that reports progress as ``requests`` reads the body of a single PUT."""
+
+    def __init__(self, file: Any, total: int, progress: _ProgressReporter):
+        self.file = file
+        self.total = total
+        self.progress = progress
+        self.sent = 0
+
+    def __len__(self) -> int:
+        # Lets requests send a Content-Length instead of a chunked body
+        return self.total
+
+    def read(self, size: int = -1) -> bytes:
+        block = self.file.read(size)
+        if block:
+            self.sent += len(block)
+            if self.sent < self.total:
+                self.progress.report(self.sent)
+        return block
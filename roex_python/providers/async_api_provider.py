@@ -0,0 +1,271 @@
+"""
+Asyncio provider for making API calls to the RoEx Tonn API
+"""
+
+import os
+import logging
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+from roex_python.deadline import Deadline, RequestTimeout
+from roex_python.exceptions import RoExApiError, RoExTimeoutError
+from roex_python.providers.api_provider import DEFAULT_TIMEOUT, normalize_timeout
+from roex_python.providers.retry import RetryPolicy, parse_retry_after
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only when the extra is missing
+    httpx = None
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+
+class AsyncApiProvider:
+    """
+    Asyncio counterpart of ``ApiProvider`` built on ``httpx.AsyncClient``.
+
+    Requires the optional ``httpx`` dependency (``pip install roex_python[async]``).
+    """
+
+    def __init__(self, base_url: str, api_key: str, pool_connections: int = 10,
+                 pool_maxsize: int = 10, keep_alive: bool = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT):
+        """
+        Initialize the async API provider
+
+        Args:
+            base_url: Base URL for the API (e.g., "https://tonn.roexaudio.com")
+            api_key: API key for authentication
+            pool_connections: Maximum number of idle keep-alive connections to retain.
+            pool_maxsize: Maximum number of concurrent connections across all hosts.
+                Requests beyond this limit wait for a free connection.
+            keep_alive: Whether to keep connections open between requests.
+            retry_policy: Retry behaviour for ``post`` and ``get``. Defaults to
+                ``RetryPolicy()``. A policy may be shared with a sync provider.
+            timeout: Per-request timeout in seconds, either a single value or a
+                (connect, read) tuple.
+
+        Raises:
+            ImportError: If ``httpx`` is not installed.
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncApiProvider requires the 'httpx' package. "
+                "Install it with: pip install roex_python[async]"
+            )
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1.")
+        self.base_url = base_url
+        self.api_key = api_key
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.timeout = normalize_timeout(timeout)
+        self.headers = {
+            "Content-Type": "application/json",
+            "x-api-key": api_key
+        }
+        self.client = self._create_client()
+        logger.info(f"AsyncApiProvider initialized for base URL: {self.base_url}")
+
+    def _create_client(self) -> "httpx.AsyncClient":
+        """Create the pooled async client shared by every request made through this provider."""
+        limits = httpx.Limits(
+            max_connections=self.pool_maxsize,
+            max_keepalive_connections=self.pool_connections if self.keep_alive else 0,
+        )
+        return httpx.AsyncClient(limits=limits, timeout=self._httpx_timeout(self.timeout))
+
+    @staticmethod
+    def _httpx_timeout(timeout: RequestTimeout) -> "httpx.Timeout":
+        """Convert a (connect, read) tuple into an ``httpx.Timeout``."""
+        connect, read = timeout
+        return httpx.Timeout(connect=connect, read=read, write=read, pool=read)
+
+    def _timeout_for(self, deadline: Optional[Deadline], operation: str) -> "httpx.Timeout":
+        """Per-request timeout, shortened to fit within *deadline* if one is given."""
+        if deadline is None:
+            return self._httpx_timeout(self.timeout)
+        return self._httpx_timeout(deadline.request_timeout(self.timeout, operation))
+
+    @staticmethod
+    def _raise_if_deadline_passed(error: Exception, deadline: Optional[Deadline], operation: str) -> None:
+        """Report a request cut short by a deadline-capped timeout as RoExTimeoutError."""
+        if deadline is not None and deadline.expired:
+            raise RoExTimeoutError(
+                f"{operation} did not complete within {deadline.timeout} seconds.", timeout=deadline.timeout
+            ) from error
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying client and release all pooled connections.
+
+        The provider should not be used after it has been closed.
+        """
+        logger.info(f"Closing AsyncApiProvider client for base URL: {self.base_url}")
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncApiProvider":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    @staticmethod
+    def _raise_for_status(response: "httpx.Response", method: str, endpoint: str) -> None:
+        """Raise a RoExApiError carrying the status code if the response is an error."""
+        if not response.is_error:
+            return
+        text = response.text or ""
+        logger.warning(f"Non-OK ({response.status_code}) response from {endpoint}. Response text: {text[:500]}...")
+        raise RoExApiError(
+            f"{method} {endpoint} failed with status {response.status_code}: {text[:500]}",
+            status_code=response.status_code,
+            endpoint=endpoint,
+            response_text=text,
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        )
+
+    async def post(self, endpoint: str, data: Dict[str, Any],
+                   deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        Make a POST request to the API, handling retries and specific errors.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/mixpreview")
+            data: JSON payload for the request
+            deadline: Optional deadline for the call. Request timeouts and retry
+                backoff are shortened so the call finishes before it.
+
+        Returns:
+            JSON response from the API
+
+        Raises:
+            RoExApiError: If the API returns an error status. 429 and 5xx
+                responses are retried first; other 4xx responses fail immediately.
+            httpx.TransportError: If the request fails at the transport level
+                after all retries.
+            RoExTimeoutError: If *deadline* passes before the call completes.
+        """
+        return await self.retry_policy.acall(endpoint, self._post, endpoint, data, deadline, deadline=deadline)
+
+    async def _post(self, endpoint: str, data: Dict[str, Any],
+                    deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Make a single POST attempt."""
+        url = urljoin(self.base_url, endpoint)
+        timeout = self._timeout_for(deadline, f"POST {endpoint}")
+        logger.info(f"Making async POST request to: {url}")
+        logger.debug(f"Request data (keys): {list(data.keys())}")
+
+        try:
+            response = await self.client.post(url, json=data, headers=self.headers, timeout=timeout)
+            logger.info(f"Received response with status code: {response.status_code} from {url}")
+            self._raise_for_status(response, "POST", endpoint)
+            try:
+                return response.json()
+            except ValueError:
+                return {"response": response.text}
+        except httpx.TransportError as e:
+            logger.exception(f"HTTP request failed: POST {url}. Error: {e}")
+            self._raise_if_deadline_passed(e, deadline, f"POST {endpoint}")
+            raise
+
+    async def get(self, endpoint: str, deadline: Optional[Deadline] = None) -> Any:
+        """
+        Make a GET request to the API, handling retries and specific errors.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/health")
+            deadline: Optional deadline for the call. Request timeouts and retry
+                backoff are shortened so the call finishes before it.
+
+        Returns:
+            JSON response from the API or response text if not JSON
+
+        Raises:
+            RoExApiError: If the API returns an error status. 429 and 5xx
+                responses are retried first; other 4xx responses fail immediately.
+            httpx.TransportError: If the request fails at the transport level
+                after all retries.
+            RoExTimeoutError: If *deadline* passes before the call completes.
+        """
+        return await self.retry_policy.acall(endpoint, self._get, endpoint, deadline, deadline=deadline)
+
+    async def _get(self, endpoint: str, deadline: Optional[Deadline] = None) -> Any:
+        """Make a single GET attempt."""
+        url = urljoin(self.base_url, endpoint)
+        timeout = self._timeout_for(deadline, f"GET {endpoint}")
+        logger.info(f"Making async GET request to: {url}")
+
+        try:
+            response = await self.client.get(url, headers=self.headers, timeout=timeout)
+            logger.info(f"Received response with status code: {response.status_code} from {url}")
+            self._raise_for_status(response, "GET", endpoint)
+            try:
+                return response.json()
+            except ValueError:
+                logger.warning(f"Response from GET {url} is not JSON. Returning raw text.")
+                return response.text
+        except httpx.TransportError as e:
+            logger.exception(f"HTTP request failed: GET {url}. Error: {e}")
+            self._raise_if_deadline_passed(e, deadline, f"GET {endpoint}")
+            raise
+
+    async def upload_to_signed_url(self, signed_url: str,
+                                   data: Union[bytes, AsyncIterator[bytes]],
+                                   content_type: str, content_length: Optional[int] = None) -> "httpx.Response":
+        """
+        Upload raw file data to a pre-signed URL using the pooled client.
+
+        Args:
+            signed_url: The pre-signed upload URL returned by ``/upload``
+            data: Bytes or an async iterator of byte chunks to send as the body
+            content_type: MIME type of the uploaded data
+            content_length: Total body size. Required for streamed bodies so the
+                upload is not sent with chunked transfer encoding.
+
+        Returns:
+            The HTTP response from the storage service
+
+        Raises:
+            RoExApiError: If the storage service rejects the upload
+        """
+        headers = {"Content-Type": content_type}
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
+        response = await self.client.put(signed_url, content=data, headers=headers)
+        self._raise_for_status(response, "PUT", signed_url.split("?", 1)[0])
+        return response
+
+    async def download_file(self, url: str, local_filename: str, chunk_size: int = 65536) -> bool:
+        """
+        Download a file from a URL to a local file
+
+        Args:
+            url: URL of the file to download
+            local_filename: Path to save the downloaded file
+            chunk_size: Size of chunks for streaming download
+
+        Returns:
+            True if download was successful, False otherwise
+        """
+        logger.info(f"Attempting to download file from {url} to {local_filename}")
+        os.makedirs(os.path.dirname(os.path.abspath(local_filename)), exist_ok=True)
+
+        try:
+            async with self.client.stream("GET", url) as r:
+                r.raise_for_status()
+                with open(local_filename, 'wb') as f:
+                    async for chunk in r.aiter_bytes(chunk_size=chunk_size):
+                        f.write(chunk)
+            logger.info(f"Successfully downloaded file to {local_filename}")
+            return True
+        except httpx.HTTPError as e:
+            logger.exception(f"Failed to download file from {url}. Error: {e}")
+            return False
+        except IOError as e:
+            logger.exception(f"Failed to write downloaded file to {local_filename}. Error: {e}")
+            return False
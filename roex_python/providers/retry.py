@@ -0,0 +1,334 @@
+"""
+Retry classification and policies shared by the sync and async API providers
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar, Union
+
+import requests
+from tenacity import AsyncRetrying, RetryCallState, Retrying, before_sleep_log
+from tenacity.retry import retry_base
+from tenacity.stop import stop_base
+from tenacity.wait import wait_base, wait_exponential, wait_random_exponential
+
+from roex_python.deadline import Deadline
+from roex_python.exceptions import RoExApiError
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is an optional dependency
+    httpx = None
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Transport-level failures (connection resets, DNS errors, socket timeouts) are always worth retrying
+TRANSPORT_ERRORS = (requests.exceptions.RequestException,)
+if httpx is not None:
+    TRANSPORT_ERRORS += (httpx.TransportError,)
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header value into seconds.
+
+    Accepts both the delay-seconds and HTTP-date forms. Returns None when the
+    header is missing or cannot be parsed.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """
+    Return True if a failed request should be retried.
+
+    Only transport errors, 429 and 5xx responses are retried; other 4xx
+    responses (bad API key, malformed payload, unknown task) fail immediately.
+    """
+    if isinstance(exc, RoExApiError):
+        return exc.retryable
+    return isinstance(exc, TRANSPORT_ERRORS)
+
+
+class wait_retry_after(wait_base):
+    """
+    Tenacity wait strategy that honours ``Retry-After`` from the last error.
+
+    Falls back to *fallback* when the server did not send the header, and
+    never waits longer than *max_wait* seconds.
+    """
+
+    def __init__(self, fallback: wait_base, max_wait: float = 60.0):
+        self.fallback = fallback
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome is not None else None
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            return min(float(retry_after), self.max_wait)
+        return self.fallback(retry_state)
+
+
+class RetryBudget:
+    """
+    Client-wide token bucket that caps retries to a share of total traffic.
+
+    Every request deposits *ratio* tokens (up to *max_tokens*) and every retry
+    spends one. During a burst of failures the bucket drains quickly, so the
+    client stops amplifying load on a struggling server instead of having
+    every worker retry in lockstep. The bucket starts full so an otherwise
+    idle client can still ride out a brief outage. Thread-safe.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0):
+        """
+        Args:
+            ratio: Tokens earned per request, i.e. the long-run share of
+                requests that may be retried (0.2 allows one retry per five requests).
+            max_tokens: Bucket capacity, i.e. the largest burst of retries allowed.
+        """
+        if ratio < 0 or max_tokens < 1:
+            raise ValueError("ratio must be non-negative and max_tokens at least 1.")
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """float: Tokens currently available for retries."""
+        with self._lock:
+            return self._tokens
+
+    def record_request(self) -> None:
+        """Deposit tokens for a new (non-retry) request."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Withdraw one token for a retry. Returns False if the budget is exhausted."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+@dataclass
+class EndpointRetry:
+    """
+    Per-endpoint override for a ``RetryPolicy``. Fields left as None inherit
+    the policy's defaults.
+    """
+    max_attempts: Optional[int] = None
+    """int: Total attempts including the first (1 disables retries)"""
+    base_delay: Optional[float] = None
+    """float: Backoff for the first retry in seconds; doubles on each further retry"""
+    max_delay: Optional[float] = None
+    """float: Upper bound on a single backoff in seconds"""
+
+
+class _retry_if_retryable(retry_base):
+    """Tenacity retry predicate: only transport errors, 429 and 5xx responses are retried."""
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        if retry_state.outcome is None or not retry_state.outcome.failed:
+            return False
+        return is_retryable_error(retry_state.outcome.exception())
+
+
+class _wait_once(wait_base):
+    """
+    Tenacity wait strategy that draws each attempt's backoff once.
+
+    Tenacity 8.3 and later compute the wait before checking ``stop`` and
+    earlier releases compute it after, so the stop condition cannot rely on
+    ``RetryCallState.upcoming_sleep``. Both call this wrapper instead and get
+    the same (possibly jittered) delay for a given attempt.
+    """
+
+    def __init__(self, wait: wait_base):
+        self.wait = wait
+        self._attempt_number: Optional[int] = None
+        self._sleep = 0.0
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        if retry_state.attempt_number != self._attempt_number:
+            self._sleep = self.wait(retry_state)
+            self._attempt_number = retry_state.attempt_number
+        return self._sleep
+
+
+class _stop_within_policy(stop_base):
+    """Tenacity stop condition enforcing the attempt limit, the deadline and the budget, in that order."""
+
+    def __init__(self, policy: "RetryPolicy", max_attempts: int, deadline: Optional[Deadline],
+                 wait: _wait_once):
+        self.policy = policy
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+        self.wait = wait
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        if retry_state.attempt_number >= self.max_attempts:
+            return True
+        if self.deadline is not None:
+            # Give up if the next backoff would outlast the deadline
+            remaining = self.deadline.remaining()
+            if remaining is not None and remaining <= self.wait(retry_state):
+                return True
+        # ``stop`` is the last check that can refuse a retry, so the budget is only charged for retries that happen
+        return not self.policy._acquire_retry()
+
+
+class RetryPolicy:
+    """
+    Retry behaviour for requests made through ``ApiProvider`` and ``AsyncApiProvider``.
+
+    Transport errors, 429 and 5xx responses are retried with exponential
+    backoff (full jitter by default), honouring ``Retry-After`` when the server
+    sends it. An optional ``RetryBudget`` caps retries client-wide, and
+    per-endpoint overrides allow, for example, cheap retries for idempotent
+    polls while never retrying task creation.
+
+    Example:
+        >>> from roex_python import RoExClient, RetryPolicy, RetryBudget, EndpointRetry
+        >>>
+        >>> policy = RetryPolicy(
+        >>>     budget=RetryBudget(ratio=0.1),
+        >>>     endpoint_overrides={
+        >>>         "/retrievepreviewmix": EndpointRetry(max_attempts=5, base_delay=0.5, max_delay=2),
+        >>>         "/mixpreview": EndpointRetry(max_attempts=1),
+        >>>     },
+        >>> )
+        >>> client = RoExClient(api_key="YOUR_API_KEY", retry_policy=policy)
+        >>> ...
+        >>> print(policy.retries_taken, policy.retries_denied)
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 10.0,
+                 jitter: bool = True, budget: Optional[RetryBudget] = None,
+                 endpoint_overrides: Optional[Dict[str, Union[EndpointRetry, Dict[str, Any]]]] = None,
+                 max_retry_after: float = 60.0):
+        """
+        Args:
+            max_attempts: Total attempts per request, including the first.
+            base_delay: Backoff ceiling for the first retry in seconds; doubles on each further retry.
+            max_delay: Upper bound on a single backoff in seconds.
+            jitter: Use full jitter (a random delay between 0 and the backoff ceiling)
+                so concurrent workers do not retry in lockstep. When False the
+                ceiling itself is used.
+            budget: Token bucket shared by every request made with this policy.
+                None (the default) places no client-wide cap on retries.
+            endpoint_overrides: Mapping of endpoint path (e.g. "/mixpreview") to an
+                ``EndpointRetry`` (or equivalent dict) overriding the settings above.
+            max_retry_after: Upper bound on a server-requested ``Retry-After`` wait in seconds.
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.budget = budget
+        self.max_retry_after = max_retry_after
+        self.endpoint_overrides = {
+            endpoint: override if isinstance(override, EndpointRetry) else EndpointRetry(**override)
+            for endpoint, override in (endpoint_overrides or {}).items()
+        }
+        for override in [EndpointRetry()] + list(self.endpoint_overrides.values()):
+            if self._attempts_for(override) < 1:
+                raise ValueError("max_attempts must be at least 1.")
+        self.retries_taken = 0
+        self.retries_denied = 0
+        self._lock = threading.Lock()
+
+    def _attempts_for(self, override: EndpointRetry) -> int:
+        return override.max_attempts if override.max_attempts is not None else self.max_attempts
+
+    def _acquire_retry(self) -> bool:
+        """Charge the budget for one retry and update the counters."""
+        allowed = self.budget is None or self.budget.try_spend()
+        with self._lock:
+            if allowed:
+                self.retries_taken += 1
+            else:
+                self.retries_denied += 1
+        if not allowed:
+            logger.warning("Retry budget exhausted; not retrying failed request.")
+        return allowed
+
+    def _record_request(self) -> None:
+        if self.budget is not None:
+            self.budget.record_request()
+
+    def _retry_kwargs(self, endpoint: str, deadline: Optional[Deadline]) -> Dict[str, Any]:
+        """Build the tenacity arguments for *endpoint*."""
+        override = self.endpoint_overrides.get(endpoint, EndpointRetry())
+        max_attempts = self._attempts_for(override)
+        base_delay = override.base_delay if override.base_delay is not None else self.base_delay
+        max_delay = override.max_delay if override.max_delay is not None else self.max_delay
+        if self.jitter:
+            backoff = wait_random_exponential(multiplier=base_delay, max=max_delay)
+        else:
+            backoff = wait_exponential(multiplier=base_delay, min=base_delay, max=max_delay)
+        wait = _wait_once(wait_retry_after(backoff, max_wait=self.max_retry_after))
+        return dict(
+            stop=_stop_within_policy(self, max_attempts, deadline, wait),
+            wait=wait,
+            retry=_retry_if_retryable(),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+            reraise=True,
+        )
+
+    @staticmethod
+    def _sleep(seconds: float) -> None:
+        time.sleep(seconds)
+
+    @staticmethod
+    async def _async_sleep(seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    def call(self, endpoint: str, fn: Callable[..., T], *args: Any,
+             deadline: Optional[Deadline] = None, **kwargs: Any) -> T:
+        """
+        Call *fn* with retries according to the settings for *endpoint*.
+
+        Args:
+            endpoint: Endpoint path used to look up overrides.
+            fn: The request function to call.
+            *args: Positional arguments for *fn*.
+            deadline: If given, no retry is attempted whose backoff would end
+                after the deadline; the last error is raised instead.
+            **kwargs: Keyword arguments for *fn*.
+
+        Returns:
+            The value returned by *fn*.
+        """
+        self._record_request()
+        retrying = Retrying(sleep=self._sleep, **self._retry_kwargs(endpoint, deadline))
+        return retrying(fn, *args, **kwargs)
+
+    async def acall(self, endpoint: str, fn: Callable[..., Awaitable[T]], *args: Any,
+                    deadline: Optional[Deadline] = None, **kwargs: Any) -> T:
+        """Coroutine counterpart of ``call`` for async request functions."""
+        self._record_request()
+        retrying = AsyncRetrying(sleep=self._async_sleep, **self._retry_kwargs(endpoint, deadline))
+        return await retrying(fn, *args, **kwargs)
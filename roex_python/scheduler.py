@@ -0,0 +1,335 @@
+"""
+Background scheduler that polls many RoEx tasks from a single thread
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import requests
+
+from roex_python.deadline import Deadline
+from roex_python.exceptions import RoExTaskError, RoExTimeoutError
+from roex_python.polling import PollPolicy, TaskPoller
+from roex_python.providers.api_provider import ApiProvider
+from roex_python.webhooks import WebhookListener
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+Req = TypeVar("Req")
+
+
+class TaskHandle(Future):
+    """
+    Future for the result of a submitted RoEx task.
+
+    Returned by ``client.mix.submit_preview``, ``client.mastering.submit`` and
+    ``client.enhance.submit``. It is a ``concurrent.futures.Future``, so
+    ``done()``, ``result(timeout)``, ``add_done_callback()`` and ``cancel()``
+    work as usual and handles can be passed to ``concurrent.futures.as_completed``
+    or ``concurrent.futures.wait``. Cancelling a handle stops polling the task;
+    it does not cancel the task on the server.
+
+    Attributes:
+        task_id (str): ID of the task being polled.
+    """
+
+    def __init__(self, task_id: str):
+        super().__init__()
+        self.task_id = task_id
+
+    def __repr__(self) -> str:
+        return f"<TaskHandle task_id={self.task_id!r} {super().__repr__()[1:-1]}>"
+
+
+@dataclass
+class _PollJob:
+    """Book-keeping for one task tracked by the scheduler."""
+    task_id: str
+    endpoint: str
+    payload: Dict[str, Any]
+    check: Callable[[Dict[str, Any]], Any]
+    is_failed: Optional[Callable[[Dict[str, Any]], bool]]
+    policy: PollPolicy
+    deadline: Deadline
+    future: TaskHandle = field(init=False)
+    attempt: int = 0
+    due: float = 0.0
+    in_flight: bool = False
+    wake: bool = False
+
+    def __post_init__(self):
+        self.future = TaskHandle(self.task_id)
+
+
+class PollScheduler:
+    """
+    Polls any number of outstanding tasks without a thread per task.
+
+    ``retrieve_preview_mix`` and friends block the calling thread for the
+    whole lifetime of a task, almost all of it asleep between polls. The
+    scheduler instead keeps every outstanding task in a priority queue keyed
+    by its next due time. One dispatcher thread sleeps until the earliest
+    task is due and hands due polls to a small worker pool that sends them
+    through the client's pooled session, so a thousand outstanding tasks
+    cost one sleeping thread plus *max_workers* threads for in-flight
+    requests. Each task's result is delivered through a ``TaskHandle``.
+
+    Polls follow the same ``PollPolicy`` rules as ``TaskPoller``: failed tasks
+    and non-retryable API errors resolve the future with an exception,
+    transient errors are polled past, and exhausting *max_attempts* or the
+    policy's *timeout* raises ``RoExTimeoutError``.
+
+    The client owns one scheduler, shared by the ``submit`` methods of its
+    controllers; ``watch`` can also be used directly for any retrieval endpoint.
+    With a ``WebhookListener`` attached, submitted tasks are polled on the
+    listener's slow fallback policy and polled immediately when their
+    callback arrives.
+
+    Example:
+        >>> scheduler = client.poll_scheduler
+        >>> handle = scheduler.watch("/retrievepreviewmaster", payload,
+        >>>                          MasteringController._check_preview_master, task_id=task_id)
+        >>> print(handle.result(timeout=600).download_url_mastered_preview)
+    """
+
+    def __init__(self, api_provider: ApiProvider, policy: Optional[PollPolicy] = None, max_workers: int = 4,
+                 webhook_listener: Optional[WebhookListener] = None):
+        """
+        Args:
+            api_provider: Provider used to send the polls.
+            policy: Default backoff curve and limits for watched tasks.
+                Defaults to ``PollPolicy()``.
+            max_workers: Maximum number of polls in flight at once. Keep this at
+                or below the client's ``pool_maxsize``. Defaults to 4.
+            webhook_listener: Listener whose callbacks trigger immediate polls.
+                Defaults to None (polling only).
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.api_provider = api_provider
+        self.policy = policy if policy is not None else PollPolicy()
+        self.max_workers = max_workers
+        self.webhook_listener = webhook_listener
+        self._poller = TaskPoller(self.policy)
+        self._queue: List[Tuple[float, int, _PollJob]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._jobs: Dict[TaskHandle, _PollJob] = {}
+        self._in_flight = 0
+        self._closed = False
+        self._dispatcher: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def pending(self) -> int:
+        """int: Number of tasks that have not resolved yet."""
+        with self._condition:
+            return len(self._jobs)
+
+    def watch(self, endpoint: str, payload: Dict[str, Any], check: Callable[[Dict[str, Any]], Any],
+              task_id: str, is_failed: Optional[Callable[[Dict[str, Any]], bool]] = None,
+              policy: Optional[PollPolicy] = None, webhook_url: Optional[str] = None) -> TaskHandle:
+        """
+        Start tracking a task and return a future for its result.
+
+        The first poll is sent as soon as a worker is free. When *webhook_url*
+        is a URL reserved with ``attach_webhook``, the task is instead polled on
+        the listener's fallback policy and polled immediately on callback.
+
+        Args:
+            endpoint: Retrieval endpoint path, e.g. "/retrievepreviewmix".
+            payload: JSON payload identifying the task.
+            check: Returns the parsed result once the task is done, otherwise None.
+            task_id: Task ID, for logging and errors.
+            is_failed: Optional predicate returning True when a response reports
+                that the task has failed.
+            policy: Backoff curve and limits for this task. Defaults to the
+                scheduler's policy, or the listener's fallback policy when
+                *webhook_url* is given.
+            webhook_url: Callback URL returned by ``attach_webhook``.
+
+        Returns:
+            TaskHandle: Resolves with the result returned by *check*. Cancelling
+            the handle stops polling the task.
+
+        Raises:
+            RuntimeError: If the scheduler has been closed.
+        """
+        listener = self.webhook_listener if webhook_url is not None else None
+        if policy is None:
+            policy = listener.fallback_policy if listener is not None else self.policy
+        job = _PollJob(task_id=task_id, endpoint=endpoint, payload=payload, check=check,
+                       is_failed=is_failed, policy=policy, deadline=Deadline(policy.timeout))
+        # With a callback on the way there is no point polling a task that has just started
+        first_delay = job.deadline.cap(policy.first_delay) if listener is not None else 0.0
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot watch tasks on a closed PollScheduler.")
+            self._start()
+            self._jobs[job.future] = job
+            self._push(job, time.monotonic() + first_delay)
+        job.future.add_done_callback(self._forget)
+        if listener is not None:
+            listener.attach(webhook_url, lambda: self.poll_now(job.future))
+            job.future.add_done_callback(lambda _: listener.discard(webhook_url))
+        logger.info(f"Scheduled polling for task {task_id} at {endpoint}")
+        return job.future
+
+    def attach_webhook(self, request: Req) -> Tuple[Req, Optional[str]]:
+        """
+        Point *request* at the webhook listener, if one is attached.
+
+        Requests that already carry a ``webhook_url`` are left unchanged, since
+        the caller is handling callbacks itself.
+
+        Args:
+            request: A request model with a ``webhook_url`` field.
+
+        Returns:
+            Tuple: The request to submit (a copy with ``webhook_url`` set, or
+            *request* itself) and the callback URL to pass to ``watch``, or None.
+        """
+        if self.webhook_listener is None or getattr(request, "webhook_url", None):
+            return request, None
+        callback_url = self.webhook_listener.reserve()
+        return replace(request, webhook_url=callback_url), callback_url
+
+    def poll_now(self, handle: TaskHandle) -> bool:
+        """
+        Poll a watched task as soon as a worker is free, ignoring its backoff.
+
+        Args:
+            handle: Handle returned by ``watch``.
+
+        Returns:
+            bool: False if the task is no longer being watched.
+        """
+        with self._condition:
+            job = self._jobs.get(handle)
+            if job is None or self._closed:
+                return False
+            if job.in_flight:
+                job.wake = True
+            else:
+                self._push(job, time.monotonic())
+        logger.debug(f"Polling task {job.task_id} now")
+        return True
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop the scheduler and cancel every task that has not resolved.
+
+        Args:
+            wait: Whether to wait for polls already in flight to finish.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            queued = list(self._jobs.values())
+            self._queue.clear()
+            self._condition.notify_all()
+        for job in queued:
+            job.future.cancel()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+        logger.info(f"PollScheduler closed; cancelled {len(queued)} queued tasks.")
+
+    def __enter__(self) -> "PollScheduler":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        """Start the dispatcher thread and worker pool on first use. Caller holds the lock."""
+        if self._dispatcher is not None:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="roex-poll")
+        self._dispatcher = threading.Thread(target=self._dispatch, name="roex-poll-scheduler", daemon=True)
+        self._dispatcher.start()
+
+    def _push(self, job: _PollJob, due: float) -> None:
+        """Queue *job* to be polled at monotonic time *due*. Caller holds the lock."""
+        # Rescheduling leaves the old heap entry in place; it is skipped as stale when popped
+        job.due = due
+        heapq.heappush(self._queue, (due, next(self._sequence), job))
+        self._condition.notify()
+
+    def _forget(self, handle: TaskHandle) -> None:
+        """Drop a resolved or cancelled task from the index."""
+        with self._condition:
+            self._jobs.pop(handle, None)
+
+    def _dispatch(self) -> None:
+        """Dispatcher loop: sleep until the earliest task is due, then hand it to a worker."""
+        with self._condition:
+            while not self._closed:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                due = self._queue[0][0]
+                now = time.monotonic()
+                if due > now:
+                    self._condition.wait(due - now)
+                    continue
+                due, _, job = heapq.heappop(self._queue)
+                if job.future.done() or job.in_flight or due != job.due:
+                    continue
+                job.in_flight = True
+                self._in_flight += 1
+                self._executor.submit(self._run, job)
+
+    def _run(self, job: _PollJob) -> None:
+        """Send one poll for *job*, then resolve its future or schedule the next poll."""
+        try:
+            delay = self._poll_once(job)
+        except BaseException as e:
+            delay = None
+            if not job.future.done():
+                job.future.set_exception(e)
+        with self._condition:
+            self._in_flight -= 1
+            job.in_flight = False
+            if delay is not None and not self._closed and not job.future.cancelled():
+                if job.wake:
+                    job.wake, delay = False, 0.0
+                self._push(job, time.monotonic() + delay)
+                return
+        if delay is not None:
+            # Closed while this poll was in flight
+            job.future.cancel()
+
+    def _poll_once(self, job: _PollJob) -> Optional[float]:
+        """Poll *job* once. Returns the delay before the next poll, or None once resolved."""
+        job.deadline.check(f"Task {job.task_id}")
+        job.attempt += 1
+        try:
+            logger.debug(f"Polling {job.endpoint} for task {job.task_id} (attempt {job.attempt})")
+            response = self.api_provider.post(job.endpoint, job.payload, deadline=job.deadline)
+            result = self._poller._handle_response(response, job.check, job.is_failed, job.task_id)
+            if result is not None:
+                logger.info(f"Task {job.task_id} completed after {job.attempt} polls.")
+                if not job.future.done():
+                    job.future.set_result(result)
+                return None
+        except requests.HTTPError as e:
+            TaskPoller._raise_if_unrecoverable(e)
+            logger.error(f"Error during polling for task {job.task_id}: {e}")
+        except (RoExTimeoutError, RoExTaskError):
+            raise
+        except Exception as e:
+            logger.exception(f"Unexpected error during polling for task {job.task_id}: {e}")
+
+        if job.policy.max_attempts is not None and job.attempt >= job.policy.max_attempts:
+            raise TaskPoller(job.policy)._timed_out(job.endpoint, job.task_id, job.attempt)
+        return job.deadline.cap(job.policy.delay(job.attempt))
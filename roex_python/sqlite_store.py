@@ -0,0 +1,158 @@
+"""
+SQLite key-value table with TTL expiry and LRU eviction, shared by the on-disk caches
+"""
+
+import logging
+import os
+import sqlite3
+from contextlib import closing
+from typing import Mapping, Optional, Sequence, Tuple
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# Journal modes a store can be opened with
+JOURNAL_MODES = ("DELETE", "WAL")
+
+
+class SqliteStore:
+    """
+    A table of rows keyed by a string, stored in a SQLite file.
+
+    Each row holds the caller's value columns plus ``created_at`` and
+    ``last_used`` timestamps. Rows older than *ttl* seconds are treated as
+    absent and removed, and once there are more than *max_entries* rows the
+    least recently used are evicted. Each operation opens its own
+    connection, so a store can be shared by threads, and by every process
+    that points at the same path on the same machine.
+
+    The default rollback journal (``journal_mode="DELETE"``) works anywhere
+    SQLite's file locking does. ``journal_mode="WAL"`` lets readers proceed
+    while another process writes, but needs a shared-memory ``-shm`` file
+    and so only works on a local disk; never use it on NFS, SMB or other
+    network file systems.
+
+    Timestamps are passed in by the caller, so a cache can read the clock
+    once per operation and use the same time for every tier.
+
+    Example:
+        >>> store = SqliteStore("uploads.sqlite3", "uploads", {"readable_url": "TEXT NOT NULL"},
+        ...                     ttl=3600, max_entries=1000)
+        >>> store.put("key", ("https://example.com/a.wav",), time.time())
+        >>> store.get("key", ("readable_url",), time.time())
+        (1700000000.0, 'https://example.com/a.wav')
+    """
+
+    def __init__(self, path: str, table: str, columns: Mapping[str, str], ttl: Optional[float],
+                 max_entries: Optional[int], journal_mode: str = "DELETE"):
+        """
+        Args:
+            path: Location of the SQLite file; ``~`` is expanded and the
+                directory is created if needed.
+            table: Name of the table.
+            columns: Value column names mapped to their SQL type, in order.
+            ttl: Seconds a row stays valid, or None to keep rows until evicted.
+            max_entries: Maximum number of rows kept, or None for no limit.
+            journal_mode: "DELETE" (the default) or "WAL", for a file on a
+                local disk only. Set once, when the store is created.
+
+        Raises:
+            ValueError: If *journal_mode* is not one of ``JOURNAL_MODES``
+        """
+        journal_mode = journal_mode.upper()
+        if journal_mode not in JOURNAL_MODES:
+            raise ValueError(f"journal_mode must be one of {', '.join(JOURNAL_MODES)}, got {journal_mode}")
+        self.path = os.path.expanduser(path)
+        self.table = table
+        self.columns = tuple(columns)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.journal_mode = journal_mode
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        definitions = "".join(f"    {name} {sql_type},\n" for name, sql_type in columns.items())
+        with closing(self._connect()) as conn, conn:
+            # WAL is recorded in the file itself; DELETE also switches back a file left in WAL mode
+            conn.execute(f"PRAGMA journal_mode={journal_mode}")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (\n"
+                f"    key TEXT PRIMARY KEY,\n{definitions}"
+                f"    created_at REAL NOT NULL,\n    last_used REAL NOT NULL\n)"
+            )
+
+    def get(self, key: str, columns: Sequence[str], now: float) -> Optional[Tuple]:
+        """
+        Look up a row and mark it used.
+
+        Args:
+            key: Row key.
+            columns: Value columns to return.
+            now: Current time, as from ``time.time()``.
+
+        Returns:
+            Optional[Tuple]: ``created_at`` followed by *columns*, or None if
+            the row is absent or expired. Expired rows are deleted.
+        """
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(f"SELECT created_at, {', '.join(columns)} FROM {self.table} WHERE key = ?",
+                               (key,)).fetchone()
+            if row is None:
+                return None
+            if self.ttl is not None and now - row[0] > self.ttl:
+                conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                return None
+            conn.execute(f"UPDATE {self.table} SET last_used = ? WHERE key = ?", (now, key))
+        return row
+
+    def put(self, key: str, values: Sequence, now: float) -> None:
+        """
+        Insert or replace a row, then evict expired and excess rows.
+
+        Args:
+            key: Row key.
+            values: One value per column given to the constructor, in order.
+            now: Current time, recorded as ``created_at`` and ``last_used``.
+        """
+        names = ", ".join(("key",) + self.columns + ("created_at", "last_used"))
+        placeholders = ", ".join("?" * (len(self.columns) + 3))
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f"INSERT OR REPLACE INTO {self.table} ({names}) VALUES ({placeholders})",
+                         (key, *values, now, now))
+            self._evict(conn, now)
+
+    def evict(self, now: float) -> int:
+        """
+        Remove expired rows and, beyond *max_entries*, the least recently used.
+
+        Returns:
+            int: Number of rows removed.
+        """
+        with closing(self._connect()) as conn, conn:
+            return self._evict(conn, now)
+
+    def clear(self) -> None:
+        """Remove every row."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f"DELETE FROM {self.table}")
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection; one per operation keeps the store safe to share between threads."""
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        """Evict expired and excess rows using *conn*. Returns the number removed."""
+        removed = 0
+        if self.ttl is not None:
+            removed += conn.execute(f"DELETE FROM {self.table} WHERE created_at < ?", (now - self.ttl,)).rowcount
+        if self.max_entries is not None:
+            removed += conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN "
+                f"(SELECT key FROM {self.table} ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        if removed:
+            logger.debug(f"Evicted {removed} entries from {self.table} in {self.path}")
+        return removed
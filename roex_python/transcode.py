@@ -0,0 +1,102 @@
+"""
+Lossless WAV to FLAC transcoding before upload
+"""
+
+import logging
+import os
+import tempfile
+from typing import Optional
+
+from roex_python.models.upload import TranscodeResult
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# WAV sample formats FLAC can hold without loss
+LOSSLESS_SUBTYPES = ("PCM_U8", "PCM_S8", "PCM_16", "PCM_24")
+
+DEFAULT_MIN_SAVING = 0.1
+
+
+def require_soundfile() -> None:
+    """Raise ImportError with an install hint if ``soundfile`` is missing."""
+    try:
+        import soundfile  # noqa: F401
+    except ImportError as e:
+        raise ImportError("FLAC transcoding requires soundfile: pip install \"roex-python[audio]\"") from e
+
+
+def transcode_to_flac(wav_path: str, output_dir: Optional[str] = None, min_saving: float = DEFAULT_MIN_SAVING,
+                      block_frames: int = 65536) -> TranscodeResult:
+    """
+    Losslessly transcode a WAV file to FLAC, keeping it only if it is worth it.
+
+    The WAV is read and encoded block by block, so memory use does not grow
+    with file size. Files whose samples FLAC cannot store exactly (32-bit
+    integer or floating-point WAVs) are not transcoded, and the FLAC is
+    discarded if it is not at least *min_saving* smaller than the WAV, e.g.
+    for noise-like material that does not compress.
+
+    Safe to run in a worker process.
+
+    Args:
+        wav_path: Path to the WAV file.
+        output_dir: Directory for the FLAC file. Defaults to the system temp directory.
+        min_saving: Smallest fraction of the WAV's size the FLAC must save to be
+            used, from 0.0 to 1.0. Defaults to 0.1 (10%).
+        block_frames: Frames read and encoded at a time.
+
+    Returns:
+        TranscodeResult: The FLAC path and sizes, or the reason it was skipped.
+
+    Raises:
+        ImportError: If ``soundfile`` is not installed
+        ValueError: If *min_saving* is outside [0, 1]
+    """
+    import soundfile
+
+    if not 0.0 <= min_saving <= 1.0:
+        raise ValueError(f"min_saving must be between 0 and 1, got {min_saving}")
+    original_bytes = os.path.getsize(wav_path)
+    result = TranscodeResult(source_path=wav_path, original_bytes=original_bytes)
+
+    info = soundfile.info(wav_path)
+    if info.format != "WAV" or info.subtype not in LOSSLESS_SUBTYPES:
+        result.skipped_reason = f"{info.format}/{info.subtype} cannot be stored losslessly as FLAC"
+        return result
+
+    stem = os.path.splitext(os.path.basename(wav_path))[0]
+    fd, flac_path = tempfile.mkstemp(prefix=f"{stem}.", suffix=".flac", dir=output_dir)
+    os.close(fd)
+    try:
+        subtype = "PCM_16" if info.subtype in ("PCM_U8", "PCM_S8", "PCM_16") else "PCM_24"
+        with soundfile.SoundFile(wav_path) as source, \
+                soundfile.SoundFile(flac_path, mode="w", samplerate=source.samplerate, channels=source.channels,
+                                    format="FLAC", subtype=subtype) as out:
+            for block in source.blocks(blocksize=block_frames, dtype="int32"):
+                out.write(block)
+        flac_bytes = os.path.getsize(flac_path)
+    except BaseException:
+        os.remove(flac_path)
+        raise
+
+    if flac_bytes > original_bytes * (1.0 - min_saving):
+        os.remove(flac_path)
+        result.skipped_reason = f"FLAC would only save {1 - flac_bytes / original_bytes:.0%}"
+        return result
+    result.flac_path = flac_path
+    result.flac_bytes = flac_bytes
+    logger.info(f"Transcoded {wav_path} to FLAC: {original_bytes} -> {flac_bytes} bytes "
+                f"({result.bytes_saved / original_bytes:.0%} saved)")
+    return result
+
+
+def upload_name(path: str, result: TranscodeResult) -> str:
+    """Filename to upload under: the original name, with a .flac extension if transcoded."""
+    name = os.path.basename(path)
+    return os.path.splitext(name)[0] + ".flac" if result.flac_path else name
+
+
+def is_wav(path: str) -> bool:
+    """True if *path* has a .wav extension."""
+    return os.path.splitext(path)[1].lower() == ".wav"
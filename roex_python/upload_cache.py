@@ -0,0 +1,144 @@
+"""
+Persistent content-addressed cache of uploaded files
+"""
+
+import hashlib
+import logging
+import os
+import time
+from typing import BinaryIO, Optional
+
+from roex_python.sqlite_store import SqliteStore
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join("~", ".cache", "roex", "uploads.sqlite3")
+
+_COLUMNS = {"readable_url": "TEXT NOT NULL", "size": "INTEGER NOT NULL"}
+
+
+class UploadCache:
+    """
+    Maps file contents to the ``readable_url`` of an earlier upload.
+
+    Pass a cache to ``utils.upload_file`` or ``utils.upload_files`` and a file
+    whose exact contents were uploaded before is not uploaded again: the
+    ``/upload`` request and the PUT are both skipped. Files are identified by
+    the SHA-256 of their contents (streamed, so large files are never loaded
+    into memory), together with their content type and the API base URL.
+
+    Entries are stored in a SQLite file, so the cache is shared by every
+    thread, and every process on the same machine, that points at the same
+    path. Keep the file on a local disk: SQLite's locking is unreliable on
+    network file systems such as NFS and SMB, so workers on different
+    machines should each use their own cache. Entries older than *ttl*
+    seconds are ignored and removed, and the least recently used entries
+    are evicted once there are more than *max_entries*.
+
+    Example:
+        >>> cache = UploadCache()
+        >>> url = upload_file(client, "stems/drums.wav", cache=cache)  # uploads
+        >>> url = upload_file(client, "stems/drums.wav", cache=cache)  # cache hit, no upload
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: Optional[float] = 24 * 3600,
+                 max_entries: Optional[int] = 10000, journal_mode: str = "DELETE"):
+        """
+        Args:
+            path: Location of the SQLite file. Defaults to
+                ``~/.cache/roex/uploads.sqlite3``.
+            ttl: Seconds an upload stays valid, or None to keep entries until
+                evicted. Keep this below the lifetime of uploaded files on the
+                RoEx side. Defaults to 24 hours.
+            max_entries: Maximum number of entries kept, or None for no limit.
+                Defaults to 10000.
+            journal_mode: SQLite journal mode, "DELETE" (the default) or
+                "WAL". WAL lets many local processes read while one writes,
+                but only works on a local disk.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self._store = SqliteStore(path, "uploads", _COLUMNS, ttl, max_entries, journal_mode)
+        self.path = self._store.path
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    @staticmethod
+    def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+        """
+        SHA-256 of a file's contents, read in chunks.
+
+        Args:
+            file_path: Path to the file.
+            chunk_size: Bytes read at a time. Defaults to 1 MiB.
+
+        Returns:
+            str: Hex digest.
+        """
+        with open(file_path, "rb") as f:
+            return UploadCache.hash_stream(f, chunk_size)
+
+    @staticmethod
+    def hash_stream(stream: BinaryIO, chunk_size: int = 1024 * 1024) -> str:
+        """
+        SHA-256 of the rest of a binary stream, read in chunks.
+
+        Args:
+            stream: Readable binary stream.
+            chunk_size: Bytes read at a time. Defaults to 1 MiB.
+
+        Returns:
+            str: Hex digest.
+        """
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(content_hash: str, content_type: str, base_url: str) -> str:
+        """Cache key for a file's contents as uploaded to a given API."""
+        return f"{base_url.rstrip('/')}|{content_type}|{content_hash}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a previous upload.
+
+        Args:
+            key: Key built with ``key``.
+
+        Returns:
+            Optional[str]: The cached readable URL, or None if absent or expired.
+        """
+        row = self._store.get(key, ("readable_url",), time.time())
+        return row[1] if row is not None else None
+
+    def put(self, key: str, readable_url: str, size: int) -> None:
+        """
+        Record an upload, then evict expired and excess entries.
+
+        Args:
+            key: Key built with ``key``.
+            readable_url: URL returned for the upload.
+            size: File size in bytes.
+        """
+        self._store.put(key, (readable_url, size), time.time())
+
+    def evict(self) -> int:
+        """
+        Remove expired entries and, beyond *max_entries*, the least recently used.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        return self._store.evict(time.time())
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._store.clear()
+
+    def __len__(self) -> int:
+        return len(self._store)
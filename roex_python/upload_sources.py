@@ -0,0 +1,324 @@
+"""
+Upload sources: local paths, in-memory buffers, file objects and NumPy arrays
+"""
+
+import io
+import logging
+import os
+import struct
+import sys
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Iterator, Optional, Union
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+UploadSource = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, BinaryIO, Any]
+"""Anything ``utils.upload_file`` can upload: a path, a bytes-like buffer, a binary
+file object, or a float NumPy array of samples."""
+
+CONTENT_TYPES = {
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+    '.flac': 'audio/flac'
+}
+
+ARRAY_FORMATS = ("wav", "flac")
+
+
+def content_type_for(filename: str) -> str:
+    """Determine content type based on file extension.
+
+    Args:
+        filename: File name or path
+
+    Returns:
+        The MIME content type for the file
+
+    Raises:
+        ValueError: If the file extension is not supported
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in CONTENT_TYPES:
+        raise ValueError(f"Unsupported file type: {extension}. Must be one of: {', '.join(CONTENT_TYPES.keys())}")
+    return CONTENT_TYPES[extension]
+
+
+class PreparedUpload:
+    """
+    An upload source resolved to a filename, content type and a way to read it.
+
+    Built by ``prepare_upload``. ``open`` can be called more than once (e.g. to
+    hash the contents for an ``UploadCache`` and then to upload them), and
+    every stream it yields is seekable unless the source file object was not.
+
+    Attributes:
+        filename: Name sent to ``/upload``.
+        content_type: MIME type of the bytes that will be uploaded.
+        path: Local path, when the source is a file on disk.
+    """
+
+    def __init__(self, filename: str, content_type: str, path: Optional[str] = None,
+                 buffer: Optional[memoryview] = None, file: Optional[BinaryIO] = None,
+                 encoder: Optional["WavEncoder"] = None):
+        self.filename = filename
+        self.content_type = content_type
+        self.path = path
+        self._buffer = buffer
+        self._file = file
+        self._file_start = file.tell() if file is not None and _seekable(file) else None
+        self._encoder = encoder
+
+    @property
+    def seekable(self) -> bool:
+        """bool: True if the bytes can be re-read, which chunked uploads and caching need."""
+        return self._file is None or self._file_start is not None
+
+    @contextmanager
+    def open(self) -> Iterator[BinaryIO]:
+        """Yield a binary stream positioned at the start of the upload's bytes."""
+        if self.path is not None:
+            with open(self.path, 'rb') as f:
+                yield f
+        elif self._buffer is not None:
+            yield _BufferReader(self._buffer)
+        elif self._encoder is not None:
+            yield self._encoder.reader()
+        else:
+            # Caller-owned file objects are rewound but never closed
+            if self._file_start is not None:
+                self._file.seek(self._file_start)
+            yield self._file
+
+    def size(self) -> int:
+        """Number of bytes that will be uploaded."""
+        if self.path is not None:
+            return os.path.getsize(self.path)
+        if self._buffer is not None:
+            return self._buffer.nbytes
+        if self._encoder is not None:
+            return self._encoder.size
+        with self.open() as f:
+            return f.seek(0, os.SEEK_END) - self._file_start
+
+
+def prepare_upload(source: UploadSource, filename: Optional[str] = None, sample_rate: Optional[int] = None,
+                   audio_format: str = "wav", bit_depth: int = 24) -> PreparedUpload:
+    """
+    Resolve an upload source to a ``PreparedUpload``.
+
+    Args:
+        source: A path; ``bytes``, ``bytearray`` or ``memoryview`` holding an
+            encoded audio file; a binary file object; or a float NumPy array
+            of samples in [-1, 1], shaped (frames,) or (frames, channels).
+        filename: Name for the upload. Required for buffers and for file
+            objects without a ``name``; its extension sets the content type.
+            Defaults to the path's base name, or "audio.wav" / "audio.flac"
+            for arrays.
+        sample_rate: Sample rate in Hz. Required for arrays.
+        audio_format: "wav" or "flac", for arrays. WAV is encoded on the fly
+            as the upload reads it; FLAC needs the ``soundfile`` package.
+        bit_depth: PCM bit depth for arrays, 16 or 24. Defaults to 24.
+
+    Returns:
+        PreparedUpload: Filename, content type and readable stream for the upload.
+
+    Raises:
+        ValueError: If the file type is unsupported or a required argument is missing
+        TypeError: If *source* is not a supported type
+    """
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(source, np.ndarray):
+        return _prepare_array(source, filename, sample_rate, audio_format, bit_depth)
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        name = filename or os.path.basename(path)
+        return PreparedUpload(name, content_type_for(name), path=path)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        if not filename:
+            raise ValueError("filename is required when uploading from a buffer, e.g. filename='mix.wav'")
+        return PreparedUpload(filename, content_type_for(filename), buffer=memoryview(source).cast("B"))
+    if hasattr(source, "read"):
+        name = filename or os.path.basename(getattr(source, "name", "") or "")
+        if not name:
+            raise ValueError("filename is required for file objects without a name, e.g. filename='mix.wav'")
+        return PreparedUpload(name, content_type_for(name), file=source)
+    raise TypeError(f"Cannot upload {type(source).__name__}; pass a path, bytes, a binary file or a NumPy array")
+
+
+def _prepare_array(samples: Any, filename: Optional[str], sample_rate: Optional[int],
+                   audio_format: str, bit_depth: int) -> PreparedUpload:
+    """Prepare a NumPy array of samples for upload as WAV or FLAC."""
+    if audio_format not in ARRAY_FORMATS:
+        raise ValueError(f"audio_format must be one of {ARRAY_FORMATS}, got {audio_format!r}")
+    if not sample_rate or sample_rate <= 0:
+        raise ValueError("sample_rate is required when uploading a NumPy array")
+    name = filename or f"audio.{audio_format}"
+    content_type = content_type_for(name)
+    if content_type != CONTENT_TYPES["." + audio_format]:
+        raise ValueError(f"filename {name!r} does not match audio_format {audio_format!r}")
+    encoder = WavEncoder(samples, int(sample_rate), bit_depth)
+    if audio_format == "wav":
+        return PreparedUpload(name, content_type, encoder=encoder)
+    return PreparedUpload(name, content_type, buffer=_encode_flac(encoder))
+
+
+def _encode_flac(encoder: "WavEncoder") -> memoryview:
+    """Encode samples to FLAC in memory, block by block."""
+    try:
+        import soundfile
+    except ImportError as e:
+        raise ImportError("Uploading arrays as FLAC requires soundfile: pip install soundfile") from e
+    buffer = io.BytesIO()
+    subtype = "PCM_16" if encoder.bit_depth == 16 else "PCM_24"
+    with soundfile.SoundFile(buffer, mode="w", samplerate=encoder.sample_rate, channels=encoder.channels,
+                             format="FLAC", subtype=subtype) as out:
+        for start in range(0, encoder.frames, WavEncoder.BLOCK_FRAMES):
+            out.write(encoder.samples[start:start + WavEncoder.BLOCK_FRAMES])
+    return buffer.getbuffer()
+
+
+class WavEncoder:
+    """
+    Encodes a float NumPy array as a PCM WAV file on demand.
+
+    The encoded file is never materialised: ``reader`` returns a seekable
+    stream that converts only the frames covering each ``read``, so memory
+    use stays at one read's worth regardless of the array's length.
+    """
+
+    BLOCK_FRAMES = 65536
+    HEADER_SIZE = 44
+
+    def __init__(self, samples: Any, sample_rate: int, bit_depth: int = 24):
+        """
+        Args:
+            samples: Float array shaped (frames,) or (frames, channels), values in [-1, 1].
+            sample_rate: Sample rate in Hz.
+            bit_depth: 16 or 24.
+
+        Raises:
+            TypeError: If *samples* is not a floating-point array
+            ValueError: If the shape or bit depth is unsupported
+        """
+        import numpy as np
+        if not np.issubdtype(samples.dtype, np.floating):
+            raise TypeError(f"Expected a float array of samples, got dtype {samples.dtype}")
+        if samples.ndim not in (1, 2) or samples.shape[0] == 0:
+            raise ValueError(f"Expected samples shaped (frames,) or (frames, channels), got {samples.shape}")
+        if bit_depth not in (16, 24):
+            raise ValueError(f"bit_depth must be 16 or 24, got {bit_depth}")
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.bit_depth = bit_depth
+        self.frames = samples.shape[0]
+        self.channels = 1 if samples.ndim == 1 else samples.shape[1]
+        self.sample_bytes = bit_depth // 8
+        self.frame_bytes = self.channels * self.sample_bytes
+        self.data_size = self.frames * self.frame_bytes
+        if self.HEADER_SIZE - 8 + self.data_size > 0xFFFFFFFF:
+            raise ValueError("Array is too long for a WAV file; upload it as FLAC instead")
+        self.size = self.HEADER_SIZE + self.data_size
+        self.header = self._header()
+
+    def _header(self) -> bytes:
+        """RIFF/WAVE header for PCM data."""
+        byte_rate = self.sample_rate * self.frame_bytes
+        return (b"RIFF" + struct.pack("<I", self.size - 8) + b"WAVE"
+                + b"fmt " + struct.pack("<IHHIIHH", 16, 1, self.channels, self.sample_rate, byte_rate,
+                                        self.frame_bytes, self.bit_depth)
+                + b"data" + struct.pack("<I", self.data_size))
+
+    def reader(self) -> BinaryIO:
+        """A new seekable stream over the encoded file."""
+        return _EncodedReader(self)
+
+    def encode(self, start: int, end: int) -> bytes:
+        """Encoded bytes in the range [start, end) of the file."""
+        import numpy as np
+        out = b""
+        if start < self.HEADER_SIZE:
+            out = self.header[start:end]
+            start = self.HEADER_SIZE
+        if end <= start:
+            return out
+        first, last = (start - self.HEADER_SIZE), (end - self.HEADER_SIZE)
+        first_frame, last_frame = first // self.frame_bytes, -(-last // self.frame_bytes)
+        block = np.clip(self.samples[first_frame:last_frame], -1.0, 1.0).reshape(-1)
+        if self.bit_depth == 16:
+            pcm = np.round(block * 32767).astype("<i2").tobytes()
+        else:
+            pcm = np.round(block * 8388607).astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+        offset = first_frame * self.frame_bytes
+        return out + pcm[first - offset:last - offset]
+
+
+class _RandomAccessReader(io.RawIOBase):
+    """Seekable binary stream whose bytes are produced on demand by ``_slice``."""
+
+    def __init__(self, size: int):
+        super().__init__()
+        self.size = size
+        self.position = 0
+
+    def _slice(self, start: int, end: int) -> bytes:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        # Lets requests send a Content-Length instead of a chunked body
+        return self.size - self.position
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self.position, os.SEEK_END: self.size}[whence]
+        self.position = max(0, base + offset)
+        return self.position
+
+    def read(self, size: int = -1) -> bytes:
+        end = self.size if size is None or size < 0 else min(self.size, self.position + size)
+        data = self._slice(self.position, end) if end > self.position else b""
+        self.position += len(data)
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class _EncodedReader(_RandomAccessReader):
+    """Stream over a ``WavEncoder``, encoding only the frames each read covers."""
+
+    def __init__(self, encoder: WavEncoder):
+        super().__init__(encoder.size)
+        self.encoder = encoder
+
+    def _slice(self, start: int, end: int) -> bytes:
+        return self.encoder.encode(start, end)
+
+
+class _BufferReader(_RandomAccessReader):
+    """Stream over a memoryview that copies only what each read returns."""
+
+    def __init__(self, buffer: memoryview):
+        super().__init__(buffer.nbytes)
+        self.buffer = buffer
+
+    def _slice(self, start: int, end: int) -> bytes:
+        return self.buffer[start:end].tobytes()
+
+
+def _seekable(file: Any) -> bool:
+    """True if *file* supports seek and tell."""
+    try:
+        return bool(file.seekable()) if hasattr(file, "seekable") else (file.tell() is not None)
+    except (OSError, ValueError):
+        return False
@@ -1,12 +1,22 @@
 """Utility functions for the RoEx package."""
 
+import asyncio
 import os
+import tempfile
+import time
 import requests
-from typing import Dict, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from typing import AsyncIterator, Callable, Dict, Optional, Sequence, Tuple
 import logging
 
 from .client import RoExClient
-from .models import UploadUrlRequest
+from .async_client import AsyncRoExClient
+from .models import (BatchUploadResult, FileUploadResult, TranscodeResult, UploadProgress, UploadUrlRequest,
+                     UploadUrlResponse)
+from .upload_cache import UploadCache
+from .transcode import DEFAULT_MIN_SAVING, is_wav, require_soundfile, transcode_to_flac, upload_name
+from .upload_sources import PreparedUpload, UploadSource, content_type_for, prepare_upload
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
@@ -23,34 +33,87 @@ def get_content_type(file_path: str) -> str:
     Raises:
         ValueError: If the file extension is not supported
     """
-    extension = os.path.splitext(file_path)[1].lower()
-    content_type_map = {
-        '.mp3': 'audio/mpeg',
-        '.wav': 'audio/wav',
-        '.flac': 'audio/flac'
-    }
-    if extension not in content_type_map:
-        raise ValueError(f"Unsupported file type: {extension}. Must be one of: {', '.join(content_type_map.keys())}")
-    return content_type_map[extension]
-
-
-def upload_file(client: RoExClient, file_path: str) -> str:
+    return content_type_for(file_path)
+
+
+def upload_file(client: RoExClient, file_path: UploadSource, cache: Optional[UploadCache] = None,
+                chunk_size: Optional[int] = None,
+                on_progress: Optional[Callable[[UploadProgress], None]] = None,
+                filename: Optional[str] = None, sample_rate: Optional[int] = None,
+                audio_format: str = "wav", transcode: bool = False,
+                min_flac_saving: float = DEFAULT_MIN_SAVING) -> str:
     """Upload a file and return its readable URL.
     
+    With *chunk_size* set, files larger than one chunk are sent as a
+    resumable upload, one chunk at a time, so a dropped connection is retried
+    from the last chunk storage acknowledged instead of from the start of the
+    file. If storage will not open a resumable session for the signed URL,
+    the file is sent in a single PUT.
+    
+    Besides a path, the source can be audio already in memory, so nothing has
+    to be written to disk first: ``bytes``/``memoryview`` holding an encoded
+    file, a binary file object, or a float NumPy array of samples. Arrays are
+    encoded as 24-bit WAV while the upload reads them, without building the
+    whole file in memory, or as FLAC with ``audio_format="flac"`` (requires
+    ``soundfile``).
+    
     Args:
         client: RoExClient instance
-        file_path: Path to the file to upload
+        file_path: Path to the file to upload, or an in-memory source as above
+        cache: Optional UploadCache. If a file with identical contents was
+            uploaded before, its URL is returned without uploading again.
+        chunk_size: Bytes per resumable chunk, a multiple of 256 KiB such as
+            ``DEFAULT_UPLOAD_CHUNK_SIZE`` (8 MiB). Defaults to None, which
+            sends every file in a single PUT.
+        on_progress: Optional callback receiving an ``UploadProgress`` (bytes
+            sent, throughput, ETA) as the upload advances.
+        filename: Name for the upload, whose extension sets the content type.
+            Required for buffers and unnamed file objects; defaults to the
+            file's name, or "audio.wav" / "audio.flac" for arrays.
+        sample_rate: Sample rate in Hz; required for NumPy arrays.
+        audio_format: "wav" (default) or "flac"; how NumPy arrays are encoded.
+        transcode: Convert a WAV file to FLAC before uploading it, unless the
+            FLAC would save less than *min_flac_saving* of its size. Applies to
+            paths only and requires ``soundfile``. Defaults to False.
+        min_flac_saving: Smallest fraction of the WAV's size the FLAC must
+            save to be uploaded instead. Defaults to 0.1 (10%).
         
     Returns:
         The URL where the uploaded file can be accessed
         
     Raises:
         Exception: If the upload fails
+        
+    Example:
+        >>> samples = render()  # float32 array, shape (frames, 2)
+        >>> url = upload_file(client, samples, sample_rate=48000, filename="render.wav")
     """
-    logger.info(f"Starting upload process for file: {file_path}")
-    filename = os.path.basename(file_path)
-    content_type = get_content_type(file_path)
+    source = prepare_upload(file_path, filename=filename, sample_rate=sample_rate, audio_format=audio_format)
+    filename = source.filename
+    content_type = source.content_type
+    logger.info(f"Starting upload process for {source.path or filename}")
+    if transcode and source.path is not None and is_wav(source.path):
+        require_soundfile()
+        transcoded = transcode_to_flac(source.path, min_saving=min_flac_saving)
+        if transcoded.flac_path is None:
+            logger.info(f"Uploading {source.path} as WAV: {transcoded.skipped_reason}")
+        else:
+            try:
+                return upload_file(client, transcoded.flac_path, cache=cache, chunk_size=chunk_size,
+                                   on_progress=on_progress, filename=upload_name(source.path, transcoded))
+            finally:
+                os.remove(transcoded.flac_path)
+    if not source.seekable:
+        # Chunked uploads and progress need to re-read and measure the stream
+        chunk_size, on_progress = None, None
     
+    cache_key = _cache_key(client, cache, source)
+    if cache_key is not None:
+        cached_url = cache.get(cache_key)
+        if cached_url is not None:
+            logger.info(f"Skipping upload of {filename}; identical contents already uploaded to {cached_url}")
+            return cached_url
+
     # Get upload URLs
     try:
         logger.info(f"Requesting upload URL for {filename}...")
@@ -68,14 +131,13 @@ def upload_file(client: RoExClient, file_path: str) -> str:
     # Upload the file
     try:
         logger.info(f"Attempting to upload {filename} to upload URL...")
-        with open(file_path, 'rb') as f:
-            upload_response = requests.put(
-                response.signed_url,
-                data=f,
-                headers={'Content-Type': content_type}
-            )
-            upload_response.raise_for_status() # Raises HTTPError for bad responses (4xx or 5xx)
+        with source.open() as f:
+            # Goes through the client's pooled session; raises HTTPError for bad responses (4xx or 5xx)
+            client.api_provider.upload_to_signed_url(response.signed_url, f, content_type,
+                                                     chunk_size=chunk_size, on_progress=on_progress)
         logger.info(f"Successfully uploaded {filename}. Readable URL: {response.readable_url}")
+        if cache_key is not None:
+            cache.put(cache_key, response.readable_url, source.size())
         return response.readable_url
     except requests.exceptions.RequestException as e:
         logger.exception(f"HTTP error during file upload for {filename}: {e}")
@@ -83,3 +145,224 @@ def upload_file(client: RoExClient, file_path: str) -> str:
     except Exception as e:
         logger.exception(f"Unexpected error during file upload for {filename}: {e}")
         raise
+
+
+def upload_files(client: RoExClient, file_paths: Sequence[str], max_workers: int = 8,
+                 cache: Optional[UploadCache] = None,
+                 chunk_size: Optional[int] = None,
+                 on_progress: Optional[Callable[[UploadProgress], None]] = None,
+                 transcode: bool = False, min_flac_saving: float = DEFAULT_MIN_SAVING,
+                 transcode_workers: Optional[int] = None) -> BatchUploadResult:
+    """Upload many files in parallel and return their readable URLs in input order.
+
+    Signed URLs for all files are requested concurrently, and each file is
+    PUT as soon as its URL arrives, so URL requests for later files overlap
+    with uploads of earlier ones. All requests go through the client's pooled
+    connections; raise ``pool_maxsize`` on the client if *max_workers* exceeds it.
+    A file that fails does not stop the others.
+
+    With ``transcode=True``, WAV files are first converted to FLAC in a pool
+    of worker processes, and each file moves on to upload as soon as its
+    FLAC is ready. A FLAC that does not save at least *min_flac_saving* of
+    the WAV's size is discarded and the WAV is uploaded instead, as are WAVs
+    that fail to transcode. Requires ``soundfile``.
+
+    Args:
+        client: RoExClient instance
+        file_paths: Paths of the files to upload
+        max_workers: Maximum number of concurrent URL requests and of concurrent
+            uploads. Defaults to 8.
+        cache: Optional UploadCache. Files whose contents were uploaded before
+            are not uploaded again and are marked ``cached`` in the result.
+        chunk_size: Bytes per resumable chunk for large files, as in
+            ``upload_file``. Defaults to None (single PUT).
+        on_progress: Optional callback receiving an ``UploadProgress`` for each
+            file as it advances. Called from worker threads; use
+            ``UploadProgress.path`` to tell files apart.
+        transcode: Convert WAV files to FLAC before uploading. Defaults to False.
+        min_flac_saving: Smallest fraction of a WAV's size the FLAC must save
+            to be uploaded instead. Defaults to 0.1 (10%).
+        transcode_workers: Number of transcoding processes. Defaults to the
+            number of CPUs.
+
+    Returns:
+        BatchUploadResult with one FileUploadResult per path, in input order,
+        plus total bytes, bytes saved by transcoding, elapsed time and throughput
+
+    Raises:
+        ValueError: If max_workers is less than 1
+        ImportError: If *transcode* is set and ``soundfile`` is not installed
+
+    Example:
+        >>> batch = upload_files(client, ["drums.wav", "bass.wav", "vocals.wav"], transcode=True)
+        >>> for result in batch.failed:
+        >>>     print(f"{result.path}: {result.error}")
+        >>> print(f"FLAC saved {batch.bytes_saved / 1e6:.1f} MB")
+        >>> drums_url, bass_url, vocals_url = batch.readable_urls
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    transcoding = transcode and any(is_wav(path) for path in file_paths)
+    if transcoding:
+        require_soundfile()
+    logger.info(f"Uploading {len(file_paths)} files with {max_workers} workers")
+    started = time.monotonic()
+    results = [FileUploadResult(path=path) for path in file_paths]
+
+    with ExitStack() as stack:
+        url_pool = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="roex-upload-url"))
+        put_pool = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="roex-upload"))
+        if transcoding:
+            flac_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="roex-flac-"))
+            transcode_pool = stack.enter_context(ProcessPoolExecutor(max_workers=transcode_workers))
+
+        def request_url(result: FileUploadResult) -> Future:
+            path, filename = result.path, None
+            if result.transcode is not None and result.transcode.flac_path:
+                path, filename = result.transcode.flac_path, upload_name(result.path, result.transcode)
+            return url_pool.submit(_request_upload_url, client, result, path, filename, cache)
+
+        # Each file moves through transcode (optional) -> upload URL -> PUT independently
+        stages: Dict[Future, Tuple[str, FileUploadResult]] = {}
+        for result in results:
+            if transcoding and is_wav(result.path):
+                future = transcode_pool.submit(transcode_to_flac, result.path, flac_dir, min_flac_saving)
+                stages[future] = ("transcode", result)
+            else:
+                stages[request_url(result)] = ("url", result)
+        while stages:
+            done, _ = wait(stages, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, result = stages.pop(future)
+                if stage == "transcode":
+                    try:
+                        result.transcode = future.result()
+                    except Exception as e:
+                        logger.warning(f"Could not transcode {result.path}; uploading it as WAV: {e}")
+                        result.transcode = TranscodeResult(source_path=result.path,
+                                                           skipped_reason=f"Transcoding failed: {e}")
+                    stages[request_url(result)] = ("url", result)
+                elif stage == "url":
+                    try:
+                        prepared = future.result()
+                    except Exception as e:
+                        result.error = f"Could not get upload URL: {e}"
+                        result.seconds = time.monotonic() - started
+                        logger.error(f"Error getting upload URL for {result.path}: {e}")
+                        continue
+                    if prepared is None:
+                        result.seconds = time.monotonic() - started
+                        continue
+                    response, source, cache_key = prepared
+                    put_future = put_pool.submit(_put_file, client, result, response, source,
+                                                 started, cache, cache_key, chunk_size, on_progress)
+                    stages[put_future] = ("put", result)
+
+    batch = BatchUploadResult(files=results, elapsed_seconds=time.monotonic() - started)
+    logger.info(f"Uploaded {len(results) - len(batch.failed)}/{len(results)} files "
+                f"({sum(f.cached for f in results)} from cache), "
+                f"{batch.total_bytes} bytes in {batch.elapsed_seconds:.1f}s ({batch.throughput / 1e6:.2f} MB/s)"
+                + (f"; FLAC saved {batch.bytes_saved} bytes" if transcoding else ""))
+    return batch
+
+
+def _cache_key(client: RoExClient, cache: Optional[UploadCache], source: PreparedUpload) -> Optional[str]:
+    """Upload cache key for *source*, or None when no cache is in use or the source cannot be re-read."""
+    if cache is None or not source.seekable:
+        return None
+    with source.open() as f:
+        content_hash = UploadCache.hash_stream(f)
+    return cache.key(content_hash, source.content_type, client.api_provider.base_url)
+
+
+def _request_upload_url(client: RoExClient, result: FileUploadResult, path: str, filename: Optional[str],
+                        cache: Optional[UploadCache]
+                        ) -> Optional[Tuple[UploadUrlResponse, PreparedUpload, Optional[str]]]:
+    """Request a signed upload URL for the file at *path*, uploaded as *filename*.
+
+    Returns the URL response, the prepared source and its cache key, or None
+    if the file was found in *cache* (in which case *result* is already filled in).
+    """
+    source = prepare_upload(path, filename=filename)
+    cache_key = _cache_key(client, cache, source)
+    if cache_key is not None:
+        cached_url = cache.get(cache_key)
+        if cached_url is not None:
+            result.readable_url, result.cached = cached_url, True
+            logger.info(f"Skipping upload of {result.path}; identical contents already uploaded")
+            return None
+    request = UploadUrlRequest(filename=source.filename, content_type=source.content_type)
+    response = client.upload.get_upload_url(request)
+    if response.error:
+        raise ValueError(f"Failed to get valid upload URL response from RoEx API: {response.message}")
+    return response, source, cache_key
+
+
+def _put_file(client: RoExClient, result: FileUploadResult, response: UploadUrlResponse, source: PreparedUpload,
+              batch_started: float, cache: Optional[UploadCache], cache_key: Optional[str],
+              chunk_size: Optional[int], on_progress: Optional[Callable[[UploadProgress], None]]) -> None:
+    """Upload *source* to its signed URL, recording the outcome on *result*."""
+    try:
+        with source.open() as f:
+            client.api_provider.upload_to_signed_url(response.signed_url, f, source.content_type,
+                                                     chunk_size=chunk_size, on_progress=on_progress)
+        result.readable_url = response.readable_url
+        result.bytes_uploaded = source.size()
+        logger.info(f"Uploaded {result.path}. Readable URL: {response.readable_url}")
+        if cache_key is not None:
+            cache.put(cache_key, response.readable_url, result.bytes_uploaded)
+    except Exception as e:
+        result.error = f"Upload failed: {e}"
+        logger.error(f"Error uploading {result.path}: {e}")
+    finally:
+        result.seconds = time.monotonic() - batch_started
+
+
+async def _iter_file_chunks(file_path: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+    """Yield a file's contents in chunks without loading it into memory or blocking the event loop."""
+    # Disk I/O runs in the default executor (asyncio.to_thread needs Python 3.9)
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(None, open, file_path, 'rb')
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, f.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        await loop.run_in_executor(None, f.close)
+
+
+async def upload_file_async(client: AsyncRoExClient, file_path: str) -> str:
+    """Upload a file through an AsyncRoExClient and return its readable URL.
+
+    The file is streamed in chunks, so memory use does not grow with file size.
+
+    Args:
+        client: AsyncRoExClient instance
+        file_path: Path to the file to upload
+
+    Returns:
+        The URL where the uploaded file can be accessed
+
+    Raises:
+        Exception: If the upload fails
+    """
+    logger.info(f"Starting async upload process for file: {file_path}")
+    filename = os.path.basename(file_path)
+    content_type = get_content_type(file_path)
+
+    request = UploadUrlRequest(filename=filename, content_type=content_type)
+    response = await client.upload.get_upload_url(request)
+    if response.error:
+        logger.error(f"Failed to get upload URL: {response.message}")
+        raise ValueError("Failed to get valid upload URL response from RoEx API.")
+
+    await client.api_provider.upload_to_signed_url(
+        response.signed_url,
+        _iter_file_chunks(file_path),
+        content_type,
+        content_length=os.path.getsize(file_path),
+    )
+    logger.info(f"Successfully uploaded {filename}. Readable URL: {response.readable_url}")
+    return response.readable_url
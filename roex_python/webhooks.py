@@ -0,0 +1,208 @@
+"""
+Embedded HTTP listener that turns RoEx webhook callbacks into task completions
+"""
+
+import logging
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Set
+
+from roex_python.polling import PollPolicy
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# Callback bodies are only logged, so there is no reason to accept large ones
+MAX_CALLBACK_BYTES = 1024 * 1024
+
+# Bind addresses meaning "every interface", which no remote caller can use as a URL host
+WILDCARD_HOSTS = frozenset({"", "0.0.0.0", "::"})
+
+
+class WebhookListener:
+    """
+    Lightweight HTTP server that receives RoEx task callbacks.
+
+    Pass a listener to ``RoExClient(webhook_listener=...)`` and the client's
+    ``submit`` methods register a unique callback URL as the request's
+    ``webhook_url`` (unless one is already set). When the API calls it, the
+    matching task is polled once straight away and its ``TaskHandle``
+    resolves, so a job costs roughly one callback and one retrieval instead
+    of tens of polls. Until the callback arrives the task is polled on the
+    slow *fallback_policy*, so a late or lost callback only delays the result.
+
+    Each callback URL ends in a random token, so only the API (which received
+    the URL) can trigger it. The API must be able to reach the listener: run
+    it on a publicly reachable host, or behind a tunnel or load balancer, and
+    pass that address as *public_url*.
+
+    Example:
+        >>> listener = WebhookListener(port=8080, public_url="https://hooks.example.com")
+        >>> with RoExClient(api_key="YOUR_API_KEY", webhook_listener=listener) as client:
+        >>>     handle = client.mastering.submit(mastering_request)
+        >>>     print(handle.result(timeout=900).download_url_mastered_preview)
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 0, public_url: Optional[str] = None,
+                 path: str = "/roex-webhook", fallback_policy: Optional[PollPolicy] = None):
+        """
+        Args:
+            host: Interface to listen on. Defaults to all interfaces.
+            port: Port to listen on; 0 picks a free port. Defaults to 0.
+            public_url: Base URL at which the API can reach this listener, e.g.
+                "https://hooks.example.com". Required when *host* is a wildcard
+                address such as "0.0.0.0"; otherwise defaults to
+                ``http://{host}:{port}``.
+            path: Path prefix for callback URLs. Defaults to "/roex-webhook".
+            fallback_policy: Polling used while waiting for a callback. Defaults
+                to a first poll after 60 s, backing off to one poll every 5
+                minutes, for up to an hour.
+
+        Raises:
+            ValueError: If *public_url* is omitted while *host* is a wildcard address
+        """
+        if not public_url and host in WILDCARD_HOSTS:
+            raise ValueError(f"public_url is required when listening on the wildcard address {host!r}: "
+                             "the API cannot reach a callback URL built from it")
+        self.host = host
+        self.port = port
+        self.public_url = public_url.rstrip("/") if public_url else None
+        self.path = "/" + path.strip("/")
+        self.fallback_policy = fallback_policy if fallback_policy is not None else PollPolicy(
+            first_delay=60.0, backoff=2.0, max_delay=300.0, max_attempts=None, timeout=3600.0
+        )
+        self.callbacks_received = 0
+        self._lock = threading.Lock()
+        self._waiting: Dict[str, Callable[[], None]] = {}
+        self._early: Set[str] = set()
+        self._reserved: Set[str] = set()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """str: Base URL that callback URLs are built from."""
+        if self.public_url:
+            return self.public_url + self.path
+        return f"http://{self.host}:{self.port}{self.path}"
+
+    def start(self) -> "WebhookListener":
+        """Start serving callbacks on a background thread. Safe to call more than once."""
+        with self._lock:
+            if self._server is not None:
+                return self
+            self._server = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+            self._server.daemon_threads = True
+            self.port = self._server.server_address[1]
+            self._thread = threading.Thread(target=self._server.serve_forever, name="roex-webhooks", daemon=True)
+            self._thread.start()
+        logger.info(f"Webhook listener serving on {self.host}:{self.port}; callbacks at {self.url}/<token>")
+        return self
+
+    def close(self) -> None:
+        """Stop the server. Tasks still waiting fall back to polling."""
+        with self._lock:
+            server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            self._thread.join()
+            logger.info("Webhook listener stopped.")
+
+    def __enter__(self) -> "WebhookListener":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def reserve(self) -> str:
+        """
+        Create a callback URL for a task that is about to be submitted.
+
+        Starts the listener if it is not running yet.
+
+        Returns:
+            str: Callback URL to send as the request's ``webhook_url``.
+        """
+        self.start()
+        token = secrets.token_urlsafe(16)
+        with self._lock:
+            self._reserved.add(token)
+        return f"{self.url}/{token}"
+
+    def attach(self, callback_url: str, on_callback: Callable[[], None]) -> None:
+        """
+        Call *on_callback* when the API calls *callback_url*.
+
+        If the callback already arrived (the task finished before ``attach``),
+        *on_callback* runs immediately.
+
+        Args:
+            callback_url: URL returned by ``reserve``.
+            on_callback: Function to run once, typically ``PollScheduler.poll_now``.
+        """
+        token = self._token(callback_url)
+        with self._lock:
+            self._reserved.discard(token)
+            fired = token in self._early
+            self._early.discard(token)
+            if not fired:
+                self._waiting[token] = on_callback
+        if fired:
+            on_callback()
+
+    def discard(self, callback_url: str) -> None:
+        """Stop waiting for *callback_url*, e.g. once its task resolved by polling."""
+        token = self._token(callback_url)
+        with self._lock:
+            self._waiting.pop(token, None)
+            self._reserved.discard(token)
+            self._early.discard(token)
+
+    def _token(self, callback_url: str) -> str:
+        """Extract the token from a callback URL."""
+        return callback_url.rstrip("/").rsplit("/", 1)[-1]
+
+    def _receive(self, token: str) -> bool:
+        """Handle a callback for *token*. Returns False if the token is unknown."""
+        with self._lock:
+            on_callback = self._waiting.pop(token, None)
+            if on_callback is None:
+                if token not in self._reserved:
+                    return False
+                # Callback raced ahead of attach(); run it when the task is attached
+                self._reserved.discard(token)
+                self._early.add(token)
+            self.callbacks_received += 1
+        if on_callback is not None:
+            try:
+                on_callback()
+            except Exception as e:
+                logger.exception(f"Error handling webhook callback: {e}")
+        return True
+
+    def _handler_class(self) -> type:
+        """Build the request handler class bound to this listener."""
+        listener = self
+
+        class _CallbackHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length > MAX_CALLBACK_BYTES:
+                    self.send_error(413)
+                    return
+                body = self.rfile.read(length)
+                prefix, _, token = self.path.partition("?")[0].rpartition("/")
+                if prefix != listener.path or not listener._receive(token):
+                    logger.warning(f"Ignoring webhook callback to unknown path {self.path}")
+                    self.send_error(404)
+                    return
+                logger.info(f"Webhook callback received: {body[:500]!r}")
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                logger.debug("Webhook listener: " + format % args)
+
+        return _CallbackHandler
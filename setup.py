@@ -39,6 +39,17 @@ setup(
         "tenacity>=8.0.0",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.23.0",
+        ],
+        "audio": [
+            "numpy>=1.17",
+            "scipy>=1.2",
+            "soundfile>=0.10.0",
+        ],
+        "parquet": [
+            "pyarrow>=6.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
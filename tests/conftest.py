@@ -7,6 +7,7 @@ import pytest
 from unittest.mock import Mock, MagicMock
 from roex_python.client import RoExClient
 from roex_python.providers.api_provider import ApiProvider
+from roex_python.scheduler import PollScheduler
 from roex_python.models import (
     MusicalStyle, DesiredLoudness, InstrumentGroup,
     PresenceSetting, PanPreference, ReverbPreference
@@ -34,6 +35,15 @@ def mock_api_provider():
     return mock
 
 
+@pytest.fixture
+def mock_poll_scheduler():
+    """Returns a mocked PollScheduler with no webhook listener attached"""
+    mock = Mock(spec=PollScheduler)
+    mock.webhook_listener = None
+    mock.attach_webhook.side_effect = lambda request: (request, None)
+    return mock
+
+
 @pytest.fixture
 def roex_client(api_key, base_url):
     """Returns a configured RoExClient instance for integration tests"""
@@ -0,0 +1,169 @@
+"""
+Unit tests for the analysis result cache
+"""
+
+import pytest
+from unittest.mock import patch
+from roex_python.analysis_cache import AnalysisCache
+from roex_python.client import RoExClient
+from roex_python.controllers.analysis_controller import AnalysisController
+from roex_python.models import AnalysisMusicalStyle, AnalysisResult, MixAnalysisRequest
+
+BASE_URL = "https://api.example.com"
+
+
+def request(url="https://example.com/a.wav", style=AnalysisMusicalStyle.POP, is_master=False):
+    """Returns an analysis request"""
+    return MixAnalysisRequest(audio_file_location=url, musical_style=style, is_master=is_master)
+
+
+def response(loudness=-14.0):
+    """Returns a /mixanalysis response"""
+    return {"mixDiagnosisResults": {"payload": {"integrated_loudness_lufs": loudness}, "info": "ok"}}
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Returns an empty two-tier cache in a temporary directory"""
+    return AnalysisCache(path=str(tmp_path / "cache" / "analyses.sqlite3"))
+
+
+@pytest.mark.unit
+class TestAnalysisCache:
+    """Test cache keys, tiers, expiry and eviction"""
+
+    def test_key_covers_style_master_flag_and_source(self):
+        """Test that each input of the analysis is part of the key"""
+        key = AnalysisCache.key(request(), BASE_URL)
+
+        assert key == AnalysisCache.key(request(), BASE_URL + "/")
+        assert key != AnalysisCache.key(request(style=AnalysisMusicalStyle.ROCK), BASE_URL)
+        assert key != AnalysisCache.key(request(is_master=True), BASE_URL)
+        assert key != AnalysisCache.key(request(url="https://example.com/b.wav"), BASE_URL)
+        assert key != AnalysisCache.key(request(), "https://staging.example.com")
+
+    def test_content_hash_shared_across_urls(self):
+        """Test that the same audio at two URLs shares a key when its hash is given"""
+        key_a = AnalysisCache.key(request("https://example.com/a.wav"), BASE_URL, content_hash="abc")
+        key_b = AnalysisCache.key(request("https://example.com/b.wav"), BASE_URL, content_hash="abc")
+
+        assert key_a == key_b
+
+    def test_memory_round_trip_returns_copies(self):
+        """Test that cached results come back equal but not shared"""
+        cache = AnalysisCache()
+        result = AnalysisResult(payload={"integrated_loudness_lufs": -14.0})
+        cache.put("k", result)
+
+        first = cache.get("k")
+        first.payload["integrated_loudness_lufs"] = 0.0
+
+        assert cache.get("k") == result
+        assert (cache.hits, cache.misses) == (2, 0)
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_errors_are_not_cached(self):
+        """Test that results the API reported as errors are not stored"""
+        cache = AnalysisCache()
+        cache.put("k", AnalysisResult(error=True, info="bad file"))
+
+        assert cache.get("k") is None
+
+    def test_memory_tier_is_lru(self):
+        """Test that the least recently used entry leaves the memory tier first"""
+        cache = AnalysisCache(max_memory_entries=2)
+        for key in ("a", "b"):
+            cache.put(key, AnalysisResult(info=key))
+        cache.get("a")
+        cache.put("c", AnalysisResult(info="c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").info == "a"
+        assert len(cache) == 2
+
+    def test_disk_tier_persists_and_promotes(self, disk_cache):
+        """Test that a new cache on the same file serves results from disk"""
+        disk_cache.put("k", AnalysisResult(payload={"bit_depth": 24}))
+
+        reopened = AnalysisCache(path=disk_cache.path)
+        assert reopened.get("k").payload == {"bit_depth": 24}
+        assert "k" in reopened._memory
+
+    def test_expiry_in_both_tiers(self, disk_cache):
+        """Test that entries older than ttl miss and are removed"""
+        with patch("roex_python.analysis_cache.time.time", return_value=1000.0):
+            disk_cache.put("k", AnalysisResult(info="old"))
+        with patch("roex_python.analysis_cache.time.time", return_value=1000.0 + disk_cache.ttl + 1):
+            assert disk_cache.get("k") is None
+        assert len(disk_cache) == 0
+
+    def test_disk_eviction(self, tmp_path):
+        """Test that the disk tier keeps at most max_entries"""
+        cache = AnalysisCache(path=str(tmp_path / "analyses.sqlite3"), max_entries=2, ttl=None)
+        for i in range(4):
+            cache.put(str(i), AnalysisResult(info=str(i)))
+
+        assert len(cache) == 2
+        cache.clear()
+        assert len(cache) == 0 and cache.get("3") is None
+
+    def test_disk_journal_mode(self, tmp_path, disk_cache):
+        """Test that the disk tier uses the rollback journal by default and rejects unknown modes"""
+        assert disk_cache._store.journal_mode == "DELETE"
+        assert AnalysisCache(path=str(tmp_path / "wal.sqlite3"), journal_mode="WAL")._store.journal_mode == "WAL"
+        with pytest.raises(ValueError):
+            AnalysisCache(path=str(tmp_path / "off.sqlite3"), journal_mode="OFF")
+
+    @pytest.mark.parametrize("kwargs", [{"ttl": 0}, {"max_memory_entries": 0}, {"max_entries": 0}])
+    def test_invalid_arguments(self, kwargs):
+        """Test argument validation"""
+        with pytest.raises(ValueError):
+            AnalysisCache(**kwargs)
+
+
+@pytest.mark.unit
+class TestCachedAnalysis:
+    """Test that the analysis controller uses the cache transparently"""
+
+    def test_repeated_analysis_skips_api(self, mock_api_provider):
+        """Test that a second identical analysis is served from the cache"""
+        mock_api_provider.post.return_value = response()
+        controller = AnalysisController(mock_api_provider, cache=AnalysisCache())
+
+        first = controller.analyze_mix(request())
+        second = controller.analyze_mix(request())
+
+        assert first == second
+        assert mock_api_provider.post.call_count == 1
+        controller.analyze_mix(request(is_master=True))
+        assert mock_api_provider.post.call_count == 2
+
+    def test_content_hash(self, mock_api_provider):
+        """Test that re-uploaded audio with a known hash reuses the analysis"""
+        mock_api_provider.post.return_value = response()
+        controller = AnalysisController(mock_api_provider, cache=AnalysisCache())
+
+        controller.analyze_mix(request("https://example.com/upload1.wav"), content_hash="abc")
+        controller.analyze_mix(request("https://example.com/upload2.wav"), content_hash="abc")
+
+        assert mock_api_provider.post.call_count == 1
+
+    def test_compare_mixes_uses_cache(self, mock_api_provider):
+        """Test that comparisons reuse cached analyses"""
+        mock_api_provider.post.return_value = response()
+        controller = AnalysisController(mock_api_provider, cache=AnalysisCache())
+        controller.analyze_mix(request("https://example.com/a.wav"))
+
+        controller.compare_mixes("https://example.com/a.wav", "https://example.com/b.wav", AnalysisMusicalStyle.POP)
+        controller.compare_mixes("https://example.com/a.wav", "https://example.com/b.wav", AnalysisMusicalStyle.POP)
+
+        assert mock_api_provider.post.call_count == 2
+
+    def test_client_wires_cache(self):
+        """Test that RoExClient(analysis_cache=...) reaches the controller"""
+        cache = AnalysisCache()
+        client = RoExClient(api_key="test_key", analysis_cache=cache)
+
+        assert client.analysis.cache is cache
+        client.close()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the columnar analysis table
+"""
+
+import csv
+import math
+import pytest
+from roex_python.analysis_table import AnalysisTable
+from roex_python.models import AnalysisResult
+
+
+def analysis(loudness, clipping="NO", bass="GOOD", **extra):
+    """Returns an AnalysisResult with a few metrics set"""
+    payload = {"integrated_loudness_lufs": loudness, "peak_loudness_dbfs": -1.0, "clipping": clipping,
+               "tonal_profile": {"bass_frequency": bass}, **extra}
+    return AnalysisResult(payload=payload)
+
+
+@pytest.fixture
+def table():
+    """Returns a table with three rows"""
+    table = AnalysisTable()
+    table.add("https://example.com/a.wav", analysis(-14.0))
+    table.add("https://example.com/b.wav", analysis(-8.5, clipping="YES", bass="HIGH"))
+    table.add("https://example.com/c.wav", AnalysisResult(payload={"integrated_loudness_lufs": "N/A"}))
+    return table
+
+
+@pytest.mark.unit
+class TestAnalysisTable:
+    """Test AnalysisTable"""
+
+    def test_columns(self, table):
+        """Test that every extracted metric has a column"""
+        assert len(table) == 3
+        assert table.columns[0] == "url"
+        assert "integrated_loudness_lufs" in table.columns
+        assert "tonal_profile.bass_frequency" in table.columns
+
+    def test_numeric_column_is_packed(self, table):
+        """Test that numeric metrics are stored as doubles with NaN for missing values"""
+        loudness = table.column("integrated_loudness_lufs")
+
+        assert loudness.typecode == "d"
+        assert list(loudness[:2]) == [-14.0, -8.5]
+        assert math.isnan(loudness[2])
+
+    def test_categorical_column_is_dictionary_encoded(self):
+        """Test that repeated values share one category"""
+        table = AnalysisTable()
+        for i in range(100):
+            table.add(f"https://example.com/{i}.wav", analysis(-14.0, clipping="YES" if i % 2 else "NO"))
+
+        assert table._categorical["clipping"].categories == ["NO", "YES"]
+        assert table.column("clipping")[:3] == ["NO", "YES", "NO"]
+        assert table.column("stereo_field") == [None] * 100
+
+    def test_rows(self, table):
+        """Test row-wise access"""
+        rows = list(table.rows())
+
+        assert rows[1]["url"] == "https://example.com/b.wav"
+        assert rows[1]["clipping"] == "YES"
+        assert rows[1]["tonal_profile.bass_frequency"] == "HIGH"
+        assert rows[2]["clipping"] is None
+
+    def test_unknown_column(self, table):
+        """Test that unknown columns raise KeyError"""
+        with pytest.raises(KeyError):
+            table.column("tempo")
+
+    def test_to_csv(self, table, tmp_path):
+        """Test CSV export with empty fields for missing values"""
+        path = tmp_path / "analyses.csv"
+
+        table.to_csv(str(path))
+
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["integrated_loudness_lufs"] for row in rows] == ["-14.0", "-8.5", ""]
+        assert rows[1]["clipping"] == "YES"
+
+    def test_to_numpy(self, table):
+        """Test conversion to a structured array for vectorised queries"""
+        np = pytest.importorskip("numpy")
+
+        records = table.to_numpy()
+
+        assert records.dtype["integrated_loudness_lufs"] == np.float64
+        loud = records[records["integrated_loudness_lufs"] > -9.0]
+        assert list(loud["url"]) == ["https://example.com/b.wav"]
+        assert list(records["clipping"]) == ["NO", "YES", None]
+        assert len(AnalysisTable().to_numpy()) == 0
+
+    def test_to_parquet(self, table, tmp_path):
+        """Test Parquet export round trip"""
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+        path = tmp_path / "analyses.parquet"
+
+        table.to_parquet(str(path))
+
+        read = pq.read_table(str(path))
+        assert read.column_names == table.columns
+        assert read.column("clipping").to_pylist() == ["NO", "YES", None]
+        assert read.column("integrated_loudness_lufs").to_pylist() == [-14.0, -8.5, None]
@@ -2,11 +2,17 @@
 Unit tests for ApiProvider
 """
 
+import base64
+import hashlib
+import io
+import threading
 import pytest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import Mock, patch
 import requests
 from tenacity import RetryError
-from roex_python.providers.api_provider import ApiProvider
+from roex_python.deadline import Deadline
+from roex_python.exceptions import RoExApiError, RoExDownloadError, RoExTimeoutError
+from roex_python.providers.api_provider import ApiProvider, UPLOAD_CHUNK_GRANULARITY
 
 
 @pytest.mark.unit
@@ -24,13 +30,61 @@ class TestApiProviderInit:
         assert provider.api_key == "test_key_123"
         assert provider.headers["Content-Type"] == "application/json"
         assert provider.headers["x-api-key"] == "test_key_123"
+    
+    def test_session_uses_configured_pool(self):
+        """Test that the shared session mounts an adapter with the configured pool sizes"""
+        provider = ApiProvider(
+            base_url="https://test.roexaudio.com",
+            api_key="test_key",
+            pool_connections=4,
+            pool_maxsize=32
+        )
+        
+        adapter = provider.session.get_adapter("https://tonn.roexaudio.com/health")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+        assert provider.session.headers["Connection"] == "keep-alive"
+    
+    def test_keep_alive_disabled(self):
+        """Test that disabling keep-alive sends Connection: close"""
+        provider = ApiProvider(
+            base_url="https://test.roexaudio.com",
+            api_key="test_key",
+            keep_alive=False
+        )
+        
+        assert provider.session.headers["Connection"] == "close"
+    
+    def test_invalid_pool_size_raises_error(self):
+        """Test that non-positive pool sizes are rejected"""
+        with pytest.raises(ValueError, match="pool_maxsize"):
+            ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key", pool_maxsize=0)
+    
+    def test_timeout_settings(self):
+        """Test that a single timeout value applies to both connect and read"""
+        provider = ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key", timeout=30)
+        
+        assert provider.timeout == (30.0, 30.0)
+        assert ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key").timeout == (10.0, 120.0)
+        with pytest.raises(ValueError, match="timeout"):
+            ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key", timeout=(0, 5))
+    
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the session"""
+        provider = ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+        
+        with patch.object(provider.session, 'close') as mock_close:
+            with provider as entered:
+                assert entered is provider
+        
+        mock_close.assert_called_once()
 
 
 @pytest.mark.unit
 class TestApiProviderPost:
     """Test POST request method"""
     
-    @patch('roex_python.providers.api_provider.requests.post')
+    @patch('roex_python.providers.api_provider.requests.Session.post')
     def test_successful_post_request(self, mock_post):
         """Test successful POST request"""
         # Setup
@@ -54,18 +108,19 @@ class TestApiProviderPost:
         mock_post.assert_called_once_with(
             "https://test.roexaudio.com/test",
             json={"data": "value"},
-            headers=provider.headers
+            headers=provider.headers,
+            timeout=provider.timeout
         )
     
-    @patch('roex_python.providers.api_provider.requests.post')
+    @patch('roex_python.providers.api_provider.requests.Session.post')
     def test_post_with_http_error(self, mock_post):
-        """Test POST request with HTTP error (tenacity retries then raises RetryError)"""
+        """Test that a 4xx response raises RoExApiError immediately without retrying"""
         # Setup
         mock_response = Mock()
         mock_response.ok = False
         mock_response.status_code = 404
         mock_response.text = "Not found"
-        mock_response.raise_for_status.side_effect = requests.HTTPError("404 Error")
+        mock_response.headers = {}
         mock_post.return_value = mock_response
         
         provider = ApiProvider(
@@ -73,11 +128,70 @@ class TestApiProviderPost:
             api_key="test_key"
         )
         
-        # Execute & Assert - tenacity wraps the error in RetryError after exhausting retries
-        with pytest.raises((requests.HTTPError, RetryError)):
+        # Execute & Assert
+        with pytest.raises(RoExApiError) as exc_info:
             provider.post("/notfound", {"data": "value"})
+        
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.endpoint == "/notfound"
+        assert exc_info.value.response_text == "Not found"
+        assert isinstance(exc_info.value, requests.HTTPError)
+        mock_post.assert_called_once()
     
-    @patch('roex_python.providers.api_provider.requests.post')
+    @patch('roex_python.providers.api_provider.requests.Session.post')
+    def test_post_with_auth_error_is_not_retried(self, mock_post):
+        """Test that a 401 (bad API key) fails fast"""
+        # Setup
+        mock_response = Mock()
+        mock_response.ok = False
+        mock_response.status_code = 401
+        mock_response.text = "Invalid API key"
+        mock_response.headers = {}
+        mock_post.return_value = mock_response
+        
+        provider = ApiProvider(
+            base_url="https://test.roexaudio.com",
+            api_key="bad_key"
+        )
+        
+        # Execute & Assert
+        with pytest.raises(RoExApiError) as exc_info:
+            provider.post("/mixpreview", {})
+        
+        assert exc_info.value.status_code == 401
+        assert not exc_info.value.retryable
+        mock_post.assert_called_once()
+    
+    @patch('roex_python.providers.api_provider.requests.Session.post')
+    def test_post_rate_limited_honours_retry_after(self, mock_post):
+        """Test that a 429 is retried after the server-provided Retry-After delay"""
+        # Setup
+        limited = Mock()
+        limited.ok = False
+        limited.status_code = 429
+        limited.text = "Too many requests"
+        limited.headers = {"Retry-After": "7"}
+        success = Mock()
+        success.ok = True
+        success.status_code = 200
+        success.json.return_value = {"success": True}
+        mock_post.side_effect = [limited, success]
+        
+        provider = ApiProvider(
+            base_url="https://test.roexaudio.com",
+            api_key="test_key"
+        )
+        
+        # Execute
+        with patch('roex_python.providers.retry.time.sleep') as mock_sleep:
+            result = provider.post("/test", {})
+        
+        # Assert
+        assert result == {"success": True}
+        assert mock_post.call_count == 2
+        mock_sleep.assert_called_once_with(7.0)
+    
+    @patch('roex_python.providers.api_provider.requests.Session.post')
     def test_post_with_non_json_response(self, mock_post):
         """Test POST request that returns non-JSON response"""
         # Setup
@@ -100,7 +214,7 @@ class TestApiProviderPost:
         # Assert
         assert result == {"response": "Plain text response"}
     
-    @patch('roex_python.providers.api_provider.requests.post')
+    @patch('roex_python.providers.api_provider.requests.Session.post')
     def test_post_with_connection_error(self, mock_post):
         """Test POST request with connection error (tenacity retries then raises RetryError)"""
         # Setup
@@ -115,7 +229,33 @@ class TestApiProviderPost:
         with pytest.raises((requests.exceptions.ConnectionError, RetryError)):
             provider.post("/test", {"data": "value"})
     
-    @patch('roex_python.providers.api_provider.requests.post')
+    @patch('roex_python.providers.api_provider.requests.Session.post')
+    def test_post_timeout_capped_by_deadline(self, mock_post):
+        """Test that the per-request timeout never extends past the deadline"""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+        mock_post.return_value = mock_response
+        
+        provider = ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+        provider.post("/test", {}, deadline=Deadline(3))
+        
+        connect, read = mock_post.call_args.kwargs["timeout"]
+        assert 0 < connect <= 3
+        assert 0 < read <= 3
+    
+    @patch('roex_python.providers.api_provider.requests.Session.post')
+    def test_post_after_deadline_raises_timeout(self, mock_post):
+        """Test that no request is sent once the deadline has passed"""
+        provider = ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+        
+        with pytest.raises(RoExTimeoutError):
+            provider.post("/test", {}, deadline=Deadline(0))
+        
+        mock_post.assert_not_called()
+    
+    @patch('roex_python.providers.api_provider.requests.Session.post')
     def test_post_url_construction(self, mock_post):
         """Test that URLs are constructed correctly"""
         # Setup
@@ -143,7 +283,7 @@ class TestApiProviderPost:
 class TestApiProviderGet:
     """Test GET request method"""
     
-    @patch('roex_python.providers.api_provider.requests.get')
+    @patch('roex_python.providers.api_provider.requests.Session.get')
     def test_successful_get_request(self, mock_get):
         """Test successful GET request"""
         # Setup
@@ -166,18 +306,19 @@ class TestApiProviderGet:
         assert result == {"status": "healthy"}
         mock_get.assert_called_once_with(
             "https://test.roexaudio.com/health",
-            headers=provider.headers
+            headers=provider.headers,
+            timeout=provider.timeout
         )
     
-    @patch('roex_python.providers.api_provider.requests.get')
+    @patch('roex_python.providers.api_provider.requests.Session.get')
     def test_get_with_http_error(self, mock_get):
-        """Test GET request with HTTP error (tenacity retries then raises RetryError)"""
+        """Test that a 5xx response is retried and then raised as RoExApiError"""
         # Setup
         mock_response = Mock()
         mock_response.ok = False
         mock_response.status_code = 500
         mock_response.text = "Internal server error"
-        mock_response.raise_for_status.side_effect = requests.HTTPError("500 Error")
+        mock_response.headers = {}
         mock_get.return_value = mock_response
         
         provider = ApiProvider(
@@ -185,11 +326,16 @@ class TestApiProviderGet:
             api_key="test_key"
         )
         
-        # Execute & Assert - tenacity wraps the error in RetryError after exhausting retries
-        with pytest.raises((requests.HTTPError, RetryError)):
-            provider.get("/error")
+        # Execute & Assert
+        with patch('roex_python.providers.retry.time.sleep'):
+            with pytest.raises(RoExApiError) as exc_info:
+                provider.get("/error")
+        
+        assert exc_info.value.status_code == 500
+        assert exc_info.value.retryable
+        assert mock_get.call_count == 3
     
-    @patch('roex_python.providers.api_provider.requests.get')
+    @patch('roex_python.providers.api_provider.requests.Session.get')
     def test_get_with_text_response(self, mock_get):
         """Test GET request that returns plain text"""
         # Setup
@@ -213,18 +359,551 @@ class TestApiProviderGet:
         assert result == "OK"
 
 
+@pytest.mark.unit
+class TestApiProviderUploadToSignedUrl:
+    """Test signed-URL upload method"""
+    
+    @patch('roex_python.providers.api_provider.requests.Session.put')
+    def test_successful_upload(self, mock_put):
+        """Test that uploads go through the pooled session without the API key"""
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_put.return_value = mock_response
+        
+        provider = ApiProvider(
+            base_url="https://test.roexaudio.com",
+            api_key="test_key"
+        )
+        
+        result = provider.upload_to_signed_url("https://signed.example.com/upload", b"audio", "audio/wav")
+        
+        assert result is mock_response
+        mock_put.assert_called_once_with(
+            "https://signed.example.com/upload",
+            data=b"audio",
+            headers={"Content-Type": "audio/wav"},
+            timeout=provider.timeout
+        )
+    
+    @patch('roex_python.providers.api_provider.requests.Session.put')
+    def test_upload_http_error(self, mock_put):
+        """Test that a rejected upload raises RoExApiError without leaking the signature"""
+        mock_response = Mock()
+        mock_response.ok = False
+        mock_response.status_code = 403
+        mock_response.text = "SignatureDoesNotMatch"
+        mock_response.headers = {}
+        mock_put.return_value = mock_response
+        
+        provider = ApiProvider(
+            base_url="https://test.roexaudio.com",
+            api_key="test_key"
+        )
+        
+        with pytest.raises(RoExApiError) as exc_info:
+            provider.upload_to_signed_url("https://signed.example.com/upload?sig=secret", b"audio", "audio/wav")
+        
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.endpoint == "https://signed.example.com/upload"
+
+
+class FakeResumableStorage:
+    """Stand-in for a storage session implementing the resumable upload protocol"""
+    
+    def __init__(self, drop_chunks=(), resumable=True, start_status=403):
+        self.received = b""
+        self.drop_chunks = set(drop_chunks)
+        self.resumable = resumable
+        self.start_status = start_status
+        self.starts = 0
+        self.chunk_puts = 0
+        self.status_queries = 0
+        self.single_puts = 0
+    
+    @staticmethod
+    def respond(status, headers=None):
+        response = Mock()
+        response.status_code = status
+        response.ok = status < 400
+        response.text = ""
+        response.headers = headers or {}
+        return response
+    
+    def post(self, url, data, headers, timeout):
+        assert headers["x-goog-resumable"] == "start"
+        self.starts += 1
+        if not self.resumable:
+            return self.respond(self.start_status)
+        return self.respond(201, {"Location": "https://storage.example.com/session/1"})
+    
+    def put(self, url, data, headers, timeout):
+        if url != "https://storage.example.com/session/1":
+            self.single_puts += 1
+            self.received = data.read()
+            return self.respond(200)
+        first, _, total = headers["Content-Range"][len("bytes "):].partition("/")
+        if first == "*":
+            self.status_queries += 1
+        else:
+            self.chunk_puts += 1
+            if self.chunk_puts in self.drop_chunks:
+                # Storage kept half the chunk before the connection dropped
+                self.received += data[:len(data) // 2]
+                raise requests.exceptions.ConnectionError("connection reset")
+            start = int(first.split("-")[0])
+            assert start == len(self.received), "chunk must resume at the acknowledged offset"
+            self.received += data
+        if len(self.received) == int(total):
+            return self.respond(200)
+        return self.respond(308, {"Range": f"bytes=0-{len(self.received) - 1}"} if self.received else {})
+
+
+@pytest.mark.unit
+class TestApiProviderResumableUpload:
+    """Test chunked, resumable signed-URL uploads"""
+    
+    CHUNK = UPLOAD_CHUNK_GRANULARITY
+    
+    @pytest.fixture
+    def provider(self):
+        """Returns a provider without backoff sleeps"""
+        provider = ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+        with patch('roex_python.providers.api_provider.time.sleep'):
+            yield provider
+    
+    def test_uploads_in_chunks_with_progress(self, provider):
+        """Test that a large file is sent chunk by chunk and progress reaches 100%"""
+        payload = bytes(range(256)) * (self.CHUNK * 5 // 256 // 2)  # 2.5 chunks
+        storage = FakeResumableStorage()
+        provider.session = storage
+        updates = []
+        
+        provider.upload_to_signed_url("https://signed.example.com/upload?sig=x", io.BytesIO(payload),
+                                      "audio/wav", chunk_size=self.CHUNK, on_progress=updates.append)
+        
+        assert storage.received == payload
+        assert storage.chunk_puts == 3
+        assert [u.bytes_sent for u in updates] == [self.CHUNK, 2 * self.CHUNK, len(payload)]
+        assert updates[-1].fraction == 1.0 and updates[-1].eta_seconds == 0.0
+        assert all(u.total_bytes == len(payload) for u in updates)
+    
+    def test_resumes_from_acknowledged_offset(self, provider):
+        """Test that a dropped chunk resumes where storage stopped, not from zero"""
+        payload = b"x" * (self.CHUNK * 3)
+        storage = FakeResumableStorage(drop_chunks={2})
+        provider.session = storage
+        
+        provider.upload_to_signed_url("https://signed.example.com/upload", io.BytesIO(payload),
+                                      "audio/wav", chunk_size=self.CHUNK)
+        
+        assert storage.received == payload
+        assert storage.status_queries == 1
+        # Only the unacknowledged half of the dropped chunk is resent
+        assert storage.chunk_puts == 4
+    
+    def test_gives_up_after_max_chunk_retries(self, provider):
+        """Test that repeated failures without progress end the upload"""
+        storage = FakeResumableStorage()
+        storage.put = Mock(side_effect=requests.exceptions.ConnectionError("down"))
+        provider.session = storage
+        
+        with pytest.raises(requests.exceptions.ConnectionError):
+            provider.upload_to_signed_url("https://signed.example.com/upload", io.BytesIO(b"x" * self.CHUNK * 2),
+                                          "audio/wav", chunk_size=self.CHUNK, max_chunk_retries=2)
+        
+        assert storage.put.call_count == 3
+    
+    def test_falls_back_to_single_put(self, provider):
+        """Test that a URL that cannot open a resumable session is uploaded in one PUT"""
+        payload = b"x" * (self.CHUNK * 2)
+        storage = FakeResumableStorage(resumable=False)
+        provider.session = storage
+        updates = []
+        
+        provider.upload_to_signed_url("https://signed.example.com/upload", io.BytesIO(payload),
+                                      "audio/wav", chunk_size=self.CHUNK, on_progress=updates.append)
+        
+        assert storage.received == payload
+        assert storage.single_puts == 1
+        assert updates[-1].bytes_sent == len(payload)
+    
+    def test_falls_back_to_single_put_when_start_keeps_failing(self, provider):
+        """Test that a session start still failing with 503 after retries falls back to one PUT"""
+        payload = b"x" * (self.CHUNK * 2)
+        storage = FakeResumableStorage(resumable=False, start_status=503)
+        provider.session = storage
+        
+        with patch('roex_python.providers.retry.time.sleep'):
+            provider.upload_to_signed_url("https://signed.example.com/upload", io.BytesIO(payload),
+                                          "audio/wav", chunk_size=self.CHUNK)
+        
+        assert storage.starts > 1
+        assert storage.received == payload
+        assert storage.single_puts == 1
+    
+    def test_invalid_chunk_size(self, provider):
+        """Test that chunk sizes must be multiples of 256 KiB"""
+        with pytest.raises(ValueError, match="multiple"):
+            provider.upload_to_signed_url("https://signed.example.com/upload", io.BytesIO(b"x"),
+                                          "audio/wav", chunk_size=1000)
+
+
+@pytest.mark.unit
+class TestApiProviderDownloadToFile:
+    """Test atomic downloads"""
+    
+    @staticmethod
+    def stream(chunks, status=200):
+        """Build a streamed response context manager yielding *chunks*"""
+        def iter_content(chunk_size):
+            for chunk in chunks:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        response = Mock(status_code=status, ok=status < 400, text="", headers={})
+        response.iter_content = iter_content
+        context = Mock()
+        context.__enter__ = Mock(return_value=response)
+        context.__exit__ = Mock(return_value=None)
+        return context
+    
+    @patch('roex_python.providers.api_provider.requests.Session.get')
+    def test_writes_file_and_returns_size(self, mock_get, tmp_path):
+        """Test that the body is written to the target path"""
+        mock_get.return_value = self.stream([b"abc", b"def"])
+        provider = ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+        target = tmp_path / "out" / "mix.wav"
+        
+        written = provider.download_to_file("https://example.com/mix.wav", str(target))
+        
+        assert written == 6
+        assert target.read_bytes() == b"abcdef"
+        assert sorted(p.name for p in target.parent.iterdir()) == ["mix.wav"]
+    
+    @patch('roex_python.providers.api_provider.time.sleep')
+    @patch('roex_python.providers.api_provider.requests.Session.get')
+    def test_failed_download_keeps_existing_file(self, mock_get, mock_sleep, tmp_path):
+        """Test that an interrupted download leaves no partial file behind"""
+        mock_get.return_value = self.stream([b"new", requests.exceptions.ConnectionError("reset")])
+        provider = ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+        target = tmp_path / "mix.wav"
+        target.write_bytes(b"old")
+        
+        with pytest.raises(requests.exceptions.ConnectionError):
+            provider.download_to_file("https://example.com/mix.wav", str(target), max_retries=2)
+        
+        assert mock_get.call_count == 3
+        assert target.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["mix.wav"]
+    
+    @patch('roex_python.providers.api_provider.requests.Session.get')
+    def test_http_error_raises(self, mock_get, tmp_path):
+        """Test that an error status raises RoExApiError"""
+        mock_get.return_value = self.stream([], status=403)
+        provider = ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+        
+        with pytest.raises(RoExApiError) as exc_info:
+            provider.download_to_file("https://example.com/mix.wav?sig=secret", str(tmp_path / "mix.wav"))
+        
+        assert exc_info.value.endpoint == "https://example.com/mix.wav"
+        assert list(tmp_path.iterdir()) == []
+    
+    @patch('roex_python.providers.api_provider.requests.Session.get')
+    def test_deadline_caps_request_and_stops_transfer(self, mock_get, tmp_path):
+        """Test that the request timeout fits the deadline and a transfer still running when it passes is abandoned"""
+        # Setup
+        deadline = Deadline(0.05)
+        
+        def slow_chunks():
+            yield b"abc"
+            threading.Event().wait(0.1)
+            yield b"def"
+        
+        mock_get.return_value = self.stream(slow_chunks())
+        provider = ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+        target = tmp_path / "mix.wav"
+        
+        # Execute
+        with pytest.raises(RoExTimeoutError):
+            provider.download_to_file("https://example.com/mix.wav", str(target), deadline=deadline)
+        
+        # Assert
+        assert mock_get.call_count == 1
+        assert all(t <= 0.05 for t in mock_get.call_args[1]["timeout"])
+        assert list(tmp_path.iterdir()) == []
+        assert provider.download_file("https://example.com/mix.wav", str(target), deadline=deadline) is False
+        assert mock_get.call_count == 1
+
+
+class FakeDownloadServer:
+    """Stand-in for a storage server streaming one file, with Range and If-Range support"""
+    
+    def __init__(self, body, headers=None, drops=(), truncations=(), honour_range=True, barrier=None):
+        self.body = body
+        self.headers = {"ETag": '"v1"', **(headers or {})}
+        self.drops = list(drops)
+        self.truncations = list(truncations)
+        self.honour_range = honour_range
+        self.barrier = barrier
+        self.replacement = None
+        self.requests = []
+        self.lock = threading.Lock()
+    
+    def get(self, url, stream, timeout, headers):
+        with self.lock:
+            self.requests.append(dict(headers))
+            served = self.body, dict(self.headers)
+            if self.replacement is not None:
+                # The object changes once the first response has gone out
+                self.body, self.headers = self.replacement
+                self.replacement = None
+            drop = self.drops.pop(0) if self.drops else None
+            cut = self.truncations.pop(0) if self.truncations else None
+        body, response_headers = served
+        start, end, status = 0, len(body) - 1, 200
+        if "Range" in headers and self.honour_range and headers.get("If-Range", response_headers["ETag"]) == \
+                response_headers["ETag"]:
+            first, _, last = headers["Range"][len("bytes="):].partition("-")
+            start, end, status = int(first), int(last) if last else len(body) - 1, 206
+            response_headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+        response_headers["Content-Length"] = str(end + 1 - start)
+        if self.barrier is not None and status == 206 and end > start:
+            # Segments must all be in flight at once to get past the barrier
+            self.barrier.wait()
+        
+        def iter_content(chunk_size):
+            for offset in range(start, end + 1, 8):
+                if drop is not None and offset - start >= drop:
+                    raise requests.exceptions.ChunkedEncodingError("connection broken")
+                if cut is not None and offset - start >= cut:
+                    return
+                yield body[offset:min(offset + 8, end + 1)]
+        
+        response = Mock(status_code=status, ok=True, text="", headers=response_headers)
+        response.iter_content = iter_content
+        context = Mock()
+        context.__enter__ = Mock(return_value=response)
+        context.__exit__ = Mock(return_value=None)
+        return context
+
+
+@pytest.mark.unit
+class TestApiProviderResumableDownload:
+    """Test resumed, verified downloads"""
+    
+    BODY = bytes(range(256)) * 4
+    
+    @pytest.fixture
+    def provider(self):
+        """Returns a provider without backoff sleeps"""
+        provider = ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+        with patch('roex_python.providers.api_provider.time.sleep'):
+            yield provider
+    
+    @staticmethod
+    def download(provider, server, target, **kwargs):
+        with patch.object(provider.session, "get", side_effect=server.get):
+            return provider.download_to_file("https://storage.example.com/mix.wav?sig=1", str(target), **kwargs)
+    
+    def test_resumes_from_last_byte(self, provider, tmp_path):
+        """Test that a dropped transfer continues with a Range request"""
+        server = FakeDownloadServer(self.BODY, drops=[400])
+        target = tmp_path / "mix.wav"
+        
+        written = self.download(provider, server, target)
+        
+        assert written == len(self.BODY)
+        assert target.read_bytes() == self.BODY
+        assert [r.get("Range") for r in server.requests] == [None, "bytes=400-"]
+        assert server.requests[1]["If-Range"] == '"v1"'
+        assert all(r["Accept-Encoding"] == "identity" for r in server.requests)
+    
+    def test_short_body_is_resumed(self, provider, tmp_path):
+        """Test that a body shorter than Content-Length is detected and completed"""
+        server = FakeDownloadServer(self.BODY, truncations=[96, 96])
+        target = tmp_path / "mix.wav"
+        
+        self.download(provider, server, target)
+        
+        assert target.read_bytes() == self.BODY
+        assert [r.get("Range") for r in server.requests] == [None, "bytes=96-", "bytes=192-"]
+    
+    def test_changed_file_restarts_from_zero(self, provider, tmp_path):
+        """Test that If-Range keeps two versions of a file from being spliced together"""
+        server = FakeDownloadServer(self.BODY, drops=[400])
+        server.replacement = (b"new version" * 10, {"ETag": '"v2"'})
+        target = tmp_path / "mix.wav"
+        
+        self.download(provider, server, target)
+        
+        assert target.read_bytes() == b"new version" * 10
+    
+    def test_server_without_range_support_restarts(self, provider, tmp_path):
+        """Test that a full response to a Range request replaces the partial data"""
+        server = FakeDownloadServer(self.BODY, drops=[400], honour_range=False)
+        target = tmp_path / "mix.wav"
+        
+        self.download(provider, server, target)
+        
+        assert target.read_bytes() == self.BODY
+    
+    @pytest.mark.parametrize("headers", [
+        {"x-goog-hash": "crc32c=AAAAAA==, md5=" + base64.b64encode(hashlib.md5(BODY).digest()).decode()},
+        {"Content-MD5": base64.b64encode(hashlib.md5(BODY).digest()).decode()},
+        {"ETag": '"' + hashlib.md5(BODY).hexdigest() + '"'},
+    ])
+    def test_checksum_verified_across_resume(self, provider, tmp_path, headers):
+        """Test that the MD5 reported by the server is checked over resumed data"""
+        server = FakeDownloadServer(self.BODY, headers=headers, drops=[400])
+        target = tmp_path / "mix.wav"
+        
+        self.download(provider, server, target)
+        
+        assert target.read_bytes() == self.BODY
+    
+    def test_checksum_mismatch_raises(self, provider, tmp_path):
+        """Test that corrupt data is re-downloaded from zero, then rejected"""
+        server = FakeDownloadServer(self.BODY, headers={"ETag": '"' + "0" * 32 + '"'})
+        target = tmp_path / "mix.wav"
+        
+        with pytest.raises(RoExDownloadError) as exc_info:
+            self.download(provider, server, target, max_retries=2)
+        
+        assert "checksum" in str(exc_info.value)
+        assert [r.get("Range") for r in server.requests] == [None, None, None]
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_checksum_can_be_disabled(self, provider, tmp_path):
+        """Test that verify=False skips the checksum but not the length check"""
+        server = FakeDownloadServer(self.BODY, headers={"ETag": '"' + "0" * 32 + '"'})
+        target = tmp_path / "mix.wav"
+        
+        assert self.download(provider, server, target, verify=False) == len(self.BODY)
+    
+    def test_gives_up_without_progress(self, provider, tmp_path):
+        """Test that retries stop after max_retries attempts that make no progress"""
+        server = FakeDownloadServer(self.BODY, drops=[0] * 10)
+        
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            self.download(provider, server, tmp_path / "mix.wav", max_retries=3)
+        
+        assert len(server.requests) == 4
+    
+    def test_keeps_resuming_while_progressing(self, provider, tmp_path):
+        """Test that attempts which make progress do not count towards max_retries"""
+        server = FakeDownloadServer(self.BODY, drops=[128] * 7)
+        target = tmp_path / "mix.wav"
+        
+        self.download(provider, server, target, max_retries=2)
+        
+        assert target.read_bytes() == self.BODY
+
+
+@pytest.mark.unit
+class TestApiProviderSegmentedDownload:
+    """Test concurrent multi-range downloads"""
+    
+    BODY = bytes(range(256)) * 16
+    
+    @pytest.fixture
+    def provider(self):
+        """Returns a provider without backoff sleeps"""
+        provider = ApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+        with patch('roex_python.providers.api_provider.time.sleep'):
+            yield provider
+    
+    @staticmethod
+    def download(provider, server, target, **kwargs):
+        kwargs.setdefault("segments", 4)
+        kwargs.setdefault("min_segment_size", 512)
+        with patch.object(provider.session, "get", side_effect=server.get):
+            return provider.download_to_file("https://storage.example.com/master.wav?sig=1", str(target), **kwargs)
+    
+    def test_segments_fetched_concurrently(self, provider, tmp_path):
+        """Test that the file is split into ranges fetched at the same time and assembled in place"""
+        server = FakeDownloadServer(self.BODY, barrier=threading.Barrier(4, timeout=5))
+        target = tmp_path / "master.wav"
+        
+        written = self.download(provider, server, target)
+        
+        assert written == len(self.BODY)
+        assert target.read_bytes() == self.BODY
+        assert server.requests[0]["Range"] == "bytes=0-0"
+        assert sorted(r["Range"] for r in server.requests[1:]) == [
+            "bytes=0-1023", "bytes=1024-2047", "bytes=2048-3071", "bytes=3072-4095"]
+        assert all(r["If-Range"] == '"v1"' for r in server.requests[1:])
+    
+    def test_segment_count_limited_by_min_size(self, provider, tmp_path):
+        """Test that no segment is smaller than min_segment_size"""
+        server = FakeDownloadServer(self.BODY)
+        
+        self.download(provider, server, tmp_path / "master.wav", segments=16, min_segment_size=1024)
+        
+        assert len(server.requests) == 1 + 4
+    
+    def test_falls_back_without_range_support(self, provider, tmp_path):
+        """Test that a server ignoring Range gets a single streamed download"""
+        server = FakeDownloadServer(self.BODY, honour_range=False)
+        target = tmp_path / "master.wav"
+        
+        self.download(provider, server, target)
+        
+        assert target.read_bytes() == self.BODY
+        assert [r.get("Range") for r in server.requests] == ["bytes=0-0", None]
+    
+    def test_small_file_uses_single_stream(self, provider, tmp_path):
+        """Test that files under two segments' worth are not split"""
+        server = FakeDownloadServer(self.BODY)
+        
+        self.download(provider, server, tmp_path / "master.wav", min_segment_size=len(self.BODY))
+        
+        assert [r.get("Range") for r in server.requests] == ["bytes=0-0", None]
+    
+    def test_dropped_segment_resumes(self, provider, tmp_path):
+        """Test that a failed segment resumes from its own last byte"""
+        server = FakeDownloadServer(self.BODY, drops=[None, 400])
+        target = tmp_path / "master.wav"
+        
+        self.download(provider, server, target)
+        
+        assert target.read_bytes() == self.BODY
+        ranges = [tuple(map(int, r["Range"][len("bytes="):].split("-"))) for r in server.requests[1:]]
+        assert len(ranges) == 5
+        resumed = [(first, last) for first, last in ranges if first % 1024]
+        assert [(first % 1024, last - first) for first, last in resumed] == [(400, 1023 - 400)]
+    
+    def test_changed_file_falls_back_to_single_stream(self, provider, tmp_path):
+        """Test that segments of a file that changed after the probe are discarded"""
+        server = FakeDownloadServer(self.BODY)
+        server.replacement = (b"new version" * 400, {"ETag": '"v2"'})
+        target = tmp_path / "master.wav"
+        
+        self.download(provider, server, target)
+        
+        assert target.read_bytes() == b"new version" * 400
+    
+    def test_segmented_checksum(self, provider, tmp_path):
+        """Test that the assembled file is checked against x-goog-hash"""
+        good = {"x-goog-hash": "md5=" + base64.b64encode(hashlib.md5(self.BODY).digest()).decode()}
+        bad = {"x-goog-hash": "md5=" + base64.b64encode(b"0" * 16).decode()}
+        
+        self.download(provider, FakeDownloadServer(self.BODY, headers=good), tmp_path / "good.wav")
+        with pytest.raises(RoExDownloadError):
+            self.download(provider, FakeDownloadServer(self.BODY, headers=bad), tmp_path / "bad.wav",
+                          max_retries=0)
+        
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["good.wav"]
+
+
 @pytest.mark.unit
 class TestApiProviderDownloadFile:
     """Test file download functionality"""
     
-    @patch('roex_python.providers.api_provider.requests.get')
-    @patch('roex_python.providers.api_provider.os.makedirs')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_successful_download(self, mock_file, mock_makedirs, mock_get):
+    @patch('roex_python.providers.api_provider.requests.Session.get')
+    def test_successful_download(self, mock_get, tmp_path):
         """Test successful file download"""
         # Setup
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
+        mock_response = Mock(status_code=200, ok=True, headers={"Content-Length": "12"})
         mock_response.iter_content = Mock(return_value=[b'chunk1', b'chunk2'])
         mock_get.return_value.__enter__ = Mock(return_value=mock_response)
         mock_get.return_value.__exit__ = Mock(return_value=None)
@@ -237,20 +916,21 @@ class TestApiProviderDownloadFile:
         # Execute
         result = provider.download_file(
             "https://example.com/file.wav",
-            "/tmp/downloaded.wav"
+            str(tmp_path / "downloaded.wav")
         )
         
         # Assert
         assert result is True
-        mock_get.assert_called_once_with("https://example.com/file.wav", stream=True)
+        assert (tmp_path / "downloaded.wav").read_bytes() == b'chunk1chunk2'
+        mock_get.assert_called_once_with("https://example.com/file.wav", stream=True, timeout=provider.timeout,
+                                         headers={"Accept-Encoding": "identity"})
     
-    @patch('roex_python.providers.api_provider.requests.get')
+    @patch('roex_python.providers.api_provider.requests.Session.get')
     @patch('roex_python.providers.api_provider.os.makedirs')
     def test_download_with_http_error(self, mock_makedirs, mock_get):
         """Test download with HTTP error"""
         # Setup
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = requests.HTTPError("404 Error")
+        mock_response = Mock(status_code=404, ok=False, text="Not Found", headers={})
         mock_get.return_value.__enter__ = Mock(return_value=mock_response)
         mock_get.return_value.__exit__ = Mock(return_value=None)
         
@@ -268,7 +948,7 @@ class TestApiProviderDownloadFile:
         # Assert
         assert result is False
     
-    @patch('roex_python.providers.api_provider.requests.get')
+    @patch('roex_python.providers.api_provider.requests.Session.get')
     @patch('roex_python.providers.api_provider.os.makedirs')
     @patch('builtins.open', side_effect=IOError("Write failed"))
     def test_download_with_write_error(self, mock_file, mock_makedirs, mock_get):
@@ -293,3 +973,4 @@ class TestApiProviderDownloadFile:
         
         # Assert
         assert result is False
+
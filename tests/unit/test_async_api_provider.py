@@ -0,0 +1,147 @@
+"""
+Unit tests for AsyncApiProvider
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+httpx = pytest.importorskip("httpx")
+
+from roex_python.exceptions import RoExApiError
+from roex_python.providers.async_api_provider import AsyncApiProvider
+
+
+def make_provider(handler):
+    """Build a provider whose pooled client is backed by a mock transport"""
+    provider = AsyncApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+    provider.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return provider
+
+
+@pytest.mark.unit
+class TestAsyncApiProviderInit:
+    """Test AsyncApiProvider initialization"""
+    
+    def test_init_with_required_params(self):
+        """Test initialization with base_url and api_key"""
+        provider = AsyncApiProvider(base_url="https://test.roexaudio.com", api_key="test_key_123")
+        
+        assert provider.base_url == "https://test.roexaudio.com"
+        assert provider.headers["x-api-key"] == "test_key_123"
+        assert isinstance(provider.client, httpx.AsyncClient)
+    
+    def test_invalid_pool_size_raises_error(self):
+        """Test that non-positive pool sizes are rejected"""
+        with pytest.raises(ValueError, match="pool_maxsize"):
+            AsyncApiProvider(base_url="https://test.roexaudio.com", api_key="test_key", pool_maxsize=0)
+    
+    def test_missing_httpx_raises_import_error(self):
+        """Test that a helpful ImportError is raised without httpx"""
+        with patch('roex_python.providers.async_api_provider.httpx', None):
+            with pytest.raises(ImportError, match="roex_python\\[async\\]"):
+                AsyncApiProvider(base_url="https://test.roexaudio.com", api_key="test_key")
+
+
+@pytest.mark.unit
+class TestAsyncApiProviderRequests:
+    """Test async POST, GET, upload and download"""
+    
+    def test_successful_post_request(self):
+        """Test that POST sends JSON with the API key and parses the response"""
+        seen = {}
+        
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["key"] = request.headers["x-api-key"]
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={"task_id": "123"})
+        
+        provider = make_provider(handler)
+        result = asyncio.run(provider.post("/test", {"data": "value"}))
+        
+        assert result == {"task_id": "123"}
+        assert seen == {
+            "url": "https://test.roexaudio.com/test",
+            "key": "test_key",
+            "body": {"data": "value"}
+        }
+    
+    def test_post_with_non_json_response(self):
+        """Test POST request that returns non-JSON response"""
+        provider = make_provider(lambda request: httpx.Response(200, text="Plain text"))
+        
+        result = asyncio.run(provider.post("/test", {}))
+        
+        assert result == {"response": "Plain text"}
+    
+    def test_get_with_text_response(self):
+        """Test GET request that returns plain text"""
+        provider = make_provider(lambda request: httpx.Response(200, text="OK"))
+        
+        assert asyncio.run(provider.get("/health")) == "OK"
+    
+    def test_post_with_client_error_is_not_retried(self):
+        """Test that a 4xx response raises RoExApiError after a single attempt"""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(400, text="Missing trackData")
+        
+        provider = make_provider(handler)
+        
+        with pytest.raises(RoExApiError) as exc_info:
+            asyncio.run(provider.post("/mixpreview", {}))
+        
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.response_text == "Missing trackData"
+        assert len(calls) == 1
+    
+    def test_post_retries_server_errors(self):
+        """Test that a 503 is retried and the later success returned"""
+        responses = [httpx.Response(503), httpx.Response(200, json={"ok": True})]
+        provider = make_provider(lambda request: responses.pop(0))
+        
+        with patch('roex_python.providers.retry.asyncio.sleep', new=AsyncMock()):
+            result = asyncio.run(provider.post("/test", {}))
+        
+        assert result == {"ok": True}
+        assert responses == []
+    
+    def test_upload_streams_with_content_length(self):
+        """Test that streamed uploads send Content-Length rather than chunked encoding"""
+        seen = {}
+        
+        def handler(request):
+            seen["headers"] = request.headers
+            seen["body"] = request.read()
+            return httpx.Response(200)
+        
+        async def chunks():
+            yield b"abc"
+            yield b"def"
+        
+        provider = make_provider(handler)
+        asyncio.run(provider.upload_to_signed_url("https://signed.example.com/up", chunks(), "audio/wav", 6))
+        
+        assert seen["body"] == b"abcdef"
+        assert seen["headers"]["Content-Length"] == "6"
+        assert "Transfer-Encoding" not in seen["headers"]
+    
+    def test_download_file(self, tmp_path):
+        """Test that downloads stream to disk"""
+        provider = make_provider(lambda request: httpx.Response(200, content=b"x" * 100))
+        target = tmp_path / "out" / "file.wav"
+        
+        assert asyncio.run(provider.download_file("https://example.com/file.wav", str(target))) is True
+        assert target.read_bytes() == b"x" * 100
+    
+    def test_download_with_http_error(self, tmp_path):
+        """Test download with HTTP error returns False"""
+        provider = make_provider(lambda request: httpx.Response(404))
+        
+        result = asyncio.run(provider.download_file("https://example.com/missing.wav", str(tmp_path / "f.wav")))
+        
+        assert result is False
@@ -5,11 +5,14 @@ Unit tests for RoExClient
 import pytest
 from unittest.mock import Mock, patch
 from roex_python.client import RoExClient
+from roex_python.providers.retry import RetryPolicy
+from roex_python.async_client import AsyncRoExClient
 from roex_python.controllers import (
     MixController, MasteringController, AnalysisController,
     EnhanceController, UploadController
 )
 from roex_python.controllers.audio_cleanup_controller import AudioCleanupController
+from roex_python.controllers.async_controllers import AsyncMasteringController, AsyncMixController
 
 
 @pytest.mark.unit
@@ -54,13 +57,54 @@ class TestRoExClientInit:
         assert client.enhance.api_provider is client.api_provider
         assert client.audio_cleanup.api_provider is client.api_provider
         assert client.upload.api_provider is client.api_provider
+    
+    def test_pool_settings_passed_to_provider(self):
+        """Test that connection pool settings reach the shared ApiProvider"""
+        client = RoExClient(api_key="test_key_123", pool_connections=2, pool_maxsize=50, keep_alive=False)
+        
+        assert client.api_provider.pool_connections == 2
+        assert client.api_provider.pool_maxsize == 50
+        assert client.api_provider.keep_alive is False
+    
+    def test_retry_policy_passed_to_provider(self):
+        """Test that a custom RetryPolicy is used by the shared ApiProvider"""
+        policy = RetryPolicy(max_attempts=5)
+        client = RoExClient(api_key="test_key_123", retry_policy=policy)
+        
+        assert client.api_provider.retry_policy is policy
+        assert isinstance(RoExClient(api_key="test_key_123").api_provider.retry_policy, RetryPolicy)
+    
+    def test_context_manager_closes_provider(self):
+        """Test that the client closes the shared session on exit"""
+        client = RoExClient(api_key="test_key_123")
+        
+        with patch.object(client.api_provider, 'close') as mock_close:
+            with client as entered:
+                assert entered is client
+        
+        mock_close.assert_called_once()
+    
+    def test_controllers_share_poll_scheduler(self):
+        """Test that polling controllers share the client's scheduler, which closes with the client"""
+        client = RoExClient(api_key="test_key_123")
+        scheduler = client.poll_scheduler
+        
+        assert scheduler.api_provider is client.api_provider
+        assert client.mix.poll_scheduler is scheduler
+        assert client.mastering.poll_scheduler is scheduler
+        assert client.enhance.poll_scheduler is scheduler
+        
+        with patch.object(scheduler, 'close') as mock_close:
+            client.close()
+        
+        mock_close.assert_called_once()
 
 
 @pytest.mark.unit
 class TestRoExClientHealthCheck:
     """Test health_check method"""
     
-    @patch('roex_python.providers.api_provider.requests.get')
+    @patch('roex_python.providers.api_provider.requests.Session.get')
     def test_health_check_success(self, mock_get):
         """Test successful health check"""
         # Setup
@@ -83,3 +127,24 @@ class TestRoExClientHealthCheck:
         # Verify correct endpoint was called
         call_args = mock_get.call_args[0]
         assert call_args[0].endswith("/health")
+
+
+@pytest.mark.unit
+class TestAsyncRoExClient:
+    """Test AsyncRoExClient initialization"""
+    
+    def test_init(self):
+        """Test that async controllers share a single async provider"""
+        pytest.importorskip("httpx")
+        client = AsyncRoExClient(api_key="test_key_123", pool_maxsize=200)
+        
+        assert isinstance(client.mix, AsyncMixController)
+        assert isinstance(client.mastering, AsyncMasteringController)
+        assert client.mix.api_provider is client.api_provider
+        assert client.upload.api_provider is client.api_provider
+        assert client.api_provider.pool_maxsize == 200
+    
+    def test_empty_api_key_raises_error(self):
+        """Test that an empty API key is rejected"""
+        with pytest.raises(ValueError, match="API key cannot be empty"):
+            AsyncRoExClient(api_key="")
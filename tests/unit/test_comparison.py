@@ -0,0 +1,71 @@
+"""
+Unit tests for pairwise metric differences
+"""
+
+import math
+import pytest
+from unittest.mock import patch
+from roex_python.comparison import PairwiseDifferences
+
+
+def metrics(loudness, clipping="NO", bass="GOOD"):
+    """Extracted metrics for one mix, as AnalysisController._extract_metrics returns them"""
+    return {"integrated_loudness_lufs": loudness, "peak_loudness_dbfs": -1.0, "bit_depth": "N/A",
+            "sample_rate": 44100, "clipping": clipping, "if_master_drc": "N/A", "if_master_loudness": "N/A",
+            "stereo_field": "N/A", "tonal_profile": {"bass_frequency": bass}}
+
+
+@pytest.fixture
+def differences():
+    """Differences between three mixes, one without a loudness value"""
+    return PairwiseDifferences(["a", "b", "c"], [metrics(-14.0), metrics(-8.5, "YES", "HIGH"), metrics("N/A")])
+
+
+@pytest.mark.unit
+class TestPairwiseDifferences:
+    """Test PairwiseDifferences"""
+
+    def test_mapping_over_ordered_pairs(self, differences):
+        """Test that every pair appears once, first label first, and reversed or unknown pairs are missing"""
+        assert len(differences) == 3
+        assert list(differences) == [("a", "b"), ("a", "c"), ("b", "c")]
+        assert ("b", "a") not in differences
+        assert ("a", "z") not in differences
+        assert "a" not in differences
+
+    def test_pair_matches_compare_mixes_format(self, differences):
+        """Test that a looked-up pair holds numeric, categorical and tonal differences"""
+        pair = differences[("a", "b")]
+
+        assert pair["integrated_loudness_lufs"] == {"difference": 5.5, "mix_a_value": -14.0, "mix_b_value": -8.5}
+        assert pair["bit_depth"] == "N/A"
+        assert pair["clipping"] == {"status": "DIFFERENT", "mix_a_value": "NO", "mix_b_value": "YES"}
+        assert pair["tonal_profile"]["bass_frequency"]["status"] == "DIFFERENT"
+        assert pair["tonal_profile"]["high_frequency"]["status"] == "SAME"
+        assert differences[("a", "c")]["integrated_loudness_lufs"] == "N/A"
+
+    def test_matrix(self, differences):
+        """Test that a metric's matrix holds every pair's absolute difference, NaN where a value is missing"""
+        matrix = differences.matrix("integrated_loudness_lufs")
+
+        assert matrix[0][1] == matrix[1][0] == 5.5
+        assert matrix[2][2] != matrix[2][2]
+        assert math.isnan(matrix[0][2])
+        assert differences.matrix("integrated_loudness_lufs") is matrix
+        with pytest.raises(KeyError):
+            differences.matrix("clipping")
+
+    def test_matrix_without_numpy(self, differences):
+        """Test that the matrix is built as nested lists of the same values when NumPy is missing"""
+        with patch("roex_python.comparison.np", None):
+            matrix = differences.matrix("sample_rate")
+
+        assert matrix == [[0.0] * 3] * 3
+        assert type(matrix) is list
+
+    def test_invalid_labels(self):
+        """Test that labels must be unique and match the metrics"""
+        with pytest.raises(ValueError):
+            PairwiseDifferences(["a", "a"], [metrics(-14.0), metrics(-9.0)])
+        with pytest.raises(ValueError):
+            PairwiseDifferences(["a"], [metrics(-14.0), metrics(-9.0)])
@@ -2,13 +2,22 @@
 Unit tests for AnalysisController
 """
 
+import threading
 import pytest
 from unittest.mock import Mock
 import requests
+from roex_python.analysis_table import AnalysisTable
+from roex_python.comparison import PairwiseDifferences
 from roex_python.controllers.analysis_controller import AnalysisController
+from roex_python.exceptions import RoExApiError
 from roex_python.models import MixAnalysisRequest, AnalysisMusicalStyle, AnalysisResult
 
 
+def responses_by_url(responses):
+    """Fake ``post`` returning the response for the analysed URL, whatever order the calls arrive in"""
+    return lambda endpoint, payload: responses[payload["mixDiagnosisData"]["audioFileLocation"]]
+
+
 @pytest.mark.unit
 class TestAnalysisControllerInit:
     """Test AnalysisController initialization"""
@@ -112,7 +121,7 @@ class TestAnalyzeMix:
     def test_http_error_handling(self, mock_api_provider):
         """Test error handling when API returns HTTP error"""
         # Setup
-        mock_api_provider.post.side_effect = requests.HTTPError("API Error")
+        mock_api_provider.post.side_effect = RoExApiError("API Error", status_code=400)
         
         controller = AnalysisController(mock_api_provider)
         
@@ -123,8 +132,11 @@ class TestAnalyzeMix:
         )
         
         # Execute & Assert
-        with pytest.raises(Exception, match="Failed to analyze mix"):
+        with pytest.raises(RoExApiError) as exc_info:
             controller.analyze_mix(request)
+        
+        assert exc_info.value.status_code == 400
+        mock_api_provider.post.assert_called_once()
 
 
 @pytest.mark.unit
@@ -133,9 +145,9 @@ class TestCompareMixes:
     
     def test_successful_comparison(self, mock_api_provider):
         """Test successful comparison of two mixes"""
-        # Setup - return different results for each call
-        mock_api_provider.post.side_effect = [
-            {
+        # Setup - return different results for each mix
+        mock_api_provider.post.side_effect = responses_by_url({
+            "https://example.com/mix_a.wav": {
                 "mixDiagnosisResults": {
                     "payload": {
                         "integrated_loudness_lufs": -14.0,
@@ -145,7 +157,7 @@ class TestCompareMixes:
                     }
                 }
             },
-            {
+            "https://example.com/mix_b.wav": {
                 "mixDiagnosisResults": {
                     "payload": {
                         "integrated_loudness_lufs": -12.0,
@@ -155,7 +167,7 @@ class TestCompareMixes:
                     }
                 }
             }
-        ]
+        })
         
         controller = AnalysisController(mock_api_provider)
         
@@ -178,8 +190,8 @@ class TestCompareMixes:
     def test_comparison_differences(self, mock_api_provider):
         """Test that differences are calculated correctly"""
         # Setup
-        mock_api_provider.post.side_effect = [
-            {
+        mock_api_provider.post.side_effect = responses_by_url({
+            "https://example.com/mix_a.wav": {
                 "mixDiagnosisResults": {
                     "payload": {
                         "integrated_loudness_lufs": -14.0,
@@ -190,7 +202,7 @@ class TestCompareMixes:
                     }
                 }
             },
-            {
+            "https://example.com/mix_b.wav": {
                 "mixDiagnosisResults": {
                     "payload": {
                         "integrated_loudness_lufs": -10.0,
@@ -201,7 +213,7 @@ class TestCompareMixes:
                     }
                 }
             }
-        ]
+        })
         
         controller = AnalysisController(mock_api_provider)
         
@@ -225,6 +237,189 @@ class TestCompareMixes:
         assert diffs["clipping"]["mix_b_value"] == "YES"
 
 
+@pytest.mark.unit
+class TestConcurrentComparison:
+    """Test that comparisons run their analyses concurrently"""
+    
+    URLS = [f"https://example.com/mix{i}.wav" for i in range(4)]
+    
+    @staticmethod
+    def analysis(loudness, clipping="NO"):
+        return {"mixDiagnosisResults": {"payload": {
+            "integrated_loudness_lufs": loudness, "clipping": clipping,
+            "tonal_profile": {"bass_frequency": "GOOD" if loudness < -12 else "HIGH"}
+        }}}
+    
+    def test_compare_mixes_overlaps_analyses(self, mock_api_provider):
+        """Test that the second analysis starts before the first finishes"""
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def post(endpoint, payload):
+            barrier.wait()
+            return self.analysis(-14.0)
+        
+        mock_api_provider.post.side_effect = post
+        controller = AnalysisController(mock_api_provider)
+        
+        result = controller.compare_mixes(self.URLS[0], self.URLS[1], AnalysisMusicalStyle.POP)
+        
+        assert result["differences"]["integrated_loudness_lufs"]["difference"] == 0.0
+    
+    def test_compare_many_all_pairs(self, mock_api_provider):
+        """Test that every pair is compared exactly as compare_mixes would"""
+        responses = {url: self.analysis(-16.0 + 2 * i, "YES" if i == 3 else "NO") for i, url in enumerate(self.URLS)}
+        mock_api_provider.post.side_effect = responses_by_url(responses)
+        controller = AnalysisController(mock_api_provider)
+        
+        result = controller.compare_many(self.URLS, AnalysisMusicalStyle.POP)
+        
+        assert list(result["mixes"]) == self.URLS
+        assert isinstance(result["differences"], PairwiseDifferences)
+        assert list(result["differences"]) == [(a, b) for i, a in enumerate(self.URLS) for b in self.URLS[i + 1:]]
+        for (url_a, url_b), differences in result["differences"].items():
+            expected = AnalysisController._compare_metrics(
+                AnalysisController._parse_analysis_result(responses[url_a]),
+                AnalysisController._parse_analysis_result(responses[url_b]))
+            assert differences == expected
+        assert result["differences"][(self.URLS[0], self.URLS[3])]["integrated_loudness_lufs"]["difference"] == 6.0
+        assert result["differences"][(self.URLS[2], self.URLS[3])]["clipping"]["status"] == "DIFFERENT"
+    
+    def test_compare_many_bounds_concurrency(self, mock_api_provider):
+        """Test that no more than max_workers analyses run at once"""
+        lock, in_flight, peak = threading.Lock(), [0], [0]
+        
+        def post(endpoint, payload):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            threading.Event().wait(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return self.analysis(-14.0)
+        
+        mock_api_provider.post.side_effect = post
+        controller = AnalysisController(mock_api_provider)
+        
+        controller.compare_many(self.URLS, AnalysisMusicalStyle.POP, max_workers=2)
+        
+        assert mock_api_provider.post.call_count == 4
+        assert peak[0] <= 2
+    
+    def test_compare_many_propagates_errors(self, mock_api_provider):
+        """Test that a failed analysis fails the comparison"""
+        mock_api_provider.post.side_effect = RoExApiError("boom", status_code=500)
+        controller = AnalysisController(mock_api_provider)
+        
+        with pytest.raises(RoExApiError):
+            controller.compare_many(self.URLS, AnalysisMusicalStyle.POP)
+    
+    @pytest.mark.parametrize("urls, kwargs", [
+        (URLS[:1], {}),
+        ([URLS[0], URLS[0]], {}),
+        (URLS, {"max_workers": 0}),
+    ])
+    def test_compare_many_validation(self, mock_api_provider, urls, kwargs):
+        """Test argument validation"""
+        controller = AnalysisController(mock_api_provider)
+        
+        with pytest.raises(ValueError):
+            controller.compare_many(urls, AnalysisMusicalStyle.POP, **kwargs)
+        
+        mock_api_provider.post.assert_not_called()
+
+
+@pytest.mark.unit
+class TestAnalyzeBatch:
+    """Test analyze_batch"""
+    
+    @staticmethod
+    def requests(count):
+        return (MixAnalysisRequest(f"https://example.com/{i}.wav", AnalysisMusicalStyle.POP, True)
+                for i in range(count))
+    
+    @staticmethod
+    def post(endpoint, payload):
+        url = payload["mixDiagnosisData"]["audioFileLocation"]
+        if url.endswith("/3.wav"):
+            raise RoExApiError("boom", status_code=400)
+        index = int(url.rsplit("/", 1)[1].split(".")[0])
+        return {"mixDiagnosisResults": {"payload": {"integrated_loudness_lufs": -10.0 - index}}}
+    
+    def test_yields_every_request(self, mock_api_provider):
+        """Test that each request yields one item with per-item errors"""
+        mock_api_provider.post.side_effect = self.post
+        controller = AnalysisController(mock_api_provider)
+        
+        items = sorted(controller.analyze_batch(self.requests(6), max_in_flight=3), key=lambda item: item.index)
+        
+        assert [item.index for item in items] == list(range(6))
+        assert [item.ok for item in items] == [True, True, True, False, True, True]
+        assert "boom" in items[3].error
+        assert items[5].result.payload["integrated_loudness_lufs"] == -15.0
+        assert all(item.seconds is not None for item in items)
+    
+    def test_fills_table(self, mock_api_provider):
+        """Test that successful analyses are appended to the table"""
+        mock_api_provider.post.side_effect = self.post
+        controller = AnalysisController(mock_api_provider)
+        table = AnalysisTable()
+        
+        for _ in controller.analyze_batch(self.requests(6), table=table):
+            pass
+        
+        assert len(table) == 5
+        rows = {row["url"]: row for row in table.rows()}
+        assert rows["https://example.com/4.wav"]["integrated_loudness_lufs"] == -14.0
+        assert "https://example.com/3.wav" not in rows
+    
+    def test_reads_requests_lazily(self, mock_api_provider):
+        """Test that no more than max_in_flight requests are taken ahead of the results"""
+        lock, in_flight, peak, consumed = threading.Lock(), [0], [0], []
+        
+        def post(endpoint, payload):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            threading.Event().wait(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return {"mixDiagnosisResults": {"payload": {}}}
+        
+        def requests():
+            for request in self.requests(50):
+                consumed.append(request)
+                yield request
+        
+        mock_api_provider.post.side_effect = post
+        controller = AnalysisController(mock_api_provider)
+        
+        batch = controller.analyze_batch(requests(), max_in_flight=4)
+        first = next(batch)
+        
+        assert len(consumed) <= 4 + 1
+        assert first.ok
+        assert sum(1 for _ in batch) == 49
+        assert peak[0] <= 4
+    
+    def test_stopping_early_cancels_queue(self, mock_api_provider):
+        """Test that abandoning the iterator leaves the rest of the requests unsent"""
+        mock_api_provider.post.side_effect = self.post
+        controller = AnalysisController(mock_api_provider)
+        
+        batch = controller.analyze_batch(self.requests(1000), max_in_flight=2)
+        next(batch)
+        batch.close()
+        
+        assert mock_api_provider.post.call_count <= 4
+    
+    def test_invalid_max_in_flight(self, mock_api_provider):
+        """Test that max_in_flight must be positive"""
+        controller = AnalysisController(mock_api_provider)
+        
+        with pytest.raises(ValueError):
+            controller.analyze_batch(self.requests(1), max_in_flight=0)
+
+
 @pytest.mark.unit
 class TestExtractMetrics:
     """Test _extract_metrics method"""
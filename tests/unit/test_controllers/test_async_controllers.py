@@ -0,0 +1,282 @@
+"""
+Unit tests for the asyncio controllers
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from roex_python.controllers.async_controllers import (
+    AsyncAnalysisController,
+    AsyncAudioCleanupController,
+    AsyncEnhanceController,
+    AsyncMasteringController,
+    AsyncMixController,
+    AsyncUploadController
+)
+from roex_python.exceptions import RoExApiError, RoExTaskError
+from roex_python.models import (
+    AnalysisMusicalStyle, AudioCleanupData, DesiredLoudness, EnhanceMusicalStyle,
+    MasteringRequest, MixEnhanceRequest, MultitrackMixRequest, MusicalStyle,
+    PreviewMixResult, SoundSource, UploadUrlRequest
+)
+
+
+@pytest.fixture
+def async_provider():
+    """Returns a provider whose post method is an AsyncMock"""
+    provider = Mock()
+    provider.post = AsyncMock()
+    return provider
+
+
+@pytest.mark.unit
+class TestAsyncMixController:
+    """Test AsyncMixController"""
+    
+    def test_create_mix_preview_reuses_payload_builder(self, async_provider, sample_track_data):
+        """Test that the async payload matches the synchronous one"""
+        async_provider.post.return_value = {"multitrack_task_id": "mix_1"}
+        controller = AsyncMixController(async_provider)
+        request = MultitrackMixRequest(track_data=sample_track_data, musical_style=MusicalStyle.POP)
+        
+        result = asyncio.run(controller.create_mix_preview(request))
+        
+        assert result.multitrack_task_id == "mix_1"
+        endpoint, payload = async_provider.post.call_args[0]
+        assert endpoint == "/mixpreview"
+        assert payload["multitrackData"]["trackData"][0]["trackURL"] == "https://example.com/bass.wav"
+    
+    @patch('roex_python.polling.asyncio.sleep', new_callable=AsyncMock)
+    def test_retrieve_preview_mix_polls_with_asyncio_sleep(self, mock_sleep, async_provider):
+        """Test that pending responses are polled with asyncio.sleep, starting with a short wait"""
+        async_provider.post.side_effect = [
+            {"status": "MIX_TASK_PREVIEW_IN_PROGRESS"},
+            {"previewMixTaskResults": {
+                "status": "MIX_TASK_PREVIEW_COMPLETED",
+                "download_url_preview_mixed": "https://example.com/preview.wav"
+            }}
+        ]
+        controller = AsyncMixController(async_provider)
+        
+        result = asyncio.run(controller.retrieve_preview_mix("mix_1"))
+        
+        assert isinstance(result, PreviewMixResult)
+        assert result.download_url_preview_mixed == "https://example.com/preview.wav"
+        mock_sleep.assert_awaited_once()
+        assert 1.8 <= mock_sleep.await_args.args[0] <= 2.2
+    
+    @patch('roex_python.polling.asyncio.sleep', new_callable=AsyncMock)
+    def test_retrieve_preview_mix_timeout(self, mock_sleep, async_provider):
+        """Test that polling gives up after max_attempts"""
+        async_provider.post.return_value = {"status": "MIX_TASK_PREVIEW_IN_PROGRESS"}
+        controller = AsyncMixController(async_provider)
+        
+        with pytest.raises(Exception, match="did not complete"):
+            asyncio.run(controller.retrieve_preview_mix("mix_1", max_attempts=3, poll_interval=1))
+        assert async_provider.post.await_count == 3
+
+
+@pytest.mark.unit
+class TestAsyncMasteringController:
+    """Test AsyncMasteringController"""
+    
+    @patch('roex_python.polling.asyncio.sleep', new_callable=AsyncMock)
+    def test_mastering_round_trip(self, mock_sleep, async_provider):
+        """Test create, preview polling and final retrieval"""
+        async_provider.post.side_effect = [
+            {"mastering_task_id": "master_1"},
+            {"status": 202},
+            {"previewMasterTaskResults": {"download_url_mastered_preview": "https://example.com/p.wav"}},
+            {"finalMasterTaskResults": {"download_url_mastered": "https://example.com/f.wav"}}
+        ]
+        controller = AsyncMasteringController(async_provider)
+        request = MasteringRequest(
+            track_url="https://example.com/track.wav",
+            musical_style=MusicalStyle.POP,
+            desired_loudness=DesiredLoudness.MEDIUM
+        )
+        
+        async def run():
+            task = await controller.create_mastering_preview(request)
+            preview = await controller.retrieve_preview_master(task.mastering_task_id)
+            final = await controller.retrieve_final_master(task.mastering_task_id)
+            return preview, final
+        
+        preview, final = asyncio.run(run())
+        
+        assert preview.download_url_mastered_preview == "https://example.com/p.wav"
+        assert final.download_url_mastered == "https://example.com/f.wav"
+        assert async_provider.post.call_args_list[0][0][1]["masteringData"]["desiredLoudness"] == "MEDIUM"
+    
+    @patch('roex_python.polling.asyncio.sleep', new_callable=AsyncMock)
+    def test_failed_preview_stops_polling(self, mock_sleep, async_provider):
+        """Test that a failed mastering status ends polling immediately"""
+        async_provider.post.return_value = {"status": "MASTERING_TASK_FAILED"}
+        controller = AsyncMasteringController(async_provider)
+        
+        with pytest.raises(RoExTaskError):
+            asyncio.run(controller.retrieve_preview_master("master_1"))
+        
+        assert async_provider.post.await_count == 1
+        mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestAsyncAnalysisController:
+    """Test AsyncAnalysisController"""
+    
+    def test_compare_mixes(self, async_provider, mock_analysis_response):
+        """Test that both analyses run and are compared"""
+        async_provider.post.return_value = mock_analysis_response
+        controller = AsyncAnalysisController(async_provider)
+        
+        comparison = asyncio.run(controller.compare_mixes(
+            "https://example.com/a.wav", "https://example.com/b.wav", AnalysisMusicalStyle.POP
+        ))
+        
+        assert async_provider.post.await_count == 2
+        assert comparison["differences"]["integrated_loudness_lufs"]["difference"] == 0.0
+    
+    def test_compare_many_bounds_concurrency(self, async_provider):
+        """Test that at most max_workers analyses are awaited at once and every pair is compared"""
+        in_flight, peak = 0, 0
+        
+        async def post(endpoint, payload):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            url = payload["mixDiagnosisData"]["audioFileLocation"]
+            return {"mixDiagnosisResults": {"payload": {"integrated_loudness_lufs": -float(url[-5])}}}
+        
+        async_provider.post.side_effect = post
+        controller = AsyncAnalysisController(async_provider)
+        urls = [f"https://example.com/mix{i}.wav" for i in range(5)]
+        
+        comparison = asyncio.run(controller.compare_many(urls, AnalysisMusicalStyle.POP, max_workers=2))
+        
+        assert peak == 2
+        assert len(comparison["differences"]) == 10
+        assert comparison["differences"][(urls[0], urls[4])]["integrated_loudness_lufs"]["difference"] == 4.0
+
+
+@pytest.mark.unit
+class TestAsyncEnhanceController:
+    """Test AsyncEnhanceController"""
+    
+    @patch('roex_python.polling.asyncio.sleep', new_callable=AsyncMock)
+    def test_retrieve_enhanced_track(self, mock_sleep, async_provider):
+        """Test enhancement creation and polling"""
+        async_provider.post.side_effect = [
+            {"mixrevive_task_id": "enh_1", "error": False, "message": "ok"},
+            {"error": False, "revivedTrackTaskResults": {}},
+            {"error": False, "revivedTrackTaskResults": {"download_url_revived": "https://example.com/e.wav"}}
+        ]
+        controller = AsyncEnhanceController(async_provider)
+        request = MixEnhanceRequest(
+            audio_file_location="https://example.com/mix.wav",
+            musical_style=EnhanceMusicalStyle.POP
+        )
+        
+        async def run():
+            task = await controller.create_mix_enhance(request)
+            return await controller.retrieve_enhanced_track(task.mixrevive_task_id)
+        
+        result = asyncio.run(run())
+        
+        assert result.download_url_revived == "https://example.com/e.wav"
+        assert mock_sleep.await_count == 1
+    
+    @patch('roex_python.polling.asyncio.sleep', new_callable=AsyncMock)
+    def test_failed_enhancement_stops_polling(self, mock_sleep, async_provider):
+        """Test that a failed enhancement status ends polling immediately"""
+        async_provider.post.return_value = {"error": False, "revivedTrackTaskResults": {"status": "FAILED"}}
+        controller = AsyncEnhanceController(async_provider)
+        
+        with pytest.raises(RoExTaskError):
+            asyncio.run(controller.retrieve_enhanced_track("enh_1"))
+        
+        assert async_provider.post.await_count == 1
+        mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestAsyncAudioCleanupAndUpload:
+    """Test AsyncAudioCleanupController and AsyncUploadController"""
+    
+    def test_clean_up_audio(self, async_provider):
+        """Test cleanup response parsing"""
+        async_provider.post.return_value = {
+            "error": False,
+            "audioCleanupResults": {
+                "completion_time": "now", "error": False, "info": "",
+                "cleaned_audio_file_location": "https://example.com/clean.wav"
+            }
+        }
+        controller = AsyncAudioCleanupController(async_provider)
+        data = AudioCleanupData(audio_file_location="https://example.com/v.wav", sound_source=SoundSource.VOCAL_GROUP)
+        
+        result = asyncio.run(controller.clean_up_audio(data))
+        
+        assert result.audio_cleanup_results.cleaned_audio_file_location == "https://example.com/clean.wav"
+    
+    def test_clean_up_audio_returns_none_on_error(self, async_provider):
+        """Test that cleanup failures return None like the sync controller"""
+        async_provider.post.side_effect = RuntimeError("boom")
+        controller = AsyncAudioCleanupController(async_provider)
+        data = AudioCleanupData(audio_file_location="https://example.com/v.wav", sound_source=SoundSource.VOCAL_GROUP)
+        
+        assert asyncio.run(controller.clean_up_audio(data)) is None
+    
+    def test_clean_up_batch(self, async_provider):
+        """Test that batch cleanup runs concurrently within the limit and reports typed errors"""
+        in_flight, peak = [0], [0]
+        
+        async def post(endpoint, payload):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            url = payload["audioCleanupData"]["audioFileLocation"]
+            if url.endswith("/3.wav"):
+                raise RoExApiError("rate limited", status_code=429)
+            return {"error": False, "audioCleanupResults": {
+                "completion_time": "now", "error": False, "info": "", "cleaned_audio_file_location": url + ".clean"
+            }}
+        
+        async_provider.post.side_effect = post
+        controller = AsyncAudioCleanupController(async_provider)
+        requests = [AudioCleanupData(f"https://example.com/{i}.wav", list(SoundSource)[i % 3]) for i in range(10)]
+        
+        async def collect():
+            return [item async for item in controller.clean_up_batch(requests, max_in_flight=4)]
+        
+        items = sorted(asyncio.run(collect()), key=lambda item: item.index)
+        
+        assert [item.index for item in items] == list(range(10))
+        assert [item.ok for item in items] == [i != 3 for i in range(10)]
+        assert isinstance(items[3].error, RoExApiError) and items[3].error.status_code == 429
+        assert items[0].cleaned_audio_file_location == "https://example.com/0.wav.clean"
+        assert 1 < peak[0] <= 4
+    
+    def test_clean_up_batch_invalid_max_in_flight(self, async_provider):
+        """Test that max_in_flight must be positive"""
+        controller = AsyncAudioCleanupController(async_provider)
+        
+        with pytest.raises(ValueError):
+            controller.clean_up_batch([], max_in_flight=0)
+    
+    def test_get_upload_url(self, async_provider):
+        """Test upload URL parsing"""
+        async_provider.post.return_value = {
+            "signed_url": "https://signed.example.com/up",
+            "readable_url": "https://example.com/track.wav"
+        }
+        controller = AsyncUploadController(async_provider)
+        
+        result = asyncio.run(controller.get_upload_url(UploadUrlRequest("track.wav", "audio/wav")))
+        
+        assert result.signed_url == "https://signed.example.com/up"
+        assert async_provider.post.call_args[0][1] == {"filename": "track.wav", "contentType": "audio/wav"}
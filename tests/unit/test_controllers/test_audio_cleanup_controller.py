@@ -2,9 +2,12 @@
 Unit tests for AudioCleanupController
 """
 
+import threading
 import pytest
 from unittest.mock import Mock
+import requests
 from roex_python.controllers.audio_cleanup_controller import AudioCleanupController
+from roex_python.exceptions import RoExApiError, RoExTaskError
 from roex_python.models.audio_cleanup import (
     AudioCleanupData, AudioCleanupResponse, AudioCleanupResults, SoundSource
 )
@@ -239,3 +242,111 @@ class TestCleanUpAudio:
             # Should succeed for all sources
             assert isinstance(result, AudioCleanupResponse)
             assert result.error is False
+
+
+def cleanup_post(endpoint, payload):
+    """Fake /audio-cleanup: track 2 fails with HTTP 500, track 3 times out, track 4 is reported failed"""
+    url = payload["audioCleanupData"]["audioFileLocation"]
+    index = int(url.rsplit("/", 1)[1].split(".")[0])
+    if index == 2:
+        raise RoExApiError("server error", status_code=500, endpoint=endpoint)
+    if index == 3:
+        raise requests.exceptions.ReadTimeout("read timed out")
+    return {
+        "error": False,
+        "message": "Success",
+        "audioCleanupResults": {
+            "completion_time": "2025-10-17T12:00:00Z",
+            "error": index == 4,
+            "info": "cleanup failed" if index == 4 else "Cleanup completed",
+            "cleaned_audio_file_location": None if index == 4 else f"https://example.com/clean_{index}.wav"
+        }
+    }
+
+
+def cleanup_requests(count):
+    """Cleanup requests cycling through the sound sources"""
+    sources = list(SoundSource)
+    return (AudioCleanupData(f"https://example.com/{i}.wav", sources[i % len(sources)]) for i in range(count))
+
+
+@pytest.mark.unit
+class TestCleanUpBatch:
+    """Test clean_up_batch"""
+    
+    def test_yields_every_request_with_typed_errors(self, mock_api_provider):
+        """Test that each request yields one item whose error is the exception type of its failure"""
+        # Setup
+        mock_api_provider.post.side_effect = cleanup_post
+        controller = AudioCleanupController(mock_api_provider)
+        
+        # Execute
+        items = sorted(controller.clean_up_batch(cleanup_requests(6), max_in_flight=3), key=lambda item: item.index)
+        
+        # Assert
+        assert [item.index for item in items] == list(range(6))
+        assert [item.ok for item in items] == [True, True, False, False, False, True]
+        assert isinstance(items[2].error, RoExApiError) and items[2].error.status_code == 500
+        assert isinstance(items[3].error, requests.exceptions.Timeout)
+        assert isinstance(items[4].error, RoExTaskError) and "cleanup failed" in str(items[4].error)
+        assert items[4].response is not None
+        assert items[5].cleaned_audio_file_location == "https://example.com/clean_5.wav"
+        assert items[5].request.sound_source == list(SoundSource)[5]
+        assert all(item.seconds is not None for item in items)
+    
+    def test_runs_concurrently_within_limit(self, mock_api_provider):
+        """Test that requests overlap but never exceed max_in_flight"""
+        # Setup
+        lock, in_flight, peak, consumed = threading.Lock(), [0], [0], []
+        
+        def post(endpoint, payload):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            threading.Event().wait(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return cleanup_post(endpoint, {"audioCleanupData": {"audioFileLocation": "https://example.com/0.wav"}})
+        
+        def requests_():
+            for request in cleanup_requests(30):
+                consumed.append(request)
+                yield request
+        
+        mock_api_provider.post.side_effect = post
+        controller = AudioCleanupController(mock_api_provider)
+        
+        # Execute
+        batch = controller.clean_up_batch(requests_(), max_in_flight=5)
+        first = next(batch)
+        
+        # Assert
+        assert len(consumed) <= 5 + 1
+        assert first.ok
+        assert sum(1 for _ in batch) == 29
+        assert 1 < peak[0] <= 5
+    
+    def test_stopping_early_cancels_queue(self, mock_api_provider):
+        """Test that abandoning the iterator leaves the rest of the requests unsent"""
+        mock_api_provider.post.side_effect = cleanup_post
+        controller = AudioCleanupController(mock_api_provider)
+        
+        batch = controller.clean_up_batch(cleanup_requests(1000), max_in_flight=2)
+        next(batch)
+        batch.close()
+        
+        assert mock_api_provider.post.call_count <= 4
+    
+    def test_invalid_max_in_flight(self, mock_api_provider):
+        """Test that max_in_flight must be positive"""
+        controller = AudioCleanupController(mock_api_provider)
+        
+        with pytest.raises(ValueError):
+            controller.clean_up_batch(cleanup_requests(1), max_in_flight=0)
+    
+    def test_clean_up_audio_still_returns_none(self, mock_api_provider):
+        """Test that the single-request method keeps returning None on failure"""
+        mock_api_provider.post.side_effect = cleanup_post
+        controller = AudioCleanupController(mock_api_provider)
+        
+        assert controller.clean_up_audio(AudioCleanupData("https://example.com/2.wav", SoundSource.VOCAL_GROUP)) is None
@@ -6,6 +6,7 @@ import pytest
 from unittest.mock import Mock, patch
 import requests
 from roex_python.controllers.enhance_controller import EnhanceController
+from roex_python.exceptions import RoExApiError, RoExTaskError
 from roex_python.models import (
     MixEnhanceRequest, MixEnhanceResponse, EnhancedTrackResult,
     MusicalStyle, LoudnessPreference
@@ -96,7 +97,7 @@ class TestCreateMixEnhancePreview:
     def test_http_error_handling(self, mock_api_provider):
         """Test error handling when API returns HTTP error"""
         # Setup
-        mock_api_provider.post.side_effect = requests.HTTPError("API Error")
+        mock_api_provider.post.side_effect = RoExApiError("API Error", status_code=400)
         
         controller = EnhanceController(mock_api_provider)
         
@@ -106,8 +107,11 @@ class TestCreateMixEnhancePreview:
         )
         
         # Execute & Assert
-        with pytest.raises(Exception, match="Failed to create mix enhance preview"):
+        with pytest.raises(RoExApiError) as exc_info:
             controller.create_mix_enhance_preview(request)
+        
+        assert exc_info.value.status_code == 400
+        mock_api_provider.post.assert_called_once()
 
 
 @pytest.mark.unit
@@ -144,7 +148,7 @@ class TestCreateMixEnhance:
     def test_http_error_handling(self, mock_api_provider):
         """Test error handling"""
         # Setup
-        mock_api_provider.post.side_effect = requests.HTTPError("API Error")
+        mock_api_provider.post.side_effect = RoExApiError("API Error", status_code=400)
         
         controller = EnhanceController(mock_api_provider)
         
@@ -154,15 +158,18 @@ class TestCreateMixEnhance:
         )
         
         # Execute & Assert
-        with pytest.raises(Exception, match="Failed to create mix enhance"):
+        with pytest.raises(RoExApiError) as exc_info:
             controller.create_mix_enhance(request)
+        
+        assert exc_info.value.status_code == 400
+        mock_api_provider.post.assert_called_once()
 
 
 @pytest.mark.unit
 class TestRetrieveEnhancedTrack:
     """Test retrieve_enhanced_track method"""
     
-    @patch('roex_python.controllers.enhance_controller.time.sleep')
+    @patch('roex_python.polling.time.sleep')
     def test_successful_retrieval(self, mock_sleep, mock_api_provider):
         """Test successful enhanced track retrieval"""
         mock_api_provider.post.return_value = {
@@ -184,7 +191,7 @@ class TestRetrieveEnhancedTrack:
         assert result.stems == {"vocal": "https://example.com/vocal.wav"}
         assert result.preview_start_time == 30.0
     
-    @patch('roex_python.controllers.enhance_controller.time.sleep')
+    @patch('roex_python.polling.time.sleep')
     def test_polling_until_ready(self, mock_sleep, mock_api_provider):
         """Test polling until enhanced track is ready"""
         mock_api_provider.post.side_effect = [
@@ -205,7 +212,7 @@ class TestRetrieveEnhancedTrack:
         assert result.download_url_revived == "https://example.com/enhanced.wav"
         assert mock_api_provider.post.call_count == 3
     
-    @patch('roex_python.controllers.enhance_controller.time.sleep')
+    @patch('roex_python.polling.time.sleep')
     def test_polling_timeout(self, mock_sleep, mock_api_provider):
         """Test polling timeout after max attempts"""
         mock_api_provider.post.return_value = {"error": True}
@@ -217,7 +224,21 @@ class TestRetrieveEnhancedTrack:
         
         assert mock_api_provider.post.call_count == 3
     
-    @patch('roex_python.controllers.enhance_controller.time.sleep')
+    @patch('roex_python.polling.time.sleep')
+    def test_failed_task_stops_polling(self, mock_sleep, mock_api_provider):
+        """Test that a failed enhancement status ends polling immediately"""
+        mock_api_provider.post.return_value = {"error": False, "revivedTrackTaskResults": {"status": "FAILED"}}
+        
+        controller = EnhanceController(mock_api_provider)
+        
+        with pytest.raises(RoExTaskError) as exc_info:
+            controller.retrieve_enhanced_track("enhance_task_123", timeout=60)
+        
+        assert exc_info.value.task_id == "enhance_task_123"
+        mock_api_provider.post.assert_called_once()
+        mock_sleep.assert_not_called()
+    
+    @patch('roex_python.polling.time.sleep')
     def test_http_error_continues_polling(self, mock_sleep, mock_api_provider):
         """Test that HTTP errors don't stop polling"""
         mock_api_provider.post.side_effect = [
@@ -237,6 +258,57 @@ class TestRetrieveEnhancedTrack:
         assert result.download_url_revived == "https://example.com/enhanced.wav"
 
 
+@pytest.mark.unit
+class TestSubmit:
+    """Test submit method"""
+    
+    def test_submit_watches_task_with_timeout(self, mock_api_provider, mock_poll_scheduler):
+        """Test that submit hands polling to the scheduler with a time-bounded policy"""
+        # Setup
+        mock_api_provider.post.return_value = {
+            "mixrevive_task_id": "enhance_full_123",
+            "error": False,
+            "message": "Success"
+        }
+        scheduler = mock_poll_scheduler
+        controller = EnhanceController(mock_api_provider, poll_scheduler=scheduler)
+        request = MixEnhanceRequest(
+            audio_file_location="https://example.com/mix.wav",
+            musical_style=MusicalStyle.ELECTRONIC
+        )
+        
+        # Execute
+        handle = controller.submit(request, timeout=120)
+        
+        # Assert
+        assert handle is scheduler.watch.return_value
+        args, kwargs = scheduler.watch.call_args
+        assert args[0] == "/retrieveenhancedtrack"
+        assert kwargs["task_id"] == "enhance_full_123"
+        assert kwargs["policy"].timeout == 120
+        assert kwargs["policy"].max_attempts is None
+        assert kwargs["is_failed"]({"status": "ENHANCE_TASK_FAILED"})
+        assert not kwargs["is_failed"]({"error": True})
+    
+    def test_submit_raises_when_task_not_started(self, mock_api_provider, mock_poll_scheduler):
+        """Test that an error response from the API raises instead of polling"""
+        mock_api_provider.post.return_value = {
+            "mixrevive_task_id": "",
+            "error": True,
+            "message": "Unsupported file"
+        }
+        scheduler = mock_poll_scheduler
+        controller = EnhanceController(mock_api_provider, poll_scheduler=scheduler)
+        request = MixEnhanceRequest(
+            audio_file_location="https://example.com/mix.wav",
+            musical_style=MusicalStyle.ELECTRONIC
+        )
+        
+        with pytest.raises(RoExTaskError, match="Unsupported file"):
+            controller.submit(request)
+        scheduler.watch.assert_not_called()
+
+
 @pytest.mark.unit
 class TestPayloadPreparation:
     """Test _prepare_mix_enhance_payload method"""
@@ -5,11 +5,16 @@ Unit tests for MasteringController
 import pytest
 from unittest.mock import Mock, patch
 import requests
+import itertools
+import threading
 import time
 from roex_python.controllers.mastering_controller import MasteringController
+from roex_python.exceptions import RoExApiError, RoExTaskError, RoExTimeoutError
+from roex_python.polling import PollPolicy
+from roex_python.scheduler import PollScheduler, TaskHandle
 from roex_python.models import (
     MasteringRequest, MusicalStyle, DesiredLoudness,
-    MasteringTaskResponse, PreviewMasterResult, FinalMasterResult
+    MasteringTaskResponse, PreviewMasterResult, FinalMasterResult, AlbumMasteringRequest
 )
 
 
@@ -82,7 +87,7 @@ class TestCreateMasteringPreview:
     def test_http_error_handling(self, mock_api_provider):
         """Test error handling when API returns HTTP error"""
         # Setup
-        mock_api_provider.post.side_effect = requests.HTTPError("API Error")
+        mock_api_provider.post.side_effect = RoExApiError("API Error", status_code=400)
         
         controller = MasteringController(mock_api_provider)
         request = MasteringRequest(
@@ -92,8 +97,11 @@ class TestCreateMasteringPreview:
         )
         
         # Execute & Assert
-        with pytest.raises(Exception, match="Failed to create mastering preview"):
+        with pytest.raises(RoExApiError) as exc_info:
             controller.create_mastering_preview(request)
+        
+        assert exc_info.value.status_code == 400
+        mock_api_provider.post.assert_called_once()
 
 
 @pytest.mark.unit
@@ -116,7 +124,7 @@ class TestRetrievePreviewMaster:
         assert result.download_url_mastered_preview == "https://example.com/preview.wav"
         assert result.preview_start_time == 15.0
     
-    @patch('roex_python.controllers.mastering_controller.time.sleep')
+    @patch('roex_python.polling.time.sleep')
     def test_polling_until_ready(self, mock_sleep, mock_api_provider):
         """Test polling until preview is ready"""
         mock_api_provider.post.side_effect = [
@@ -136,7 +144,51 @@ class TestRetrievePreviewMaster:
         assert result.download_url_mastered_preview == "https://example.com/preview.wav"
         assert mock_api_provider.post.call_count == 3
     
-    @patch('roex_python.controllers.mastering_controller.time.sleep')
+    @patch('roex_python.polling.time.sleep')
+    def test_polling_stops_on_auth_error(self, mock_sleep, mock_api_provider):
+        """Test that a non-retryable error aborts polling instead of exhausting max_attempts"""
+        mock_api_provider.post.side_effect = RoExApiError("Invalid API key", status_code=401)
+        
+        controller = MasteringController(mock_api_provider)
+        
+        with pytest.raises(RoExApiError) as exc_info:
+            controller.retrieve_preview_master("task_123", max_attempts=30, poll_interval=1)
+        
+        assert exc_info.value.status_code == 401
+        assert mock_api_provider.post.call_count == 1
+        mock_sleep.assert_not_called()
+    
+    @patch('roex_python.polling.time.sleep')
+    def test_failed_task_stops_polling(self, mock_sleep, mock_api_provider):
+        """Test that a failed mastering status ends polling immediately"""
+        mock_api_provider.post.return_value = {"previewMasterTaskResults": {"status": "MASTERING_TASK_FAILED"}}
+        
+        controller = MasteringController(mock_api_provider)
+        
+        with pytest.raises(RoExTaskError) as exc_info:
+            controller.retrieve_preview_master("task_123", max_attempts=30)
+        
+        assert exc_info.value.task_id == "task_123"
+        mock_api_provider.post.assert_called_once()
+        mock_sleep.assert_not_called()
+    
+    @patch('roex_python.polling.time.sleep')
+    def test_polling_stops_at_deadline(self, mock_sleep, mock_api_provider):
+        """Test that polling raises RoExTimeoutError once the timeout has elapsed"""
+        mock_api_provider.post.return_value = {"status": 202}
+        
+        controller = MasteringController(mock_api_provider)
+        
+        # Every clock reading advances one second
+        with patch('roex_python.deadline.time.monotonic', side_effect=itertools.count()):
+            with pytest.raises(RoExTimeoutError) as exc_info:
+                controller.retrieve_preview_master("task_123", max_attempts=30, timeout=5)
+        
+        assert exc_info.value.timeout == 5
+        assert 1 <= mock_api_provider.post.call_count < 30
+        assert "deadline" in mock_api_provider.post.call_args.kwargs
+    
+    @patch('roex_python.polling.time.sleep')
     def test_polling_timeout(self, mock_sleep, mock_api_provider):
         """Test polling timeout after max attempts"""
         # Setup - first call raises error, then returns pending status
@@ -153,8 +205,75 @@ class TestRetrievePreviewMaster:
         with pytest.raises(Exception, match="did not complete after polling"):
             controller.retrieve_preview_master("task_123", max_attempts=3, poll_interval=0.1)
         
-        # Should have tried: 1 initial + 3 polling attempts = 4 total
-        assert mock_api_provider.post.call_count == 4
+        # The first poll is the initial request, so max_attempts bounds the total
+        assert mock_api_provider.post.call_count == 3
+
+
+@pytest.mark.unit
+class TestSubmit:
+    """Test submit method"""
+    
+    def test_submit_returns_handle_resolved_by_scheduler(self, mock_api_provider):
+        """Test that submit creates the task and the shared scheduler resolves the handle"""
+        # Setup
+        mock_api_provider.post.side_effect = [
+            {"mastering_task_id": "task_123"},
+            {"status": 202},
+            {"previewMasterTaskResults": {"download_url_mastered_preview": "https://example.com/preview.wav"}}
+        ]
+        scheduler = PollScheduler(mock_api_provider)
+        controller = MasteringController(mock_api_provider, poll_scheduler=scheduler)
+        request = MasteringRequest(
+            track_url="https://example.com/track.wav",
+            musical_style=MusicalStyle.POP,
+            desired_loudness=DesiredLoudness.MEDIUM
+        )
+        policy = PollPolicy(first_delay=0.01, max_delay=0.01, jitter=0)
+        
+        # Execute
+        with scheduler:
+            handle = controller.submit(request, poll_policy=policy)
+            result = handle.result(timeout=5)
+        
+        # Assert
+        assert isinstance(handle, TaskHandle)
+        assert handle.task_id == "task_123"
+        assert handle.done()
+        assert isinstance(result, PreviewMasterResult)
+        assert result.download_url_mastered_preview == "https://example.com/preview.wav"
+        endpoints = [c[0][0] for c in mock_api_provider.post.call_args_list]
+        assert endpoints == ["/masteringpreview", "/retrievepreviewmaster", "/retrievepreviewmaster"]
+    
+    def test_submit_watches_for_failure(self, mock_api_provider, mock_poll_scheduler):
+        """Test that the scheduler is given a predicate that recognises failed mastering tasks"""
+        mock_api_provider.post.return_value = {"mastering_task_id": "task_123"}
+        controller = MasteringController(mock_api_provider, poll_scheduler=mock_poll_scheduler)
+        request = MasteringRequest(
+            track_url="https://example.com/track.wav",
+            musical_style=MusicalStyle.POP,
+            desired_loudness=DesiredLoudness.MEDIUM
+        )
+        
+        controller.submit(request)
+        
+        is_failed = mock_poll_scheduler.watch.call_args.kwargs["is_failed"]
+        assert is_failed({"status": "MASTERING_TASK_FAILED"})
+        assert not is_failed({"status": 202})
+    
+    def test_submit_raises_when_creation_fails(self, mock_api_provider, mock_poll_scheduler):
+        """Test that creation errors are raised by submit itself"""
+        mock_api_provider.post.side_effect = RoExApiError("bad request", status_code=400)
+        scheduler = mock_poll_scheduler
+        controller = MasteringController(mock_api_provider, poll_scheduler=scheduler)
+        request = MasteringRequest(
+            track_url="https://example.com/track.wav",
+            musical_style=MusicalStyle.POP,
+            desired_loudness=DesiredLoudness.MEDIUM
+        )
+        
+        with pytest.raises(RoExApiError):
+            controller.submit(request)
+        scheduler.watch.assert_not_called()
 
 
 @pytest.mark.unit
@@ -190,13 +309,15 @@ class TestRetrieveFinalMaster:
     def test_http_error(self, mock_api_provider):
         """Test error handling"""
         # Setup
-        mock_api_provider.post.side_effect = requests.HTTPError("API Error")
+        mock_api_provider.post.side_effect = RoExApiError("API Error", status_code=400)
         
         controller = MasteringController(mock_api_provider)
         
         # Execute & Assert
-        with pytest.raises(Exception, match="Failed to retrieve final master"):
+        with pytest.raises(RoExApiError) as exc_info:
             controller.retrieve_final_master("task_123")
+        
+        assert exc_info.value.status_code == 400
 
 
 @pytest.mark.unit
@@ -205,23 +326,17 @@ class TestProcessAlbum:
     
     @patch('roex_python.controllers.mastering_controller.os.makedirs')
     def test_album_processing(self, mock_makedirs, mock_api_provider):
-        """Test processing multiple tracks as album"""
+        """Test processing multiple tracks as album one download at a time"""
         # Setup
-        mock_api_provider.post.side_effect = [
-            # First track - preview creation
-            {"mastering_task_id": "task_1"},
-            # First track - preview retrieval
-            {"previewMasterTaskResults": {"status": "ready"}},
-            # First track - final master
-            {"finalMasterTaskResults": {"download_url_mastered": "https://example.com/track1.wav"}},
-            # Second track - preview creation
-            {"mastering_task_id": "task_2"},
-            # Second track - preview retrieval
-            {"previewMasterTaskResults": {"status": "ready"}},
-            # Second track - final master
-            {"finalMasterTaskResults": {"download_url_mastered": "https://example.com/track2.wav"}}
-        ]
+        def post(endpoint, payload, deadline=None):
+            if endpoint == "/masteringpreview":
+                return {"mastering_task_id": payload["masteringData"]["trackData"][0]["trackURL"][-10:-4]}
+            if endpoint == "/retrievepreviewmaster":
+                return {"previewMasterTaskResults": {"status": "ready"}}
+            task_id = payload["masteringData"]["masteringTaskId"]
+            return {"finalMasterTaskResults": {"download_url_mastered": f"https://example.com/{task_id}.wav"}}
         
+        mock_api_provider.post.side_effect = post
         mock_api_provider.download_file.return_value = True
         
         controller = MasteringController(mock_api_provider)
@@ -243,9 +358,237 @@ class TestProcessAlbum:
         album_request = AlbumMasteringRequest(tracks=tracks)
         
         # Execute
-        result = controller.process_album(album_request)
+        with controller.poll_scheduler:
+            result = controller.process_album(album_request)
         
         # Assert
         assert len(result) == 2
-        assert result[1] == "https://example.com/track1.wav"
-        assert result[2] == "https://example.com/track2.wav"
+        assert result[1] == "https://example.com/input1.wav"
+        assert result[2] == "https://example.com/input2.wav"
+    
+    @patch('roex_python.controllers.mastering_controller.os.makedirs')
+    def test_concurrent_album_processing(self, mock_makedirs, mock_api_provider):
+        """Test that every track is created before any final master is retrieved and results keep their indices"""
+        # Setup
+        calls = []
+        
+        def post(endpoint, payload, deadline=None):
+            calls.append(endpoint)
+            track_url = payload["masteringData"].get("trackData", [{}])[0].get("trackURL")
+            task_id = payload["masteringData"].get("masteringTaskId")
+            if endpoint == "/masteringpreview":
+                return {"mastering_task_id": track_url.rsplit("/", 1)[-1]}
+            if endpoint == "/retrievepreviewmaster":
+                return {"previewMasterTaskResults": {"download_url_mastered_preview": "https://example.com/p.wav"}}
+            return {"finalMasterTaskResults": {"download_url_mastered": f"https://example.com/final_{task_id}"}}
+        
+        mock_api_provider.post.side_effect = post
+        controller = MasteringController(mock_api_provider)
+        tracks = [
+            MasteringRequest(
+                track_url=f"https://example.com/input{i}.wav",
+                musical_style=MusicalStyle.POP,
+                desired_loudness=DesiredLoudness.MEDIUM
+            )
+            for i in (1, 2, 3)
+        ]
+        
+        # Execute
+        with controller.poll_scheduler:
+            result = controller.process_album(AlbumMasteringRequest(tracks=tracks), max_in_flight=2)
+        
+        # Assert
+        assert result == {
+            1: "https://example.com/final_input1.wav",
+            2: "https://example.com/final_input2.wav",
+            3: "https://example.com/final_input3.wav",
+        }
+        # Previews may start polling while later tracks are created, but no final master is fetched before all exist
+        created = [i for i, endpoint in enumerate(calls) if endpoint == "/masteringpreview"]
+        assert len(created) == 3
+        assert max(created) < calls.index("/retrievefinalmaster")
+        assert mock_api_provider.download_file.call_count == 3
+    
+    @pytest.mark.parametrize("max_in_flight", [1, 2])
+    @patch('roex_python.controllers.mastering_controller.os.makedirs')
+    def test_album_isolates_track_errors(self, mock_makedirs, max_in_flight, mock_api_provider):
+        """Test that one failing track does not affect the others and keeps its key, whatever max_in_flight is"""
+        # Setup
+        def post(endpoint, payload, deadline=None):
+            if endpoint == "/masteringpreview":
+                if payload["masteringData"]["trackData"][0]["trackURL"].endswith("bad.wav"):
+                    raise RoExApiError("bad track", status_code=400)
+                return {"mastering_task_id": "good"}
+            if endpoint == "/retrievepreviewmaster":
+                return {"previewMasterTaskResults": {}}
+            return {"finalMasterTaskResults": {"download_url_mastered": "https://example.com/good.wav"}}
+        
+        mock_api_provider.post.side_effect = post
+        controller = MasteringController(mock_api_provider)
+        tracks = [
+            MasteringRequest(
+                track_url=f"https://example.com/{name}.wav",
+                musical_style=MusicalStyle.POP,
+                desired_loudness=DesiredLoudness.MEDIUM
+            )
+            for name in ("bad", "good")
+        ]
+        
+        # Execute
+        with controller.poll_scheduler:
+            result = controller.process_album(AlbumMasteringRequest(tracks=tracks), max_in_flight=max_in_flight)
+        
+        # Assert
+        assert result == {1: None, 2: "https://example.com/good.wav"}
+    
+    def test_invalid_max_in_flight(self, mock_api_provider):
+        """Test that max_in_flight must be positive"""
+        controller = MasteringController(mock_api_provider)
+        
+        with pytest.raises(ValueError):
+            controller.process_album(AlbumMasteringRequest(tracks=[]), max_in_flight=0)
+
+
+@pytest.mark.unit
+class TestIterAlbum:
+    """Test iter_album method"""
+    
+    @staticmethod
+    def album(*names):
+        """Build an album request with one track per name"""
+        return AlbumMasteringRequest(tracks=[
+            MasteringRequest(
+                track_url=f"https://example.com/{name}.wav",
+                musical_style=MusicalStyle.POP,
+                desired_loudness=DesiredLoudness.MEDIUM
+            )
+            for name in names
+        ])
+    
+    def test_yields_tracks_as_they_finish(self, mock_api_provider, tmp_path):
+        """Test that a fast track is yielded before a slow one that was submitted first"""
+        # Setup
+        release = threading.Event()
+        
+        def post(endpoint, payload, deadline=None):
+            if endpoint == "/masteringpreview":
+                return {"mastering_task_id": payload["masteringData"]["trackData"][0]["trackURL"][-8:-4]}
+            task_id = payload["masteringData"]["masteringTaskId"]
+            if endpoint == "/retrievepreviewmaster":
+                if task_id == "slow":
+                    release.wait(5)
+                return {"previewMasterTaskResults": {}}
+            return {"finalMasterTaskResults": {"download_url_mastered": f"https://example.com/{task_id}_final.wav"}}
+        
+        mock_api_provider.post.side_effect = post
+        mock_api_provider.download_file.return_value = True
+        controller = MasteringController(mock_api_provider)
+        
+        # Execute
+        with controller.poll_scheduler:
+            tracks = controller.iter_album(self.album("slow", "fast"), output_dir=str(tmp_path), max_in_flight=2)
+            first = next(tracks)
+            release.set()
+            second = next(tracks)
+            assert next(tracks, None) is None
+        
+        # Assert
+        assert (first.index, first.task_id) == (2, "fast")
+        assert first.ok
+        assert first.final_url == "https://example.com/fast_final.wav"
+        assert first.local_path == str(tmp_path / "final_master_track_2.wav")
+        assert first.preview_seconds is not None and first.total_seconds >= first.preview_seconds
+        assert first.download_seconds is not None
+        assert (second.index, second.task_id) == (1, "slow")
+    
+    def test_reports_errors_per_track(self, mock_api_provider, tmp_path):
+        """Test that creation and download failures are reported on the affected track only"""
+        # Setup
+        def post(endpoint, payload, deadline=None):
+            if endpoint == "/masteringpreview":
+                if payload["masteringData"]["trackData"][0]["trackURL"].endswith("bad.wav"):
+                    raise RoExApiError("bad track", status_code=400)
+                return {"mastering_task_id": "good"}
+            if endpoint == "/retrievepreviewmaster":
+                return {"previewMasterTaskResults": {}}
+            return {"finalMasterTaskResults": {"download_url_mastered": "https://example.com/good.wav"}}
+        
+        mock_api_provider.post.side_effect = post
+        mock_api_provider.download_file.return_value = False
+        controller = MasteringController(mock_api_provider)
+        
+        # Execute
+        with controller.poll_scheduler:
+            tracks = {t.index: t for t in controller.iter_album(self.album("bad", "good"), output_dir=str(tmp_path))}
+        
+        # Assert
+        assert tracks[1].task_id is None
+        assert "Could not create mastering task" in tracks[1].error
+        assert tracks[2].final_url == "https://example.com/good.wav"
+        assert tracks[2].local_path is None
+        assert "Could not download" in tracks[2].error
+        assert not tracks[1].ok and not tracks[2].ok
+    
+    def test_deadline_bounds_polling_retrieval_and_download(self, mock_api_provider, tmp_path):
+        """Test that tracks unfinished at the album deadline fail without starting final retrieval or download"""
+        # Setup
+        calls = []
+        
+        def post(endpoint, payload, deadline=None):
+            calls.append(endpoint)
+            if endpoint == "/masteringpreview":
+                return {"mastering_task_id": "slow"}
+            if endpoint == "/retrievepreviewmaster":
+                return {}
+            return {"finalMasterTaskResults": {"download_url_mastered": "https://example.com/slow_final.wav"}}
+        
+        mock_api_provider.post.side_effect = post
+        controller = MasteringController(mock_api_provider)
+        
+        # Execute
+        started = time.monotonic()
+        with controller.poll_scheduler:
+            tracks = list(controller.iter_album(self.album("slow"), output_dir=str(tmp_path), timeout=0.2))
+        elapsed = time.monotonic() - started
+        
+        # Assert
+        assert len(tracks) == 1
+        assert not tracks[0].ok
+        assert "deadline" in tracks[0].error
+        assert tracks[0].preview_seconds is None
+        assert "/retrievefinalmaster" not in calls
+        mock_api_provider.download_file.assert_not_called()
+        assert elapsed < 2
+    
+    def test_final_retrieval_and_download_use_remaining_time(self, mock_api_provider, tmp_path):
+        """Test that the final master request and download are given the album deadline"""
+        # Setup
+        deadlines = []
+        
+        def post(endpoint, payload, deadline=None):
+            if endpoint == "/masteringpreview":
+                return {"mastering_task_id": "fast"}
+            if endpoint == "/retrievepreviewmaster":
+                return {"previewMasterTaskResults": {}}
+            deadlines.append(deadline)
+            return {"finalMasterTaskResults": {"download_url_mastered": "https://example.com/fast_final.wav"}}
+        
+        mock_api_provider.post.side_effect = post
+        mock_api_provider.download_file.return_value = True
+        controller = MasteringController(mock_api_provider)
+        
+        # Execute
+        with controller.poll_scheduler:
+            tracks = list(controller.iter_album(self.album("fast"), output_dir=str(tmp_path), timeout=60))
+        
+        # Assert
+        assert tracks[0].ok
+        assert 0 < deadlines[0].timeout <= 60
+        assert mock_api_provider.download_file.call_args[1]["deadline"].timeout == 60
+    
+    def test_invalid_max_in_flight_raises_immediately(self, mock_api_provider):
+        """Test that arguments are validated before iteration starts"""
+        controller = MasteringController(mock_api_provider)
+        
+        with pytest.raises(ValueError):
+            controller.iter_album(self.album("a"), max_in_flight=0)
@@ -6,6 +6,7 @@ import pytest
 from unittest.mock import Mock, patch
 import requests
 from roex_python.controllers.mix_controller import MixController
+from roex_python.exceptions import RoExApiError, RoExTaskError
 from roex_python.models import (
     MultitrackMixRequest, TrackData, InstrumentGroup,
     PresenceSetting, PanPreference, ReverbPreference,
@@ -125,7 +126,7 @@ class TestCreateMixPreview:
     def test_http_error_handling(self, mock_api_provider):
         """Test error handling when API returns HTTP error"""
         # Setup
-        mock_api_provider.post.side_effect = requests.HTTPError("API Error")
+        mock_api_provider.post.side_effect = RoExApiError("API Error", status_code=400)
         
         controller = MixController(mock_api_provider)
         tracks = [
@@ -151,8 +152,11 @@ class TestCreateMixPreview:
         )
         
         # Execute & Assert
-        with pytest.raises(Exception, match="Failed to create mix preview"):
+        with pytest.raises(RoExApiError) as exc_info:
             controller.create_mix_preview(request)
+        
+        assert exc_info.value.status_code == 400
+        mock_api_provider.post.assert_called_once()
 
 
 @pytest.mark.unit
@@ -178,7 +182,7 @@ class TestRetrievePreviewMix:
         assert result.download_url_preview_mixed == "https://example.com/preview.wav"
         assert result.status == "MIX_TASK_PREVIEW_COMPLETED"
     
-    @patch('roex_python.controllers.mix_controller.time.sleep')
+    @patch('roex_python.polling.time.sleep')
     def test_polling_until_ready(self, mock_sleep, mock_api_provider):
         """Test polling until preview is ready"""
         mock_api_provider.post.side_effect = [
@@ -199,7 +203,7 @@ class TestRetrievePreviewMix:
         assert result.download_url_preview_mixed == "https://example.com/preview.wav"
         assert mock_api_provider.post.call_count == 3
     
-    @patch('roex_python.controllers.mix_controller.time.sleep')
+    @patch('roex_python.polling.time.sleep')
     def test_polling_timeout(self, mock_sleep, mock_api_provider):
         """Test polling timeout after max attempts"""
         # Setup - first call raises error (tries initial), then returns pending for polling attempts
@@ -216,8 +220,24 @@ class TestRetrievePreviewMix:
         with pytest.raises(Exception, match="did not complete after polling"):
             controller.retrieve_preview_mix("mix_task_123", max_attempts=3, poll_interval=0.1)
         
-        # Should have tried: 1 initial (fails) + 3 polling attempts = 4 total
-        assert mock_api_provider.post.call_count == 4
+        # The first poll is the initial request, so max_attempts bounds the total
+        assert mock_api_provider.post.call_count == 3
+    
+    @patch('roex_python.polling.time.sleep')
+    def test_failed_task_stops_polling(self, mock_sleep, mock_api_provider):
+        """Test that a failed mix status ends polling immediately"""
+        # Setup
+        mock_api_provider.post.return_value = {"status": "MIX_TASK_PREVIEW_FAILED"}
+        
+        controller = MixController(mock_api_provider)
+        
+        # Execute & Assert
+        with pytest.raises(RoExTaskError) as exc_info:
+            controller.retrieve_preview_mix("mix_task_123")
+        
+        assert exc_info.value.task_id == "mix_task_123"
+        mock_api_provider.post.assert_called_once()
+        mock_sleep.assert_not_called()
     
     def test_with_fx_settings(self, mock_api_provider):
         """Test retrieving preview with FX settings"""
@@ -240,6 +260,31 @@ class TestRetrievePreviewMix:
         assert payload["multitrackData"]["retrieveFXSettings"] is True
 
 
+@pytest.mark.unit
+class TestSubmitPreview:
+    """Test submit_preview method"""
+    
+    def test_submit_preview_watches_task(self, mock_api_provider, sample_track_data, mock_poll_scheduler):
+        """Test that submit_preview creates the task and hands polling to the scheduler"""
+        # Setup
+        mock_api_provider.post.return_value = {"multitrack_task_id": "mix_task_123"}
+        scheduler = mock_poll_scheduler
+        controller = MixController(mock_api_provider, poll_scheduler=scheduler)
+        request = MultitrackMixRequest(track_data=sample_track_data, musical_style=MusicalStyle.POP)
+        
+        # Execute
+        handle = controller.submit_preview(request, retrieve_fx_settings=True)
+        
+        # Assert
+        assert handle is scheduler.watch.return_value
+        mock_api_provider.post.assert_called_once()
+        args, kwargs = scheduler.watch.call_args
+        assert args[0] == "/retrievepreviewmix"
+        assert args[1]["multitrackData"] == {"multitrackTaskId": "mix_task_123", "retrieveFXSettings": True}
+        assert kwargs["task_id"] == "mix_task_123"
+        assert kwargs["is_failed"] is not None
+
+
 @pytest.mark.unit
 class TestRetrieveFinalMix:
     """Test retrieve_final_mix method"""
@@ -307,7 +352,7 @@ class TestRetrieveFinalMix:
     def test_http_error(self, mock_api_provider):
         """Test error handling"""
         # Setup
-        mock_api_provider.post.side_effect = requests.HTTPError("API Error")
+        mock_api_provider.post.side_effect = RoExApiError("API Error", status_code=400)
         
         controller = MixController(mock_api_provider)
         
@@ -317,8 +362,11 @@ class TestRetrieveFinalMix:
         )
         
         # Execute & Assert
-        with pytest.raises(Exception, match="Failed to retrieve final mix"):
+        with pytest.raises(RoExApiError) as exc_info:
             controller.retrieve_final_mix(request)
+        
+        assert exc_info.value.status_code == 400
+        mock_api_provider.post.assert_called_once()
 
 
 @pytest.mark.unit
@@ -826,7 +874,7 @@ class TestRetrieveFinalMixAdvanced:
     def test_advanced_final_mix_http_error(self, mock_api_provider):
         """Test error handling for advanced final mix"""
         # Setup
-        mock_api_provider.post.side_effect = requests.HTTPError("API Error")
+        mock_api_provider.post.side_effect = RoExApiError("API Error", status_code=400)
         
         controller = MixController(mock_api_provider)
         
@@ -841,5 +889,8 @@ class TestRetrieveFinalMixAdvanced:
         )
         
         # Execute & Assert
-        with pytest.raises(Exception, match="Failed to retrieve advanced final mix"):
+        with pytest.raises(RoExApiError) as exc_info:
             controller.retrieve_final_mix_advanced(request)
+        
+        assert exc_info.value.status_code == 400
+        mock_api_provider.post.assert_called_once()
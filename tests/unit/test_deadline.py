@@ -0,0 +1,59 @@
+"""
+Unit tests for Deadline
+"""
+
+import pytest
+from unittest.mock import patch
+from roex_python.deadline import Deadline
+from roex_python.exceptions import RoExTimeoutError
+
+
+@pytest.mark.unit
+class TestDeadline:
+    """Test deadline bookkeeping"""
+    
+    def test_no_deadline_never_expires(self):
+        """Test that a deadline without a timeout leaves values unchanged"""
+        deadline = Deadline(None)
+        
+        assert deadline.remaining() is None
+        assert not deadline.expired
+        assert deadline.cap(30) == 30
+        assert deadline.request_timeout((10.0, 120.0), "GET /health") == (10.0, 120.0)
+    
+    @patch('roex_python.deadline.time.monotonic')
+    def test_caps_sleeps_and_request_timeouts(self, mock_monotonic):
+        """Test that waits and request timeouts are shortened to the time remaining"""
+        mock_monotonic.return_value = 100.0
+        deadline = Deadline(30)
+        mock_monotonic.return_value = 125.0
+        
+        assert deadline.remaining() == 5.0
+        assert deadline.cap(10) == 5.0
+        assert deadline.request_timeout((10.0, 120.0), "POST /retrievepreviewmaster") == (5.0, 5.0)
+    
+    @patch('roex_python.deadline.time.monotonic')
+    def test_expired_deadline_raises(self, mock_monotonic):
+        """Test that check raises RoExTimeoutError once the deadline has passed"""
+        mock_monotonic.return_value = 100.0
+        deadline = Deadline(30)
+        mock_monotonic.return_value = 131.0
+        
+        assert deadline.expired
+        with pytest.raises(RoExTimeoutError, match="within 30 seconds") as exc_info:
+            deadline.check("Preview master task task_123")
+        assert exc_info.value.timeout == 30
+        assert isinstance(exc_info.value, TimeoutError)
+    
+    def test_coerce(self):
+        """Test that coerce accepts seconds or an existing deadline"""
+        deadline = Deadline(10)
+        
+        assert Deadline.coerce(deadline) is deadline
+        assert Deadline.coerce(5).timeout == 5
+        assert Deadline.coerce(None).remaining() is None
+    
+    def test_negative_timeout_raises_error(self):
+        """Test that negative timeouts are rejected"""
+        with pytest.raises(ValueError):
+            Deadline(-1)
@@ -0,0 +1,108 @@
+"""
+Unit tests for concurrent result downloads
+"""
+
+import os
+import threading
+import pytest
+from unittest.mock import Mock
+from roex_python.client import RoExClient
+from roex_python.downloads import download_all, result_urls
+from roex_python.models import EnhancedTrackResult, FinalMixResult, PreviewMasterResult
+from roex_python.providers.api_provider import ApiProvider
+
+
+@pytest.fixture
+def provider():
+    """Returns a mock provider that writes the URL's last segment as the file body"""
+    provider = Mock(spec=ApiProvider)
+
+    def download_to_file(url, path, segments=1):
+        if "broken" in url:
+            raise ConnectionError("reset")
+        body = url.rsplit("/", 1)[-1].encode()
+        with open(path, "wb") as f:
+            f.write(body)
+        return len(body)
+
+    provider.download_to_file.side_effect = download_to_file
+    return provider
+
+
+@pytest.mark.unit
+class TestResultUrls:
+    """Test collecting URLs from results"""
+
+    def test_final_mix_with_stems(self):
+        """Test that the mix and each stem are named"""
+        result = FinalMixResult(download_url_mixed="https://example.com/mix.wav",
+                                stems={"vocal": "https://example.com/vocal.wav", "bass": None})
+
+        assert result_urls(result) == {"mix": "https://example.com/mix.wav", "vocal": "https://example.com/vocal.wav"}
+
+    def test_enhanced_track(self):
+        """Test that both enhanced outputs and the stems are collected"""
+        result = EnhancedTrackResult(download_url_preview_revived="https://example.com/p.mp3",
+                                     download_url_revived="https://example.com/full.wav",
+                                     stems={"drums": "https://example.com/drums.wav"})
+
+        assert set(result_urls(result)) == {"enhanced", "enhanced_preview", "drums"}
+
+    def test_unsupported_result(self):
+        """Test that objects without URLs are rejected"""
+        with pytest.raises(TypeError):
+            result_urls(object())
+
+
+@pytest.mark.unit
+class TestDownloadAll:
+    """Test concurrent downloads"""
+
+    def test_downloads_every_output(self, provider, tmp_path):
+        """Test that files are saved by name with their URL's extension"""
+        result = EnhancedTrackResult(download_url_preview_revived="https://example.com/p.mp3",
+                                     download_url_revived="https://example.com/full.wav",
+                                     stems={"vocal": "https://example.com/v.flac?sig=1"})
+
+        batch = download_all(provider, result, str(tmp_path))
+
+        assert batch.ok
+        assert batch.paths == {
+            "enhanced": os.path.join(str(tmp_path), "enhanced.wav"),
+            "enhanced_preview": os.path.join(str(tmp_path), "enhanced_preview.mp3"),
+            "vocal": os.path.join(str(tmp_path), "vocal.flac"),
+        }
+        assert batch.files["enhanced"].bytes_downloaded == len(b"full.wav")
+        assert batch.total_bytes == sum(os.path.getsize(p) for p in batch.paths.values())
+
+    def test_downloads_run_concurrently(self, provider, tmp_path):
+        """Test that downloads overlap"""
+        barrier = threading.Barrier(3, timeout=5)
+        provider.download_to_file.side_effect = lambda url, path, segments: barrier.wait() or 1
+
+        batch = download_all(provider, {"a": "https://x/a.wav", "b": "https://x/b.wav", "c": "https://x/c.wav"},
+                             str(tmp_path), max_workers=3)
+
+        assert batch.ok
+
+    def test_per_file_errors(self, provider, tmp_path):
+        """Test that one failed file does not stop the others"""
+        batch = download_all(provider, {"mix": "https://x/mix.wav", "bass": "https://x/broken.wav",
+                                        "../../etc": "https://x/weird.wav"}, str(tmp_path))
+
+        assert not batch.ok
+        assert [f.name for f in batch.failed] == ["bass"]
+        assert "reset" in batch.files["bass"].error
+        # Names are sanitised so files stay inside output_dir
+        assert os.path.dirname(batch.paths["../../etc"]) == str(tmp_path)
+
+    def test_client_shortcut(self, tmp_path):
+        """Test that RoExClient.download_all uses the client's provider"""
+        client = RoExClient(api_key="test_key")
+        client.api_provider.download_to_file = Mock(return_value=3)
+
+        batch = client.download_all(PreviewMasterResult(download_url_mastered_preview="https://x/m.wav"),
+                                    str(tmp_path))
+
+        assert batch.paths == {"master_preview": os.path.join(str(tmp_path), "master_preview.wav")}
+        client.close()
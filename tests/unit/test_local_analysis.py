@@ -0,0 +1,173 @@
+"""
+Unit tests for local loudness, true-peak and tonal analysis
+"""
+
+import wave
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from roex_python.local_analysis import analyze_local, analyze_local_files, k_weighting_sos  # noqa: E402
+from roex_python.models.analysis import TONAL_BANDS  # noqa: E402
+
+
+def write_wav(path, samples, sample_rate=48000):
+    """Write float samples shaped (frames,) or (frames, channels) as a 32-bit PCM WAV"""
+    samples = np.asarray(samples, dtype=np.float64)
+    if samples.ndim == 1:
+        samples = samples[:, np.newaxis]
+    pcm = np.clip(np.round(samples * 2 ** 31), -2 ** 31, 2 ** 31 - 1).astype("<i4")
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(samples.shape[1])
+        wav.setsampwidth(4)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return str(path)
+
+
+def sine(frequency, seconds=5.0, amplitude=1.0, phase=0.0, sample_rate=48000):
+    """A sine tone"""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return amplitude * np.sin(2 * np.pi * frequency * t + phase)
+
+
+@pytest.mark.unit
+class TestKWeighting:
+    """Test the K-weighting filter"""
+
+    def test_matches_bs1770_coefficients_at_48k(self):
+        """Test the coefficients tabulated in BS.1770 are reproduced at 48 kHz"""
+        sos = k_weighting_sos(48000)
+
+        np.testing.assert_allclose(sos[0], [1.53512485958697, -2.69169618940638, 1.19839281085285,
+                                            1.0, -1.69065929318241, 0.73248077421585], atol=1e-9)
+        np.testing.assert_allclose(sos[1], [1.0, -2.0, 1.0, 1.0, -1.99004745483398, 0.99007225036621], atol=1e-9)
+
+
+@pytest.mark.unit
+class TestAnalyzeLocal:
+    """Test single-file analysis"""
+
+    def test_full_scale_sine_loudness(self, tmp_path):
+        """Test a 997 Hz sine at full scale measures -3.01 LUFS, as in the BS.1770 reference"""
+        path = write_wav(tmp_path / "tone.wav", sine(997, amplitude=0.999))
+
+        result = analyze_local(path)
+
+        assert result.integrated_loudness_lufs == pytest.approx(-3.01 + 20 * np.log10(0.999), abs=0.02)
+        assert result.sample_rate == 48000 and result.channels == 1 and result.duration_seconds == 5.0
+
+    def test_stereo_sums_channels(self, tmp_path):
+        """Test identical stereo channels measure 3 LU louder than one"""
+        tone = sine(997, amplitude=0.1)
+        mono = analyze_local(write_wav(tmp_path / "mono.wav", tone))
+        stereo = analyze_local(write_wav(tmp_path / "stereo.wav", np.stack([tone, tone], axis=1)))
+
+        assert mono.integrated_loudness_lufs == pytest.approx(-23.01, abs=0.02)
+        assert stereo.integrated_loudness_lufs == pytest.approx(-20.0, abs=0.02)
+
+    def test_relative_gate_ignores_quiet_passages(self, tmp_path):
+        """Test a passage 20 dB down is gated out of the integrated loudness"""
+        loud = sine(997, seconds=4.0, amplitude=0.1)
+        quiet = sine(997, seconds=4.0, amplitude=0.01)
+        path = write_wav(tmp_path / "dynamic.wav", np.concatenate([loud, quiet]))
+
+        result = analyze_local(path)
+
+        # Ungated, the average would be -25.7 LUFS; only the blocks straddling the change pull it down
+        assert result.integrated_loudness_lufs == pytest.approx(-23.01, abs=0.25)
+
+    def test_true_peak_between_samples(self, tmp_path):
+        """Test a fs/4 sine sampled 45 degrees off its peaks has a true peak 3 dB above its sample peak"""
+        path = write_wav(tmp_path / "intersample.wav", sine(12000, amplitude=0.99, phase=np.pi / 4))
+
+        result = analyze_local(path)
+
+        assert result.sample_peak_dbfs == pytest.approx(20 * np.log10(0.99) - 3.01, abs=0.05)
+        assert result.true_peak_dbtp == pytest.approx(20 * np.log10(0.99), abs=0.3)
+        assert result.clipped_samples == 0
+
+    def test_counts_clipped_samples(self, tmp_path):
+        """Test samples at full scale are counted as clipped"""
+        samples = np.zeros(48000)
+        samples[[100, 200, 300]] = [1.0, -1.0, 0.5]
+        path = write_wav(tmp_path / "clipped.wav", samples)
+
+        result = analyze_local(path)
+
+        assert result.clipped_samples == 2
+        assert result.sample_peak_dbfs == pytest.approx(0.0, abs=1e-6)
+
+    def test_tonal_levels(self, tmp_path):
+        """Test a low tone puts its energy in the bass band and a high tone in the high band"""
+        low = analyze_local(write_wav(tmp_path / "low.wav", sine(100, amplitude=0.5)))
+        high = analyze_local(write_wav(tmp_path / "high.wav", sine(10000, amplitude=0.5)))
+
+        assert set(low.tonal_levels_db) == set(TONAL_BANDS)
+        assert max(low.tonal_levels_db, key=low.tonal_levels_db.get) == "bass_frequency"
+        assert max(high.tonal_levels_db, key=high.tonal_levels_db.get) == "high_frequency"
+        assert low.tonal_levels_db["bass_frequency"] == pytest.approx(0.0, abs=0.1)
+
+    def test_independent_of_block_size(self, tmp_path):
+        """Test measurements do not depend on how the file is split into blocks"""
+        rng = np.random.default_rng(0)
+        path = write_wav(tmp_path / "noise.wav", rng.uniform(-0.5, 0.5, size=(48000 * 3, 2)))
+
+        whole = analyze_local(path, block_frames=1 << 20)
+        pieces = analyze_local(path, block_frames=1001)
+
+        assert pieces.integrated_loudness_lufs == pytest.approx(whole.integrated_loudness_lufs, abs=1e-9)
+        assert pieces.true_peak_dbtp == pytest.approx(whole.true_peak_dbtp, abs=1e-9)
+        assert pieces.clipped_samples == whole.clipped_samples
+
+    def test_silence(self, tmp_path):
+        """Test digital silence has no integrated loudness and -inf peaks"""
+        result = analyze_local(write_wav(tmp_path / "silence.wav", np.zeros(48000)))
+
+        assert result.integrated_loudness_lufs is None
+        assert result.true_peak_dbtp == float("-inf")
+        assert result.tonal_levels_db == {}
+        assert not result.within_spec()
+
+
+@pytest.mark.unit
+class TestTriage:
+    """Test spec checks, payload conversion and batch analysis"""
+
+    def test_within_spec(self, tmp_path):
+        """Test a file near the target passes and one far from it does not"""
+        result = analyze_local(write_wav(tmp_path / "tone.wav", sine(997, amplitude=0.1)))
+
+        assert result.within_spec(target_lufs=-23.0, tolerance=0.5)
+        assert not result.within_spec(target_lufs=-14.0)
+        assert not result.within_spec(target_lufs=-23.0, max_true_peak=-30.0)
+
+    def test_to_analysis_result(self, tmp_path):
+        """Test the measurements map onto AnalysisResult payload keys"""
+        result = analyze_local(write_wav(tmp_path / "tone.wav", sine(997, amplitude=0.1)))
+
+        analysis = result.to_analysis_result()
+
+        assert not analysis.error
+        assert analysis.payload["integrated_loudness_lufs"] == result.integrated_loudness_lufs
+        assert analysis.payload["peak_loudness_dbfs"] == result.true_peak_dbtp
+        assert analysis.payload["clipping"] == "NO"
+        assert "tonal_profile" not in analysis.payload
+
+    def test_analyze_local_files(self, tmp_path):
+        """Test every file is analyzed in order and a bad file is reported rather than raised"""
+        good = write_wav(tmp_path / "good.wav", sine(997, seconds=1.0, amplitude=0.1))
+        bad = tmp_path / "bad.wav"
+        bad.write_bytes(b"not audio")
+
+        results = analyze_local_files([good, str(bad), good], max_workers=2)
+
+        assert [r.path for r in results] == [good, str(bad), good]
+        assert results[0].ok and results[2].ok
+        assert not results[1].ok and results[1].integrated_loudness_lufs is None
+
+    def test_analyze_local_files_rejects_bad_workers(self):
+        """Test max_workers must be positive"""
+        with pytest.raises(ValueError):
+            analyze_local_files([], max_workers=0)
@@ -0,0 +1,179 @@
+"""
+Unit tests for the end-to-end multitrack pipeline
+"""
+
+import os
+import threading
+import pytest
+from unittest.mock import Mock, patch
+
+from roex_python import MultitrackPipeline, RoExClient
+from roex_python.downloads import result_urls
+from roex_python.exceptions import RoExApiError
+from roex_python.models import (
+    BatchDownloadResult, BatchUploadResult, DesiredLoudness, DownloadResult, FileUploadResult, FinalMixResult,
+    InstrumentGroup, MusicalStyle, PanPreference, PresenceSetting, PreviewMixResult, TrackData, TrackEffectsData
+)
+from roex_python.scheduler import TaskHandle
+
+
+def track(location, group=InstrumentGroup.DRUMS_GROUP):
+    """A track with default settings"""
+    return TrackData(location, group, PresenceSetting.NORMAL, PanPreference.CENTRE)
+
+
+def fake_upload_files(client, paths, **kwargs):
+    """Upload every path to https://storage.example.com/<name>"""
+    return BatchUploadResult(files=[
+        FileUploadResult(path=path, readable_url=f"https://storage.example.com/{os.path.basename(path)}")
+        for path in paths
+    ])
+
+
+def fake_download_all(api_provider, result, output_dir, max_workers=8):
+    """Pretend to download every URL of *result* to output_dir/<name>.wav"""
+    return BatchDownloadResult(files={
+        name: DownloadResult(name=name, url=url, path=os.path.join(output_dir, f"{name}.wav"), bytes_downloaded=10)
+        for name, url in result_urls(result).items()
+    })
+
+
+def resolved_handle(task_id="mix_1", preview_url="https://example.com/preview.wav"):
+    """A TaskHandle already resolved with a preview"""
+    handle = TaskHandle(task_id)
+    handle.set_result(PreviewMixResult(download_url_preview_mixed=preview_url))
+    return handle
+
+
+@pytest.fixture
+def client():
+    """A client whose mix controller calls are mocked"""
+    client = RoExClient(api_key="test_key")
+    client.mix.submit_preview = Mock(return_value=resolved_handle())
+    client.mix.retrieve_final_mix_advanced = Mock(return_value=FinalMixResult(
+        download_url_mixed="https://example.com/final.wav",
+        stems={"vocal": "https://example.com/vocal.wav"}
+    ))
+    yield client
+    client.close()
+
+
+@pytest.mark.unit
+class TestMultitrackPipeline:
+    """Test MultitrackPipeline.run"""
+
+    @patch("roex_python.pipeline.download_all", side_effect=fake_download_all)
+    @patch("roex_python.pipeline.upload_files", side_effect=fake_upload_files)
+    def test_runs_every_stage(self, mock_upload, mock_download, client, tmp_path):
+        """Test local stems are uploaded once, mixed, mastered and downloaded with per-stage timings"""
+        # Setup
+        tracks = [track("stems/drums.wav"), track("https://example.com/bass.wav", InstrumentGroup.BASS_GROUP),
+                  track("stems/vocals.wav", InstrumentGroup.VOCAL_GROUP)]
+        effects = {"stems/vocals.wav": TrackEffectsData(track_url="ignored", gain_db=-1.5)}
+        pipeline = client.multitrack_pipeline(MusicalStyle.POP, create_master=True,
+                                              desired_loudness=DesiredLoudness.MEDIUM, upload_workers=3)
+
+        # Execute
+        result = pipeline.run(tracks, str(tmp_path), track_effects=effects)
+
+        # Assert
+        assert result.ok, result.error
+        assert mock_upload.call_args[0][1] == ["stems/drums.wav", "stems/vocals.wav"]
+        assert mock_upload.call_args[1]["max_workers"] == 3
+        expected_urls = ["https://storage.example.com/drums.wav", "https://example.com/bass.wav",
+                         "https://storage.example.com/vocals.wav"]
+        assert result.track_urls == expected_urls
+        mix_request = client.mix.submit_preview.call_args[0][0]
+        assert [t.track_url for t in mix_request.track_data] == expected_urls
+        assert mix_request.track_data[2].instrument_group == InstrumentGroup.VOCAL_GROUP
+        final_request = client.mix.retrieve_final_mix_advanced.call_args[0][0]
+        assert final_request.multitrack_task_id == "mix_1"
+        assert final_request.create_master and final_request.desired_loudness == DesiredLoudness.MEDIUM
+        assert [(t.track_url, t.gain_db) for t in final_request.track_data] == [
+            (expected_urls[0], 0.0), (expected_urls[1], 0.0), (expected_urls[2], -1.5)]
+        assert set(result.paths) == {"preview_mix", "mix", "vocal"}
+        assert set(result.stage_seconds) == {"upload", "preview", "final_mix", "download"}
+        assert result.total_seconds >= sum(result.stage_seconds.values()) - 1e-6
+
+    @patch("roex_python.pipeline.upload_files", side_effect=fake_upload_files)
+    def test_preview_download_overlaps_final_mix(self, mock_upload, client, tmp_path):
+        """Test the preview downloads while the final mix is being requested"""
+        # Setup
+        final_started = threading.Event()
+        overlapped = []
+
+        def download(api_provider, result, output_dir, max_workers=8):
+            if isinstance(result, dict) and "preview_mix" in result:
+                overlapped.append(final_started.wait(5))
+            return fake_download_all(api_provider, result, output_dir)
+
+        def final_mix(request):
+            final_started.set()
+            return FinalMixResult(download_url_mixed="https://example.com/final.wav")
+
+        client.mix.retrieve_final_mix_advanced.side_effect = final_mix
+        pipeline = MultitrackPipeline(client, MusicalStyle.POP)
+
+        # Execute
+        with patch("roex_python.pipeline.download_all", side_effect=download):
+            result = pipeline.run([track("stems/drums.wav"), track("stems/bass.wav")], str(tmp_path))
+
+        # Assert
+        assert result.ok
+        assert overlapped == [True]
+
+    @patch("roex_python.pipeline.upload_files")
+    def test_upload_failure_stops_pipeline(self, mock_upload, client, tmp_path):
+        """Test a stem that fails to upload stops the pipeline before the mix is submitted"""
+        mock_upload.return_value = BatchUploadResult(files=[
+            FileUploadResult(path="stems/drums.wav", readable_url="https://storage.example.com/drums.wav"),
+            FileUploadResult(path="stems/vocals.wav", error="Upload failed: 403")
+        ])
+        pipeline = MultitrackPipeline(client, MusicalStyle.POP)
+
+        result = pipeline.run([track("stems/drums.wav"), track("stems/vocals.wav")], str(tmp_path))
+
+        assert not result.ok
+        assert result.failed_stage == "upload"
+        assert "stems/vocals.wav: Upload failed: 403" in result.error
+        client.mix.submit_preview.assert_not_called()
+
+    @patch("roex_python.pipeline.upload_files", side_effect=fake_upload_files)
+    def test_preview_timeout(self, mock_upload, client, tmp_path):
+        """Test a preview that is not ready in time fails the preview stage and stops polling"""
+        handle = TaskHandle("mix_slow")
+        client.mix.submit_preview.return_value = handle
+        pipeline = MultitrackPipeline(client, MusicalStyle.POP, preview_timeout=0.01)
+
+        result = pipeline.run([track("stems/drums.wav"), track("stems/bass.wav")], str(tmp_path))
+
+        assert result.failed_stage == "preview"
+        assert result.task_id == "mix_slow"
+        assert "not ready" in result.error
+        assert handle.cancelled()
+        client.mix.retrieve_final_mix_advanced.assert_not_called()
+
+    @patch("roex_python.pipeline.download_all", side_effect=fake_download_all)
+    def test_final_mix_failure_keeps_preview(self, mock_download, client, tmp_path):
+        """Test the preview download is still reported when the final mix fails"""
+        client.mix.retrieve_final_mix_advanced.side_effect = RoExApiError("bad request", status_code=400)
+        pipeline = MultitrackPipeline(client, MusicalStyle.POP)
+
+        result = pipeline.run([track("https://example.com/drums.wav"), track("https://example.com/bass.wav")],
+                              str(tmp_path))
+
+        assert result.failed_stage == "final_mix"
+        assert "bad request" in result.error
+        assert result.uploads is None and "upload" not in result.stage_seconds
+        assert set(result.paths) == {"preview_mix"}
+
+    @patch("roex_python.pipeline.upload_files", side_effect=fake_upload_files)
+    def test_invalid_arguments(self, mock_upload, client, tmp_path):
+        """Test track counts outside the API limits are rejected before uploading, as are bad worker counts"""
+        with pytest.raises(ValueError):
+            MultitrackPipeline(client, MusicalStyle.POP).run([track("stems/drums.wav")], str(tmp_path))
+        mock_upload.assert_not_called()
+        with pytest.raises(ValueError):
+            MultitrackPipeline(client, MusicalStyle.POP, upload_workers=0)
+        with pytest.raises(ValueError):
+            MultitrackPipeline(client, MusicalStyle.POP, download_workers=0)
@@ -0,0 +1,156 @@
+"""
+Unit tests for PollPolicy and TaskPoller
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from roex_python.exceptions import RoExApiError, RoExTaskError, RoExTimeoutError
+from roex_python.polling import PollPolicy, TaskPoller, reports_failure
+
+
+def check_done(response):
+    """Return the URL once the fake task reports done"""
+    return response.get("url") if response.get("done") else None
+
+
+@pytest.mark.unit
+class TestPollPolicy:
+    """Test backoff curves"""
+
+    def test_geometric_backoff_is_capped(self):
+        """Test that waits grow geometrically up to max_delay"""
+        policy = PollPolicy(first_delay=1, backoff=2, max_delay=5, jitter=0)
+
+        assert [policy.delay(n) for n in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    def test_jitter_stays_within_fraction(self):
+        """Test that jitter randomises waits within +/- the configured fraction"""
+        policy = PollPolicy(first_delay=10, max_delay=10, jitter=0.2)
+
+        delays = [policy.delay(1) for _ in range(50)]
+
+        assert all(8 <= d <= 12 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_fixed_policy(self):
+        """Test that a fixed policy always waits the same interval"""
+        policy = PollPolicy.fixed(5, max_attempts=3)
+
+        assert [policy.delay(n) for n in range(1, 4)] == [5, 5, 5]
+        assert policy.max_attempts == 3
+
+    def test_resolve_overrides(self):
+        """Test that explicit method arguments override the policy"""
+        custom = PollPolicy(first_delay=0.5, max_attempts=10)
+
+        assert PollPolicy.resolve(None) == PollPolicy()
+        assert PollPolicy.resolve(custom, timeout=60) == PollPolicy(first_delay=0.5, max_attempts=10, timeout=60)
+        assert PollPolicy.resolve(custom, max_attempts=3, poll_interval=2) == PollPolicy.fixed(2, max_attempts=3)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"backoff": 0.5},
+        {"jitter": 1.5},
+        {"first_delay": 30, "max_delay": 10},
+        {"max_attempts": 0},
+        {"max_attempts": None, "timeout": None},
+    ])
+    def test_invalid_policy_raises_error(self, kwargs):
+        """Test that invalid policies are rejected"""
+        with pytest.raises(ValueError):
+            PollPolicy(**kwargs)
+
+
+@pytest.mark.unit
+class TestTaskPoller:
+    """Test the shared polling loop"""
+
+    @patch('roex_python.polling.time.sleep')
+    def test_first_poll_is_immediate(self, mock_sleep):
+        """Test that a finished task is returned without sleeping"""
+        request = Mock(return_value={"done": True, "url": "https://example.com/a.wav"})
+
+        result = TaskPoller().poll(request, "/retrieve", {"id": 1}, check_done, task_id="t1")
+
+        assert result == "https://example.com/a.wav"
+        request.assert_called_once()
+        assert request.call_args.args == ("/retrieve", {"id": 1})
+        assert "deadline" in request.call_args.kwargs
+        mock_sleep.assert_not_called()
+
+    @patch('roex_python.polling.time.sleep')
+    def test_polls_with_backoff_until_done(self, mock_sleep):
+        """Test that pending polls sleep along the policy's curve"""
+        request = Mock(side_effect=[{"done": False}, {"done": False}, {"done": True, "url": "u"}])
+        policy = PollPolicy(first_delay=1, backoff=3, max_delay=10, jitter=0)
+
+        result = TaskPoller(policy).poll(request, "/retrieve", {}, check_done, task_id="t1")
+
+        assert result == "u"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 3]
+
+    @patch('roex_python.polling.time.sleep')
+    def test_gives_up_after_max_attempts(self, mock_sleep):
+        """Test that RoExTimeoutError is raised without a trailing sleep"""
+        request = Mock(return_value={"done": False})
+
+        with pytest.raises(RoExTimeoutError, match="did not complete after polling 3 times"):
+            TaskPoller(PollPolicy(max_attempts=3)).poll(request, "/retrieve", {}, check_done, task_id="t1")
+
+        assert request.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch('roex_python.polling.time.sleep')
+    def test_failed_status_exits_early(self, mock_sleep):
+        """Test that a task reported as failed stops polling"""
+        request = Mock(return_value={"status": "TASK_FAILED"})
+
+        with pytest.raises(RoExTaskError) as exc_info:
+            TaskPoller().poll(request, "/retrieve", {}, check_done, task_id="t1",
+                              is_failed=lambda r: r.get("status") == "TASK_FAILED")
+
+        assert exc_info.value.task_id == "t1"
+        assert exc_info.value.status == "TASK_FAILED"
+        request.assert_called_once()
+
+    def test_reports_failure(self):
+        """Test failed statuses are recognised at the top level and in the results section"""
+        assert reports_failure({"status": "MIX_TASK_PREVIEW_FAILED"}, "previewMixTaskResults")
+        assert reports_failure({"previewMasterTaskResults": {"status": "failed"}}, "previewMasterTaskResults")
+        assert not reports_failure({"status": 202, "previewMasterTaskResults": None}, "previewMasterTaskResults")
+        assert not reports_failure({"status": "MIX_TASK_PREVIEW_COMPLETED"}, "previewMixTaskResults")
+        assert not reports_failure(None, "previewMixTaskResults")
+
+    @patch('roex_python.polling.time.sleep')
+    def test_transient_and_not_found_errors_are_polled_past(self, mock_sleep):
+        """Test that 5xx and 404 responses do not end polling"""
+        request = Mock(side_effect=[
+            RoExApiError("busy", status_code=503),
+            RoExApiError("not yet visible", status_code=404),
+            {"done": True, "url": "u"},
+        ])
+
+        assert TaskPoller().poll(request, "/retrieve", {}, check_done, task_id="t1") == "u"
+        assert request.call_count == 3
+
+    @patch('roex_python.polling.time.sleep')
+    def test_auth_error_fails_fast(self, mock_sleep):
+        """Test that a 401 is raised immediately"""
+        request = Mock(side_effect=RoExApiError("bad key", status_code=401))
+
+        with pytest.raises(RoExApiError):
+            TaskPoller().poll(request, "/retrieve", {}, check_done, task_id="t1")
+
+        request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_async_poll(self):
+        """Test that apoll awaits the request and sleeps with asyncio.sleep"""
+        request = AsyncMock(side_effect=[{"done": False}, {"done": True, "url": "u"}])
+        policy = PollPolicy(first_delay=1, jitter=0)
+
+        with patch('roex_python.polling.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            result = asyncio.run(TaskPoller(policy).apoll(request, "/retrieve", {}, check_done, task_id="t1"))
+
+        assert result == "u"
+        mock_sleep.assert_awaited_once_with(1)
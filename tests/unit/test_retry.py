@@ -0,0 +1,234 @@
+"""
+Unit tests for retry classification and RetryPolicy
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+import requests
+from roex_python.deadline import Deadline
+from roex_python.exceptions import RoExApiError
+from roex_python.providers.retry import (
+    EndpointRetry,
+    RetryBudget,
+    RetryPolicy,
+    is_retryable_error,
+    parse_retry_after
+)
+
+
+def failing_then(result, failures):
+    """Build a request function that raises each of *failures* before returning *result*"""
+    return Mock(side_effect=list(failures) + [result])
+
+
+@pytest.mark.unit
+class TestRetryClassification:
+    """Test which errors are considered transient"""
+    
+    @pytest.mark.parametrize("status_code,expected", [
+        (400, False), (401, False), (403, False), (404, False),
+        (429, True), (500, True), (502, True), (503, True),
+    ])
+    def test_api_error_classification(self, status_code, expected):
+        """Test that only 429 and 5xx responses are retried"""
+        assert is_retryable_error(RoExApiError("error", status_code=status_code)) is expected
+    
+    def test_transport_errors_are_retryable(self):
+        """Test that connection failures and timeouts are retried"""
+        assert is_retryable_error(requests.exceptions.ConnectionError("refused"))
+        assert is_retryable_error(requests.exceptions.Timeout("timed out"))
+        assert not is_retryable_error(ValueError("bad input"))
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for seconds, HTTP dates and garbage"""
+        assert parse_retry_after("12") == 12.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+@pytest.mark.unit
+class TestRetryBudget:
+    """Test the client-wide retry token bucket"""
+    
+    def test_budget_starts_full_and_drains(self):
+        """Test that each retry spends one token until the bucket is empty"""
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+        
+        assert budget.try_spend() is True
+        assert budget.try_spend() is True
+        assert budget.try_spend() is False
+    
+    def test_requests_refill_budget(self):
+        """Test that requests deposit tokens up to the cap"""
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+        budget.try_spend()
+        budget.try_spend()
+        
+        budget.record_request()
+        budget.record_request()
+        
+        assert budget.tokens == 1.0
+        for _ in range(10):
+            budget.record_request()
+        assert budget.tokens == 2.0
+    
+    def test_invalid_budget_raises_error(self):
+        """Test that a bucket that could never allow a retry is rejected"""
+        with pytest.raises(ValueError):
+            RetryBudget(max_tokens=0)
+
+
+@pytest.mark.unit
+class TestRetryPolicy:
+    """Test RetryPolicy.call and acall"""
+    
+    @patch('roex_python.providers.retry.time.sleep')
+    def test_retries_transient_errors(self, mock_sleep):
+        """Test that transient errors are retried and counted"""
+        policy = RetryPolicy(max_attempts=3)
+        fn = failing_then("ok", [RoExApiError("busy", status_code=503), requests.exceptions.ConnectionError()])
+        
+        assert policy.call("/health", fn) == "ok"
+        assert fn.call_count == 3
+        assert policy.retries_taken == 2
+        assert policy.retries_denied == 0
+    
+    @patch('roex_python.providers.retry.time.sleep')
+    def test_gives_up_after_max_attempts(self, mock_sleep):
+        """Test that the last error is re-raised once attempts are exhausted"""
+        policy = RetryPolicy(max_attempts=2)
+        fn = Mock(side_effect=RoExApiError("busy", status_code=502))
+        
+        with pytest.raises(RoExApiError):
+            policy.call("/health", fn)
+        
+        assert fn.call_count == 2
+        assert policy.retries_taken == 1
+    
+    @patch('roex_python.providers.retry.time.sleep')
+    def test_full_jitter_stays_within_backoff(self, mock_sleep):
+        """Test that jittered delays never exceed the exponential ceiling"""
+        policy = RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=3.0)
+        fn = failing_then("ok", [RoExApiError("busy", status_code=500)] * 3)
+        
+        policy.call("/health", fn)
+        
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        assert all(0 <= d <= ceiling for d, ceiling in zip(delays, [1.0, 2.0, 3.0]))
+    
+    @patch('roex_python.providers.retry.time.sleep')
+    def test_without_jitter_uses_ceiling(self, mock_sleep):
+        """Test that disabling jitter backs off deterministically"""
+        policy = RetryPolicy(max_attempts=3, base_delay=1.0, jitter=False)
+        fn = failing_then("ok", [RoExApiError("busy", status_code=500)] * 2)
+        
+        policy.call("/health", fn)
+        
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+    
+    @patch('roex_python.providers.retry.time.sleep')
+    def test_budget_denies_retries(self, mock_sleep):
+        """Test that an exhausted budget stops retries and counts the denial"""
+        policy = RetryPolicy(max_attempts=5, budget=RetryBudget(ratio=0, max_tokens=1))
+        fn = Mock(side_effect=RoExApiError("busy", status_code=503))
+        
+        with pytest.raises(RoExApiError):
+            policy.call("/health", fn)
+        
+        assert fn.call_count == 2
+        assert policy.retries_taken == 1
+        assert policy.retries_denied == 1
+    
+    @patch('roex_python.providers.retry.time.sleep')
+    def test_budget_not_charged_on_final_attempt(self, mock_sleep):
+        """Test that giving up after max_attempts does not spend a token"""
+        budget = RetryBudget(ratio=0, max_tokens=5)
+        policy = RetryPolicy(max_attempts=2, budget=budget)
+        
+        with pytest.raises(RoExApiError):
+            policy.call("/health", Mock(side_effect=RoExApiError("busy", status_code=503)))
+        
+        assert budget.tokens == 4
+        assert policy.retries_denied == 0
+    
+    @patch('roex_python.providers.retry.time.sleep')
+    def test_budget_not_charged_when_deadline_stops_retry(self, mock_sleep):
+        """Test that a retry the deadline rules out neither spends a token nor counts as taken"""
+        budget = RetryBudget(ratio=0, max_tokens=5)
+        policy = RetryPolicy(max_attempts=5, budget=budget)
+        fn = Mock(side_effect=RoExApiError("busy", status_code=503, retry_after=30))
+        
+        with pytest.raises(RoExApiError):
+            policy.call("/health", fn, deadline=Deadline(5))
+        
+        assert fn.call_count == 1
+        mock_sleep.assert_not_called()
+        assert budget.tokens == 5
+        assert policy.retries_taken == 0
+        assert policy.retries_denied == 0
+    
+    def test_deadline_check_without_upcoming_sleep(self):
+        """Test the deadline check works on tenacity < 8.3, which calls stop before wait and has no upcoming_sleep"""
+        # Setup
+        policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_retry_after=300)
+        kwargs = policy._retry_kwargs("/health", Deadline(100))
+        failed = Mock(failed=True, exception=Mock(return_value=RoExApiError("busy", status_code=503)))
+        state = SimpleNamespace(attempt_number=1, outcome=failed)
+        
+        # Execute
+        stopped = kwargs["stop"](state)
+        sleep = kwargs["wait"](state)
+        
+        # Assert
+        assert not stopped
+        assert 0 <= sleep <= 1.0
+        assert kwargs["wait"](state) == sleep
+        state.attempt_number = 2
+        failed.exception.return_value = RoExApiError("busy", status_code=503, retry_after=200)
+        assert kwargs["stop"](state)
+        assert kwargs["wait"](state) == 200.0
+        assert policy.retries_taken == 1
+    
+    @patch('roex_python.providers.retry.time.sleep')
+    def test_endpoint_overrides(self, mock_sleep):
+        """Test per-endpoint attempt limits and delays"""
+        policy = RetryPolicy(
+            max_attempts=3,
+            jitter=False,
+            endpoint_overrides={
+                "/mixpreview": EndpointRetry(max_attempts=1),
+                "/retrievepreviewmix": {"max_attempts": 5, "base_delay": 0.25, "max_delay": 0.5},
+            }
+        )
+        create = Mock(side_effect=RoExApiError("busy", status_code=503))
+        poll = failing_then({"status": 202}, [RoExApiError("busy", status_code=503)] * 4)
+        
+        with pytest.raises(RoExApiError):
+            policy.call("/mixpreview", create)
+        result = policy.call("/retrievepreviewmix", poll)
+        
+        assert create.call_count == 1
+        assert result == {"status": 202}
+        assert poll.call_count == 5
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.25, 0.5, 0.5, 0.5]
+    
+    def test_invalid_override_raises_error(self):
+        """Test that zero attempts are rejected"""
+        with pytest.raises(ValueError, match="max_attempts"):
+            RetryPolicy(endpoint_overrides={"/mixpreview": EndpointRetry(max_attempts=0)})
+    
+    def test_async_call(self):
+        """Test that acall retries coroutines with asyncio.sleep"""
+        policy = RetryPolicy(max_attempts=3)
+        fn = AsyncMock(side_effect=[RoExApiError("busy", status_code=429, retry_after=2), {"ok": True}])
+        
+        with patch('roex_python.providers.retry.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            result = asyncio.run(policy.acall("/health", fn))
+        
+        assert result == {"ok": True}
+        mock_sleep.assert_awaited_once_with(2)
+        assert policy.retries_taken == 1
@@ -0,0 +1,165 @@
+"""
+Unit tests for PollScheduler
+"""
+
+import threading
+import pytest
+from concurrent.futures import CancelledError, as_completed, wait
+from unittest.mock import Mock
+from roex_python.controllers.mastering_controller import MasteringController
+from roex_python.controllers.mix_controller import MixController
+from roex_python.exceptions import RoExApiError, RoExTaskError, RoExTimeoutError
+from roex_python.models import PreviewMasterResult, PreviewMixResult
+from roex_python.polling import PollPolicy
+from roex_python.providers.api_provider import ApiProvider
+from roex_python.scheduler import PollScheduler, TaskHandle
+
+FAST = PollPolicy(first_delay=0.01, max_delay=0.01, jitter=0, max_attempts=20, timeout=5)
+
+
+def master_done(task_id):
+    """Completed /retrievepreviewmaster response for *task_id*"""
+    return {"previewMasterTaskResults": {"download_url_mastered_preview": f"https://example.com/{task_id}.wav"}}
+
+
+def watch_master(scheduler, task_id, policy=None):
+    """Watch a mastering preview task the way MasteringController.submit does"""
+    return scheduler.watch("/retrievepreviewmaster", MasteringController._prepare_task_payload(task_id),
+                           MasteringController._check_preview_master, task_id=task_id, policy=policy)
+
+
+def watch_mix(scheduler, task_id):
+    """Watch a mix preview task the way MixController.submit_preview does"""
+    return scheduler.watch("/retrievepreviewmix", MixController._prepare_retrieve_preview_payload(task_id, True),
+                           MixController._check_preview_mix, task_id=task_id,
+                           is_failed=MixController._is_preview_mix_failed)
+
+
+@pytest.fixture
+def provider():
+    """Returns a mock provider"""
+    return Mock(spec=ApiProvider)
+
+
+@pytest.mark.unit
+class TestPollScheduler:
+    """Test background polling of many tasks"""
+
+    def test_resolves_many_tasks_with_bounded_threads(self, provider):
+        """Test that many tasks resolve without a thread per task"""
+        polls = {}
+        lock = threading.Lock()
+
+        def post(endpoint, payload, deadline=None):
+            task_id = payload["masteringData"]["masteringTaskId"]
+            with lock:
+                polls[task_id] = polls.get(task_id, 0) + 1
+                count = polls[task_id]
+            return master_done(task_id) if count >= 3 else {"status": 202}
+
+        provider.post.side_effect = post
+        threads_before = threading.active_count()
+
+        with PollScheduler(provider, policy=FAST, max_workers=2) as scheduler:
+            futures = {f"t{i}": watch_master(scheduler, f"t{i}") for i in range(50)}
+            done, not_done = wait(futures.values(), timeout=10)
+            # One dispatcher plus the worker pool, regardless of task count
+            assert threading.active_count() - threads_before <= 3
+
+        assert not not_done
+        for task_id, future in futures.items():
+            result = future.result()
+            assert isinstance(result, PreviewMasterResult)
+            assert result.download_url_mastered_preview == f"https://example.com/{task_id}.wav"
+        assert set(polls.values()) == {3}
+        assert scheduler.pending == 0
+
+    def test_preview_mix_payload_and_result(self, provider):
+        """Test that polls carry the payload and deadline and results are parsed by check"""
+        provider.post.return_value = {
+            "previewMixTaskResults": {
+                "status": "MIX_TASK_PREVIEW_COMPLETED",
+                "download_url_preview_mixed": "https://example.com/preview.wav"
+            }
+        }
+
+        with PollScheduler(provider, policy=FAST) as scheduler:
+            result = watch_mix(scheduler, "mix_1").result(timeout=5)
+
+        assert isinstance(result, PreviewMixResult)
+        endpoint, payload = provider.post.call_args.args
+        assert endpoint == "/retrievepreviewmix"
+        assert payload["multitrackData"] == {"multitrackTaskId": "mix_1", "retrieveFXSettings": True}
+        assert "deadline" in provider.post.call_args.kwargs
+
+    def test_failed_task_raises_from_future(self, provider):
+        """Test that a failed task resolves its future with RoExTaskError"""
+        provider.post.return_value = {"status": "MIX_TASK_PREVIEW_FAILED"}
+
+        with PollScheduler(provider, policy=FAST) as scheduler:
+            future = watch_mix(scheduler, "mix_1")
+            with pytest.raises(RoExTaskError):
+                future.result(timeout=5)
+
+        provider.post.assert_called_once()
+
+    def test_auth_error_fails_fast_and_transient_errors_retry(self, provider):
+        """Test that 401 ends polling while 503 is polled past"""
+        provider.post.side_effect = [RoExApiError("busy", status_code=503),
+                                     RoExApiError("bad key", status_code=401)]
+
+        with PollScheduler(provider, policy=FAST) as scheduler:
+            future = watch_master(scheduler, "m1")
+            with pytest.raises(RoExApiError) as exc_info:
+                future.result(timeout=5)
+
+        assert exc_info.value.status_code == 401
+        assert provider.post.call_count == 2
+
+    def test_gives_up_after_max_attempts(self, provider):
+        """Test that exhausting max_attempts raises RoExTimeoutError"""
+        provider.post.return_value = {"status": 202}
+        policy = PollPolicy(first_delay=0.01, max_delay=0.01, jitter=0, max_attempts=3)
+
+        with PollScheduler(provider) as scheduler:
+            future = watch_master(scheduler, "m1", policy=policy)
+            with pytest.raises(RoExTimeoutError, match="after polling 3 times"):
+                future.result(timeout=5)
+
+        assert provider.post.call_count == 3
+
+    def test_close_cancels_outstanding_tasks(self, provider):
+        """Test that closing the scheduler cancels tasks that have not resolved"""
+        provider.post.return_value = {"status": 202}
+        slow = PollPolicy(first_delay=60, max_delay=60, max_attempts=5)
+        scheduler = PollScheduler(provider, policy=slow)
+        future = watch_master(scheduler, "m1")
+
+        scheduler.close()
+
+        with pytest.raises(CancelledError):
+            future.result(timeout=5)
+        with pytest.raises(RuntimeError):
+            watch_master(scheduler, "m2")
+
+    def test_handles_support_as_completed_and_callbacks(self, provider):
+        """Test that TaskHandle works with as_completed and done callbacks"""
+        provider.post.side_effect = lambda endpoint, payload, deadline=None: master_done(
+            payload["masteringData"]["masteringTaskId"])
+        finished = []
+
+        with PollScheduler(provider, policy=FAST) as scheduler:
+            handles = [watch_master(scheduler, f"t{i}") for i in range(3)]
+            for handle in handles:
+                handle.add_done_callback(lambda h: finished.append(h.task_id))
+            completed = {h.task_id for h in as_completed(handles, timeout=5)}
+
+        assert all(isinstance(h, TaskHandle) for h in handles)
+        assert completed == {"t0", "t1", "t2"}
+        assert sorted(finished) == ["t0", "t1", "t2"]
+        assert "t0" in repr(handles[0])
+
+    def test_invalid_max_workers(self, provider):
+        """Test that max_workers must be positive"""
+        with pytest.raises(ValueError):
+            PollScheduler(provider, max_workers=0)
@@ -0,0 +1,84 @@
+"""
+Unit tests for the SQLite TTL/LRU store behind the on-disk caches
+"""
+
+import sqlite3
+from contextlib import closing
+import pytest
+from roex_python.sqlite_store import SqliteStore
+
+COLUMNS = {"value": "TEXT NOT NULL", "size": "INTEGER NOT NULL"}
+
+
+def make_store(tmp_path, ttl=None, max_entries=None, **kwargs):
+    """Build a store in a nested temporary directory"""
+    return SqliteStore(str(tmp_path / "nested" / "store.sqlite3"), "entries", COLUMNS, ttl, max_entries, **kwargs)
+
+
+def journal_mode(store):
+    """The journal mode a fresh connection to *store*'s file sees"""
+    with closing(sqlite3.connect(store.path)) as conn:
+        return conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+
+@pytest.mark.unit
+class TestSqliteStore:
+    """Test row storage, expiry and eviction"""
+
+    def test_round_trip(self, tmp_path):
+        """Test a row is returned with its creation time and requested columns"""
+        store = make_store(tmp_path)
+
+        store.put("k", ("a", 10), 100.0)
+
+        assert store.get("k", ("value", "size"), 150.0) == (100.0, "a", 10)
+        assert store.get("k", ("size",), 150.0) == (100.0, 10)
+        assert store.get("missing", ("value",), 150.0) is None
+        assert len(store) == 1
+
+    def test_expired_rows_are_removed(self, tmp_path):
+        """Test a row older than ttl misses and is deleted"""
+        store = make_store(tmp_path, ttl=60)
+        store.put("k", ("a", 10), 100.0)
+
+        assert store.get("k", ("value",), 161.0) is None
+        assert len(store) == 0
+
+    def test_least_recently_used_rows_are_evicted(self, tmp_path):
+        """Test rows beyond max_entries are evicted by last use, not creation"""
+        store = make_store(tmp_path, max_entries=2)
+        store.put("a", ("a", 1), 1.0)
+        store.put("b", ("b", 1), 2.0)
+        store.get("a", ("value",), 3.0)
+
+        store.put("c", ("c", 1), 4.0)
+
+        assert store.get("b", ("value",), 5.0) is None
+        assert store.get("a", ("value",), 5.0) is not None
+        assert store.get("c", ("value",), 5.0) is not None
+
+    def test_evict_and_clear(self, tmp_path):
+        """Test evict removes expired rows and clear removes everything"""
+        store = make_store(tmp_path, ttl=60)
+        store.put("old", ("a", 1), 0.0)
+        store.put("new", ("b", 1), 50.0)
+
+        assert store.evict(100.0) == 1
+        store.clear()
+        assert len(store) == 0
+
+    def test_journal_mode_defaults_to_rollback_journal(self, tmp_path):
+        """Test a store uses the rollback journal unless WAL is asked for, and switches a WAL file back"""
+        assert journal_mode(make_store(tmp_path, journal_mode="wal")) == "wal"
+
+        store = make_store(tmp_path)
+        store.put("k", ("a", 1), 1.0)
+
+        assert store.journal_mode == "DELETE"
+        assert journal_mode(store) == "delete"
+        assert not (tmp_path / "nested" / "store.sqlite3-wal").exists()
+
+    def test_invalid_journal_mode(self, tmp_path):
+        """Test journal modes other than DELETE and WAL are rejected"""
+        with pytest.raises(ValueError):
+            make_store(tmp_path, journal_mode="MEMORY")
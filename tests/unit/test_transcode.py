@@ -0,0 +1,113 @@
+"""
+Unit tests for WAV to FLAC transcoding before upload
+"""
+
+import os
+import pytest
+from unittest.mock import Mock
+from roex_python.models import UploadUrlResponse
+from roex_python.transcode import transcode_to_flac
+from roex_python.utils import upload_file, upload_files
+
+np = pytest.importorskip("numpy")
+soundfile = pytest.importorskip("soundfile")
+
+
+def write_wav(path, kind="tone", subtype="PCM_24", seconds=1.0):
+    """Write a stereo WAV of a compressible tone or incompressible noise"""
+    frames = int(44100 * seconds)
+    if kind == "tone":
+        t = np.arange(frames) / 44100
+        tone = 0.5 * np.sin(2 * np.pi * 220 * t)
+        samples = np.stack([tone, tone], axis=1)
+    else:
+        samples = np.random.default_rng(0).uniform(-1, 1, (frames, 2))
+    soundfile.write(str(path), samples, 44100, subtype=subtype)
+    return str(path)
+
+
+def make_client():
+    """Build a client mock that records uploaded names and content types"""
+    client = Mock()
+    client.uploaded = {}
+    client.upload.get_upload_url.side_effect = lambda request: UploadUrlResponse(
+        signed_url=f"https://signed.example.com/{request.filename}",
+        readable_url=f"https://example.com/{request.filename}"
+    )
+
+    def upload_to_signed_url(signed_url, data, content_type, **kwargs):
+        client.uploaded[signed_url.rsplit("/", 1)[-1]] = (len(data.read()), content_type)
+
+    client.api_provider.upload_to_signed_url.side_effect = upload_to_signed_url
+    return client
+
+
+@pytest.mark.unit
+class TestTranscodeToFlac:
+    """Test lossless transcoding and the pay-off check"""
+
+    def test_transcodes_losslessly(self, tmp_path):
+        """Test that the FLAC is smaller and decodes to the same samples"""
+        wav = write_wav(tmp_path / "tone.wav")
+
+        result = transcode_to_flac(wav, output_dir=str(tmp_path))
+
+        assert result.flac_path and result.skipped_reason is None
+        assert result.flac_bytes < result.original_bytes == os.path.getsize(wav)
+        assert result.bytes_saved == result.original_bytes - result.flac_bytes
+        original, _ = soundfile.read(wav, dtype="int32")
+        decoded, _ = soundfile.read(result.flac_path, dtype="int32")
+        np.testing.assert_array_equal(decoded, original)
+
+    def test_skips_when_saving_is_too_small(self, tmp_path):
+        """Test that incompressible audio keeps its WAV and leaves no FLAC behind"""
+        wav = write_wav(tmp_path / "noise.wav", kind="noise")
+
+        result = transcode_to_flac(wav, output_dir=str(tmp_path), min_saving=0.1)
+
+        assert result.flac_path is None and result.bytes_saved == 0
+        assert "only save" in result.skipped_reason
+        assert sorted(os.listdir(tmp_path)) == ["noise.wav"]
+
+    def test_skips_float_wav(self, tmp_path):
+        """Test that floating-point WAVs are not transcoded"""
+        wav = write_wav(tmp_path / "float.wav", subtype="FLOAT")
+
+        result = transcode_to_flac(wav, output_dir=str(tmp_path))
+
+        assert result.flac_path is None
+        assert "FLOAT" in result.skipped_reason
+
+
+@pytest.mark.unit
+class TestTranscodedUploads:
+    """Test transcoding in the upload helpers"""
+
+    def test_upload_files_transcodes_in_process_pool(self, tmp_path):
+        """Test that WAVs that compress are sent as FLAC and savings are reported"""
+        paths = [write_wav(tmp_path / "tone.wav"), write_wav(tmp_path / "noise.wav", kind="noise")]
+        client = make_client()
+
+        batch = upload_files(client, paths, transcode=True, transcode_workers=2)
+
+        assert batch.ok
+        assert batch.readable_urls == ["https://example.com/tone.flac", "https://example.com/noise.wav"]
+        assert client.uploaded["tone.flac"][1] == "audio/flac"
+        assert client.uploaded["noise.wav"][1] == "audio/wav"
+        tone, noise = batch.files
+        assert tone.bytes_uploaded == tone.transcode.flac_bytes
+        assert batch.bytes_saved == tone.transcode.bytes_saved > 0
+        assert noise.transcode.skipped_reason is not None
+        assert not os.path.exists(tone.transcode.flac_path)
+
+    def test_upload_file_transcodes_and_cleans_up(self, tmp_path):
+        """Test that a single upload sends FLAC and removes its temporary file"""
+        wav = write_wav(tmp_path / "tone.wav")
+        client = make_client()
+
+        url = upload_file(client, wav, transcode=True)
+
+        assert url == "https://example.com/tone.flac"
+        size, content_type = client.uploaded["tone.flac"]
+        assert content_type == "audio/flac" and size < os.path.getsize(wav)
+        assert sorted(os.listdir(tmp_path)) == ["tone.wav"]
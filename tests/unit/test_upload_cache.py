@@ -0,0 +1,146 @@
+"""
+Unit tests for the content-addressed upload cache
+"""
+
+import hashlib
+import pytest
+from unittest.mock import Mock, patch
+from roex_python.models import UploadUrlResponse
+from roex_python.upload_cache import UploadCache
+from roex_python.utils import upload_file, upload_files
+
+
+def make_client():
+    """Build a client mock whose upload URLs are derived from the filename"""
+    client = Mock()
+    client.api_provider.base_url = "https://api.example.com"
+    client.upload.get_upload_url.side_effect = lambda request: UploadUrlResponse(
+        signed_url=f"https://signed.example.com/{request.filename}",
+        readable_url=f"https://example.com/{request.filename}"
+    )
+    return client
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Returns an empty cache in a temporary directory"""
+    return UploadCache(path=str(tmp_path / "cache" / "uploads.sqlite3"))
+
+
+@pytest.mark.unit
+class TestUploadCache:
+    """Test cache storage, expiry and eviction"""
+
+    def test_hash_file_streams_contents(self, tmp_path):
+        """Test that hashing in small chunks matches hashing the whole file"""
+        path = tmp_path / "a.wav"
+        path.write_bytes(b"abc" * 1000)
+
+        assert UploadCache.hash_file(str(path), chunk_size=7) == hashlib.sha256(b"abc" * 1000).hexdigest()
+
+    def test_key_includes_type_and_base_url(self):
+        """Test that identical contents sent to another API or as another type do not collide"""
+        key = UploadCache.key("abc", "audio/wav", "https://api.example.com/")
+
+        assert key == UploadCache.key("abc", "audio/wav", "https://api.example.com")
+        assert key != UploadCache.key("abc", "audio/flac", "https://api.example.com")
+        assert key != UploadCache.key("abc", "audio/wav", "https://staging.example.com")
+
+    def test_persists_across_instances(self, cache):
+        """Test that a second cache on the same file sees earlier uploads"""
+        cache.put("k", "https://example.com/a.wav", 10)
+
+        assert UploadCache(path=cache.path).get("k") == "https://example.com/a.wav"
+        assert len(cache) == 1
+
+    def test_expired_entries_are_ignored(self, cache):
+        """Test that entries older than ttl miss and are removed"""
+        with patch("roex_python.upload_cache.time.time", return_value=1000.0):
+            cache.put("k", "https://example.com/a.wav", 10)
+        with patch("roex_python.upload_cache.time.time", return_value=1000.0 + cache.ttl + 1):
+            assert cache.get("k") is None
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        """Test that entries beyond max_entries are evicted by last use"""
+        cache = UploadCache(path=str(tmp_path / "uploads.sqlite3"), ttl=None, max_entries=2)
+        with patch("roex_python.upload_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put("a", "https://example.com/a.wav", 1)
+            cache.put("b", "https://example.com/b.wav", 1)
+            cache.get("a")
+            cache.put("c", "https://example.com/c.wav", 1)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "https://example.com/a.wav"
+        assert cache.get("c") == "https://example.com/c.wav"
+
+    def test_invalid_arguments(self, tmp_path):
+        """Test that ttl and max_entries must be positive"""
+        with pytest.raises(ValueError):
+            UploadCache(path=str(tmp_path / "a.sqlite3"), ttl=0)
+        with pytest.raises(ValueError):
+            UploadCache(path=str(tmp_path / "b.sqlite3"), max_entries=0)
+        with pytest.raises(ValueError):
+            UploadCache(path=str(tmp_path / "c.sqlite3"), journal_mode="OFF")
+
+    def test_journal_mode(self, tmp_path):
+        """Test that the rollback journal is the default and WAL can be chosen for local disks"""
+        assert UploadCache(path=str(tmp_path / "a.sqlite3"))._store.journal_mode == "DELETE"
+        cache = UploadCache(path=str(tmp_path / "b.sqlite3"), journal_mode="WAL")
+        cache.put("k", "https://example.com/a.wav", 10)
+
+        assert cache._store.journal_mode == "WAL"
+        assert UploadCache(path=cache.path, journal_mode="WAL").get("k") == "https://example.com/a.wav"
+
+
+@pytest.mark.unit
+class TestCachedUploads:
+    """Test that uploads skip files already in the cache"""
+
+    def test_upload_file_skips_repeat_upload(self, tmp_path, cache):
+        """Test that uploading identical contents twice sends them once"""
+        first = tmp_path / "drums.wav"
+        copy = tmp_path / "drums_copy.wav"
+        first.write_bytes(b"drums")
+        copy.write_bytes(b"drums")
+        client = make_client()
+
+        url = upload_file(client, str(first), cache=cache)
+        repeat = upload_file(client, str(copy), cache=cache)
+
+        assert url == repeat == "https://example.com/drums.wav"
+        client.upload.get_upload_url.assert_called_once()
+        client.api_provider.upload_to_signed_url.assert_called_once()
+
+    def test_changed_contents_are_uploaded(self, tmp_path, cache):
+        """Test that editing a file invalidates its cache entry"""
+        path = tmp_path / "drums.wav"
+        path.write_bytes(b"take 1")
+        client = make_client()
+        upload_file(client, str(path), cache=cache)
+
+        path.write_bytes(b"take 2")
+        upload_file(client, str(path), cache=cache)
+
+        assert client.api_provider.upload_to_signed_url.call_count == 2
+
+    def test_upload_files_marks_cache_hits(self, tmp_path, cache):
+        """Test that batch uploads skip cached files and report them"""
+        paths = []
+        for name in ("bass.wav", "vocals.wav"):
+            path = tmp_path / name
+            path.write_bytes(name.encode())
+            paths.append(str(path))
+        client = make_client()
+        upload_file(client, paths[0], cache=cache)
+        client.reset_mock()
+
+        batch = upload_files(client, paths, cache=cache)
+
+        assert batch.ok
+        assert batch.readable_urls == ["https://example.com/bass.wav", "https://example.com/vocals.wav"]
+        assert [f.cached for f in batch.files] == [True, False]
+        assert batch.files[0].bytes_uploaded == 0
+        client.upload.get_upload_url.assert_called_once()
+        assert len(cache) == 2
@@ -0,0 +1,152 @@
+"""
+Unit tests for in-memory upload sources
+"""
+
+import io
+import wave
+import pytest
+from unittest.mock import Mock
+from roex_python.models import UploadUrlResponse
+from roex_python.upload_sources import WavEncoder, prepare_upload
+from roex_python.utils import upload_file
+
+np = pytest.importorskip("numpy")
+
+
+def make_client():
+    """Build a client mock that records the uploaded body"""
+    client = Mock()
+    client.uploaded = {}
+    client.upload.get_upload_url.side_effect = lambda request: UploadUrlResponse(
+        signed_url=f"https://signed.example.com/{request.filename}",
+        readable_url=f"https://example.com/{request.filename}"
+    )
+
+    def upload_to_signed_url(signed_url, data, content_type, **kwargs):
+        client.uploaded[signed_url.rsplit("/", 1)[-1]] = (data.read(), content_type)
+
+    client.api_provider.upload_to_signed_url.side_effect = upload_to_signed_url
+    return client
+
+
+def sine(frames=4410, channels=2):
+    """A stereo test tone"""
+    t = np.arange(frames) / 44100
+    tone = 0.5 * np.sin(2 * np.pi * 440 * t)
+    return np.stack([tone, -tone], axis=1)[:, :channels].astype(np.float32)
+
+
+@pytest.mark.unit
+class TestPrepareUpload:
+    """Test resolving sources to filenames and streams"""
+
+    def test_buffer_requires_filename(self):
+        """Test that buffers need a filename for their content type"""
+        with pytest.raises(ValueError, match="filename is required"):
+            prepare_upload(b"RIFF....")
+
+        prepared = prepare_upload(memoryview(b"fLaC...."), filename="mix.flac")
+        with prepared.open() as f:
+            assert f.read() == b"fLaC...."
+        assert prepared.content_type == "audio/flac"
+        assert prepared.size() == 8
+
+    def test_file_object_is_rewound_and_not_closed(self):
+        """Test that file objects are read from their position and left open"""
+        f = io.BytesIO(b"junkRIFFdata")
+        f.seek(4)
+        prepared = prepare_upload(f, filename="mix.wav")
+
+        for _ in range(2):
+            with prepared.open() as stream:
+                assert stream.read() == b"RIFFdata"
+        assert not f.closed
+        assert prepared.size() == 8
+
+    def test_array_requires_float_samples_and_sample_rate(self):
+        """Test that arrays need a sample rate and floating-point samples"""
+        with pytest.raises(ValueError, match="sample_rate"):
+            prepare_upload(sine())
+        with pytest.raises(TypeError, match="float"):
+            prepare_upload(np.zeros(10, dtype=np.int16), sample_rate=44100)
+        with pytest.raises(ValueError, match="does not match"):
+            prepare_upload(sine(), sample_rate=44100, filename="mix.flac")
+
+
+@pytest.mark.unit
+class TestWavEncoder:
+    """Test on-the-fly WAV encoding"""
+
+    @pytest.mark.parametrize("bit_depth", [16, 24])
+    def test_encodes_valid_wav(self, bit_depth):
+        """Test that the stream is a WAV file with the original samples"""
+        samples = sine()
+        encoder = WavEncoder(samples, 44100, bit_depth=bit_depth)
+
+        data = encoder.reader().read()
+
+        assert len(data) == encoder.size
+        with wave.open(io.BytesIO(data)) as wav:
+            assert (wav.getnchannels(), wav.getframerate(), wav.getsampwidth()) == (2, 44100, bit_depth // 8)
+            frames = wav.readframes(wav.getnframes())
+        if bit_depth == 16:
+            decoded = np.frombuffer(frames, "<i2").reshape(-1, 2) / 32767
+        else:
+            raw = np.frombuffer(frames, np.uint8).reshape(-1, 3)
+            padded = np.zeros((len(raw), 4), np.uint8)
+            padded[:, 1:] = raw
+            decoded = (padded.view("<i4").reshape(-1, 2) >> 8) / 8388607
+        np.testing.assert_allclose(decoded, samples, atol=1 / 2 ** (bit_depth - 2))
+
+    def test_random_access_matches_sequential_read(self):
+        """Test that seeking and small reads produce the same bytes as one read"""
+        encoder = WavEncoder(sine(frames=1001, channels=2), 44100)
+        whole = encoder.reader().read()
+        reader = encoder.reader()
+
+        pieces = []
+        for size in (7, 37, 3, 1000, 2 ** 20):
+            pieces.append(reader.read(size))
+        reader.seek(50)
+
+        assert b"".join(pieces) == whole
+        assert reader.read(13) == whole[50:63]
+        assert len(reader) == len(whole) - 63
+
+
+@pytest.mark.unit
+class TestUploadFromMemory:
+    """Test upload_file with in-memory sources"""
+
+    def test_uploads_array_as_wav(self):
+        """Test that an array is uploaded as WAV without touching disk"""
+        client = make_client()
+
+        url = upload_file(client, sine(), sample_rate=44100, filename="render.wav")
+
+        body, content_type = client.uploaded["render.wav"]
+        assert url == "https://example.com/render.wav"
+        assert content_type == "audio/wav"
+        assert body[:4] == b"RIFF" and body[8:12] == b"WAVE"
+
+    def test_uploads_array_as_flac(self):
+        """Test that arrays can be sent as FLAC"""
+        soundfile = pytest.importorskip("soundfile")
+        client = make_client()
+        samples = sine()
+
+        upload_file(client, samples, sample_rate=44100, audio_format="flac")
+
+        body, content_type = client.uploaded["audio.flac"]
+        assert content_type == "audio/flac"
+        decoded, rate = soundfile.read(io.BytesIO(body), dtype="float32")
+        assert rate == 44100
+        np.testing.assert_allclose(decoded, samples, atol=1e-6)
+
+    def test_uploads_bytes(self):
+        """Test that encoded audio in memory is uploaded as-is"""
+        client = make_client()
+
+        upload_file(client, bytearray(b"ID3 mp3 data"), filename="take.mp3")
+
+        assert client.uploaded["take.mp3"] == (b"ID3 mp3 data", "audio/mpeg")
@@ -4,7 +4,12 @@ Unit tests for utility functions
 
 import pytest
 from unittest.mock import Mock, patch, mock_open
-from roex_python.utils import get_content_type, upload_file
+import asyncio
+import io
+import threading
+import requests
+from unittest.mock import AsyncMock
+from roex_python.utils import _iter_file_chunks, get_content_type, upload_file, upload_file_async, upload_files
 from roex_python.models import UploadUrlResponse
 
 
@@ -54,9 +59,8 @@ class TestGetContentType:
 class TestUploadFile:
     """Test file upload functionality"""
     
-    @patch('roex_python.utils.requests.put')
     @patch('builtins.open', new_callable=mock_open, read_data=b'audio data')
-    def test_successful_upload(self, mock_file, mock_put):
+    def test_successful_upload(self, mock_file):
         """Test successful file upload"""
         # Setup
         mock_client = Mock()
@@ -71,9 +75,7 @@ class TestUploadFile:
         )
         mock_upload_controller.get_upload_url.return_value = upload_response
         
-        mock_put_response = Mock()
-        mock_put_response.raise_for_status = Mock()
-        mock_put.return_value = mock_put_response
+        mock_put = mock_client.api_provider.upload_to_signed_url
         
         # Execute
         result = upload_file(mock_client, "test_track.wav")
@@ -82,10 +84,11 @@ class TestUploadFile:
         assert result == "https://example.com/track.wav"
         mock_upload_controller.get_upload_url.assert_called_once()
         mock_put.assert_called_once()
+        assert mock_put.call_args[0][0] == "https://signed.example.com/upload"
+        assert mock_put.call_args.kwargs["chunk_size"] is None
         mock_file.assert_called_once_with("test_track.wav", 'rb')
     
-    @patch('roex_python.utils.requests.put')
-    def test_upload_with_error_response(self, mock_put):
+    def test_upload_with_error_response(self):
         """Test upload when get_upload_url returns error"""
         # Setup
         mock_client = Mock()
@@ -104,9 +107,8 @@ class TestUploadFile:
         with pytest.raises(ValueError, match="Failed to get valid upload URL"):
             upload_file(mock_client, "test_track.wav")
     
-    @patch('roex_python.utils.requests.put')
     @patch('builtins.open', new_callable=mock_open, read_data=b'audio data')
-    def test_upload_http_error(self, mock_file, mock_put):
+    def test_upload_http_error(self, mock_file):
         """Test upload when HTTP request fails"""
         # Setup
         mock_client = Mock()
@@ -122,15 +124,14 @@ class TestUploadFile:
         mock_upload_controller.get_upload_url.return_value = upload_response
         
         import requests
-        mock_put.side_effect = requests.exceptions.RequestException("Upload failed")
+        mock_client.api_provider.upload_to_signed_url.side_effect = requests.exceptions.RequestException("Upload failed")
         
         # Execute & Assert
         with pytest.raises(requests.exceptions.RequestException):
             upload_file(mock_client, "test_track.wav")
     
-    @patch('roex_python.utils.requests.put')
     @patch('builtins.open', side_effect=FileNotFoundError("File not found"))
-    def test_upload_file_not_found(self, mock_file, mock_put):
+    def test_upload_file_not_found(self, mock_file):
         """Test upload when file doesn't exist"""
         # Setup
         mock_client = Mock()
@@ -149,9 +150,8 @@ class TestUploadFile:
         with pytest.raises(FileNotFoundError):
             upload_file(mock_client, "nonexistent.wav")
     
-    @patch('roex_python.utils.requests.put')
     @patch('builtins.open', new_callable=mock_open, read_data=b'audio data')
-    def test_correct_content_type_sent(self, mock_file, mock_put):
+    def test_correct_content_type_sent(self, mock_file):
         """Test that correct content type header is sent"""
         # Setup
         mock_client = Mock()
@@ -166,13 +166,172 @@ class TestUploadFile:
         )
         mock_upload_controller.get_upload_url.return_value = upload_response
         
-        mock_put_response = Mock()
-        mock_put_response.raise_for_status = Mock()
-        mock_put.return_value = mock_put_response
+        mock_put = mock_client.api_provider.upload_to_signed_url
         
         # Execute
         upload_file(mock_client, "test_track.mp3")
         
         # Assert - check that PUT was called with correct content type
         call_args = mock_put.call_args
-        assert call_args[1]['headers']['Content-Type'] == 'audio/mpeg'
+        assert call_args[0][2] == 'audio/mpeg'
+
+    @patch('builtins.open', new_callable=mock_open, read_data=b'audio data')
+    def test_chunk_size_and_progress_forwarded(self, mock_file):
+        """Test that resumable upload settings reach the provider"""
+        # Setup
+        mock_client = Mock()
+        mock_client.upload.get_upload_url.return_value = UploadUrlResponse(
+            signed_url="https://signed.example.com/upload",
+            readable_url="https://example.com/track.wav"
+        )
+        on_progress = Mock()
+        
+        # Execute
+        upload_file(mock_client, "test_track.wav", chunk_size=512 * 1024, on_progress=on_progress)
+        
+        # Assert
+        kwargs = mock_client.api_provider.upload_to_signed_url.call_args.kwargs
+        assert kwargs == {"chunk_size": 512 * 1024, "on_progress": on_progress}
+
+
+@pytest.mark.unit
+class TestUploadFileAsync:
+    """Test async file upload functionality"""
+    
+    def test_successful_upload_streams_file(self, sample_audio_file):
+        """Test that the file is streamed to the signed URL with its size"""
+        mock_client = Mock()
+        mock_client.upload.get_upload_url = AsyncMock(return_value=UploadUrlResponse(
+            signed_url="https://signed.example.com/upload",
+            readable_url="https://example.com/track.wav"
+        ))
+        sent = {}
+        
+        async def fake_upload(url, body, content_type, content_length=None):
+            sent["body"] = b"".join([chunk async for chunk in body])
+            sent["content_length"] = content_length
+            sent["content_type"] = content_type
+        
+        mock_client.api_provider.upload_to_signed_url = fake_upload
+        
+        result = asyncio.run(upload_file_async(mock_client, sample_audio_file))
+        
+        assert result == "https://example.com/track.wav"
+        assert sent["body"] == b"RIFF" + b"\x00" * 44
+        assert sent["content_length"] == 48
+        assert sent["content_type"] == "audio/wav"
+    
+    def test_file_is_read_off_the_event_loop(self):
+        """Test that opening and reading the file happen in worker threads, not the event loop's thread"""
+        threads = []
+        
+        class RecordingFile(io.BytesIO):
+            def read(self, size=-1):
+                threads.append(threading.current_thread())
+                return super().read(size)
+        
+        def recording_open(file_path, mode):
+            threads.append(threading.current_thread())
+            return RecordingFile(b"x" * 10)
+        
+        async def read_all():
+            return [chunk async for chunk in _iter_file_chunks("track.wav", chunk_size=4)]
+        
+        with patch("roex_python.utils.open", side_effect=recording_open, create=True):
+            chunks = asyncio.run(read_all())
+        
+        assert chunks == [b"xxxx", b"xxxx", b"xx"]
+        assert len(threads) == 5
+        assert threading.main_thread() not in threads
+    
+    def test_upload_with_error_response(self, sample_audio_file):
+        """Test async upload when get_upload_url returns error"""
+        mock_client = Mock()
+        mock_client.upload.get_upload_url = AsyncMock(return_value=UploadUrlResponse(error=True, message="nope"))
+        
+        with pytest.raises(ValueError, match="Failed to get valid upload URL"):
+            asyncio.run(upload_file_async(mock_client, sample_audio_file))
+
+
+@pytest.mark.unit
+class TestUploadFiles:
+    """Test parallel batch uploads"""
+    
+    @staticmethod
+    def make_client(fail_url_for=(), fail_put_for=()):
+        """Build a client mock whose upload URLs are derived from the filename"""
+        client = Mock()
+        
+        def get_upload_url(request):
+            if request.filename in fail_url_for:
+                return UploadUrlResponse(error=True, message="quota exceeded")
+            return UploadUrlResponse(
+                signed_url=f"https://signed.example.com/{request.filename}",
+                readable_url=f"https://example.com/{request.filename}"
+            )
+        
+        def upload_to_signed_url(signed_url, data, content_type, **kwargs):
+            if signed_url.rsplit("/", 1)[-1] in fail_put_for:
+                raise requests.HTTPError("403 Forbidden")
+            data.read()
+        
+        client.upload.get_upload_url.side_effect = get_upload_url
+        client.api_provider.upload_to_signed_url.side_effect = upload_to_signed_url
+        return client
+    
+    @staticmethod
+    def make_files(tmp_path, names):
+        """Create small audio files and return their paths"""
+        paths = []
+        for i, name in enumerate(names):
+            path = tmp_path / name
+            path.write_bytes(b"x" * (100 * (i + 1)))
+            paths.append(str(path))
+        return paths
+    
+    def test_returns_urls_in_input_order(self, tmp_path):
+        """Test that readable URLs keep input order and stats are aggregated"""
+        names = [f"stem{i}.wav" for i in range(10)]
+        paths = self.make_files(tmp_path, names)
+        client = self.make_client()
+        
+        batch = upload_files(client, paths, max_workers=4)
+        
+        assert batch.ok
+        assert batch.readable_urls == [f"https://example.com/{name}" for name in names]
+        assert [f.path for f in batch.files] == paths
+        assert batch.total_bytes == sum(100 * (i + 1) for i in range(10))
+        assert batch.elapsed_seconds > 0
+        assert batch.throughput > 0
+        assert client.api_provider.upload_to_signed_url.call_count == 10
+    
+    def test_uploads_overlap(self, tmp_path):
+        """Test that uploads run concurrently"""
+        paths = self.make_files(tmp_path, ["a.wav", "b.wav", "c.wav"])
+        client = self.make_client()
+        barrier = threading.Barrier(3, timeout=5)
+        client.api_provider.upload_to_signed_url.side_effect = lambda *args, **kwargs: barrier.wait()
+        
+        batch = upload_files(client, paths, max_workers=3)
+        
+        assert batch.ok
+    
+    def test_per_file_errors(self, tmp_path):
+        """Test that failures are reported per file without stopping the batch"""
+        paths = self.make_files(tmp_path, ["ok.wav", "nourl.wav", "forbidden.wav", "notes.txt"])
+        client = self.make_client(fail_url_for={"nourl.wav"}, fail_put_for={"forbidden.wav"})
+        
+        batch = upload_files(client, paths)
+        
+        assert not batch.ok
+        assert batch.readable_urls == ["https://example.com/ok.wav", None, None, None]
+        errors = {f.path.rsplit("/", 1)[-1]: f.error for f in batch.failed}
+        assert "quota exceeded" in errors["nourl.wav"]
+        assert "403" in errors["forbidden.wav"]
+        assert "Unsupported file type" in errors["notes.txt"]
+        assert batch.total_bytes == 100
+    
+    def test_invalid_max_workers(self):
+        """Test that max_workers must be positive"""
+        with pytest.raises(ValueError):
+            upload_files(Mock(), [], max_workers=0)
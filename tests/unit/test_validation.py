@@ -0,0 +1,207 @@
+"""
+Unit tests for header-only audio validation
+"""
+
+import struct
+import wave
+import pytest
+from roex_python.exceptions import (
+    AudioFormatError,
+    AudioTooLongError,
+    AudioTooQuietError,
+    AudioTooShortError,
+    InvalidSampleRateError,
+)
+from roex_python.validation import iter_blocks, measure_rms, read_header, validate_audio, validate_audio_files
+
+
+def write_wav(path, frames, sample_rate=44100, channels=2, sample_width=2, data=None):
+    """Write a PCM WAV with the standard library"""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(sample_width)
+        wav.setframerate(sample_rate)
+        wav.writeframes(data if data is not None else b"\x00" * frames * channels * sample_width)
+    return str(path)
+
+
+def streaminfo(sample_rate, channels, bits, frames):
+    """Build a FLAC marker and STREAMINFO block"""
+    packed = (sample_rate << 44) | ((channels - 1) << 41) | ((bits - 1) << 36) | frames
+    info = struct.pack(">HH", 4096, 4096) + b"\x00" * 6 + packed.to_bytes(8, "big") + b"\x00" * 16
+    return b"fLaC" + bytes([0x80]) + (34).to_bytes(3, "big") + info
+
+
+@pytest.mark.unit
+class TestReadHeader:
+    """Test header parsing"""
+
+    def test_wav(self, tmp_path):
+        """Test a plain RIFF WAV"""
+        path = write_wav(tmp_path / "a.wav", frames=48000, sample_rate=48000)
+
+        header = read_header(path)
+
+        assert (header.format, header.sample_rate, header.channels, header.bit_depth) == ("WAV", 48000, 2, 16)
+        assert header.frames == 48000 and header.duration_seconds == 1.0
+        assert header.data_offset == 44
+
+    def test_rf64_and_extensible_fmt(self, tmp_path):
+        """Test an RF64 file whose sizes live in ds64, with a WAVE_FORMAT_EXTENSIBLE fmt chunk"""
+        frames, channels, width = 100, 2, 3
+        data_size = frames * channels * width
+        ds64 = b"ds64" + struct.pack("<I", 28) + struct.pack("<QQQI", 0, data_size, frames, 0)
+        fmt_body = struct.pack("<HHIIHH", 0xFFFE, channels, 96000, 96000 * 6, 6, 24)
+        fmt_body += struct.pack("<HHI", 22, 24, 3) + struct.pack("<H", 1) + b"\x00" * 14
+        fmt = b"fmt " + struct.pack("<I", len(fmt_body)) + fmt_body
+        data = b"data" + struct.pack("<I", 0xFFFFFFFF) + b"\x00" * data_size
+        path = tmp_path / "big.wav"
+        path.write_bytes(b"RF64" + struct.pack("<I", 0xFFFFFFFF) + b"WAVE" + ds64 + fmt + data)
+
+        header = read_header(str(path))
+
+        assert (header.sample_rate, header.channels, header.bit_depth, header.frames) == (96000, 2, 24, 100)
+        assert header.sample_format == "pcm"
+
+    def test_flac_behind_id3(self, tmp_path):
+        """Test FLAC STREAMINFO, including after an ID3v2 tag"""
+        path = tmp_path / "a.flac"
+        path.write_bytes(b"ID3\x04\x00\x00\x00\x00\x00\x03abc" + streaminfo(44100, 2, 24, 441000))
+
+        header = read_header(str(path))
+
+        assert (header.format, header.sample_rate, header.channels, header.bit_depth) == ("FLAC", 44100, 2, 24)
+        assert header.duration_seconds == 10.0
+
+    def test_not_audio(self, tmp_path):
+        """Test that other files raise AudioFormatError"""
+        path = tmp_path / "notes.wav"
+        path.write_bytes(b"hello world")
+
+        with pytest.raises(AudioFormatError):
+            read_header(str(path))
+
+    def test_truncated_wav_counts_available_frames(self, tmp_path):
+        """Test that a truncated file reports only the frames it holds"""
+        path = write_wav(tmp_path / "a.wav", frames=1000)
+        with open(path, "r+b") as f:
+            f.truncate(44 + 400)
+
+        assert read_header(path).frames == 100
+
+
+@pytest.mark.unit
+class TestValidateAudio:
+    """Test checks built on the header and the streaming RMS"""
+
+    def test_measure_rms_reads_bounded_frames(self, tmp_path):
+        """Test that only the first rms_seconds are measured"""
+        np = pytest.importorskip("numpy")
+        loud = np.full((100, 1), 16384, dtype="<i2")
+        silent = np.zeros((900, 1), dtype="<i2")
+        path = write_wav(tmp_path / "a.wav", frames=1000, sample_rate=100, channels=1,
+                         data=np.concatenate([loud, silent]).tobytes())
+
+        assert measure_rms(path, max_seconds=1, block_frames=7) == pytest.approx(0.5)
+        assert measure_rms(path, max_seconds=None) == pytest.approx(0.5 * np.sqrt(0.1))
+
+    def test_iter_blocks(self, tmp_path):
+        """Test that the whole file is decoded in blocks of at most block_frames"""
+        np = pytest.importorskip("numpy")
+        samples = np.arange(20, dtype="<i2").reshape(10, 2)
+        path = write_wav(tmp_path / "a.wav", frames=10, data=samples.tobytes())
+
+        blocks = list(iter_blocks(read_header(path), block_frames=4))
+
+        assert [len(block) for block in blocks] == [4, 4, 2]
+        assert np.array_equal(np.concatenate(blocks), samples / 32768.0)
+
+    def test_24_bit_rms(self, tmp_path):
+        """Test decoding of signed 24-bit samples"""
+        pytest.importorskip("numpy")
+        sample = (-4194304).to_bytes(3, "little", signed=True)  # -0.5 full scale
+        path = write_wav(tmp_path / "a.wav", frames=10, channels=1, sample_width=3, data=sample * 10)
+
+        assert measure_rms(path) == pytest.approx(0.5)
+
+    def test_failures(self, tmp_path):
+        """Test each validation failure"""
+        pytest.importorskip("numpy")
+        with pytest.raises(InvalidSampleRateError):
+            validate_audio(write_wav(tmp_path / "rate.wav", frames=22050 * 20, sample_rate=22050))
+        with pytest.raises(AudioTooShortError):
+            validate_audio(write_wav(tmp_path / "short.wav", frames=44100))
+        with pytest.raises(AudioTooLongError):
+            validate_audio(write_wav(tmp_path / "long.wav", frames=44100 * 20), max_duration=15)
+        with pytest.raises(AudioTooQuietError):
+            validate_audio(write_wav(tmp_path / "silent.wav", frames=44100 * 20))
+
+    def test_header_only(self, tmp_path):
+        """Test that min_rms=None validates from the header alone"""
+        header = validate_audio(write_wav(tmp_path / "silent.wav", frames=44100 * 20), min_rms=None)
+
+        assert header.duration_seconds == 20.0
+
+    def test_batch_keeps_order_and_isolates_errors(self, tmp_path):
+        """Test that a batch reports each file's outcome in input order"""
+        paths = [write_wav(tmp_path / f"{i}.wav", frames=44100 * (20 if i % 2 else 1)) for i in range(6)]
+        paths.append(str(tmp_path / "missing.wav"))
+
+        results = validate_audio_files(paths, max_workers=3, min_rms=None)
+
+        assert [r.path for r in results] == paths
+        assert [r.ok for r in results] == [False, True, False, True, False, True, False]
+        assert isinstance(results[0].error, AudioTooShortError)
+        assert results[0].header.duration_seconds == 1.0
+        assert isinstance(results[-1].error, AudioFormatError) and results[-1].header is None
+
+
+def zero_total_samples(path):
+    """Clear a FLAC file's STREAMINFO total_samples, as a streaming encoder leaves it"""
+    data = bytearray(path.read_bytes())
+    packed = int.from_bytes(data[18:26], "big") & ~0xFFFFFFFFF
+    data[18:26] = packed.to_bytes(8, "big")
+    path.write_bytes(bytes(data))
+
+
+@pytest.mark.unit
+class TestUnknownLengthFlac:
+    """Test FLAC files whose STREAMINFO does not record the length"""
+
+    def test_header_reports_unknown_length(self, tmp_path):
+        """Test that a total_samples of 0 means unknown, not empty"""
+        path = tmp_path / "stream.flac"
+        path.write_bytes(streaminfo(44100, 2, 16, 0))
+
+        header = read_header(str(path))
+
+        assert header.frames is None and header.duration_seconds is None
+
+    def test_duration_checks_skipped_by_default(self, tmp_path):
+        """Test that an unknown length does not fail the minimum duration"""
+        path = tmp_path / "stream.flac"
+        path.write_bytes(streaminfo(44100, 2, 16, 0))
+
+        header = validate_audio(str(path), min_rms=None)
+
+        assert header.duration_seconds is None
+
+    def test_full_validation_decodes_length(self, tmp_path):
+        """Test that full=True counts the frames and applies the duration checks"""
+        np = pytest.importorskip("numpy")
+        soundfile = pytest.importorskip("soundfile")
+        # Setup
+        path = tmp_path / "stream.flac"
+        samples = (np.sin(np.arange(441000) / 10.0) * 0.5)[:, np.newaxis].repeat(2, axis=1)
+        soundfile.write(str(path), samples, 44100, subtype="PCM_16")
+        zero_total_samples(path)
+
+        # Execute
+        header = validate_audio(str(path), full=True)
+
+        # Assert
+        assert header.frames == 441000 and header.duration_seconds == 10.0
+        with pytest.raises(AudioTooLongError):
+            validate_audio(str(path), max_duration=5, full=True)
+        assert measure_rms(str(path), block_frames=4096) == pytest.approx(0.5 / np.sqrt(2), rel=1e-3)
+        assert measure_rms(str(path), max_seconds=1, block_frames=4096) == pytest.approx(0.5 / np.sqrt(2), rel=1e-2)
@@ -0,0 +1,119 @@
+"""
+Unit tests for WebhookListener and webhook-driven task resolution
+"""
+
+import threading
+import pytest
+import requests
+from unittest.mock import Mock
+from roex_python.controllers.mastering_controller import MasteringController
+from roex_python.models import DesiredLoudness, MasteringRequest, MusicalStyle
+from roex_python.polling import PollPolicy
+from roex_python.providers.api_provider import ApiProvider
+from roex_python.scheduler import PollScheduler
+from roex_python.webhooks import WebhookListener
+
+SLOW = PollPolicy(first_delay=60, max_delay=60, max_attempts=5)
+
+
+@pytest.fixture
+def listener():
+    """Returns a running listener on a free local port"""
+    with WebhookListener(host="127.0.0.1", fallback_policy=SLOW) as running:
+        yield running
+
+
+@pytest.mark.unit
+class TestWebhookListener:
+    """Test callback routing"""
+
+    def test_callback_runs_attached_function(self, listener):
+        """Test that a POST to a reserved URL runs its callback once"""
+        url = listener.reserve()
+        fired = threading.Event()
+        listener.attach(url, fired.set)
+
+        response = requests.post(url, json={"status": "COMPLETED"}, timeout=5)
+
+        assert response.status_code == 204
+        assert fired.is_set()
+        assert listener.callbacks_received == 1
+        # A second delivery of the same callback is not routed again
+        assert requests.post(url, json={}, timeout=5).status_code == 404
+
+    def test_unknown_token_is_rejected(self, listener):
+        """Test that callbacks to unreserved URLs are ignored"""
+        response = requests.post(f"{listener.url}/not-a-token", json={}, timeout=5)
+
+        assert response.status_code == 404
+        assert listener.callbacks_received == 0
+
+    def test_callback_before_attach(self, listener):
+        """Test that a callback arriving before attach runs on attach"""
+        url = listener.reserve()
+        requests.post(url, json={}, timeout=5)
+        on_callback = Mock()
+
+        listener.attach(url, on_callback)
+
+        on_callback.assert_called_once()
+
+    def test_public_url(self):
+        """Test that callback URLs use the public URL when given"""
+        listener = WebhookListener(port=0, public_url="https://hooks.example.com/", fallback_policy=SLOW)
+
+        assert listener.url == "https://hooks.example.com/roex-webhook"
+
+    @pytest.mark.parametrize("host", ["0.0.0.0", "::", ""])
+    def test_wildcard_host_requires_public_url(self, host):
+        """Test that a wildcard bind address is never sent to the API as a callback host"""
+        with pytest.raises(ValueError, match="public_url"):
+            WebhookListener(host=host, fallback_policy=SLOW)
+
+        listener = WebhookListener(host=host, public_url="https://hooks.example.com", fallback_policy=SLOW)
+
+        assert listener.url == "https://hooks.example.com/roex-webhook"
+
+
+@pytest.mark.unit
+class TestWebhookScheduling:
+    """Test that callbacks replace polling in the scheduler"""
+
+    def test_attach_webhook_sets_url_only_when_missing(self, listener):
+        """Test that requests keep a caller-supplied webhook_url"""
+        scheduler = PollScheduler(Mock(spec=ApiProvider), webhook_listener=listener)
+        request = MasteringRequest(track_url="https://example.com/t.wav", musical_style=MusicalStyle.POP,
+                                   desired_loudness=DesiredLoudness.MEDIUM)
+        own = MasteringRequest(track_url="https://example.com/t.wav", musical_style=MusicalStyle.POP,
+                               desired_loudness=DesiredLoudness.MEDIUM, webhook_url="https://mine.example.com")
+
+        updated, url = scheduler.attach_webhook(request)
+        unchanged, no_url = scheduler.attach_webhook(own)
+
+        assert updated.webhook_url == url and url.startswith(listener.url + "/")
+        assert request.webhook_url is None
+        assert unchanged is own and no_url is None
+
+    def test_submit_resolves_on_callback(self, listener):
+        """Test that a submitted task is polled once when its callback arrives"""
+        provider = Mock(spec=ApiProvider)
+        provider.post.side_effect = [
+            {"mastering_task_id": "task_123"},
+            {"previewMasterTaskResults": {"download_url_mastered_preview": "https://example.com/p.wav"}}
+        ]
+        scheduler = PollScheduler(provider, webhook_listener=listener)
+        controller = MasteringController(provider, poll_scheduler=scheduler)
+        request = MasteringRequest(track_url="https://example.com/t.wav", musical_style=MusicalStyle.POP,
+                                   desired_loudness=DesiredLoudness.MEDIUM)
+
+        with scheduler:
+            handle = controller.submit(request)
+            callback_url = provider.post.call_args[0][1]["masteringData"]["webhookURL"]
+            assert not handle.done()
+
+            requests.post(callback_url, json={"mastering_task_id": "task_123"}, timeout=5)
+            result = handle.result(timeout=5)
+
+        assert result.download_url_mastered_preview == "https://example.com/p.wav"
+        # One create and one retrieval, despite the 60 s fallback interval
+        assert provider.post.call_count == 2